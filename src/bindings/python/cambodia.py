@@ -31,7 +31,7 @@ class TrackItem(urwid.AttrWrap):
         length = '%d:%02d' % (sec / 60, sec % 60)
         if track.has_meta_data():
             widget = self.create_columns(str(num), track.title,
-                     '/'.join(a.name for a in track.artists),
+                     '/'.join(track.artist_names),
                      track.album, length)
             if not track.is_playable():
                 widget = urwid.AttrWrap(widget, 'tr-na')
@@ -57,24 +57,116 @@ class TrackItem(urwid.AttrWrap):
     def keypress(self, (maxcol,), key):
         return key
 
-class TrackWalker(urwid.SimpleListWalker):
+class LoadingItem(urwid.AttrWrap):
+    def __init__(self):
+        widget = urwid.Text('Loading...', align = 'center', wrap = 'clip')
+        self.__super.__init__(widget, 'tr-loading', 'tr-focus')
+
+    def selectable(self):
+        return True
+
+    def keypress(self, (maxcol,), key):
+        return key
+
+class TrackWalker(urwid.ListWalker):
+    """Virtual list of the tracks of a playlist.
+
+    Tracks are fetched from the playlist a page at a time as the list is
+    scrolled, and widgets are only created for the rows around the focus.
+    Until all tracks are fetched, the last row is a LoadingItem.
+    """
+    # tracks to fetch at a time
+    PAGE = 100
+    # rows on each side of the focus to keep widgets for
+    KEEP = 200
+
     def __init__(self, playlist):
-        num = 1
-        contents = []
-        for t in playlist.tracks:
-            contents.append(TrackItem(t, num))
-            num += 1
+        self.tracks = []
+        self.pending = playlist.iter_tracks()
+        self.widgets = {}
+        self.focus = 0
+        self.loading = LoadingItem()
+
+    def fetch(self, count):
+        """Fetch up to count more tracks. Returns False once all are."""
+        if self.pending is None:
+            return False
+
+        for i in range(count):
+            try:
+                self.tracks.append(next(self.pending))
+            except StopIteration:
+                self.pending = None
+                break
+
+        self._modified()
+        return self.pending is not None
+
+    def idle(self):
+        """Fetch a page if the loading row is near the focus. Returns
+        True if the list changed."""
+        if self.pending is None or len(self.tracks) - self.focus > self.KEEP:
+            return False
+
+        self.fetch(self.PAGE)
+        return True
 
-        urwid.SimpleListWalker.__init__(self, contents)
+    def get_widget(self, position):
+        if position < 0:
+            return None
 
-    def set_focus(self, position):
-        if not self:
-            return
+        if position >= len(self.tracks):
+            if position == len(self.tracks) and self.pending is not None:
+                return self.loading
+            return None
+
+        widget = self.widgets.get(position)
+        if widget is None:
+            widget = TrackItem(self.tracks[position], position + 1)
+            if position == self.focus:
+                widget.set_attr('tr-selected')
+            self.widgets[position] = widget
+
+        return widget
+
+    def get_focus(self):
+        widget = self.get_widget(self.focus)
+        if widget is None:
+            return None, None
+
+        return widget, self.focus
+
+    def get_next(self, position):
+        widget = self.get_widget(position + 1)
+        if widget is None:
+            return None, None
 
+        return widget, position + 1
+
+    def get_prev(self, position):
+        widget = self.get_widget(position - 1)
+        if widget is None:
+            return None, None
+
+        return widget, position - 1
+
+    def set_focus(self, position):
         # Highligt current track when focus leaves TracksView
-        self[self.focus].set_attr('tr-normal')
-        urwid.SimpleListWalker.set_focus(self, position)
-        self[self.focus].set_attr('tr-selected')
+        widget = self.widgets.get(self.focus)
+        if widget is not None:
+            widget.set_attr('tr-normal')
+
+        self.focus = position
+        widget = self.widgets.get(position)
+        if widget is not None:
+            widget.set_attr('tr-selected')
+
+        # Drop the widgets that scrolled far off screen.
+        for p in self.widgets.keys():
+            if abs(p - position) > self.KEEP:
+                del self.widgets[p]
+
+        self._modified()
 
 class TracksView(urwid.Frame):
     def __init__(self, playlist, session):
@@ -83,18 +175,34 @@ class TracksView(urwid.Frame):
 
         header = urwid.AttrWrap(TrackItem.create_columns('#', 'Title', 'Artist',
                 'Album', 'Len.'), 'tr-header')
-        footer = urwid.AttrWrap(urwid.Text('"%s" by %s, %d tracks' %
-                (playlist.name, playlist.author, len(playlist.tracks)),
-                align = 'center', wrap = 'clip'), 'tr-footer')
-        tracks = urwid.ListBox(TrackWalker(playlist))
-        self.__super.__init__(tracks, header = header, footer = footer)
-        tracks.set_focus(0)
+        self.footer = urwid.Text('', align = 'center', wrap = 'clip')
+        self.walker = TrackWalker(playlist)
+        self.walker.fetch(TrackWalker.PAGE)
+        self.update_footer()
+        tracks = urwid.ListBox(self.walker)
+        self.__super.__init__(tracks, header = header,
+                footer = urwid.AttrWrap(self.footer, 'tr-footer'))
+
+    def update_footer(self):
+        if self.walker.pending is None:
+            count = '%d tracks' % len(self.walker.tracks)
+        else:
+            count = 'loading tracks'
+        self.footer.set_text('"%s" by %s, %s' %
+                (self.playlist.name, self.playlist.author, count))
+
+    def idle(self):
+        if not self.walker.idle():
+            return False
+
+        self.update_footer()
+        return True
 
     def keypress(self, (maxcol, maxrow), key):
         key =  self.get_body().keypress((maxcol, maxrow-2), key)
         if key == 'enter':
             item,pos = self.get_body().get_focus()
-            if item:
+            if isinstance(item, TrackItem):
                 self.session.play(self.playlist, item.track)
         else:
             return key
@@ -104,10 +212,16 @@ class TracksView(urwid.Frame):
 class PlaylistItem(urwid.AttrWrap):
     def __init__(self, playlist, session):
         self.playlist = playlist
+        self.session = session
+        self.view = None
         widget = urwid.Text(playlist.name, wrap = 'clip')
         self.__super.__init__(widget, None, 'pl-focus')
 
-        self.tracks_view = TracksView(playlist, session)
+    def tracks_view(self):
+        # Built on first focus, as most playlists are never looked at.
+        if self.view is None:
+            self.view = TracksView(self.playlist, self.session)
+        return self.view
 
     def selectable(self):
         return True
@@ -135,7 +249,13 @@ class PlaylistWalker(urwid.SimpleListWalker):
         self[self.focus].set_attr('pl-selected')
 
         # Display TracksView
-        self.tracks_container.set_w(self[self.focus].tracks_view)
+        self.tracks_container.set_w(self[self.focus].tracks_view())
+
+    def idle(self):
+        if not self:
+            return False
+
+        return self[self.focus].tracks_view().idle()
 
 class PlaylistsView(urwid.ListBox):
     def __init__(self, session, tracks_container):
@@ -150,8 +270,11 @@ class BrowseView(urwid.Columns):
         dummy = urwid.Filler(urwid.Text(
             'No playlists found. Press "escape" to quit.', align = 'center'))
         tracks_container = urwid.WidgetWrap(dummy)
-        playlists = PlaylistsView(session, tracks_container)
-        self.__super.__init__([('fixed', 15, playlists), tracks_container], 1, 0)
+        self.playlists = PlaylistsView(session, tracks_container)
+        self.__super.__init__([('fixed', 15, self.playlists), tracks_container], 1, 0)
+
+    def idle(self):
+        return self.playlists.playlists.idle()
 
 ################################################################################
 # Player view
@@ -171,8 +294,13 @@ class RootView(urwid.Frame):
         header = urwid.AttrWrap(urwid.Text('♪ Cambodia ♪',
                 align = 'center', wrap = 'clip'), 'header')
         player = PlayerView(session)
-        browser = BrowseView(session)
-        self.__super.__init__(browser, header = header, footer = player)
+        self.browser = BrowseView(session)
+        self.__super.__init__(self.browser, header = header, footer = player)
+
+    def idle(self):
+        """Do background work, like loading tracks, while there's no input.
+        Returns True if the screen needs redrawing."""
+        return self.browser.idle()
 
 ################################################################################
 # Spotify session
@@ -188,10 +316,9 @@ class SpotifySession(spytify.Spytify):
 
         self.logged_in = True
 
+        # Only the names; tracks load as the playlists are looked at.
         print 'Loading playlists...'
-        self.playlists = self.session.stored_playlists
-        if not self.playlists:
-            self.playlists = []
+        self.playlists = self.session.open_stored_playlists()
 
         #print 'Searching...'
         #testlist = self.session.search('album:"SimCity 3000"')
@@ -244,6 +371,7 @@ class Manager:
                 ('tr-focus',    'black',     'light gray', 'standout'),
                 ('tr-selected', 'white',     'black',      'bold'),
                 ('tr-na',       'dark red',  'default'),
+                ('tr-loading',  'dark gray', 'default'),
                 ])
             self.ui.run_wrapper(self.run)
 
@@ -255,6 +383,8 @@ class Manager:
 
     def run(self):
         self.size = self.ui.get_cols_rows()
+        # Wake up now and then to load tracks in the background.
+        self.ui.set_input_timeouts(max_wait = 0.1)
 
         self.done = False
         while not self.done:
@@ -265,6 +395,8 @@ class Manager:
                 if keys:
                     self.handle_input(keys)
                     break;
+                if self.view.idle():
+                    break;
 
     def handle_input(self, keys):
         for k in keys:
@@ -22,7 +22,7 @@ def pkgconfig(*packages, **kw):
 
 extra_link_args = []
 libraries = []
-build = ['audio_thread.c', 'spytify.c']
+build = ['audio_thread.c', 'event_ring.c', '_spytify.c']
 if os.uname()[0] == 'Darwin':
     build.append('coreaudio.c')
     extra_link_args.extend(['-framework', 'CoreAudio'])
@@ -42,5 +42,6 @@ setup(name         = 'spytify',
       author       = 'Jørgen Pedersen Tjernø',
       author_email = 'jorgen@devsoft.no',
       license      = 'New BSD (3-clause BSD)',
-      ext_modules  = [Extension('spytify', files, **pkg)]
+      packages     = ['spytify'],
+      ext_modules  = [Extension('spytify._spytify', files, **pkg)]
      )
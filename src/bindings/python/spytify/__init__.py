@@ -0,0 +1,5 @@
+# vim: set fileencoding=utf-8 :
+# spytify - Python bindings for libdespotify
+# Copyright Jørgen P. Tjernø <jorgen@devsoft.no>
+
+from spytify._spytify import *
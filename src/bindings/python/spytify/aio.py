@@ -0,0 +1,197 @@
+# vim: set fileencoding=utf-8 :
+# spytify.aio - asyncio front-end for Spytify.
+#
+# A despotify session can only have one request outstanding, so every
+# AsyncSpytify owns a worker thread that holds the session and runs queued
+# requests back to back. The blocking despotify calls release the GIL, so
+# the event loop keeps running while a request is in flight.
+
+import threading
+
+try:
+    import asyncio
+except ImportError:
+    import trollius as asyncio
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from spytify import Spytify, SpytifyError
+
+class AsyncSpytify(object):
+    """Asynchronous version of Spytify.
+
+    Every request method returns an asyncio Future, which can be awaited
+    (or yielded from) in a coroutine running on the given event loop.
+    Requests are handed to a worker thread in the order they were made.
+    """
+    def __init__(self, user, pw, high_bitrate=True, use_cache=True,
+                 callback=None, loop=None):
+        """Create a new AsyncSpytify, and start connecting to Spotify.
+
+        Args:
+            user: Username to authenticate with
+            pw: Password to authenticate with
+            high_bitrate: Wether or not to request high bitrate data.
+            use_cache: Wether or not to use the despotify cache.
+            callback: Called on the event loop for playback events, with
+                the same arguments as the Spytify callback.
+            loop: Event loop to deliver results on, defaults to the
+                current event loop.
+        """
+        self.loop = loop or asyncio.get_event_loop()
+        self.callback = callback
+        self.session = None
+        self.event_fd = None
+        self.requests = queue.Queue()
+
+        # The connect request is queued first, so everything else waits
+        # for authentication to finish.
+        self.connected = self.request(self._connect, user, pw,
+                                      high_bitrate, use_cache)
+
+        self.thread = threading.Thread(target=self._run,
+                                       name='AsyncSpytify worker')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _connect(self, user, pw, high_bitrate, use_cache):
+        self.session = Spytify(user, pw, high_bitrate, use_cache)
+        if self.callback is not None:
+            self.loop.call_soon_threadsafe(self._watch_events)
+        return self
+
+    def _watch_events(self):
+        # Events are read on the loop as soon as the session queues them,
+        # rather than from a thread of their own.
+        self.event_fd = self.session.fileno()
+        self.loop.add_reader(self.event_fd, self._dispatch_events)
+
+    def _dispatch_events(self):
+        for signal, data in self.session.poll_events():
+            self.callback(signal, data)
+
+    def _run(self):
+        while True:
+            future, func, args = self.requests.get()
+            if func is None:
+                break
+
+            if future.cancelled():
+                continue
+
+            try:
+                result = func(*args)
+            except Exception as e:
+                self.loop.call_soon_threadsafe(_set_exception, future, e)
+            else:
+                self.loop.call_soon_threadsafe(_set_result, future, result)
+
+    def request(self, func, *args):
+        """Queue func(*args) to be run in the worker thread.
+
+        Returns:
+            Future for the return value of func.
+        """
+        future = asyncio.Future(loop=self.loop)
+        self.requests.put((future, func, args))
+        return future
+
+    def call(self, name, *args):
+        """Queue a call to the Spytify method name.
+
+        Returns:
+            Future for the return value of the method.
+        """
+        return self.request(lambda *args: getattr(self._session(), name)(*args),
+                            *args)
+
+    def _session(self):
+        if self.session is None:
+            raise SpytifyError('Not connected to Spotify')
+        return self.session
+
+    def search(self, searchtext, *args):
+        """Search for a string, see Spytify.search()."""
+        return self.call('search', searchtext, *args)
+
+    def lookup(self, uri):
+        """Look up an URI, see Spytify.lookup()."""
+        return self.call('lookup', uri)
+
+    def lookup_many(self, uris):
+        """Look up a sequence of URIs, see Spytify.lookup_many()."""
+        return self.call('lookup_many', uris)
+
+    def get_image(self, image_id):
+        """Fetch an image, see Spytify.get_image()."""
+        return self.call('get_image', image_id)
+
+    def stored_playlists(self):
+        """Fetch the stored playlists.
+
+        Returns:
+            Future for the RootList, with all playlists loaded.
+        """
+        def fetch():
+            playlists = self._session().stored_playlists
+            len(playlists)
+            return playlists
+
+        return self.request(fetch)
+
+    def album_tracks(self, album):
+        """Fetch the full album data for album.
+
+        Returns:
+            Future for the list of tracks on the album.
+        """
+        return self.request(lambda: album.tracks)
+
+    def artist_albums(self, artist):
+        """Fetch the full artist data for artist.
+
+        Returns:
+            Future for the list of albums by the artist.
+        """
+        return self.request(lambda: artist.albums)
+
+    def play(self, track):
+        """Start playback of a track, see Spytify.play()."""
+        return self.call('play', track)
+
+    def play_list(self, playlist, starting_track=None):
+        """Play a playlist, see Spytify.play_list()."""
+        return self.call('play_list', playlist, starting_track)
+
+    def stop(self):
+        """Stop playback."""
+        return self.call('stop')
+
+    def next(self):
+        """Play next song in playlist."""
+        return self.call('next')
+
+    def close(self):
+        """Close the session, after all queued requests have run.
+
+        Returns:
+            Future that is done when the session has been closed.
+        """
+        if self.event_fd is not None:
+            self.loop.remove_reader(self.event_fd)
+            self.event_fd = None
+
+        closed = self.call('close')
+        self.requests.put((None, None, None))
+        return closed
+
+def _set_result(future, result):
+    if not future.cancelled():
+        future.set_result(result)
+
+def _set_exception(future, exception):
+    if not future.cancelled():
+        future.set_exception(exception)
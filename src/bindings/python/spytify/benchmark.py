@@ -0,0 +1,265 @@
+# vim: set fileencoding=utf-8 :
+# spytify.benchmark - time despotify and spytify against a fake server.
+#
+# Starts the fake Spotify server from clients/fakeserver on a free port,
+# points the library at it through $DESPOTIFY_SERVER, with a scratch cache
+# directory, and times logging in, searching, loading a big playlist from
+# the server and from the cache, creating the Track objects of the
+# playlist, and decoding a track. Needs no network access nor account.
+#
+# Results are written as JSON. Given a baseline from an earlier run, the
+# exit status tells whether any median got slower by more than the
+# tolerance.
+#
+# Usage: python -m spytify.benchmark -s SERVER [-n TRACKS] [-o FILE]
+#            [--baseline FILE]
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+USER = 'bench'
+PASSWORD = 'bench'
+
+def _summary(samples, unit='s'):
+    ordered = sorted(samples)
+    n = len(ordered)
+    if n % 2:
+        median = ordered[n // 2]
+    else:
+        median = (ordered[n // 2 - 1] + ordered[n // 2]) / 2.0
+
+    return {'unit': unit, 'samples': samples, 'min': ordered[0],
+            'median': median, 'mean': sum(ordered) / float(n),
+            'max': ordered[-1]}
+
+def _timed(function, *args):
+    started = timeit.default_timer()
+    result = function(*args)
+    return timeit.default_timer() - started, result
+
+class FakeServer(object):
+    """A running clients/fakeserver process.
+
+    Args:
+        path: Path of the fakeserver binary.
+        playlist_tracks: Number of tracks on the stored playlist.
+        search_hits: Number of tracks a search finds.
+        seconds: Length of every track.
+        delay: Milliseconds the server waits before every reply, to
+            stand in for the network.
+    """
+    def __init__(self, path, playlist_tracks=10000, search_hits=100,
+                 seconds=30, delay=0):
+        self.process = subprocess.Popen(
+            [path, '-P', PASSWORD, '-p', str(playlist_tracks),
+             '-s', str(search_hits), '-t', str(seconds), '-d', str(delay)],
+            stdout=subprocess.PIPE)
+        line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError('%s did not start' % path)
+
+        self.address = '127.0.0.1:%d' % int(line)
+
+    def close(self):
+        self.process.terminate()
+        self.process.wait()
+
+def _login(high_bitrate=True, use_cache=True):
+    from spytify import Spytify
+    return Spytify(USER, PASSWORD, high_bitrate, use_cache)
+
+def _load_playlist(session):
+    session.flush_stored_playlists()
+    return session.stored_playlists[0]
+
+def _decode(session, track):
+    stream = session.pcm_stream(track)
+    size = 0
+    try:
+        for chunk in stream:
+            size += len(chunk)
+    finally:
+        stream.close()
+
+    return size, stream.samplerate, stream.channels
+
+def run(server, repeat=5):
+    """Run the benchmarks.
+
+    The cache directory is set up when the first session of the process is
+    created, so run this before any other session is, and only once per
+    process.
+
+    Args:
+        server: Running FakeServer.
+        repeat: Number of times to run each benchmark, at least 2.
+    Returns:
+        Dict of results, with for each benchmark its 'samples' and their
+        'min', 'median', 'mean' and 'max', in seconds unless 'unit' says
+        otherwise.
+    """
+    from spytify import clear_disk_cache, disk_cache_stats
+    from spytify import stats as stats_module
+
+    os.environ['DESPOTIFY_SERVER'] = server.address
+    results = {}
+
+    # login
+    samples = []
+    for i in range(repeat):
+        seconds, session = _timed(_login)
+        samples.append(seconds)
+        session.close()
+    results['login'] = _summary(samples)
+
+    session = _login()
+    try:
+        # search
+        samples = []
+        for i in range(repeat):
+            seconds, found = _timed(session.search, 'bench %d' % i)
+            samples.append(seconds)
+        results['search'] = _summary(samples)
+
+        # the playlist from the server once, and then from the cache
+        clear_disk_cache()
+        cold = []
+        hot = []
+        for i in range(repeat):
+            seconds, playlist = _timed(_load_playlist, session)
+            if i == 0:
+                cold.append(seconds)
+            else:
+                hot.append(seconds)
+        results['playlist_load'] = _summary(cold)
+        results['playlist_load_cached'] = _summary(hot)
+        tracks = len(playlist.tracks)
+
+        # creating the wrappers, on a fresh playlist every time
+        samples = []
+        table_samples = []
+        for i in range(repeat):
+            playlist = _load_playlist(session)
+            seconds, items = _timed(list, playlist.tracks)
+            samples.append(seconds)
+            seconds, table = _timed(playlist.to_table)
+            table_samples.append(seconds)
+        results['materialize_tracks'] = _summary(samples)
+        results['materialize_table'] = _summary(table_samples)
+
+        # decoding
+        samples = []
+        throughput = []
+        for i in range(repeat):
+            seconds, (size, samplerate, channels) = \
+                _timed(_decode, session, items[i % len(items)])
+            samples.append(seconds)
+            throughput.append(size / max(seconds, 1e-9) / (1024 * 1024))
+        results['pcm_decode'] = _summary(samples)
+        results['pcm_decode_throughput'] = _summary(throughput, 'MB/s')
+        audio = size / float(samplerate * channels * 2)
+
+        stats = json.loads(stats_module.to_json(session.stats()))
+    finally:
+        session.close()
+
+    return {'results': results,
+            'stats': stats,
+            'disk_cache': disk_cache_stats(),
+            'config': {'repeat': repeat, 'playlist_tracks': tracks,
+                       'track_seconds': audio},
+            'time': time.time(),
+            'python': platform.python_version(),
+            'platform': platform.platform()}
+
+def compare(report, baseline, tolerance=0.2):
+    """Returns the benchmarks whose median got worse than in baseline.
+
+    Args:
+        report: Dict from run().
+        baseline: Dict from an earlier run().
+        tolerance: Fraction by which a median may get worse.
+    Returns:
+        List of (name, baseline median, median) tuples.
+    """
+    worse = []
+    for name, result in sorted(report['results'].items()):
+        old = baseline['results'].get(name)
+        if old is None or not old['median']:
+            continue
+
+        # throughputs get worse by going down, times by going up
+        if result['unit'] == 's':
+            change = result['median'] / old['median'] - 1
+        else:
+            change = old['median'] / max(result['median'], 1e-9) - 1
+
+        if change > tolerance:
+            worse.append((name, old['median'], result['median']))
+
+    return worse
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m spytify.benchmark',
+        description='Benchmark despotify and spytify against a fake '
+                    'Spotify server.')
+    parser.add_argument('-s', '--server', required=True,
+                        help='path to the clients/fakeserver binary')
+    parser.add_argument('-n', '--tracks', type=int, default=10000,
+                        help='tracks on the playlist (default 10000)')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='runs of each benchmark (default 5)')
+    parser.add_argument('-t', '--seconds', type=int, default=30,
+                        help='length of the tracks (default 30)')
+    parser.add_argument('-d', '--delay', type=int, default=0,
+                        help='milliseconds the server waits before every '
+                             'reply (default 0)')
+    parser.add_argument('-o', '--output',
+                        help='file to write the results to, default stdout')
+    parser.add_argument('--baseline',
+                        help='results of an earlier run to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='fraction by which a median may get worse '
+                             'than in the baseline (default 0.2)')
+    args = parser.parse_args(argv)
+
+    cache = tempfile.mkdtemp(prefix='spytify-benchmark-')
+    os.environ['XDG_CACHE_HOME'] = cache
+    server = FakeServer(args.server, args.tracks, seconds=args.seconds,
+                        delay=args.delay)
+    try:
+        report = run(server, max(args.repeat, 2))
+    finally:
+        server.close()
+        shutil.rmtree(cache, True)
+
+    report['config'].update({'delay': args.delay})
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        out = open(args.output, 'w')
+        out.write(output + '\n')
+        out.close()
+    else:
+        sys.stdout.write(output + '\n')
+
+    if args.baseline:
+        baseline = json.load(open(args.baseline))
+        worse = compare(report, baseline, args.tolerance)
+        for name, old, new in worse:
+            sys.stderr.write('%s: %.4g -> %.4g\n' % (name, old, new))
+        if worse:
+            return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
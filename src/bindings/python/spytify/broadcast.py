@@ -0,0 +1,492 @@
+# vim: set fileencoding=utf-8 :
+# spytify.broadcast - stream playlists to many HTTP listeners at once.
+#
+# Every channel decodes its playlist once, in a thread with a session of
+# its own, at the pace it plays at. The audio goes into a ring shared by
+# all listeners of the channel; each listener only has a cursor into it.
+# A listener that can't keep up falls off the end of the ring and is
+# dropped, so it never holds up the channel or the other listeners.
+#
+# Listeners get a WAV stream of unknown length, at
+# http://HOST:PORT/<channel>; http://HOST:PORT/ lists the channels and
+# their listeners as JSON.
+#
+# Usage: python -m spytify.broadcast -u USER [-l HOST] [-P PORT]
+#            NAME[=PLAYLIST_ID]...
+#        python -m spytify.broadcast -s FAKESERVER NAME...
+
+import argparse
+import collections
+import getpass
+import json
+import math
+import struct
+import sys
+import threading
+import time
+
+try:
+    import asyncio
+except ImportError:
+    import trollius as asyncio
+
+from spytify import Spytify, SpytifyError
+
+# Bytes of PCM decoded at a time.
+CHUNK_SIZE = 64 * 1024
+
+class Ring(object):
+    """The last capacity bytes of audio of a channel.
+
+    Positions count the bytes written since the channel started. Chunks
+    are kept as they are, so listeners share them instead of copies.
+    """
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.chunks = collections.deque()
+        self.start = 0
+        self.end = 0
+
+    def append(self, data):
+        self.chunks.append((self.end, data))
+        self.end += len(data)
+        while self.end - self.start > self.capacity and len(self.chunks) > 1:
+            position, old = self.chunks.popleft()
+            self.start = position + len(old)
+
+    def read(self, cursor):
+        """Returns the data from cursor on, as a list of buffers, or None if
+        it has been overwritten already."""
+        if cursor < self.start:
+            return None
+
+        found = []
+        for position, data in reversed(self.chunks):
+            if position + len(data) <= cursor:
+                break
+            if position < cursor:
+                data = memoryview(data)[cursor - position:]
+            found.append(data)
+
+        found.reverse()
+        return found
+
+class Channel(object):
+    """A stream of audio shared by many listeners.
+
+    Args:
+        name: Name of the channel, the path listeners ask for.
+        source: Called in the decoding thread, returns an iterable of
+            (samplerate, channels, data) with data signed 16 bit little
+            endian PCM, like playlist_source().
+        loop: Event loop the listeners are served on.
+        seconds: Audio kept for listeners that fall behind.
+        lead: Seconds the decoder may run ahead of real time.
+    """
+    def __init__(self, name, source, loop, seconds=10, lead=2.0):
+        self.name = name
+        self.source = source
+        self.loop = loop
+        self.seconds = seconds
+        self.lead = lead
+        self.format = None
+        self.ring = Ring(seconds * 44100 * 4)
+        self.listeners = set()
+        self.dropped = 0
+        self.sent = 0
+        self.error = None
+        self.thread = None
+        self.stopped = threading.Event()
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run,
+                                       name='Broadcast %s' % self.name)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self, timeout=None):
+        """Stop decoding, and wait for the decoding thread to finish.
+
+        Args:
+            timeout: Seconds to wait at most, None to wait for as long as
+                it takes.
+        Returns: True if the thread has finished.
+        """
+        self.stopped.set()
+        if self.thread is None:
+            return True
+
+        self.thread.join(timeout)
+        return not self.thread.is_alive()
+
+    def _run(self):
+        started = None
+        position = 0
+        chunks = None
+        try:
+            chunks = iter(self.source())
+            for samplerate, channels, data in chunks:
+                if self.stopped.is_set():
+                    break
+
+                if started is None:
+                    started = time.time()
+                    self.loop.call_soon_threadsafe(self._set_format,
+                                                   samplerate, channels)
+                    bytes_per_second = float(samplerate * channels * 2)
+
+                self.loop.call_soon_threadsafe(self._publish, data)
+
+                # Keep to the pace of playback.
+                position += len(data)
+                ahead = position / bytes_per_second - (time.time() - started)
+                if ahead > self.lead:
+                    self.stopped.wait(ahead - self.lead)
+        except Exception as e:
+            self.error = e
+        finally:
+            # Let the source clean up, like closing its PCMStream, in this
+            # thread rather than whenever the generator is collected.
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    self.error = self.error or e
+
+    def _set_format(self, samplerate, channels):
+        self.format = (samplerate, channels)
+        self.ring.capacity = self.seconds * samplerate * channels * 2
+        for listener in list(self.listeners):
+            listener.pump()
+
+    def _publish(self, data):
+        self.ring.append(data)
+        for listener in list(self.listeners):
+            # A backed up listener isn't pumped, so check here whether the
+            # ring has left it behind.
+            if listener.cursor < self.ring.start:
+                listener.drop()
+            else:
+                listener.pump()
+
+    def subscribe(self, listener):
+        # Join live, at the newest audio.
+        listener.cursor = self.ring.end
+        self.listeners.add(listener)
+        listener.pump()
+
+    def unsubscribe(self, listener):
+        self.listeners.discard(listener)
+
+    def wav_header(self):
+        samplerate, channels = self.format
+        # Lengths are unknown, so as big as they go.
+        return (b'RIFF' + struct.pack('<I', 0xffffffff) + b'WAVE' +
+                b'fmt ' + struct.pack('<IHHIIHH', 16, 1, channels, samplerate,
+                                      samplerate * channels * 2,
+                                      channels * 2, 16) +
+                b'data' + struct.pack('<I', 0xffffffff - 36))
+
+    def stats(self):
+        return {'listeners': len(self.listeners),
+                'dropped': self.dropped,
+                'bytes_sent': self.sent,
+                'format': self.format,
+                'error': self.error and str(self.error)}
+
+class Listener(asyncio.Protocol):
+    """An HTTP client of the server."""
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.request = b''
+        self.channel = None
+        self.cursor = 0
+        self.header_sent = False
+        self.paused = False
+
+    def connection_made(self, transport):
+        self.transport = transport
+        transport.set_write_buffer_limits(high=self.server.write_buffer)
+
+    def data_received(self, data):
+        if self.channel is not None:
+            return
+
+        self.request += data
+        if b'\r\n\r\n' not in self.request and b'\n\n' not in self.request:
+            if len(self.request) > 8192:
+                self.respond('400 Bad Request')
+            return
+
+        parts = self.request.split(b'\n', 1)[0].split()
+        if len(parts) < 2 or parts[0] != b'GET':
+            self.respond('400 Bad Request')
+            return
+
+        name = parts[1].decode('utf-8', 'replace').strip('/')
+        if not name:
+            self.respond('200 OK', 'application/json',
+                         json.dumps(self.server.stats()).encode('utf-8'))
+            return
+
+        channel = self.server.channels.get(name)
+        if channel is None:
+            self.respond('404 Not Found')
+            return
+
+        self.transport.write(b'HTTP/1.0 200 OK\r\n'
+                             b'Content-Type: audio/wav\r\n'
+                             b'Cache-Control: no-cache\r\n\r\n')
+        self.channel = channel
+        channel.subscribe(self)
+
+    def respond(self, status, content_type='text/plain', body=None):
+        if body is None:
+            body = status.encode('utf-8') + b'\n'
+        self.transport.write(('HTTP/1.0 %s\r\nContent-Type: %s\r\n'
+                              'Content-Length: %d\r\n\r\n' %
+                              (status, content_type, len(body)))
+                             .encode('utf-8') + body)
+        self.transport.close()
+
+    def pump(self):
+        """Send what the listener hasn't got yet, unless its connection is
+        backed up."""
+        if self.paused or self.channel.format is None:
+            return
+
+        if not self.header_sent:
+            self.transport.write(self.channel.wav_header())
+            self.header_sent = True
+
+        chunks = self.channel.ring.read(self.cursor)
+        if chunks is None:
+            self.drop()
+            return
+
+        for data in chunks:
+            self.transport.write(data)
+            self.cursor += len(data)
+            self.channel.sent += len(data)
+
+    def drop(self):
+        self.channel.dropped += 1
+        self.channel.unsubscribe(self)
+        self.transport.abort()
+
+    def pause_writing(self):
+        self.paused = True
+
+    def resume_writing(self):
+        self.paused = False
+        if self.channel is not None:
+            self.pump()
+
+    def connection_lost(self, exc):
+        if self.channel is not None:
+            self.channel.unsubscribe(self)
+
+class BroadcastServer(object):
+    """HTTP server for a set of channels.
+
+    Args:
+        loop: Event loop to serve on, defaults to the current event loop.
+        write_buffer: Bytes buffered for a listener before its connection
+            counts as backed up. It is then dropped if it falls out of the
+            ring before the buffer drains.
+    """
+    def __init__(self, loop=None, write_buffer=256 * 1024):
+        self.loop = loop or asyncio.get_event_loop()
+        self.write_buffer = write_buffer
+        self.channels = {}
+        self.server = None
+
+    def add_channel(self, name, source, seconds=10, lead=2.0):
+        """Add a channel and start decoding it.
+
+        Args:
+            name: Name of the channel.
+            source: See Channel.
+            seconds: Audio kept for listeners that fall behind.
+            lead: Seconds the decoder may run ahead of real time.
+        Returns:
+            The Channel.
+        """
+        channel = Channel(name, source, self.loop, seconds, lead)
+        self.channels[name] = channel
+        channel.start()
+        return channel
+
+    def start(self, host='127.0.0.1', port=8000):
+        """Start listening.
+
+        Returns:
+            Future for the asyncio Server, whose sockets tell the port
+            when 0 was asked for.
+        """
+        def started(server):
+            self.server = server
+            return server
+
+        future = asyncio.ensure_future(
+            self.loop.create_server(lambda: Listener(self), host, port),
+            loop=self.loop)
+        future.add_done_callback(lambda f: f.exception() or
+                                 started(f.result()))
+        return future
+
+    def stats(self):
+        return dict((name, channel.stats())
+                    for name, channel in self.channels.items())
+
+    def close(self, timeout=15):
+        """Stop the channels and the server.
+
+        The sessions the channels decode with are only safe to close once
+        this returns True.
+
+        Args:
+            timeout: Seconds to wait at most for the decoding threads.
+        Returns: True if every decoding thread has finished.
+        """
+        deadline = time.time() + timeout
+        for channel in self.channels.values():
+            channel.stopped.set()
+
+        finished = True
+        for channel in self.channels.values():
+            if not channel.stop(max(0, deadline - time.time())):
+                finished = False
+            for listener in list(channel.listeners):
+                listener.transport.close()
+        if self.server is not None:
+            self.server.close()
+
+        return finished
+
+def playlist_source(session, playlist, repeat=True):
+    """Returns a source decoding the tracks of a playlist, over and over.
+
+    Args:
+        session: Spytify session to decode with, used by no one else.
+        playlist: Playlist to play.
+        repeat: Start again after the last track.
+    """
+    def source():
+        while True:
+            played = False
+            for track in playlist.iter_tracks():
+                if not track.is_playable():
+                    continue
+
+                stream = session.pcm_stream(track, buffer_size=CHUNK_SIZE)
+                try:
+                    for chunk in stream:
+                        played = True
+                        yield stream.samplerate, stream.channels, chunk.tobytes()
+                finally:
+                    stream.close()
+
+            if not repeat or not played:
+                break
+
+    return source
+
+def tone_source(frequency=440.0, samplerate=44100, channels=2):
+    """Returns a source of an endless sine tone, to stand in for a
+    playlist."""
+    frames = CHUNK_SIZE // (channels * 2)
+    period = int(round(samplerate / frequency))
+    samples = [int(8000 * math.sin(2 * math.pi * i / period))
+               for i in range(period)]
+    chunk = b''.join(struct.pack('<%dh' % channels,
+                                 *([samples[i % period]] * channels))
+                     for i in range(frames - frames % period))
+
+    def source():
+        while True:
+            yield samplerate, channels, chunk
+
+    return source
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m spytify.broadcast',
+        description='Stream Spotify playlists to many HTTP listeners.')
+    parser.add_argument('channels', metavar='NAME[=PLAYLIST_ID]', nargs='+',
+                        help='channel and the id of its playlist, the first '
+                             'stored playlist if left out, or "tone" for a '
+                             'test tone')
+    parser.add_argument('-u', '--user')
+    parser.add_argument('-p', '--password',
+                        help='asked for if not given')
+    parser.add_argument('-s', '--server',
+                        help='run against clients/fakeserver at this path '
+                             'instead of Spotify')
+    parser.add_argument('-l', '--listen', default='127.0.0.1',
+                        help='address to listen on (default 127.0.0.1)')
+    parser.add_argument('-P', '--port', type=int, default=8000,
+                        help='port to listen on (default 8000)')
+    parser.add_argument('--seconds', type=int, default=10,
+                        help='audio kept for slow listeners (default 10)')
+    args = parser.parse_args(argv)
+
+    fake = None
+    if args.server:
+        import os
+        from spytify import benchmark
+        fake = benchmark.FakeServer(args.server, playlist_tracks=20)
+        os.environ['DESPOTIFY_SERVER'] = fake.address
+        user, pw = benchmark.USER, benchmark.PASSWORD
+    elif args.user:
+        user = args.user
+        pw = args.password or getpass.getpass('Enter your password: ')
+    elif [c for c in args.channels if c.partition('=')[2] != 'tone']:
+        parser.error('-u or -s is needed for playlist channels')
+
+    loop = asyncio.get_event_loop()
+    server = BroadcastServer(loop)
+    sessions = []
+    try:
+        for spec in args.channels:
+            name, _, playlist_id = spec.partition('=')
+            if playlist_id == 'tone':
+                source = tone_source()
+            else:
+                session = Spytify(user, pw, audio=False)
+                sessions.append(session)
+                if playlist_id:
+                    playlist = session.open_playlist(playlist_id.encode('ascii'))
+                else:
+                    playlist = session.open_stored_playlists()[0]
+                source = playlist_source(session, playlist)
+            server.add_channel(name, source, args.seconds)
+
+        listening = loop.run_until_complete(server.start(args.listen,
+                                                         args.port))
+        for sock in listening.sockets:
+            sys.stderr.write('Listening on http://%s:%d/\n' %
+                             sock.getsockname()[:2])
+        loop.run_forever()
+    except SpytifyError as e:
+        sys.stderr.write('Error: %s\n' % e)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server.close():
+            for session in sessions:
+                session.close()
+        else:
+            # A channel is still decoding with its session; it goes when
+            # the process exits.
+            sys.stderr.write('Some channels did not stop\n')
+        if fake is not None:
+            fake.close()
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
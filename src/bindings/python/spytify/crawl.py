@@ -0,0 +1,556 @@
+# vim: set fileencoding=utf-8 :
+# spytify.crawl - breadth-first crawl of the catalogue through browse requests.
+#
+# Starting from seed URIs, the crawler browses artists, which come with
+# their albums and the tracks on them, and queues the artists on those
+# tracks, a level at a time. Seeds can be artists, albums, tracks, or
+# searches (spotify:search:<text>). Every page is browsed at most once:
+# the frontier remembers the ids it has queued, and albums that came with
+# an artist are not browsed again.
+#
+# Browse requests run on several threads, spread over one or more sessions.
+# Each page is written as soon as it is done, as a line of JSON per artist,
+# album, track or search:
+#
+#   {"type": "artist", "id": ..., "depth": 0, "name": ..., "genres": ...,
+#    "popularity": ..., "albums": [album id, ...]}
+#   {"type": "album", "id": ..., "depth": 0, "name": ..., "year": ...,
+#    "popularity": ..., "tracks": [[id, title, length, [artist id, ...]], ...]}
+#   {"type": "track", "id": ..., "depth": 0, "title": ..., "length": ...,
+#    "album_id": ..., "artists": [artist id, ...]}
+#   {"type": "search", "id": <text>, "depth": 0, "tracks": [track id, ...]}
+#
+# Ids are 32 character hex ids. A checkpoint file holds the frontier and the
+# length of the output it goes with, so an interrupted crawl picks up where
+# the checkpoint left it.
+#
+# Usage: python -m spytify.crawl [-u USER | -s SERVER] [-n SESSIONS]
+#            [-w WORKERS] [-d DEPTH] [-m PAGES] [-o FILE] [-c CHECKPOINT]
+#            SEED...
+
+import argparse
+import collections
+import getpass
+import json
+import os
+import sys
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from spytify import SpotifyId, SpytifyError
+
+CHECKPOINT_VERSION = 1
+KINDS = ('artist', 'album', 'track', 'search')
+
+def _text(value):
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'replace')
+    return value
+
+def _bytes(value):
+    if isinstance(value, bytes):
+        return value
+    return value.encode('utf-8')
+
+def _uri(kind, id):
+    return str('spotify:%s:%s' % (kind, _text(SpotifyId(_bytes(id)).base62)))
+
+def parse_seed(uri):
+    """Returns the (kind, id) of a seed URI.
+
+    Args:
+        uri: URI like spotify:artist:<base 62 id>, or its last two parts.
+            Searches are given as spotify:search:<text>.
+    Raises:
+        ValueError: If uri isn't a seed the crawler can start from.
+    """
+    parts = _text(uri).split(':', 2)
+    if parts[0] == 'spotify':
+        parts = parts[1:]
+    if len(parts) < 2 or parts[0] not in KINDS:
+        raise ValueError('Invalid seed: %s' % uri)
+
+    kind, value = parts[0], ':'.join(parts[1:])
+    if kind == 'search':
+        return kind, value
+
+    return kind, _text(SpotifyId(_bytes(value)).hex)
+
+class Frontier(object):
+    """Pages left to crawl, oldest first, and the pages already queued.
+
+    Args:
+        max_size: Most pages to hold. Pages pushed while it is full are
+            dropped and counted, and may be pushed again later.
+    """
+    def __init__(self, max_size=100000):
+        self.pending = collections.deque()
+        self.seen = set()
+        self.max_size = max_size
+        self.dropped = 0
+
+    def push(self, kind, id, depth):
+        """Queue a page, unless it was queued before.
+
+        Returns: True if the page was queued.
+        """
+        key = (kind, id)
+        if key in self.seen:
+            return False
+        if len(self.pending) >= self.max_size:
+            self.dropped += 1
+            return False
+
+        self.seen.add(key)
+        self.pending.append((depth, kind, id))
+        return True
+
+    def mark(self, kind, id):
+        """Remember a page that was crawled as part of another one.
+
+        Returns: False if the page was queued or marked before.
+        """
+        key = (kind, id)
+        if key in self.seen:
+            return False
+
+        self.seen.add(key)
+        return True
+
+    def pop(self):
+        """Returns the oldest (depth, kind, id), or None if there is none."""
+        if not self.pending:
+            return None
+        return self.pending.popleft()
+
+    def __len__(self):
+        return len(self.pending)
+
+class _SessionQueue(object):
+    """Runs requests on a list of sessions, one request per session."""
+    def __init__(self, sessions):
+        self.size = len(sessions)
+        self.idle = queue.Queue()
+        for session in sessions:
+            self.idle.put(session)
+
+    def run(self, func, *args):
+        session = self.idle.get()
+        try:
+            return func(session, *args)
+        finally:
+            self.idle.put(session)
+
+def _track_row(track):
+    return [_text(track.track_id), _text(track.title), track.length,
+            [_text(artist.id) for artist in track.artists]]
+
+def _album_record(album):
+    return {'type': 'album', 'id': _text(album.id), 'name': _text(album.name),
+            'year': album.year, 'popularity': album.popularity,
+            'tracks': [_track_row(track) for track in album.tracks]}
+
+def _links(tracks, albums=False):
+    links = []
+    for track in tracks:
+        for artist in track[3]:
+            links.append(('artist', artist))
+        if albums and len(track) > 4:
+            links.append(('album', track[4]))
+    return links
+
+def _fetch_artist(session, id):
+    artist = session.lookup(_uri('artist', id))
+    albums = [_album_record(album) for album in artist.albums]
+    record = {'type': 'artist', 'id': id, 'name': _text(artist.name),
+              'genres': _text(artist.genres),
+              'popularity': artist.popularity,
+              'albums': [album['id'] for album in albums]}
+
+    links = []
+    for album in albums:
+        links.extend(_links(album['tracks']))
+    return [record] + albums, links
+
+def _fetch_album(session, id):
+    record = _album_record(session.lookup(_uri('album', id)))
+    record['id'] = id
+    return [record], _links(record['tracks'])
+
+def _fetch_track(session, id):
+    track = session.lookup(_uri('track', id))
+    if track is None or not track.has_meta_data():
+        return None
+
+    row = _track_row(track) + [_text(track.album_id)]
+    record = {'type': 'track', 'id': id, 'title': row[1], 'length': row[2],
+              'artists': row[3], 'album_id': row[4]}
+    return [record], _links([row], albums=True)
+
+def _fetch_search(session, query):
+    result = session.search(_bytes(query))
+    if result is None:
+        raise SpytifyError('Search for %s failed' % query)
+
+    rows = [_track_row(track) + [_text(track.album_id)]
+            for track in result.playlist.tracks]
+    record = {'type': 'search', 'id': query,
+              'tracks': [row[0] for row in rows]}
+    return [record], _links(rows, albums=True)
+
+_FETCH = {'artist': _fetch_artist, 'album': _fetch_album,
+          'track': _fetch_track, 'search': _fetch_search}
+
+class Crawler(object):
+    """Breadth-first crawler over artist and album browses.
+
+    Pages are fetched by worker threads. Each worker takes the oldest page
+    of the frontier, browses it on an idle session, writes its records and
+    queues the pages it links to, one level deeper.
+
+    Args:
+        sessions: SpytifyPool, or a list of Spytify sessions. A session
+            runs one request at a time.
+        output: File opened for writing in binary mode, which records are
+            appended to.
+        workers: Number of requests in flight, by default one per session.
+        max_depth: Pages further than this many links from a seed are not
+            crawled.
+        max_pages: Stop after browsing this many pages in this run, None
+            for no limit.
+        max_frontier: Most pages to hold in the frontier, see Frontier.
+        checkpoint: File to save the frontier to, every
+            checkpoint_interval pages and when the crawl ends.
+        checkpoint_interval: Pages between two checkpoints.
+    """
+    def __init__(self, sessions, output, workers=None, max_depth=2,
+                 max_pages=None, max_frontier=100000, checkpoint=None,
+                 checkpoint_interval=100):
+        if not hasattr(sessions, 'run'):
+            sessions = _SessionQueue(list(sessions))
+
+        self.sessions = sessions
+        self.output = output
+        self.workers = workers or sessions.size
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+
+        self.frontier = Frontier(max_frontier)
+        self.in_flight = []
+        self.failed = []
+        self.cond = threading.Condition()
+        self.threads = []
+        self.stopped = False
+        self.error = None
+
+        self.pages = 0
+        self.missing = 0
+        self.records = 0
+        self.started = 0
+        self.since_checkpoint = 0
+        self.start_time = None
+
+    def add_seed(self, uri):
+        """Queue a seed URI, see parse_seed()."""
+        kind, id = parse_seed(uri)
+        with self.cond:
+            self.frontier.push(kind, id, 0)
+            self.cond.notify_all()
+
+    def resume(self):
+        """Continue the crawl saved in the checkpoint file, if there is one.
+
+        The output is cut back to the records written when the checkpoint
+        was saved. Pages that were in flight then, or had failed, are
+        crawled again.
+
+        Returns: True if a checkpoint was loaded.
+        """
+        try:
+            with open(self.checkpoint) as f:
+                state = json.load(f)
+        except IOError:
+            return False
+
+        if state.get('version') != CHECKPOINT_VERSION:
+            raise ValueError('%s is not a crawl checkpoint' % self.checkpoint)
+
+        with self.cond:
+            frontier = self.frontier
+            frontier.seen = set((kind, id) for kind, id in state['seen'])
+            frontier.pending = collections.deque(
+                (depth, kind, id) for depth, kind, id in state['pending'])
+            frontier.dropped = state['dropped']
+            self.records = state['records']
+
+        self.output.flush()
+        self.output.truncate(state['output_bytes'])
+        return True
+
+    def stats(self):
+        """Returns a dict with the progress of the crawl.
+
+        pages counts the pages browsed in this run, pages_per_second their
+        rate since it started.
+        """
+        with self.cond:
+            elapsed = time.time() - self.start_time if self.start_time else 0
+            return {'pages': self.pages, 'records': self.records,
+                    'errors': len(self.failed), 'missing': self.missing,
+                    'dropped': self.frontier.dropped,
+                    'pending': len(self.frontier),
+                    'in_flight': len(self.in_flight),
+                    'seen': len(self.frontier.seen), 'elapsed': elapsed,
+                    'pages_per_second': self.pages / elapsed if elapsed else 0}
+
+    def start(self):
+        """Start the worker threads."""
+        self.start_time = time.time()
+        self.threads = [threading.Thread(target=self._work,
+                                         name='Spytify crawl')
+                        for i in range(self.workers)]
+        for thread in self.threads:
+            thread.daemon = True
+            thread.start()
+
+    def stop(self):
+        """Stop taking pages from the frontier.
+
+        Pages in flight are finished; join() waits for them.
+        """
+        with self.cond:
+            self.stopped = True
+            self.cond.notify_all()
+
+    def join(self, timeout=None):
+        """Wait for the workers to finish.
+
+        Returns: True if they have, False if timeout ran out first.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        for thread in self.threads:
+            thread.join(None if deadline is None
+                        else max(0, deadline - time.time()))
+            if thread.is_alive():
+                return False
+
+        return True
+
+    def run(self, report=None, interval=5.0):
+        """Crawl until the frontier is empty or a budget runs out.
+
+        A KeyboardInterrupt stops the crawl, and is raised again once the
+        pages in flight are done and the checkpoint is saved. So is an error
+        writing the output or the checkpoint.
+
+        Args:
+            report: Called with stats() every interval seconds.
+            interval: Seconds between two reports.
+        Returns: stats() at the end of the crawl.
+        """
+        self.start()
+        try:
+            while not self.join(interval):
+                if report is not None:
+                    report(self.stats())
+        except KeyboardInterrupt:
+            self.stop()
+            self.join()
+            raise
+        finally:
+            with self.cond:
+                self._save_checkpoint()
+
+        if self.error is not None:
+            raise self.error
+        return self.stats()
+
+    def _done(self):
+        return self.stopped or (self.max_pages is not None and
+                                self.started >= self.max_pages)
+
+    def _work(self):
+        while True:
+            with self.cond:
+                while not self.frontier and self.in_flight and \
+                      not self._done():
+                    self.cond.wait()
+                if self._done() or not self.frontier:
+                    self.cond.notify_all()
+                    return
+
+                page = self.frontier.pop()
+                self.in_flight.append(page)
+                self.started += 1
+
+            depth, kind, id = page
+            result = error = None
+            try:
+                result = self.sessions.run(_FETCH[kind], id)
+            except Exception as e:
+                # Not only SpytifyError: a malformed result or a socket
+                # error must not end the worker with its page in flight.
+                error = '%s: %s' % (type(e).__name__, e)
+
+            with self.cond:
+                try:
+                    self.in_flight.remove(page)
+                    self.pages += 1
+                    if error is not None:
+                        self.failed.append((page, error))
+                    elif result is None:
+                        self.missing += 1
+                    else:
+                        self._store(depth, *result)
+
+                    self.since_checkpoint += 1
+                    if self.since_checkpoint >= self.checkpoint_interval:
+                        self._save_checkpoint()
+                except Exception as e:
+                    # Writing the output or the checkpoint failed; stop,
+                    # and have run() raise it.
+                    self.error = e
+                    self.stopped = True
+                finally:
+                    self.cond.notify_all()
+
+    def _store(self, depth, records, links):
+        lines = []
+        for i, record in enumerate(records):
+            # Albums that came with an artist may have been crawled already.
+            if i and not self.frontier.mark(record['type'], record['id']):
+                continue
+
+            record['depth'] = depth
+            lines.append(json.dumps(record, separators=(',', ':')))
+
+        if lines:
+            self.output.write(('\n'.join(lines) + '\n').encode('ascii'))
+            self.records += len(lines)
+
+        if depth < self.max_depth:
+            for kind, id in links:
+                if id:
+                    self.frontier.push(kind, id, depth + 1)
+
+    def _save_checkpoint(self):
+        """Save the frontier, with the lock held."""
+        self.since_checkpoint = 0
+        if self.checkpoint is None:
+            return
+
+        # Pages in flight or failed have no records in the output yet.
+        pending = [list(page) for page in self.in_flight]
+        pending.extend(list(page) for page, error in self.failed)
+        pending.extend(list(page) for page in self.frontier.pending)
+
+        self.output.flush()
+        state = {'version': CHECKPOINT_VERSION,
+                 'output_bytes': self.output.tell(),
+                 'records': self.records,
+                 'dropped': self.frontier.dropped,
+                 'seen': [list(key) for key in self.frontier.seen],
+                 'pending': pending}
+
+        temp = '%s.tmp' % self.checkpoint
+        with open(temp, 'w') as f:
+            json.dump(state, f, separators=(',', ':'))
+        os.rename(temp, self.checkpoint)
+
+def _report(stats):
+    sys.stderr.write('%(pages)d pages, %(pages_per_second).1f pages/s, '
+                     '%(records)d records, %(pending)d pending, '
+                     '%(errors)d errors\n' % stats)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m spytify.crawl',
+        description='Crawl the Spotify catalogue from seed URIs.')
+    parser.add_argument('seeds', metavar='SEED', nargs='*',
+                        help='spotify:artist:..., spotify:album:..., '
+                             'spotify:track:... or spotify:search:TEXT')
+    parser.add_argument('-u', '--user')
+    parser.add_argument('-p', '--password',
+                        help='asked for if not given')
+    parser.add_argument('-s', '--server',
+                        help='run against clients/fakeserver at this path '
+                             'instead of Spotify')
+    parser.add_argument('-n', '--sessions', type=int, default=2,
+                        help='sessions to open (default 2)')
+    parser.add_argument('-w', '--workers', type=int,
+                        help='requests in flight (default one per session)')
+    parser.add_argument('-d', '--depth', type=int, default=2,
+                        help='links to follow from the seeds (default 2)')
+    parser.add_argument('-m', '--max-pages', type=int,
+                        help='pages to browse in this run')
+    parser.add_argument('--max-frontier', type=int, default=100000,
+                        help='pages to hold in the frontier (default 100000)')
+    parser.add_argument('-o', '--output',
+                        help='file to append records to (default stdout)')
+    parser.add_argument('-c', '--checkpoint',
+                        help='file to save the frontier to; the crawl '
+                             'resumes from it if it exists')
+    parser.add_argument('--interval', type=float, default=5.0,
+                        help='seconds between progress reports (default 5)')
+    args = parser.parse_args(argv)
+
+    if args.checkpoint and not args.output:
+        parser.error('-c needs -o')
+    if not args.seeds and not (args.checkpoint and
+                               os.path.exists(args.checkpoint)):
+        parser.error('no seeds given, and no checkpoint to resume')
+
+    fake = None
+    if args.server:
+        from spytify import benchmark
+        fake = benchmark.FakeServer(args.server)
+        os.environ['DESPOTIFY_SERVER'] = fake.address
+        user, pw = benchmark.USER, benchmark.PASSWORD
+    elif args.user:
+        user = args.user
+        pw = args.password or getpass.getpass('Enter your password: ')
+    else:
+        parser.error('-u or -s is needed')
+
+    if args.output:
+        output = open(args.output, 'ab')
+    else:
+        output = getattr(sys.stdout, 'buffer', sys.stdout)
+
+    pool = None
+    try:
+        from spytify.pool import SpytifyPool
+        pool = SpytifyPool(user, pw, size=args.sessions)
+        crawler = Crawler(pool, output, workers=args.workers,
+                          max_depth=args.depth, max_pages=args.max_pages,
+                          max_frontier=args.max_frontier,
+                          checkpoint=args.checkpoint)
+        if args.checkpoint and crawler.resume():
+            sys.stderr.write('Resuming from %s\n' % args.checkpoint)
+        for seed in args.seeds:
+            crawler.add_seed(seed)
+
+        _report(crawler.run(_report, args.interval))
+    except (SpytifyError, ValueError) as e:
+        sys.stderr.write('Error: %s\n' % e)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        output.flush()
+        if pool is not None:
+            pool.close()
+        if fake is not None:
+            fake.close()
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
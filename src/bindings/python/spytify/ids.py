@@ -0,0 +1,11 @@
+# vim: set fileencoding=utf-8 :
+# spytify.ids - bulk conversion between Spotify ids and URIs.
+#
+# to_uris() turns hex ids (Track.track_id, Album.id...) or SpotifyIds into
+# URIs, from_uris() turns URIs into SpotifyIds, which hash and compare as
+# 16 bytes instead of strings. Both convert in C, without bignums.
+
+from spytify._spytify import SpotifyId, ids_to_uris as to_uris, \
+    uris_to_ids as from_uris
+
+__all__ = ['SpotifyId', 'to_uris', 'from_uris']
@@ -0,0 +1,244 @@
+# vim: set fileencoding=utf-8 :
+# spytify.pool - spread metadata requests over several despotify sessions.
+#
+# A despotify session only has room for one outstanding request, so the
+# only way to have several requests in flight is to have several sessions.
+
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from spytify import (MAX_BROWSE_REQ, Spytify, SpytifyConnectionError,
+                     SpytifyError)
+
+class SpytifyPool(object):
+    """A pool of authenticated Spytify sessions.
+
+    The request methods check out an idle session, run the request on it
+    and hand it back, so calls made from different threads run in
+    parallel. Sessions whose request times out, or that lose their
+    connection, are reconnected.
+
+    Objects returned by the pool belong to the session that fetched them.
+    Use the pool's methods, rather than lazily loaded properties like
+    Album.tracks, to fetch more data for them; a session may have been
+    reconnected in the meantime.
+    """
+    def __init__(self, user, pw, size=4, high_bitrate=True, use_cache=True,
+                 max_ping_age=300):
+        """Create a pool, connecting size sessions to Spotify.
+
+        Args:
+            user: Username to authenticate with
+            pw: Password to authenticate with
+            size: Number of sessions to open.
+            high_bitrate: Wether or not to request high bitrate data.
+            use_cache: Wether or not to use the despotify cache.
+            max_ping_age: Sessions that haven't been pinged by the server
+                in this many seconds are reconnected by check().
+        """
+        self.user = user
+        self.pw = pw
+        self.high_bitrate = high_bitrate
+        self.use_cache = use_cache
+        self.max_ping_age = max_ping_age
+
+        self.size = size
+        self.idle = queue.Queue()
+        self.sessions = []
+        self.lock = threading.Lock()
+
+        def connect(session, i):
+            session = self.connect()
+            with self.lock:
+                self.sessions.append(session)
+
+        try:
+            self.map(connect, range(size), workers=size, pooled=False)
+        except:
+            # Don't leave the sessions that did connect open.
+            for session in self.sessions:
+                try:
+                    session.close()
+                except SpytifyError:
+                    pass
+            raise
+
+        for session in self.sessions:
+            self.idle.put(session)
+
+    def connect(self):
+        """Open and authenticate a new session."""
+        return Spytify(self.user, self.pw, self.high_bitrate, self.use_cache)
+
+    def acquire(self):
+        """Check out an idle session, waiting for one if necessary."""
+        return self.idle.get()
+
+    def release(self, session, healthy=True):
+        """Hand a session back to the pool.
+
+        Args:
+            session: Session returned by acquire().
+            healthy: If False, the session is reconnected first.
+        """
+        try:
+            if not healthy or not session.connected:
+                session = self.reconnect(session)
+        finally:
+            self.idle.put(session)
+
+    def reconnect(self, session):
+        """Replace session with a freshly connected one.
+
+        If connecting fails, session is left open and the error is raised.
+        """
+        replacement = self.connect()
+        try:
+            session.close()
+        except SpytifyError:
+            pass
+
+        with self.lock:
+            self.sessions[self.sessions.index(session)] = replacement
+
+        return replacement
+
+    def run(self, func, *args):
+        """Run func(session, *args) on an idle session.
+
+        If func raises SpytifyConnectionError, the session is reconnected
+        and func is retried once on another session. Other errors, like an
+        invalid URI, are raised as they are.
+        """
+        for attempt in (0, 1):
+            session = self.acquire()
+            try:
+                result = func(session, *args)
+            except SpytifyConnectionError:
+                self.release(session, False)
+                if attempt:
+                    raise
+            except:
+                self.release(session)
+                raise
+            else:
+                self.release(session)
+                return result
+
+    def map(self, func, items, workers=None, pooled=True):
+        """Run func(session, item) for every item, in parallel.
+
+        Args:
+            func: Called with a session and an item.
+            items: Sequence of items.
+            workers: Number of threads to use, defaults to the pool size.
+            pooled: Internal; if False, func is called with None instead
+                of a session.
+        Returns:
+            List of the results of func, in the same order as items.
+        """
+        items = list(items)
+        results = [None] * len(items)
+        errors = []
+        pending = queue.Queue()
+        for i, item in enumerate(items):
+            pending.put((i, item))
+
+        def work():
+            while not errors:
+                try:
+                    i, item = pending.get_nowait()
+                except queue.Empty:
+                    return
+
+                try:
+                    if pooled:
+                        results[i] = self.run(func, item)
+                    else:
+                        results[i] = func(None, item)
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=work)
+                   for i in range(min(workers or self.size, len(items)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+        return results
+
+    def check(self):
+        """Health check idle sessions, reconnecting the ones that are down.
+
+        Returns:
+            Number of sessions that were reconnected.
+        """
+        reconnected = 0
+        now = time.time()
+        for i in range(self.idle.qsize()):
+            try:
+                session = self.idle.get_nowait()
+            except queue.Empty:
+                break
+
+            last_ping = session.last_ping
+            healthy = session.connected and \
+                      (not last_ping or now - last_ping < self.max_ping_age)
+            if not healthy:
+                reconnected += 1
+
+            self.release(session, healthy)
+
+        return reconnected
+
+    def search(self, searchtext, *args):
+        """Search for a string, see Spytify.search()."""
+        return self.run(lambda session: session.search(searchtext, *args))
+
+    def lookup(self, uri):
+        """Look up an URI, see Spytify.lookup()."""
+        return self.run(lambda session: session.lookup(uri))
+
+    def lookup_many(self, uris, chunk_size=MAX_BROWSE_REQ):
+        """Look up a sequence of URIs, see Spytify.lookup_many().
+
+        The URIs are split in chunks of chunk_size, by default as many
+        tracks as one browse request fetches, which are looked up on all
+        sessions in parallel.
+        """
+        uris = list(uris)
+        chunks = [uris[i:i + chunk_size]
+                  for i in range(0, len(uris), chunk_size)]
+
+        results = []
+        for chunk in self.map(lambda session, chunk: session.lookup_many(chunk),
+                              chunks):
+            results.extend(chunk)
+
+        return results
+
+    def get_image(self, image_id):
+        """Fetch an image, see Spytify.get_image()."""
+        return self.run(lambda session: session.get_image(image_id))
+
+    def album_tracks(self, album):
+        """Fetch the tracks of album on an idle session."""
+        return self.run(lambda session: session.lookup(album.get_uri()).tracks)
+
+    def artist_albums(self, artist):
+        """Fetch the albums of artist on an idle session."""
+        return self.run(lambda session: session.lookup(artist.get_uri()).albums)
+
+    def close(self):
+        """Close all sessions, waiting for running requests to finish."""
+        for i in range(self.size):
+            self.acquire().close()
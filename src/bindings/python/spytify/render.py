@@ -0,0 +1,240 @@
+# vim: set fileencoding=utf-8 :
+# spytify.render - decode tracks to WAV or raw PCM files, as fast as the
+# network and the decoder allow.
+#
+# Tracks are spread over a pool of worker processes, each with its own
+# despotify session. Finished files are never rendered again, so an
+# interrupted render picks up where it left off.
+#
+# Usage: python -m spytify.render -u USER [-o DIR] [-j N] URI...
+
+import argparse
+import getpass
+import multiprocessing
+import os
+import sys
+import time
+import wave
+
+from spytify import (Album, Playlist, SearchResult, Spytify, SpytifyError,
+                     Track, split_uri)
+
+# The session of the current worker process.
+_session = None
+
+def _init_worker(user, pw, high_bitrate, use_cache):
+    global _session
+    _session = Spytify(user, pw, high_bitrate, use_cache, audio=False)
+
+def _render_track(job):
+    uri, path, raw = job
+    started = time.time()
+    part = path + '.part'
+
+    try:
+        track = _session.lookup(uri)
+        if track is None or not track.is_playable():
+            return uri, path, 0, 0.0, 'not playable'
+
+        size = render_track(_session, track, part, raw)
+    except (SpytifyError, IOError, wave.Error) as e:
+        if os.path.exists(part):
+            os.remove(part)
+        return uri, path, 0, 0.0, str(e)
+
+    os.rename(part, path)
+    return uri, path, size, time.time() - started, None
+
+def render_track(session, track, path, raw=False):
+    """Decode a track to a file.
+
+    Args:
+        session: Spytify session to decode with.
+        track: Track to decode.
+        path: File to write.
+        raw: If True, write raw signed 16 bit native endian PCM instead of
+            WAV.
+    Returns:
+        Number of bytes of PCM written.
+    Raises:
+        SpytifyError: If the track could not be decoded, or decoded to
+            nothing.
+    """
+    size = 0
+    stream = session.pcm_stream(track)
+    out = open(path, 'wb')
+    try:
+        if not raw:
+            out = wave.open(out, 'wb')
+
+        for chunk in stream:
+            if not size and not raw:
+                out.setnchannels(stream.channels)
+                out.setsampwidth(2)
+                out.setframerate(stream.samplerate)
+
+            if raw:
+                out.write(chunk)
+            else:
+                out.writeframesraw(chunk)
+            size += len(chunk)
+    finally:
+        stream.close()
+        if not size and not raw:
+            # wave refuses to close a file whose header was never set.
+            out.setparams((1, 2, 44100, 0, 'NONE', 'not compressed'))
+        out.close()
+
+    if not size:
+        raise SpytifyError('No audio decoded')
+    return size
+
+def track_uris(source):
+    """Returns the track URIs of source.
+
+    Args:
+        source: Playlist, SearchResult, Album, Track, URI, or a sequence
+            of any of them.
+    """
+    if isinstance(source, SearchResult):
+        source = source.playlist
+    if isinstance(source, (Playlist, Album)):
+        source = source.tracks
+    if isinstance(source, Track):
+        return [source.get_uri()]
+    if isinstance(source, str):
+        return [source]
+
+    uris = []
+    for item in source:
+        uris.extend(track_uris(item))
+    return uris
+
+def render(user, pw, source, output_dir='.', processes=4, raw=False,
+           high_bitrate=True, use_cache=True, progress=None):
+    """Decode tracks to files in output_dir, using a pool of processes.
+
+    Files are named after the position and id of the track. Tracks whose
+    file already exists are skipped.
+
+    Args:
+        user: Username to authenticate with.
+        pw: Password to authenticate with.
+        source: Tracks to render, see track_uris().
+        output_dir: Directory to write the files to.
+        processes: Number of worker processes, and so of sessions.
+        raw: If True, write raw PCM (.pcm) instead of WAV (.wav) files.
+        high_bitrate: Wether or not to request high bitrate data.
+        use_cache: Wether or not to use the despotify cache.
+        progress: Called with (uri, path, bytes, seconds, error) after
+            every track.
+    Returns:
+        Dict with the number of 'rendered', 'skipped' and 'failed'
+        tracks, the 'bytes' of PCM written, the wall clock 'seconds',
+        and 'tracks_per_second' and 'mb_per_second'.
+    """
+    uris = track_uris(source)
+    extension = raw and 'pcm' or 'wav'
+    width = len(str(len(uris)))
+
+    jobs = []
+    skipped = 0
+    for i, uri in enumerate(uris):
+        name = '%0*d-%s.%s' % (width, i + 1, split_uri(uri)[1], extension)
+        path = os.path.join(output_dir, name)
+        if os.path.exists(path):
+            skipped += 1
+        else:
+            jobs.append((uri, path, raw))
+
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+
+    stats = {'rendered': 0, 'skipped': skipped, 'failed': 0, 'bytes': 0}
+    started = time.time()
+    if jobs:
+        pool = multiprocessing.Pool(min(processes, len(jobs)), _init_worker,
+                                    (user, pw, high_bitrate, use_cache))
+        try:
+            for result in pool.imap_unordered(_render_track, jobs):
+                if result[4] is None:
+                    stats['rendered'] += 1
+                    stats['bytes'] += result[2]
+                else:
+                    stats['failed'] += 1
+
+                if progress is not None:
+                    progress(*result)
+        finally:
+            pool.terminate()
+            pool.join()
+
+    stats['seconds'] = time.time() - started
+    elapsed = max(stats['seconds'], 1e-6)
+    stats['tracks_per_second'] = stats['rendered'] / elapsed
+    stats['mb_per_second'] = stats['bytes'] / elapsed / (1024 * 1024)
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m spytify.render',
+        description='Decode Spotify tracks to WAV or raw PCM files.')
+    parser.add_argument('uris', metavar='URI', nargs='+',
+                        help='track or album URI')
+    parser.add_argument('-u', '--user', required=True)
+    parser.add_argument('-p', '--password',
+                        help='asked for if not given')
+    parser.add_argument('-o', '--output', default='.',
+                        help='directory to write files to')
+    parser.add_argument('-j', '--processes', type=int, default=4,
+                        help='number of worker processes (default 4)')
+    parser.add_argument('--raw', action='store_true',
+                        help='write raw PCM instead of WAV')
+    parser.add_argument('--low-bitrate', action='store_true')
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args(argv)
+
+    pw = args.password or getpass.getpass('Enter your password: ')
+
+    def progress(uri, path, size, seconds, error):
+        if error is None:
+            sys.stderr.write('%s: %.1f MB in %.1fs\n' %
+                             (path, size / (1024.0 * 1024), seconds))
+        else:
+            sys.stderr.write('%s: failed, %s\n' % (uri, error))
+
+    try:
+        # Album URIs are expanded here, before the workers are started.
+        uris = []
+        session = None
+        for uri in args.uris:
+            kind = split_uri(uri)[0]
+            if kind == 'track':
+                uris.append(uri)
+                continue
+            if kind != 'album':
+                raise SpytifyError('Not a track or album URI: %s' % uri)
+
+            if session is None:
+                session = Spytify(args.user, pw, not args.low_bitrate,
+                                  not args.no_cache, audio=False)
+            uris.extend(track_uris(session.lookup(uri)))
+        if session is not None:
+            session.close()
+
+        stats = render(args.user, pw, uris, args.output, args.processes,
+                       args.raw, not args.low_bitrate, not args.no_cache,
+                       progress)
+    except SpytifyError as e:
+        sys.stderr.write('Error: %s\n' % e)
+        return 1
+
+    sys.stderr.write('%d rendered, %d skipped, %d failed in %.1fs '
+                     '(%.2f tracks/s, %.2f MB/s)\n' %
+                     (stats['rendered'], stats['skipped'], stats['failed'],
+                      stats['seconds'], stats['tracks_per_second'],
+                      stats['mb_per_second']))
+    return stats['failed'] and 1 or 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+# vim: set fileencoding=utf-8 :
+# spytify.stats - export snapshots from Spytify.stats().
+#
+# to_json() gives a JSON document of the snapshot, to_prometheus() the
+# Prometheus text exposition format, with the latencies as histograms.
+
+import json
+
+def to_json(stats, **kwargs):
+    """Returns stats as a JSON string.
+
+    The unbounded latency bucket is written as "+Inf", as JSON has no
+    infinity. Extra keyword arguments are passed to json.dumps().
+    """
+    def bound(value):
+        if value == float('inf'):
+            return '+Inf'
+        return value
+
+    operations = {}
+    for name, op in stats['operations'].items():
+        op = dict(op)
+        op['buckets'] = [(bound(le), count) for le, count in op['buckets']]
+        operations[name] = op
+
+    stats = dict(stats)
+    stats['operations'] = operations
+    return json.dumps(stats, **kwargs)
+
+def _labels(labels, **extra):
+    labels = dict(labels or {}, **extra)
+    if not labels:
+        return ''
+
+    return '{%s}' % ','.join('%s="%s"' % (name, str(value).replace('\\', '\\\\')
+                                                       .replace('"', '\\"'))
+                             for name, value in sorted(labels.items()))
+
+def _bound(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(value)
+
+def _value(value):
+    if isinstance(value, float):
+        return repr(value)
+    return '%d' % value
+
+def to_prometheus(stats, prefix='spytify', labels=None):
+    """Returns stats in the Prometheus text exposition format.
+
+    Args:
+        stats: Snapshot from Spytify.stats().
+        prefix: Prefix of the metric names.
+        labels: Dict of labels to add to every sample, for instance to
+            tell sessions apart.
+    """
+    lines = []
+
+    def metric(name, kind, help, samples):
+        name = '%s_%s' % (prefix, name)
+        lines.append('# HELP %s %s' % (name, help))
+        lines.append('# TYPE %s %s' % (name, kind))
+        for suffix, sample_labels, value in samples:
+            lines.append('%s%s%s %s' % (name, suffix, sample_labels,
+                                        _value(value)))
+
+    operations = sorted(stats['operations'].items())
+
+    samples = []
+    for name, op in operations:
+        cumulative = 0
+        for le, count in op['buckets']:
+            cumulative += count
+            samples.append(('_bucket', _labels(labels, operation=name,
+                                               le=_bound(le)), cumulative))
+        samples.append(('_sum', _labels(labels, operation=name),
+                        op['seconds']))
+        samples.append(('_count', _labels(labels, operation=name),
+                        op['count']))
+    metric('operation_seconds', 'histogram',
+           'Latency of despotify requests.', samples)
+
+    metric('operation_errors_total', 'counter',
+           'Failed or timed out despotify requests.',
+           [('', _labels(labels, operation=name), op['errors'])
+            for name, op in operations])
+    metric('received_bytes_total', 'counter',
+           'Bytes received from the server.',
+           [('', _labels(labels, operation=name), op['bytes'])
+            for name, op in operations])
+
+    cache = stats['cache']
+    metric('cache_hits_total', 'counter', 'Disk cache hits.',
+           [('', _labels(labels), cache['hits'])])
+    metric('cache_misses_total', 'counter', 'Disk cache misses.',
+           [('', _labels(labels), cache['misses'])])
+
+    fifo = stats['fifo']
+    metric('fifo_bytes', 'gauge', 'Compressed audio buffered.',
+           [('', _labels(labels), fifo['bytes'])])
+    metric('fifo_max_bytes', 'gauge', 'Size of the audio buffer.',
+           [('', _labels(labels), fifo['max_bytes'])])
+    metric('fifo_watermark_bytes', 'gauge',
+           'Buffer level below which more audio is fetched.',
+           [('', _labels(labels), fifo['watermark'])])
+    metric('fifo_average_fill_ratio', 'gauge',
+           'Average buffer level, as a fraction of its size.',
+           [('', _labels(labels), fifo['average_fill'])])
+    metric('fifo_below_watermark_total', 'counter',
+           'Decoder reads that found the buffer below the watermark.',
+           [('', _labels(labels), fifo['below_watermark'])])
+
+    if stats['time_to_first_pcm'] is not None:
+        metric('time_to_first_pcm_seconds', 'gauge',
+               'Time the last started track took to produce audio.',
+               [('', _labels(labels), stats['time_to_first_pcm'])])
+
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,280 @@
+from despotify cimport *
+cimport audio_thread
+cimport event_ring
+
+cdef class LRUCache
+cdef class SpotifyId
+cdef class SessionStruct
+cdef class SpotifyObject(SessionStruct)
+cdef class Album(SpotifyObject)
+cdef class Artist(SpotifyObject)
+cdef class SearchResult(SpotifyObject)
+cdef class Playlist(SpotifyObject)
+cdef class RootList(SessionStruct)
+cdef class Track(SpotifyObject)
+cdef class LazyList
+cdef class PCMStream
+cdef class Image
+cdef class SearchIterator
+cdef class TrackTable
+cdef class Spytify(SessionStruct)
+
+cdef class LRUCache:
+    cdef object entries
+    cdef object lock
+    cdef readonly int max_entries
+    cdef readonly long max_bytes
+    cdef readonly double ttl
+    cdef readonly long size
+    cdef readonly long hits
+    cdef readonly long misses
+    cdef readonly long evictions
+
+cdef class SpotifyId:
+    cdef unsigned char raw_id[16]
+    cdef long hash_value
+
+cdef SpotifyId id_from_hex(char* hex)
+cdef bytes hex_to_base62(char* hex)
+
+cdef long track_size(track* t)
+cdef long album_browse_size(album_browse* album)
+cdef long artist_browse_size(artist_browse* artist)
+
+cdef enum:
+    LAZY_TRACKS
+    LAZY_ARTISTS
+    LAZY_ALBUMS
+
+cdef class LazyList:
+    # Keeps the object owning the list alive.
+    cdef SessionStruct session
+    cdef int kind
+    cdef void* head
+    cdef int length
+    cdef list items
+    cdef void* cursor
+    cdef int cursor_index
+
+    cdef void* next_node(self, void* node)
+    cdef object wrap(self, void* node)
+    cdef int count(self)
+    cdef object item(self, int index)
+
+cdef class LazyListIterator:
+    cdef LazyList parent
+    cdef int i
+
+cdef class TrackTable:
+    cdef readonly int rows
+    cdef readonly list strings
+    cdef dict string_index
+    cdef readonly bytes track_ids
+    cdef readonly bytes file_ids
+    cdef readonly bytes album_ids
+    cdef readonly object has_meta_data
+    cdef readonly object playable
+    cdef readonly object titles
+    cdef readonly object artist_offsets
+    cdef readonly object artist_names
+    cdef readonly object albums
+    cdef readonly object lengths
+    cdef readonly object tracknumbers
+    cdef readonly object years
+    cdef readonly object popularity
+
+    cdef int intern(self, char* s)
+    cdef bytes fixed_id(self, bytes column, int width, int index)
+
+cdef class TrackRow:
+    cdef TrackTable table
+    cdef int index
+
+cdef TrackTable create_track_table(track* tracks)
+
+cdef class SessionStruct:
+    cdef despotify_session* ds
+    cdef object lock
+    cdef LRUCache cache
+    # The session the object came from, None for the Spytify itself.
+    cdef Spytify session
+    cdef Spytify get_session(self)
+    cdef int check_open(self) except -1
+    cdef Album create_album(self, album* album, bint take_owner=?)
+    cdef Album create_album_full(self, album_browse* album, bint take_owner=?)
+
+    cdef Artist create_artist(self, artist* artist, bint take_owner=?)
+    cdef Artist create_artist_full(self, artist_browse* artist, bint take_owner=?)
+
+    cdef Playlist create_playlist(self, playlist* playlist, bint take_owner=?)
+    cdef RootList create_rootlist(self)
+
+    cdef SearchResult create_search_result(self, search_result* result, bint take_owner=?)
+    cdef Track create_track(self, track* track)
+
+    cdef LazyList create_lazy_list(self, int kind, void* head, int length=?)
+
+cdef class SpotifyObject(SessionStruct):
+    # Keeps the object owning the underlying struct alive.
+    cdef object owner
+    cdef SpotifyId spotify_id_value
+
+    cdef SpotifyId get_spotify_id(self)
+
+cdef class Image:
+    cdef bytes image_id
+    cdef void* data
+    cdef int length
+    cdef bint mapped
+
+cdef Image create_image(bytes image_id, void* data, int length, bint mapped)
+
+cdef class PCMStream:
+    cdef Spytify session
+    cdef Track track
+    cdef despotify_session* ds
+    cdef object buffer
+    cdef pcm_data pcm
+    cdef int pending
+    cdef int pending_offset
+    cdef readonly int samplerate
+    cdef readonly int channels
+    cdef bint started
+    cdef bint finished
+
+    cdef Py_ssize_t fill(self, char* out, Py_ssize_t size, int* error) nogil
+
+cdef class Spytify(SessionStruct):
+    cdef LRUCache image_cache
+    cdef dict fetch_tracks(self, list ids)
+    cdef SearchResult search_page(self, char* searchtext, int offset, int max_hits)
+    cdef start_playback(self, track* first, bint play_as_list)
+    cdef Spytify get_session(self)
+    cdef int check_open(self) except -1
+    cdef int check_audio(self) except -1
+    cdef RootList stored_playlists
+    cdef object callback
+    cdef double event_interval
+    cdef object dispatcher
+    cdef event_ring.event_ring* events
+    cdef audio_thread.thread_state* thread
+    cdef object snapshot
+    cdef object revalidation
+
+cdef class AlbumData:
+    cdef album* data
+    cdef char* name(self)
+    cdef char* id(self)
+    cdef char* artist(self)
+    cdef char* artist_id(self)
+    cdef char* cover_id(self)
+    cdef float popularity(self)
+    cdef AlbumData next(self)
+
+cdef class AlbumDataFull(AlbumData):
+    cdef album_browse* browse
+    cdef bint take_owner
+    cdef int num_tracks(self)
+    cdef track* tracks(self)
+    cdef int year(self)
+    cdef AlbumDataFull next_full(self)
+
+cdef class Album(SpotifyObject):
+    cdef AlbumData data
+    cdef AlbumDataFull full_data
+    cdef LazyList track_list
+    cdef bint take_owner
+
+    cdef get_full_data(self)
+    cdef SpotifyId get_spotify_id(self)
+
+cdef class ArtistData:
+    cdef artist* data
+    cdef char* name(self)
+    cdef char* id(self)
+    cdef char* portrait_id(self)
+    cdef float popularity(self)
+    cdef ArtistData next(self)
+
+cdef class ArtistDataFull(ArtistData):
+    cdef artist_browse* browse
+    cdef bint take_owner
+    cdef char* text(self)
+    cdef char* genres(self)
+    cdef char* years_active(self)
+    cdef int num_albums(self)
+    cdef album_browse* albums(self)
+
+cdef class Artist(SpotifyObject):
+    cdef ArtistData data
+    cdef ArtistDataFull full_data
+    cdef LazyList album_list
+    cdef bint take_owner
+
+    cdef get_full_data(self)
+    cdef SpotifyId get_spotify_id(self)
+
+cdef class SearchResult(SpotifyObject):
+    cdef search_result* data
+    cdef Playlist playlist
+    cdef bint take_owner
+
+cdef class SearchIterator:
+    cdef Spytify session
+    cdef bytes searchtext
+    cdef int page_size
+    cdef int offset
+    cdef LazyList tracks
+    cdef int i
+    cdef object prefetch
+    cdef object prefetched
+
+    cdef start_prefetch(self)
+    cdef next_page(self)
+
+cdef class Playlist(SpotifyObject):
+    cdef playlist* data
+    cdef LazyList track_list
+    cdef bint take_owner
+    # First track without meta data loaded, NULL once all are loaded.
+    cdef track* load_cursor
+    # Tracks before load_cursor.
+    cdef int loaded
+    cdef object load_lock
+
+    cdef SpotifyId get_spotify_id(self)
+    cdef int load_chunk(self) except -1
+    cdef load_all(self)
+
+cdef class PlaylistTrackIterator:
+    cdef Playlist playlist
+    cdef LazyList tracks
+    cdef int i
+    cdef object prefetch
+    cdef object prefetched
+
+    cdef start_prefetch(self)
+    cdef int available(self)
+
+cdef class RootList(SessionStruct):
+    cdef fetch(self)
+    cdef adopt(self, playlist* data)
+    cdef Playlist fetch_playlist(self, char* id)
+    cdef list playlists
+    # Revision of the meta playlist the playlists were loaded at.
+    cdef readonly unsigned int meta_revision
+
+cdef list stored_playlist_ids(SessionStruct session, unsigned int* revision=*)
+
+cdef class RootIterator:
+    cdef RootList parent
+    cdef int i
+
+cdef class Track(SpotifyObject):
+    cdef track* data
+    cdef LazyList artist_list
+
+    cdef SpotifyId get_spotify_id(self)
+
+cdef class OwnedTrack:
+    cdef track* data
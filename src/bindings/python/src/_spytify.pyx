@@ -0,0 +1,902 @@
+import atexit
+import select
+import threading
+import traceback
+from cpython cimport bool
+
+cdef extern from "Python.h":
+    ctypedef int Py_intptr_t
+    void PyEval_InitThreads()
+
+cdef extern from "stdlib.h":
+    void* malloc(size_t size)
+    void free(void* ptr)
+
+
+class SpytifyError(Exception):
+    pass
+
+class SpytifyConnectionError(SpytifyError):
+    """The request timed out, or the session lost its connection or was
+    closed. It may well succeed on a freshly connected session."""
+    pass
+
+# Errors of despotify_get_error() telling that the connection failed.
+CONNECTION_ERRORS = (b'Timeout', b'Network error', b'Could not connect')
+
+cdef session_error(despotify_session* ds):
+    """Returns the exception for the last error of ds."""
+    cdef const char* message = despotify_get_error(ds)
+    if message == NULL:
+        return SpytifyError('Unknown error')
+
+    error = <bytes>message
+    # Failing to send a command, like "cmd_search() failed", means the
+    # connection is gone too.
+    if error.startswith(CONNECTION_ERRORS) or error.endswith(b'() failed'):
+        return SpytifyConnectionError(error)
+    return SpytifyError(error)
+
+include "lrucache.pxi"
+include "ids.pxi"
+include "sessionstruct.pxi"
+include "spotifyobject.pxi"
+include "lazylist.pxi"
+
+include "album.pxi"
+include "artist.pxi"
+include "track.pxi"
+include "tracktable.pxi"
+include "playlist.pxi"
+include "searchresult.pxi"
+include "image.pxi"
+include "pcm.pxi"
+
+# Most tracks fetched by one browse request, MAX_BROWSE_REQ in despotify.h.
+MAX_BROWSE_REQ = c_MAX_BROWSE_REQ
+
+# Names of the operations in Spytify.stats(), in despotify_op order.
+OPERATIONS = ('search', 'playlist', 'tracks', 'album', 'artist', 'image',
+              'key', 'substream', 'cache_load')
+
+cdef class Spytify:
+    """Class representing a connection to the Spotify service.
+    
+    This should be any scripts "entrypoint" into this module; any other
+    class will most likely be instantiated by this class and returned.
+    """
+    def __init__(self, bytes user, bytes pw, bool high_bitrate=True, bool use_cache=True, object callback=None,
+                 LRUCache cache=None, LRUCache image_cache=None,
+                 double event_interval=0.1, int buffer_size=0, int watermark=0,
+                 int lookahead=1, int lookahead_substreams=1,
+                 int pcm_buffer_size=256 * 1024, bytes snapshot=None,
+                 bint audio=True):
+        """Create a new Spytify instance, and connect to Spotify.
+
+        Playback events are queued without taking the GIL, and only the
+        latest DESPOTIFY_TIME_TELL is kept. Get them with poll_events(),
+        waiting on fileno() if need be, or pass a callback.
+
+        Args:
+            user: Username to authenticate with
+            pw: Password to authenticate with
+            high_bitrate: Wether or not to request high bitrate data.
+            callback: Called with (signal, data) for every playback event,
+                from a thread of its own.
+            cache: LRUCache for looked up tracks, albums and artists.
+                Defaults to a new LRUCache(); pass LRUCache(0) to disable.
+            image_cache: LRUCache for images, sized by their length in
+                bytes. Defaults to one holding up to 32 MB.
+            event_interval: Minimum number of seconds between two batches
+                of events passed to callback.
+            buffer_size: Bytes of compressed audio to buffer, 0 for the
+                despotify default of 1 MB.
+            watermark: Fetch more audio when the buffer holds less than
+                this many bytes, 0 for the despotify default of 200 KB.
+            lookahead: Number of upcoming tracks to fetch the key and
+                first data of while playing a list, 0 to disable.
+            lookahead_substreams: Number of 100 KB chunks to fetch for each
+                upcoming track.
+            pcm_buffer_size: Bytes of decoded audio to buffer between the
+                decoder and the audio device, 256 KB by default, about 1.5
+                seconds of CD quality audio.
+            snapshot: File to keep a snapshot of the stored playlists in.
+                They are loaded from it right away, and checked against
+                the server in the background; if they changed, the fresh
+                playlists replace the old in stored_playlists and are saved
+                to the file again.
+            audio: Whether to open the audio device and start the thread
+                playing to it. Without it, tracks can only be decoded with
+                pcm_stream(); play(), play_list(), pause() and resume()
+                raise SpytifyError.
+        """
+        cdef char* c_user = user
+        cdef char* c_pw = pw
+        cdef char* c_snapshot
+        cdef bint authenticated
+        cdef playlist* data
+        cdef unsigned int meta_revision
+
+        self.stored_playlists = None
+        self.snapshot = snapshot
+        self.revalidation = None
+        self.callback = callback
+        self.event_interval = event_interval
+        self.dispatcher = None
+        self.lock = threading.RLock()
+        self.cache = cache if cache is not None else LRUCache()
+        if image_cache is None:
+            image_cache = LRUCache(max_entries=1000, max_bytes=32 * 1024 * 1024)
+        self.image_cache = image_cache
+
+        self.events = event_ring.event_ring_new(256)
+        if not self.events:
+            raise SpytifyError('Could not create the event queue')
+
+        self.ds = despotify_init_client(event_ring.event_ring_callback,
+                                        self.events, high_bitrate, use_cache)
+        if not self.ds:
+            raise session_error(self.ds)
+
+        if buffer_size:
+            despotify_set_buffer_size(self.ds, buffer_size)
+        if watermark:
+            despotify_set_watermark(self.ds, watermark)
+        despotify_set_prefetch(self.ds, lookahead, lookahead_substreams)
+
+        with nogil:
+            authenticated = despotify_authenticate(self.ds, c_user, c_pw)
+        if not authenticated:
+            raise session_error(self.ds)
+
+        if audio:
+            self.thread = audio_thread.thread_init(self.ds, pcm_buffer_size)
+            if self.thread == NULL:
+                raise SpytifyError('Could not start the audio thread')
+
+        if snapshot is not None:
+            c_snapshot = snapshot
+            with nogil:
+                data = despotify_load_snapshot(c_snapshot, &meta_revision)
+            self.stored_playlists = self.create_rootlist()
+            if data:
+                self.stored_playlists.adopt(data)
+                self.stored_playlists.meta_revision = meta_revision
+
+            self.revalidation = threading.Thread(target=self._revalidate,
+                                                 name='Spytify snapshot')
+            self.revalidation.daemon = True
+            self.revalidation.start()
+
+        if callback is not None:
+            self.dispatcher = threading.Thread(target=self._dispatch_events,
+                                               name='Spytify events')
+            self.dispatcher.daemon = True
+            self.dispatcher.start()
+
+    def _revalidate(self):
+        cdef unsigned int meta_revision
+        cdef RootList playlists = self.stored_playlists
+
+        try:
+            if playlists.playlists is None:
+                # No usable snapshot, load them now rather than on first use.
+                stored_playlist_ids(self, &meta_revision)
+                playlists.fetch()
+                playlists.meta_revision = meta_revision
+            else:
+                stored_playlist_ids(self, &meta_revision)
+                if meta_revision == playlists.meta_revision:
+                    return
+                playlists.refresh()
+
+            playlists.save_snapshot(self.snapshot)
+        except Exception:
+            traceback.print_exc()
+
+    def save_snapshot(self, bytes path=None):
+        """Save the stored playlists to a snapshot file.
+
+        Args:
+            path: File to save to, by default the snapshot passed to the
+                constructor.
+        """
+        if path is None:
+            path = self.snapshot
+        if path is None:
+            raise SpytifyError('No snapshot file given')
+
+        self.stored_playlists.save_snapshot(path)
+
+    def poll_events(self):
+        """Take the pending playback events, without waiting for any.
+
+        Returns:
+            List of (signal, data) tuples, oldest first. data is a Track
+            for DESPOTIFY_NEW_TRACK, the position in seconds for
+            DESPOTIFY_TIME_TELL, and None otherwise. There is at most one
+            DESPOTIFY_TIME_TELL, with the latest position, and it comes last.
+        """
+        cdef event_ring.event buf[64]
+        cdef double time_tell = 0
+        cdef int has_time_tell
+        cdef bint time_told = False
+        cdef int count, i
+        cdef list result = []
+        cdef OwnedTrack owned
+        cdef Track track_data
+
+        if self.events == NULL:
+            return result
+
+        count = 64
+        while count == 64:
+            count = event_ring.event_ring_drain(self.events, buf, 64,
+                                                &time_tell, &has_time_tell)
+            for i in range(count):
+                if buf[i].signal == DESPOTIFY_NEW_TRACK:
+                    # The ring hands over a copy of the track.
+                    owned = OwnedTrack()
+                    owned.data = <track*>buf[i].data
+                    track_data = self.create_track(owned.data)
+                    if track_data is not None:
+                        track_data.owner = owned
+                    data = track_data
+                else:
+                    data = None
+                result.append((buf[i].signal, data))
+
+            if has_time_tell:
+                time_told = True
+                latest = time_tell
+
+        if time_told:
+            result.append((DESPOTIFY_TIME_TELL, latest))
+
+        return result
+
+    def fileno(self):
+        """File descriptor that is readable while events are pending.
+
+        Lets select() or an asyncio loop wait for poll_events() to have
+        something to return.
+        """
+        if self.events == NULL:
+            raise SpytifyConnectionError('Session is closed')
+        return self.events.fds[0]
+
+    property events_dropped:
+        """Number of events lost because they weren't polled in time."""
+        def __get__(self):
+            if self.events == NULL:
+                return 0
+            return self.events.dropped
+
+    def _dispatch_events(self):
+        while self.ds != NULL:
+            try:
+                select.select([self], [], [])
+            except (select.error, ValueError):
+                break
+
+            for signal, data in self.poll_events():
+                try:
+                    self.callback(signal, data)
+                except Exception:
+                    traceback.print_exc()
+
+            time.sleep(self.event_interval)
+
+    property stored_playlists:
+        def __get__(self):
+            if self.stored_playlists is None:
+                self.check_open()
+                self.stored_playlists = self.create_rootlist()
+
+            return self.stored_playlists
+
+    property cache:
+        """The LRUCache holding looked up tracks, albums and artists."""
+        def __get__(self):
+            return self.cache
+
+    property image_cache:
+        """The LRUCache holding fetched images."""
+        def __get__(self):
+            return self.image_cache
+
+    property current_track:
+        def __get__(self):
+            with self.lock:
+                self.check_open()
+                return self.create_track(despotify_get_current_track(self.ds))
+
+    def stats(self, bint reset=False):
+        """Returns a snapshot of the counters and latencies of this session.
+
+        See spytify.stats for turning it into JSON or Prometheus text.
+
+        Args:
+            reset: Wether to zero the counters after taking the snapshot.
+        Returns:
+            Dict with 'operations', mapping each of OPERATIONS to a dict of
+            its 'count', 'errors', 'bytes' received, total and max
+            'seconds', and latency 'buckets' as (upper bound, count)
+            pairs; 'cache' hits and misses of this session; 'fifo' fill
+            level; 'pcm_buffer' fill level and underruns, see
+            pcm_buffer_state(); and 'time_to_first_pcm'.
+        """
+        cdef despotify_stats stats
+        cdef op_stats* op
+        cdef int i, j
+
+        if self.ds == NULL:
+            raise SpytifyConnectionError('Session is closed')
+
+        despotify_get_stats(self.ds, &stats)
+        if reset:
+            despotify_reset_stats(self.ds)
+
+        bounds = [despotify_latency_bounds[j]
+                  for j in range(DESPOTIFY_LATENCY_BUCKETS - 1)]
+        bounds.append(float('inf'))
+
+        operations = {}
+        for i in range(DESPOTIFY_OP_COUNT):
+            op = &stats.ops[i]
+            operations[OPERATIONS[i]] = {
+                'count': op.count,
+                'errors': op.errors,
+                'bytes': op.bytes,
+                'seconds': op.seconds,
+                'max_seconds': op.max_seconds,
+                'buckets': [(bounds[j], op.buckets[j])
+                            for j in range(DESPOTIFY_LATENCY_BUCKETS)],
+            }
+
+        lookups = stats.cache_hits + stats.cache_misses
+        return {
+            'operations': operations,
+            'cache': {
+                'hits': stats.cache_hits,
+                'misses': stats.cache_misses,
+                'hit_ratio': lookups and float(stats.cache_hits) / lookups,
+            },
+            'fifo': {
+                'bytes': stats.fifo_bytes,
+                'max_bytes': stats.fifo_max_bytes,
+                'watermark': stats.fifo_watermark,
+                'samples': stats.fifo_samples,
+                'below_watermark': stats.fifo_below_watermark,
+                'average_fill': stats.fifo_samples and
+                                stats.fifo_fill_sum / stats.fifo_samples,
+            },
+            'pcm_buffer': self.pcm_buffer_state(),
+            'time_to_first_pcm': self.time_to_first_pcm,
+        }
+
+    def pcm_buffer_state(self):
+        """Returns the fill level of the decoded audio buffer.
+
+        Returns:
+            Dict with the 'bytes' of audio buffered, the 'slots' of the
+            buffer and how many are 'used', the 'fill' level from 0 to 1,
+            and the number of 'underruns', times the audio device ran out
+            of audio while playing.
+        """
+        cdef int used = 0, slots = 0, buffered = 0
+        cdef unsigned long underruns = 0
+
+        if self.thread != NULL:
+            audio_thread.thread_buffer_state(self.thread, &used, &slots,
+                                             &buffered, &underruns)
+        return {
+            'bytes': buffered,
+            'used': used,
+            'slots': slots,
+            'fill': slots and float(used) / slots,
+            'underruns': underruns,
+        }
+
+    property time_to_first_pcm:
+        """Seconds from play, skip or list transition to the first audio
+        of the last started track, or None."""
+        def __get__(self):
+            if self.ds == NULL or not self.ds.time_to_first_pcm:
+                return None
+            return self.ds.time_to_first_pcm
+
+    property connected:
+        """Wether the session is still connected to the server."""
+        def __get__(self):
+            return self.ds != NULL and self.ds.user_info.server_host[0] != 0
+
+    property last_ping:
+        """Time of the last ping from the server, in seconds since the epoch."""
+        def __get__(self):
+            if self.ds == NULL:
+                return 0
+            return self.ds.user_info.last_ping
+
+    def flush_stored_playlists(self):
+        """Clear cached playlists.
+
+        stored_playlists.refresh() only reloads the playlists that changed.
+        """
+        self.stored_playlists = self.create_rootlist()
+
+    def open_playlist(self, bytes playlist_id):
+        """Fetch a playlist without loading the meta data of its tracks.
+
+        Playlist.iter_tracks() then loads them a chunk at a time, so the
+        first tracks of a big playlist can be shown right away. Playlist.tracks
+        loads all that are left first.
+
+        Args:
+            playlist_id: Id of the playlist, like Playlist.id.
+
+        Returns: Playlist.
+        """
+        cdef char* c_playlist_id = playlist_id
+        cdef playlist* data
+        cdef Playlist instance
+        cdef bint use_cache
+        with self.lock:
+            self.check_open()
+            use_cache = self.ds.use_cache
+            with nogil:
+                data = despotify_get_playlist_ids(self.ds, c_playlist_id,
+                                                  use_cache)
+            if not data:
+                raise session_error(self.ds)
+
+        instance = self.create_playlist(data, True)
+        instance.load_cursor = data.tracks
+        return instance
+
+    def open_stored_playlists(self):
+        """Like stored_playlists, but without loading the tracks.
+
+        Returns: List of Playlists from open_playlist(), whose tracks load
+            as Playlist.iter_tracks() gets to them.
+        """
+        return [self.open_playlist(id) for id in stored_playlist_ids(self)]
+
+    def lookup(self, str uri):
+        """Looks up URIs like spotify:track:32a2n4NPXhH3OI06VPLwTA.
+
+        Args:
+            uri: URI like
+                spotify:track:32a2n4NPXhH3OI06VPLwTA
+                or track:32a2n4NPXhH3OI06VPLwTA
+        Returns:
+            Artist, Track or Album object for the id. Failing to browse an
+            artist or album raises SpytifyError.
+        """
+        cdef str type
+        cdef bytes uri_id
+        cdef char id[33]
+        cdef artist_browse* artist
+        cdef album_browse* album
+        cdef track* found
+        cdef OwnedTrack owned
+        type, uri_id = split_uri(uri)
+
+        despotify_uri2id(uri_id, id)
+
+        key = (type, id)
+        result = self.cache.get(key)
+        if result is not None:
+            return result
+
+        if type == 'artist':
+            with self.lock:
+                self.check_open()
+                with nogil:
+                    artist = despotify_get_artist(self.ds, id)
+                if not artist:
+                    raise session_error(self.ds)
+            result = self.create_artist_full(artist, True)
+            self.cache.put(key, result, artist_browse_size(artist))
+        elif type =='album':
+            with self.lock:
+                self.check_open()
+                with nogil:
+                    album = despotify_get_album(self.ds, id)
+                if not album:
+                    raise session_error(self.ds)
+            result = self.create_album_full(album, True)
+            self.cache.put(key, result, album_browse_size(album))
+        elif type =='track':
+            with self.lock:
+                self.check_open()
+                with nogil:
+                    found = despotify_get_track(self.ds, id)
+            result = self.create_track(found)
+            if result is not None:
+                # Evicting the Track from the cache frees the struct.
+                owned = OwnedTrack()
+                owned.data = found
+                result.owner = owned
+                if found.has_meta_data:
+                    self.cache.put(key, result, track_size(found))
+        else:
+            raise SpytifyError('URI specifies invalid type: %s' % type)
+
+        return result
+
+    def lookup_many(self, uris):
+        """Looks up a sequence of URIs, batching track lookups.
+
+        Tracks that aren't in the cache are fetched MAX_BROWSE_REQ at a time,
+        one browse request per batch. Albums and artists are looked up one by
+        one, like lookup().
+
+        Args:
+            uris: Sequence of URIs accepted by lookup().
+        Returns:
+            List with an Artist, Track or Album object for each URI, in the
+            same order as uris. Tracks that weren't found are None.
+        """
+        cdef list results = [None] * len(uris)
+        cdef list track_ids = []
+        cdef list track_positions = []
+        cdef dict found
+        cdef str type
+        cdef bytes uri_id
+        cdef char id[33]
+        cdef int i, start, end
+
+        for i, uri in enumerate(uris):
+            type, uri_id = split_uri(uri)
+            if type == 'track':
+                despotify_uri2id(uri_id, id)
+                results[i] = self.cache.get((type, id))
+                if results[i] is None:
+                    track_ids.append(id)
+                    track_positions.append(i)
+            else:
+                results[i] = self.lookup(uri)
+
+        for start in range(0, len(track_ids), c_MAX_BROWSE_REQ):
+            end = min(start + c_MAX_BROWSE_REQ, len(track_ids))
+            found = self.fetch_tracks(track_ids[start:end])
+            for i in range(start, end):
+                results[track_positions[i]] = found.get(track_ids[i])
+
+        return results
+
+    cdef dict fetch_tracks(self, list ids):
+        """Fetches up to MAX_BROWSE_REQ tracks with one browse request.
+
+        Returns a dict mapping track id to Track for the tracks found.
+        """
+        cdef int i, num_ids = len(ids)
+        cdef char** c_ids = <char**>malloc(num_ids * sizeof(char*))
+        cdef track* tracks
+        cdef Track result
+        cdef OwnedTrack owned
+        cdef dict found = {}
+
+        if not c_ids:
+            raise MemoryError()
+
+        for i in range(num_ids):
+            c_ids[i] = ids[i]
+
+        with self.lock:
+            self.check_open()
+            with nogil:
+                tracks = despotify_get_tracks(self.ds, c_ids, num_ids)
+            free(c_ids)
+
+            if not tracks:
+                raise session_error(self.ds)
+
+        # The chain is freed with the last Track built from it.
+        owned = OwnedTrack()
+        owned.data = tracks
+        while tracks:
+            if tracks.has_meta_data:
+                result = self.create_track(tracks)
+                result.owner = owned
+                found[result.track_id] = result
+                self.cache.put(('track', result.track_id), result,
+                               track_size(tracks))
+            tracks = tracks.next
+
+        return found
+
+    def search(self, bytes searchtext, int max_hits=MAX_SEARCH_RESULTS):
+        """Search for a string like the normal Spotify client.
+
+        Args:
+            searchtext: What you want to search for. 
+                (http://www.spotify.com/blog/archives/2008/01/22/searching-spotify/)
+            max_hits: Max number of hits, cannot be higher than MAX_SEARCH_RESULTS in despotify.h.
+
+        Returns: None if search failed, a SearchResult if search was OK.
+        """
+        cdef char* c_searchtext = searchtext
+        cdef search_result* search
+        with self.lock:
+            self.check_open()
+            with nogil:
+                search = despotify_search(self.ds, c_searchtext, max_hits)
+        if not search:
+            return None
+        else:
+            return self.create_search_result(search, True)
+
+    def iter_search(self, bytes searchtext, int page_size=MAX_SEARCH_RESULTS):
+        """Search for a string, iterating over all the tracks found.
+
+        Unlike search(), this isn't limited to MAX_SEARCH_RESULTS hits.
+
+        Args:
+            searchtext: What you want to search for.
+            page_size: Number of tracks to request at a time, from 1 up
+                to MAX_SEARCH_RESULTS in despotify.h.
+
+        Returns: Iterator over the Track objects found.
+        """
+        if not 0 < page_size <= MAX_SEARCH_RESULTS:
+            raise ValueError('page_size must be from 1 to %d, not %d' %
+                             (MAX_SEARCH_RESULTS, page_size))
+        return SearchIterator(self, searchtext, page_size)
+
+    cdef SearchResult search_page(self, char* searchtext, int offset, int max_hits):
+        cdef search_result* search
+        with self.lock:
+            self.check_open()
+            with nogil:
+                search = despotify_search_page(self.ds, searchtext, offset,
+                                               max_hits)
+            if not search:
+                raise session_error(self.ds)
+
+        return self.create_search_result(search, True)
+
+    def get_image(self, bytes image_id):
+        """Fetch an image, like an album cover or an artist portrait.
+
+        Args:
+            image_id: Id of the image, like Album.cover_id or
+                Artist.portrait_id.
+
+        Returns: Image, which supports the buffer protocol.
+        """
+        cdef char* c_image_id = image_id
+        cdef void* data
+        cdef int length
+        cdef bint mapped
+        cdef Image image = self.image_cache.get(image_id)
+        if image is not None:
+            return image
+
+        with self.lock:
+            self.check_open()
+            with nogil:
+                data = despotify_map_image(self.ds, c_image_id, &length,
+                                           &mapped)
+            if not data:
+                raise session_error(self.ds)
+
+        image = create_image(image_id, data, length, mapped)
+        self.image_cache.put(image_id, image, length)
+        return image
+
+    def prefetch_images(self, image_ids):
+        """Fetch images into image_cache in a background thread.
+
+        Images that can't be fetched are skipped.
+
+        Args:
+            image_ids: Sequence of image ids.
+
+        Returns: The started threading.Thread.
+        """
+        thread = threading.Thread(target=_prefetch_images,
+                                  args=(self, list(image_ids)),
+                                  name='Spytify image prefetch')
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def play_list(self, Playlist playlist, Track starting_track=None):
+        """Play a playlist, continuing to the next song when finished.
+
+        Args:
+            playlist: Playlist to play from.
+            starting_track: If not None (default), then track to start playback from.
+        """
+        cdef track* starting_track_ptr = playlist.data.tracks
+        self.check_audio()
+        playlist.load_all()
+        if starting_track is not None:
+            starting_track_ptr = starting_track.data
+
+        self.start_playback(starting_track_ptr, True)
+        audio_thread.thread_flush(self.thread)
+        audio_thread.thread_play(self.thread)
+
+    def play(self, Track track):
+        """Start playback of a given track.
+
+        Args:
+            track: Play this track.
+        """
+        self.check_audio()
+        self.start_playback(track.data, False)
+        audio_thread.thread_flush(self.thread)
+        audio_thread.thread_play(self.thread)
+
+    def pcm_stream(self, Track track, object buffer=None,
+                   int buffer_size=1024 * 1024):
+        """Decode a track without playing it.
+
+        Stops any playback through the audio device.
+
+        Args:
+            track: Track to decode.
+            buffer: Writable buffer to fill when iterating over the stream.
+            buffer_size: Size of the bytearray to use if buffer is None.
+
+        Returns: PCMStream for the track.
+        """
+        if buffer is None:
+            buffer = bytearray(buffer_size)
+
+        self.check_open()
+        if self.thread != NULL:
+            with nogil:
+                audio_thread.thread_suspend(self.thread)
+        self.start_playback(track.data, False)
+        return PCMStream(self, track, buffer)
+
+    cdef start_playback(self, track* first, bint play_as_list):
+        cdef bint playing
+        with self.lock:
+            self.check_open()
+            with nogil:
+                playing = despotify_play(self.ds, first, play_as_list)
+            if not playing:
+                raise session_error(self.ds)
+
+    def stop(self):
+        """Stop playback."""
+        cdef bint stopped
+        with self.lock:
+            self.check_open()
+            with nogil:
+                stopped = despotify_stop(self.ds)
+            if not stopped:
+                raise session_error(self.ds)
+        if self.thread != NULL:
+            audio_thread.thread_flush(self.thread)
+
+    def pause(self):
+        """Pause playback."""
+        self.check_audio()
+        audio_thread.thread_pause(self.thread)
+
+    def resume(self):
+        """Resume playback."""
+        self.check_audio()
+        audio_thread.thread_play(self.thread)
+
+    def next(self):
+        """Play next song in playlist."""
+        with self.lock:
+            self.check_open()
+            with nogil:
+                despotify_next(self.ds)
+        if self.thread != NULL:
+            audio_thread.thread_flush(self.thread)
+
+    cdef Spytify get_session(self):
+        return self
+
+    cdef int check_open(self) except -1:
+        """Raises SpytifyConnectionError if the session was closed.
+
+        Call it with the lock held, as close() clears ds with the lock held.
+        """
+        if self.ds == NULL:
+            raise SpytifyConnectionError('Session is closed')
+        return 0
+
+    cdef int check_audio(self) except -1:
+        """Raises SpytifyError if the session plays to no audio device."""
+        self.check_open()
+        if self.thread == NULL:
+            raise SpytifyError('Session was opened without audio')
+        return 0
+
+    def close(self):
+        """Close the session with the server."""
+        if self.ds == NULL:
+            return
+
+        # The revalidation uses the session until it is done.
+        if self.revalidation is not None and \
+           self.revalidation is not threading.current_thread():
+            self.revalidation.join()
+
+        if self.thread != NULL:
+            with nogil:
+                audio_thread.thread_exit(self.thread)
+            self.thread = NULL
+        with self.lock:
+            with nogil:
+                despotify_exit(self.ds)
+            self.ds = NULL
+
+        event_ring.event_ring_wake(self.events)
+        if self.dispatcher is not None and \
+           self.dispatcher is not threading.current_thread():
+            self.dispatcher.join()
+
+        event_ring.event_ring_free(self.events)
+        self.events = NULL
+
+def split_uri(str uri):
+    """Splits an URI like spotify:track:32a2n4NPXhH3OI06VPLwTA.
+
+    Args:
+        uri: URI like
+            spotify:track:32a2n4NPXhH3OI06VPLwTA
+            or track:32a2n4NPXhH3OI06VPLwTA
+    Returns:
+        Tuple of (lowercase type, base-62 id).
+    """
+    cdef list parts = uri.split(':', 3)
+    if len(parts) < 2:
+        raise SpytifyError('Ambigious URI specified: %s' % uri)
+    if len(parts) > 2 and parts[0] != 'spotify':
+        raise SpytifyError('URI not meant for us: %s' % uri)
+
+    return parts[-2].lower(), parts[-1]
+
+def set_disk_cache_size(unsigned long max_bytes):
+    """Set the max size of the despotify disk cache, evicting the least
+    recently used entries if it's bigger.
+
+    The disk cache is used by sessions created with use_cache=True, and
+    shared by all of them.
+
+    Args:
+        max_bytes: Max size in bytes, 0 means no limit.
+    """
+    despotify_set_cache_size(max_bytes)
+
+def disk_cache_stats():
+    """Returns a dict of entry count, size and hit/miss counters of the
+    despotify disk cache."""
+    cdef cache_stats stats
+    despotify_get_cache_stats(&stats)
+    return {
+        'entries': stats.entries,
+        'bytes': stats.bytes,
+        'max_bytes': stats.max_bytes,
+        'hits': stats.hits,
+        'misses': stats.misses,
+        'evictions': stats.evictions,
+    }
+
+def clear_disk_cache():
+    """Remove everything from the despotify disk cache."""
+    despotify_clear_cache()
+
+def bytestr_to_hexstr(str bytes):
+    return ''.join(["%02x" % ord(c) for c in bytes])
+
+# Wrapper for despotify_cleanup.
+def _cleanup():
+    assert(despotify_cleanup())
+
+# Python threads release the GIL around blocking despotify calls.
+PyEval_InitThreads()
+
+assert(despotify_init())
+atexit.register(_cleanup)
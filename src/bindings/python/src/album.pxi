@@ -54,20 +54,44 @@ cdef class AlbumDataFull(AlbumData):
         next.browse = self.browse.next
         return next
 
+    def __dealloc__(self):
+        if self.take_owner and self.browse != NULL:
+            despotify_free_album_browse(self.browse)
+
 cdef class Album(SpotifyObject):
     def __init__(self):
         raise TypeError("This class cannot be instantiated from Python")
 
     cdef get_full_data(self):
+        cdef char* id
+        cdef album_browse* browse
+        cdef Album cached
         if self.full_data == None:
+            id = self.data.id()
+            cached = self.cache.get(('album', id))
+            if cached is not None:
+                self.full_data = cached.full_data
+                self.data = self.full_data
+                return
+
+            with self.lock:
+                self.check_open()
+                with nogil:
+                    browse = despotify_get_album(self.ds, id)
             self.full_data = AlbumDataFull()
-            self.full_data.browse = despotify_get_album(self.ds, self.data.id())
+            self.full_data.browse = browse
+            self.full_data.take_owner = True
             self.data = self.full_data
+            if browse:
+                self.cache.put(('album', id), self, album_browse_size(browse))
 
     def get_uri(self):
-        cdef char uri_id[23]
-        despotify_id2uri(self.id, uri_id)
-        return 'spotify:album:%s' % uri_id
+        return 'spotify:album:' + hex_to_base62(self.data.id())
+
+    cdef SpotifyId get_spotify_id(self):
+        if self.data is None:
+            return None
+        return id_from_hex(self.data.id())
 
     property name:
         def __get__(self):
@@ -80,7 +104,11 @@ cdef class Album(SpotifyObject):
     property tracks:
         def __get__(self):
             self.get_full_data()
-            return self.tracks_to_list(self.full_data.tracks())
+            if self.track_list is None:
+                self.track_list = self.create_lazy_list(
+                    LAZY_TRACKS, self.full_data.tracks(),
+                    self.full_data.num_tracks())
+            return self.track_list
 
     property year:
         def __get__(self):
@@ -95,11 +123,5 @@ cdef class Album(SpotifyObject):
         def __get__(self):
             return self.data.popularity()
 
-    def __dealloc__(self):
-        if self.take_owner:
-            if self.full_data is not None:
-                if self.full_data.browse != NULL:
-                    despotify_free_album_browse(self.full_data.browse)
-
     def __repr__(self):
         return '<Album: %s (%s)>' % (self.name, self.id)
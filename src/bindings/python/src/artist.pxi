@@ -50,21 +50,45 @@ cdef class ArtistDataFull(ArtistData):
     cdef album_browse* albums(self):
         return self.browse.albums if self.browse != NULL else NULL
 
+    def __dealloc__(self):
+        if self.take_owner and self.browse != NULL:
+            despotify_free_artist_browse(self.browse)
+
 
 cdef class Artist(SpotifyObject):
     def __init__(self):
         raise TypeError("This class cannot be instantiated from Python")
 
     def get_uri(self):
-        cdef char uri_id[23]
-        despotify_id2uri(self.id, uri_id)
-        return 'spotify:artist:%s' % uri_id
+        return 'spotify:artist:' + hex_to_base62(self.data.id())
+
+    cdef SpotifyId get_spotify_id(self):
+        if self.data is None:
+            return None
+        return id_from_hex(self.data.id())
 
     cdef get_full_data(self):
+        cdef char* id
+        cdef artist_browse* browse
+        cdef Artist cached
         if self.full_data == None:
+            id = self.data.id()
+            cached = self.cache.get(('artist', id))
+            if cached is not None:
+                self.full_data = cached.full_data
+                self.data = self.full_data
+                return
+
+            with self.lock:
+                self.check_open()
+                with nogil:
+                    browse = despotify_get_artist(self.ds, id)
             self.full_data = ArtistDataFull()
-            self.full_data.browse = despotify_get_artist(self.ds, self.data.id())
+            self.full_data.browse = browse
+            self.full_data.take_owner = True
             self.data = self.full_data
+            if browse:
+                self.cache.put(('artist', id), self, artist_browse_size(browse))
 
     property name:
         def __get__(self):
@@ -95,14 +119,11 @@ cdef class Artist(SpotifyObject):
     property albums:
         def __get__(self):
             self.get_full_data()
-            return self.albums_to_list(self.full_data.albums())
-
-    def __dealloc__(self):
-        if self.take_owner:
-            if self.full_data is not None:
-                if self.full_data.browse != NULL:
-                    despotify_free_artist_browse(self.full_data.browse)
-
+            if self.album_list is None:
+                self.album_list = self.create_lazy_list(
+                    LAZY_ALBUMS, self.full_data.albums(),
+                    self.full_data.num_albums())
+            return self.album_list
 
     def __repr__(self):
         return '<Artist: %s (%s)>' % (self.name, self.id)
@@ -1,5 +1,6 @@
 /*
- * A very simple despotify client, to show how the library is used.
+ * Playback for spytify: a decoder thread filling a ring of decoded PCM,
+ * and an output thread playing it.
  *
  * $Id$
  *
@@ -14,83 +15,209 @@
 #include "audio_thread.h"
 #include "audio.h"
 
-static void* thread_loop(void* arg)
+static void* decoder_loop(void* arg)
 {
     struct thread_state *ts = arg;
-    struct pcm_data pcm;
-    
-    pthread_mutex_init(&ts->thread_mutex, NULL);
-    pthread_cond_init(&ts->thread_cond, NULL);
-
-    bool loop = true;
-    while (loop) {
-        switch (ts->state) {
-            case PAUSE:
-                pthread_mutex_lock(&ts->thread_mutex);
-                pthread_cond_wait(&ts->thread_cond, &ts->thread_mutex);
-                pthread_mutex_unlock(&ts->thread_mutex);
-                break;
-
-            case PLAY: {
-                int rc = despotify_get_pcm(ts->session, &pcm);
-                if (rc == 0)
-                    audio_play_pcm(ts->audio_device, &pcm);
-                else {
-                    exit(-1);
-                }
-                break;
-            }
 
-            case EXIT:
-                loop = false;
-                break;
+    pthread_mutex_lock(&ts->thread_mutex);
+    while (true) {
+        /* After a flush, head may come round to the slot the output
+           thread is still playing; wait for it rather than overwrite it. */
+        while (ts->state != EXIT &&
+               (ts->state != PLAY || ts->count == ts->slots ||
+                ts->draining || ts->head == ts->reading))
+            pthread_cond_wait(&ts->decode_cond, &ts->thread_mutex);
+
+        if (ts->state == EXIT)
+            break;
+
+        /* The slot at head is the decoder's alone until it is counted. */
+        struct pcm_data* pcm = &ts->ring[ts->head];
+        int generation = ts->generation;
+        ts->decoding = true;
+        pthread_mutex_unlock(&ts->thread_mutex);
+
+        int rc = despotify_get_pcm(ts->session, pcm);
+
+        pthread_mutex_lock(&ts->thread_mutex);
+        ts->decoding = false;
+        pthread_cond_broadcast(&ts->idle_cond);
+
+        if (generation != ts->generation)
+            continue;
+
+        if (rc) {
+            /* Decoding failed, stop playing rather than spin. */
+            ts->draining = true;
+            pthread_cond_signal(&ts->output_cond);
+        }
+        else if (pcm->len > 0) {
+            ts->head = (ts->head + 1) % ts->slots;
+            ts->count++;
+            ts->bytes += pcm->len;
+            pthread_cond_signal(&ts->output_cond);
         }
     }
+    pthread_mutex_unlock(&ts->thread_mutex);
 
-    pthread_cond_destroy(&ts->thread_cond);
-    pthread_mutex_destroy(&ts->thread_mutex);
+    return NULL;
+}
+
+static void* output_loop(void* arg)
+{
+    struct thread_state *ts = arg;
+
+    pthread_mutex_lock(&ts->thread_mutex);
+    while (ts->state != EXIT) {
+        if (ts->state == PLAY && !ts->count) {
+            if (ts->draining) {
+                ts->state = PAUSE;
+                ts->draining = false;
+                pthread_cond_signal(&ts->decode_cond);
+                continue;
+            }
+
+            if (ts->playing) {
+                ts->underruns++;
+                ts->playing = false;
+            }
+        }
+
+        if (ts->state != PLAY || !ts->count) {
+            pthread_cond_wait(&ts->output_cond, &ts->thread_mutex);
+            continue;
+        }
+
+        struct pcm_data* pcm;
+        int generation = ts->generation;
+        ts->reading = (ts->head - ts->count + ts->slots) % ts->slots;
+        pcm = &ts->ring[ts->reading];
+        pthread_mutex_unlock(&ts->thread_mutex);
+
+        audio_play_pcm(ts->audio_device, pcm);
+
+        pthread_mutex_lock(&ts->thread_mutex);
+        ts->reading = -1;
+        pthread_cond_signal(&ts->decode_cond);
+        if (generation != ts->generation)
+            continue;
+
+        ts->count--;
+        ts->bytes -= pcm->len;
+        ts->playing = true;
+    }
+    pthread_mutex_unlock(&ts->thread_mutex);
 
     return NULL;
 }
 
-void thread_play(struct thread_state* ts)
+static void thread_set_state(struct thread_state* ts, enum play_state state)
 {
     pthread_mutex_lock(&ts->thread_mutex);
-    ts->state = PLAY;
-    pthread_cond_signal(&ts->thread_cond);
+    ts->state = state;
+    pthread_cond_broadcast(&ts->decode_cond);
+    pthread_cond_broadcast(&ts->output_cond);
     pthread_mutex_unlock(&ts->thread_mutex);
 }
 
+void thread_play(struct thread_state* ts)
+{
+    thread_set_state(ts, PLAY);
+}
+
 void thread_pause(struct thread_state* ts)
+{
+    thread_set_state(ts, PAUSE);
+}
+
+/* Drop the decoded PCM, after the session started, stopped or skipped a
+   track. */
+void thread_flush(struct thread_state* ts)
+{
+    pthread_mutex_lock(&ts->thread_mutex);
+    ts->generation++;
+    ts->count = 0;
+    ts->bytes = 0;
+    ts->draining = false;
+    ts->playing = false;
+    pthread_cond_broadcast(&ts->decode_cond);
+    pthread_cond_broadcast(&ts->output_cond);
+    pthread_mutex_unlock(&ts->thread_mutex);
+}
+
+/* Pause and flush, and wait for the decoder to leave the session alone. */
+void thread_suspend(struct thread_state* ts)
 {
     pthread_mutex_lock(&ts->thread_mutex);
     ts->state = PAUSE;
+    ts->generation++;
+    ts->count = 0;
+    ts->bytes = 0;
+    ts->draining = false;
+    ts->playing = false;
+    pthread_cond_broadcast(&ts->output_cond);
+    while (ts->decoding)
+        pthread_cond_wait(&ts->idle_cond, &ts->thread_mutex);
     pthread_mutex_unlock(&ts->thread_mutex);
 }
 
 void thread_exit(struct thread_state* ts)
+{
+    thread_set_state(ts, EXIT);
+
+    pthread_join(ts->decoder, NULL);
+    pthread_join(ts->output, NULL);
+
+    pthread_cond_destroy(&ts->idle_cond);
+    pthread_cond_destroy(&ts->output_cond);
+    pthread_cond_destroy(&ts->decode_cond);
+    pthread_mutex_destroy(&ts->thread_mutex);
+    free(ts->ring);
+    free(ts);
+}
+
+void thread_buffer_state(struct thread_state* ts, int* used, int* slots,
+                         int* bytes, unsigned long* underruns)
 {
     pthread_mutex_lock(&ts->thread_mutex);
-    ts->state = EXIT;
-    pthread_cond_signal(&ts->thread_cond);
+    *used = ts->count;
+    *slots = ts->slots;
+    *bytes = ts->bytes;
+    *underruns = ts->underruns;
     pthread_mutex_unlock(&ts->thread_mutex);
-
-    pthread_join(ts->thread, NULL);
 }
 
-struct thread_state* thread_init(struct despotify_session* session)
+struct thread_state* thread_init(struct despotify_session* session,
+                                 int buffer_size)
 {
     /* Allocate a new thread state. */
-    struct thread_state* ts = malloc(sizeof(struct thread_state));
+    struct thread_state* ts = calloc(1, sizeof(struct thread_state));
+    if (!ts)
+        return NULL;
+
+    /* .. with a ring of at least two slots. */
+    ts->slots = buffer_size / (int) sizeof(ts->ring->buf);
+    if (ts->slots < 2)
+        ts->slots = 2;
+    ts->ring = calloc(ts->slots, sizeof(struct pcm_data));
+    if (!ts->ring) {
+        free(ts);
+        return NULL;
+    }
 
-    /* .. and initialize the values to sane stuff. */
-    memset(ts, 0, sizeof(struct thread_state));
     ts->audio_device = audio_init();
     ts->session = session;
     ts->state = PAUSE;
+    ts->reading = -1;
+
+    pthread_mutex_init(&ts->thread_mutex, NULL);
+    pthread_cond_init(&ts->decode_cond, NULL);
+    pthread_cond_init(&ts->output_cond, NULL);
+    pthread_cond_init(&ts->idle_cond, NULL);
 
-    /* Fire off a thread to play audio! */
-    pthread_create(&ts->thread, NULL, &thread_loop, ts);
+    /* Fire off the threads to play audio! */
+    pthread_create(&ts->decoder, NULL, &decoder_loop, ts);
+    pthread_create(&ts->output, NULL, &output_loop, ts);
 
     return ts;
 }
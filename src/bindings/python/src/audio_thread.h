@@ -1,6 +1,15 @@
 #ifndef AUDIO_THREAD_H
 #define AUDIO_THREAD_H
 
+#include <pthread.h>
+#include <stdbool.h>
+
+/*
+ * Playback through the audio device, in two threads: the decoder fills a
+ * ring of decoded PCM from despotify, and the output thread plays it.
+ * The ring hides decoder and network hiccups from the device.
+ */
+
 enum play_state {
     PAUSE,
     PLAY,
@@ -8,18 +17,42 @@ enum play_state {
 };
 
 struct thread_state {
-    pthread_t thread;
+    pthread_t decoder;
+    pthread_t output;
     pthread_mutex_t thread_mutex;
-    pthread_cond_t thread_cond;
+    pthread_cond_t decode_cond; /* room in the ring, or a new state */
+    pthread_cond_t output_cond; /* PCM in the ring, or a new state */
+    pthread_cond_t idle_cond; /* the decoder left despotify_get_pcm() */
 
     void* audio_device;
     struct despotify_session* session;
     enum play_state state;
+
+    /* Decoded PCM, count slots ending before head */
+    struct pcm_data* ring;
+    int slots;
+    int head;
+    int count;
+    int bytes;
+
+    int generation; /* bumped by thread_flush(), to drop PCM in flight */
+    bool decoding; /* the decoder is in despotify_get_pcm() */
+    int reading; /* slot the output thread is playing, or -1 */
+    bool draining; /* decoding failed, play what is left and pause */
+    bool playing; /* PCM has been played since the last flush */
+    unsigned long underruns;
 };
 
-struct thread_state* thread_init(struct despotify_session* session);
+struct thread_state* thread_init(struct despotify_session* session,
+                                 int buffer_size);
 void thread_play(struct thread_state* ts);
 void thread_pause(struct thread_state* ts);
+void thread_flush(struct thread_state* ts);
+void thread_suspend(struct thread_state* ts);
 void thread_exit(struct thread_state* ts);
 
+/* Fill level of the ring, in slots of sizeof(pcm_data.buf) bytes */
+void thread_buffer_state(struct thread_state* ts, int* used, int* slots,
+                         int* bytes, unsigned long* underruns);
+
 #endif
@@ -4,7 +4,12 @@ cdef extern from "audio_thread.h":
     cdef struct thread_state:
         pass
 
-    thread_state* thread_init(despotify.despotify_session* session)
+    thread_state* thread_init(despotify.despotify_session* session,
+                              int buffer_size)
     void thread_play(thread_state*)
     void thread_pause(thread_state*)
-    void thread_exit(thread_state*)
+    void thread_flush(thread_state*)
+    void thread_suspend(thread_state*) nogil
+    void thread_exit(thread_state*) nogil
+    void thread_buffer_state(thread_state*, int* used, int* slots,
+                             int* bytes, unsigned long* underruns)
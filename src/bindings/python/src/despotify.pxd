@@ -1,5 +1,7 @@
 cdef extern from "despotify.h":
     int MAX_SEARCH_RESULTS
+    int c_MAX_BROWSE_REQ "MAX_BROWSE_REQ"
+    int TIMEOUT
     int DESPOTIFY_TRACK_CHANGE
 
     cdef enum link_type:
@@ -108,6 +110,45 @@ cdef extern from "despotify.h":
         track * tracks
         playlist * playlist
 
+    cdef struct cache_stats:
+        unsigned int entries
+        unsigned long bytes
+        unsigned long max_bytes
+        unsigned long hits
+        unsigned long misses
+        unsigned long evictions
+
+    cdef enum:
+        DESPOTIFY_OP_COUNT
+        DESPOTIFY_LATENCY_BUCKETS
+
+    double despotify_latency_bounds[]
+
+    cdef struct op_stats:
+        unsigned long count
+        unsigned long errors
+        unsigned long bytes
+        double seconds
+        double max_seconds
+        unsigned long buckets[14]
+
+    cdef struct despotify_stats:
+        op_stats ops[9]
+        unsigned long cache_hits
+        unsigned long cache_misses
+        unsigned long fifo_samples
+        unsigned long fifo_below_watermark
+        double fifo_fill_sum
+        int fifo_bytes
+        int fifo_max_bytes
+        int fifo_watermark
+
+    cdef struct pcm_data:
+        int samplerate
+        int channels
+        int len
+        char buf[4096]
+
     cdef struct despotify_session:
         bint initialized
         session * session
@@ -121,53 +162,80 @@ cdef extern from "despotify.h":
         int offset
         bint list_of_lists
         bint play_as_list
+        bint high_bitrate
+        bint use_cache
+        double time_to_first_pcm
+
+        void* vf
+        void* mf
 
         void (*client_callback)(int, void*)
 
-    cdef enum callback_signal:
+    cdef enum:
         DESPOTIFY_NEW_TRACK = 1
         DESPOTIFY_TIME_TELL = 2
         DESPOTIFY_END_OF_PLAYLIST = 3
+        DESPOTIFY_TRACK_PLAY_ERROR = 4
 
     bint despotify_init()
     char * despotify_get_error(despotify_session *)
     bint despotify_cleanup()
 
+    void despotify_set_cache_size(unsigned long)
+    void despotify_get_cache_stats(cache_stats *)
+    void despotify_clear_cache()
+
     despotify_session *despotify_init_client(void(*)(despotify_session *, int, void*, void*), void*, bint, bint)
+    void despotify_set_buffer_size(despotify_session *, int)
+    void despotify_set_watermark(despotify_session *, int)
+    void despotify_set_prefetch(despotify_session *, int, int)
 
-    bint despotify_authenticate(despotify_session *, char *, char *)
-    void despotify_exit(despotify_session *)
-    void despotify_free(despotify_session *, bint)
+    void despotify_get_stats(despotify_session *, despotify_stats *)
+    void despotify_reset_stats(despotify_session *)
 
-    void * despotify_get_image(despotify_session *, char *, int *)
+    bint despotify_authenticate(despotify_session *, char *, char *) nogil
+    void despotify_exit(despotify_session *) nogil
+    void despotify_free(despotify_session *, bint)
 
-    playlist * despotify_get_playlist(despotify_session *, char *)
-    bint despotify_rename_playlist(despotify_session *, playlist *, char *)
+    void * despotify_get_image(despotify_session *, char *, int *) nogil
+    void * despotify_map_image(despotify_session *, char *, int *, bint *) nogil
+    void despotify_free_image(void *, int, bint) nogil
+
+    playlist * despotify_get_playlist(despotify_session *, char *, bint) nogil
+    playlist * despotify_get_playlist_ids(despotify_session *, char *, bint) nogil
+    int despotify_load_playlist_tracks(despotify_session *, playlist *,
+                                       track **, bint) nogil
+    bint despotify_get_playlist_revision(despotify_session *, char *, bint,
+                                         unsigned int *, unsigned int *) nogil
+    bint despotify_rename_playlist(despotify_session *, playlist *, char *) nogil
     void despotify_free_playlist(playlist *)
-    bint despotify_set_playlist_collaboration(despotify_session *, playlist *, bint)
-    playlist * despotify_get_stored_playlists(despotify_session *)
+    bint despotify_set_playlist_collaboration(despotify_session *, playlist *, bint) nogil
+    playlist * despotify_get_stored_playlists(despotify_session *) nogil
+    bint despotify_save_snapshot(char *, playlist **, int, unsigned int) nogil
+    playlist * despotify_load_snapshot(char *, unsigned int *) nogil
 
-    album_browse * despotify_get_album(despotify_session *, char *)
+    album_browse * despotify_get_album(despotify_session *, char *) nogil
     void despotify_free_album_browse(album_browse *)
 
-    artist_browse * despotify_get_artist(despotify_session *, char *)
+    artist_browse * despotify_get_artist(despotify_session *, char *) nogil
     void despotify_free_artist_browse(artist_browse *)
 
-    search_result * despotify_search(despotify_session *, char *, int)
-    search_result * despotify_search_more(despotify_session *, search_result *, int, int)
+    search_result * despotify_search(despotify_session *, char *, int) nogil
+    search_result * despotify_search_page(despotify_session *, char *, int, int) nogil
+    search_result * despotify_search_more(despotify_session *, search_result *, int, int) nogil
     void despotify_free_search(search_result *)
 
-    track * despotify_get_track(despotify_session *, char *)
+    track * despotify_get_track(despotify_session *, char *) nogil
     track * despotify_get_current_track(despotify_session *)
-    track * despotify_get_tracks(despotify_session *, char * *, int)
+    track * despotify_get_tracks(despotify_session *, char * *, int) nogil
     void despotify_free_track(track *)
 
     link * despotify_link_from_uri(char *)
-    artist_browse * despotify_link_get_artist(despotify_session *, link *)
-    album_browse * despotify_link_get_album(despotify_session *, link *)
-    playlist * despotify_link_get_playlist(despotify_session *, link *)
-    search_result * despotify_link_get_search(despotify_session *, link *)
-    track * despotify_link_get_track(despotify_session *, link *)
+    artist_browse * despotify_link_get_artist(despotify_session *, link *) nogil
+    album_browse * despotify_link_get_album(despotify_session *, link *) nogil
+    playlist * despotify_link_get_playlist(despotify_session *, link *) nogil
+    search_result * despotify_link_get_search(despotify_session *, link *) nogil
+    track * despotify_link_get_track(despotify_session *, link *) nogil
     void despotify_free_link(link *)
 
     void despotify_uri2id(char *, char *)
@@ -178,6 +246,7 @@ cdef extern from "despotify.h":
     char * despotify_search_to_uri(search_result *, char *)
     char * despotify_track_to_uri(track *, char *)
 
-    bint despotify_play(despotify_session *, track *, bint)
-    bint despotify_stop(despotify_session *)
-    void despotify_next(despotify_session *)
+    bint despotify_play(despotify_session *, track *, bint) nogil
+    bint despotify_stop(despotify_session *) nogil
+    int despotify_get_pcm(despotify_session *, pcm_data *) nogil
+    void despotify_next(despotify_session *) nogil
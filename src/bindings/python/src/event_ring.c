@@ -0,0 +1,201 @@
+/*
+ * Lock-free event queue between the despotify threads and Python.
+ *
+ * The ring is a bounded multi-producer, single-consumer queue: every slot
+ * carries a sequence number telling writers and the reader whose turn it
+ * is. Writers are the decoder and network threads, the reader is whoever
+ * holds the GIL.
+ *
+ * The track of a DESPOTIFY_NEW_TRACK is gone once the callback returns, so
+ * the ring holds a copy of it, which the reader takes over.
+ */
+
+#include <errno.h>
+#include <fcntl.h>
+#include <stdlib.h>
+#include <string.h>
+#include <unistd.h>
+
+#include "event_ring.h"
+
+struct event_ring* event_ring_new(unsigned int size)
+{
+    struct event_ring* ring;
+    unsigned int capacity = 1;
+    unsigned int i;
+
+    while (capacity < size)
+        capacity <<= 1;
+
+    ring = calloc(1, sizeof(struct event_ring) +
+                     capacity * sizeof(struct event_slot));
+    if (!ring)
+        return NULL;
+
+    if (pipe(ring->fds)) {
+        free(ring);
+        return NULL;
+    }
+
+    for (i = 0; i < 2; i++) {
+        fcntl(ring->fds[i], F_SETFL,
+              fcntl(ring->fds[i], F_GETFL) | O_NONBLOCK);
+        fcntl(ring->fds[i], F_SETFD, FD_CLOEXEC);
+    }
+
+    ring->mask = capacity - 1;
+    for (i = 0; i < capacity; i++)
+        ring->slots[i].seq = i;
+
+    return ring;
+}
+
+void event_ring_free(struct event_ring* ring)
+{
+    struct event_slot* slot;
+
+    /* Free the tracks of the events nobody took. */
+    for (;;) {
+        slot = &ring->slots[ring->tail & ring->mask];
+        if ((int) (slot->seq - (ring->tail + 1)) < 0)
+            break;
+
+        if (slot->event.signal == DESPOTIFY_NEW_TRACK && slot->event.data)
+            despotify_free_track(slot->event.data);
+        ring->tail++;
+    }
+
+    close(ring->fds[0]);
+    close(ring->fds[1]);
+    free(ring);
+}
+
+void event_ring_wake(struct event_ring* ring)
+{
+    char byte = 0;
+
+    /* If the write fails the pipe is full, so the reader is awake anyway. */
+    if (!__sync_lock_test_and_set(&ring->notified, 1))
+        while (write(ring->fds[1], &byte, 1) < 0 && errno == EINTR)
+            ;
+}
+
+/* Copy a track, except for its key and the tracks after it */
+static struct track* copy_track(const struct track* t)
+{
+    struct track* copy = malloc(sizeof(struct track));
+    struct artist** link;
+
+    if (!copy)
+        return NULL;
+
+    memcpy(copy, t, sizeof(struct track));
+    copy->key = NULL;
+    copy->next = NULL;
+    copy->allowed = t->allowed ? strdup(t->allowed) : NULL;
+    copy->forbidden = t->forbidden ? strdup(t->forbidden) : NULL;
+
+    link = &copy->artist;
+    *link = NULL;
+    for (struct artist* a = t->artist; a; a = a->next) {
+        if (!(*link = malloc(sizeof(struct artist))))
+            break;
+
+        memcpy(*link, a, sizeof(struct artist));
+        (*link)->next = NULL;
+        link = &(*link)->next;
+    }
+
+    return copy;
+}
+
+/* Returns false if the ring was full and the event was dropped */
+static bool event_ring_push(struct event_ring* ring, int signal, void* data)
+{
+    struct event_slot* slot;
+    unsigned int pos = ring->head;
+    int diff;
+
+    for (;;) {
+        slot = &ring->slots[pos & ring->mask];
+        diff = (int) (slot->seq - pos);
+
+        if (diff == 0) {
+            if (__sync_bool_compare_and_swap(&ring->head, pos, pos + 1))
+                break;
+        }
+        else if (diff < 0) {
+            __sync_fetch_and_add(&ring->dropped, 1);
+            return false;
+        }
+
+        pos = ring->head;
+    }
+
+    slot->event.signal = signal;
+    slot->event.data = data;
+    __sync_synchronize();
+    slot->seq = pos + 1;
+    return true;
+}
+
+void event_ring_callback(struct despotify_session* ds, int signal,
+                         void* data, void* arg)
+{
+    struct event_ring* ring = arg;
+    unsigned long long bits;
+
+    (void) ds;
+
+    if (signal == DESPOTIFY_TIME_TELL) {
+        memcpy(&bits, data, sizeof(bits));
+        __sync_lock_test_and_set(&ring->time_tell, bits);
+        __sync_lock_test_and_set(&ring->has_time_tell, 1);
+    }
+    else if (signal == DESPOTIFY_NEW_TRACK) {
+        data = data ? copy_track(data) : NULL;
+        if (!event_ring_push(ring, signal, data) && data)
+            despotify_free_track(data);
+    }
+    else
+        event_ring_push(ring, signal, data);
+
+    event_ring_wake(ring);
+}
+
+int event_ring_drain(struct event_ring* ring, struct event* events, int max,
+                     double* time_tell, int* has_time_tell)
+{
+    struct event_slot* slot;
+    unsigned long long bits;
+    char buf[64];
+    int count = 0;
+
+    /* Clear the notification first, so anything pushed from here on
+       writes to the pipe again. */
+    __sync_lock_release(&ring->notified);
+    while (read(ring->fds[0], buf, sizeof(buf)) > 0)
+        ;
+
+    while (count < max) {
+        slot = &ring->slots[ring->tail & ring->mask];
+        if ((int) (slot->seq - (ring->tail + 1)) < 0)
+            break;
+
+        events[count++] = slot->event;
+        __sync_synchronize();
+        slot->seq = ring->tail + ring->mask + 1;
+        ring->tail++;
+    }
+
+    *has_time_tell = __sync_lock_test_and_set(&ring->has_time_tell, 0);
+    if (*has_time_tell) {
+        bits = __sync_fetch_and_add(&ring->time_tell, 0);
+        memcpy(time_tell, &bits, sizeof(bits));
+    }
+
+    if (count == max)
+        event_ring_wake(ring); /* there may be more */
+
+    return count;
+}
@@ -0,0 +1,53 @@
+#ifndef EVENT_RING_H
+#define EVENT_RING_H
+
+#include <despotify.h>
+
+/*
+ * Queue of despotify callback signals, filled by the library threads
+ * without taking any lock and drained by the Python side at its own pace.
+ *
+ * DESPOTIFY_TIME_TELL is not queued; only the latest position is kept.
+ */
+
+struct event {
+    int signal;
+    void* data; /* for DESPOTIFY_NEW_TRACK, a copy of the track, which
+                   the reader frees with despotify_free_track() */
+};
+
+struct event_slot {
+    volatile unsigned int seq;
+    struct event event;
+};
+
+struct event_ring {
+    unsigned int mask;
+    volatile unsigned int head; /* next slot to write */
+    unsigned int tail; /* next slot to read, used by the reader only */
+    volatile unsigned int dropped; /* events lost because the ring was full */
+
+    volatile int has_time_tell;
+    volatile unsigned long long time_tell; /* bits of a double */
+
+    volatile int notified; /* a byte is waiting in the pipe */
+    int fds[2];
+
+    struct event_slot slots[];
+};
+
+struct event_ring* event_ring_new(unsigned int size);
+void event_ring_free(struct event_ring* ring);
+
+/* Client callback for despotify_init_client, with the ring as its data. */
+void event_ring_callback(struct despotify_session* ds, int signal,
+                         void* data, void* ring);
+
+/* Makes the fd readable, waking up anyone waiting on it. */
+void event_ring_wake(struct event_ring* ring);
+
+/* Must not be called from more than one thread at a time. */
+int event_ring_drain(struct event_ring* ring, struct event* events, int max,
+                     double* time_tell, int* has_time_tell);
+
+#endif
@@ -0,0 +1,18 @@
+cimport despotify
+
+cdef extern from "event_ring.h":
+    cdef struct event:
+        int signal
+        void* data
+
+    cdef struct event_ring:
+        unsigned int dropped
+        int fds[2]
+
+    event_ring* event_ring_new(unsigned int size)
+    void event_ring_free(event_ring* ring)
+    void event_ring_callback(despotify.despotify_session* ds, int signal,
+                             void* data, void* ring)
+    void event_ring_wake(event_ring* ring)
+    int event_ring_drain(event_ring* ring, event* events, int max,
+                         double* time_tell, int* has_time_tell)
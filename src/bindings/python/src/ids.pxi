@@ -0,0 +1,258 @@
+# vim: set fileencoding=utf-8 filetype=pyrex :
+
+cdef extern from "string.h":
+    int memcmp(void* a, void* b, size_t n) nogil
+    size_t strlen(char* s) nogil
+
+cdef extern from "spytify.h":
+    cdef SpotifyId NEW_SPOTIFYID "PY_NEW" (object t)
+
+cdef char* BASE62 = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+cdef char* HEX_DIGITS = "0123456789abcdef"
+
+# Value of every character in base 16 and base 62, -1 if it isn't a digit.
+cdef int HEX_VALUES[256]
+cdef int BASE62_VALUES[256]
+
+cdef init_digit_values():
+    cdef int i
+    for i in range(256):
+        HEX_VALUES[i] = -1
+        BASE62_VALUES[i] = -1
+    for i in range(16):
+        HEX_VALUES[<unsigned char>HEX_DIGITS[i]] = i
+    for i in range(10, 16):
+        HEX_VALUES[<unsigned char>(HEX_DIGITS[i] - 32)] = i
+    for i in range(62):
+        BASE62_VALUES[<unsigned char>BASE62[i]] = i
+
+init_digit_values()
+
+# The 128 bit numbers are handled as four 32 bit limbs, most significant
+# first, so the conversions need no bignums.
+
+cdef int parse_hex(char* s, unsigned char* raw) nogil:
+    cdef int i, high, low
+    for i in range(16):
+        high = HEX_VALUES[<unsigned char>s[2 * i]]
+        low = HEX_VALUES[<unsigned char>s[2 * i + 1]]
+        if high < 0 or low < 0:
+            return -1
+        raw[i] = high << 4 | low
+    return 0
+
+cdef void format_hex(unsigned char* raw, char* out) nogil:
+    cdef int i
+    for i in range(16):
+        out[2 * i] = HEX_DIGITS[raw[i] >> 4]
+        out[2 * i + 1] = HEX_DIGITS[raw[i] & 15]
+
+cdef int parse_base62(char* s, unsigned char* raw) nogil:
+    cdef unsigned int limbs[4]
+    cdef unsigned long long t
+    cdef int i, j, digit
+    limbs[0] = limbs[1] = limbs[2] = limbs[3] = 0
+    for i in range(22):
+        digit = BASE62_VALUES[<unsigned char>s[i]]
+        if digit < 0:
+            return -1
+        t = digit
+        for j in range(3, -1, -1):
+            t += <unsigned long long>limbs[j] * 62
+            limbs[j] = <unsigned int>t
+            t >>= 32
+        if t:
+            # more than 128 bits
+            return -1
+
+    for i in range(4):
+        raw[4 * i] = limbs[i] >> 24
+        raw[4 * i + 1] = limbs[i] >> 16
+        raw[4 * i + 2] = limbs[i] >> 8
+        raw[4 * i + 3] = limbs[i]
+    return 0
+
+cdef void format_base62(unsigned char* raw, char* out) nogil:
+    cdef unsigned int limbs[4]
+    cdef unsigned long long t
+    cdef int i, j
+    for i in range(4):
+        limbs[i] = (raw[4 * i] << 24 | raw[4 * i + 1] << 16 |
+                    raw[4 * i + 2] << 8 | raw[4 * i + 3])
+    for i in range(21, -1, -1):
+        t = 0
+        for j in range(4):
+            t = t << 32 | limbs[j]
+            limbs[j] = <unsigned int>(t / 62)
+            t %= 62
+        out[i] = BASE62[t]
+
+cdef long hash_id(unsigned char* raw) nogil:
+    cdef unsigned long long h = 14695981039346656037ULL
+    cdef int i
+    for i in range(16):
+        h = (h ^ raw[i]) * 1099511628211ULL
+    return <long>(h ^ (h >> 32))
+
+cdef SpotifyId new_spotify_id(unsigned char* raw):
+    cdef SpotifyId instance = NEW_SPOTIFYID(SpotifyId)
+    memcpy(instance.raw_id, raw, 16)
+    instance.hash_value = hash_id(raw)
+    return instance
+
+cdef SpotifyId id_from_hex(char* hex):
+    """Returns the SpotifyId of a hex id from a despotify struct, or None
+    if it's empty or malformed."""
+    cdef unsigned char raw[16]
+    if hex == NULL or strlen(hex) < 32 or parse_hex(hex, raw) < 0:
+        return None
+    return new_spotify_id(raw)
+
+cdef bytes hex_to_base62(char* hex):
+    """Returns the base 62 form of a hex id, as in URIs."""
+    cdef unsigned char raw[16]
+    cdef char out[23]
+    if hex == NULL:
+        return b''
+    if strlen(hex) < 32 or parse_hex(hex, raw) < 0:
+        # Keep what despotify makes of it.
+        despotify_id2uri(hex, out)
+        return out
+    format_base62(raw, out)
+    return out[:22]
+
+cdef class SpotifyId:
+    """A 16 byte Spotify id.
+
+    Ids hash and compare by value in constant time, so they make good dict
+    keys and set members, and take a lot less memory than their strings.
+
+    Args:
+        value: 32 character hex id (Track.track_id, Album.id...), 22
+            character base 62 id (the last part of a URI), or the 16 raw
+            bytes.
+    """
+    def __init__(self, bytes value):
+        cdef char* s = value
+        cdef Py_ssize_t length = len(value)
+        if length == 16:
+            memcpy(self.raw_id, s, 16)
+        elif length == 22:
+            if parse_base62(s, self.raw_id) < 0:
+                raise ValueError('Invalid base 62 id: %r' % value)
+        elif length == 32:
+            if parse_hex(s, self.raw_id) < 0:
+                raise ValueError('Invalid hex id: %r' % value)
+        else:
+            raise ValueError('Invalid id: %r' % value)
+
+        self.hash_value = hash_id(self.raw_id)
+
+    property raw:
+        def __get__(self):
+            return (<char*>self.raw_id)[:16]
+
+    property hex:
+        def __get__(self):
+            cdef char out[32]
+            format_hex(self.raw_id, out)
+            return out[:32]
+
+    property base62:
+        def __get__(self):
+            cdef char out[22]
+            format_base62(self.raw_id, out)
+            return out[:22]
+
+    def uri(self, kind='track'):
+        """Returns the URI of the id, like spotify:track:<base 62 id>."""
+        return 'spotify:%s:%s' % (kind, self.base62)
+
+    def __hash__(self):
+        return self.hash_value
+
+    def __richcmp__(SpotifyId self, other, int operator):
+        cdef int order
+        if not isinstance(other, SpotifyId):
+            return NotImplemented
+        order = memcmp(self.raw_id, (<SpotifyId>other).raw_id, 16)
+        if operator == 0:
+            return order < 0
+        elif operator == 1:
+            return order <= 0
+        elif operator == 2:
+            return order == 0
+        elif operator == 3:
+            return order != 0
+        elif operator == 4:
+            return order > 0
+        else:
+            return order >= 0
+
+    def __reduce__(self):
+        return (SpotifyId, (self.raw,))
+
+    def __str__(self):
+        return self.hex
+
+    def __repr__(self):
+        return 'SpotifyId(%r)' % self.hex
+
+def ids_to_uris(ids, kind='track'):
+    """Returns the URIs of a sequence of ids.
+
+    Args:
+        ids: SpotifyIds, or 32 character hex ids like Track.track_id.
+        kind: Kind of object in the URIs: track, album or artist.
+    """
+    cdef bytes prefix = ('spotify:%s:' % kind).encode('ascii')
+    cdef Py_ssize_t prefix_len = len(prefix)
+    cdef char buf[64]
+    cdef unsigned char raw[16]
+    cdef unsigned char* id_raw
+    cdef char* hex
+    cdef list result = []
+
+    if prefix_len > 64 - 22:
+        raise ValueError('Invalid kind: %r' % kind)
+    memcpy(buf, <char*>prefix, prefix_len)
+
+    for value in ids:
+        if isinstance(value, SpotifyId):
+            id_raw = (<SpotifyId>value).raw_id
+        else:
+            hex = value
+            if len(value) < 32 or parse_hex(hex, raw) < 0:
+                raise ValueError('Invalid hex id: %r' % value)
+            id_raw = raw
+        format_base62(id_raw, buf + prefix_len)
+        result.append(buf[:prefix_len + 22])
+
+    return result
+
+def uris_to_ids(uris):
+    """Returns the SpotifyIds of a sequence of URIs.
+
+    Repeated URIs give the same SpotifyId object.
+
+    Args:
+        uris: URIs like spotify:track:32a2n4NPXhH3OI06VPLwTA, or their
+            last part. Playlist URIs are accepted as well.
+    """
+    cdef dict seen = {}
+    cdef list result = []
+    cdef unsigned char raw[16]
+    cdef bytes uri_id
+    cdef SpotifyId found
+
+    for uri in uris:
+        found = seen.get(uri)
+        if found is None:
+            uri_id = uri[uri.rfind(':') + 1:]
+            if len(uri_id) != 22 or parse_base62(uri_id, raw) < 0:
+                raise ValueError('Invalid URI: %r' % uri)
+            found = new_spotify_id(raw)
+            seen[uri] = found
+        result.append(found)
+
+    return result
@@ -0,0 +1,55 @@
+# vim: set fileencoding=utf-8 filetype=pyrex :
+
+cdef extern from "spytify.h":
+    cdef Image NEW_IMAGE "PY_NEW" (object t)
+
+cdef extern from "Python.h":
+    int PyBuffer_FillInfo(Py_buffer* view, object obj, void* buf,
+                          Py_ssize_t len, int readonly, int flags) except -1
+
+cdef class Image:
+    """Image data, like an album cover or an artist portrait.
+
+    Supports the buffer protocol, so memoryview(image) gives read-only
+    access to the data without copying it. Images loaded from the disk
+    cache are read straight from a mapping of the cache file.
+    """
+    def __init__(self):
+        raise TypeError("This class cannot be instantiated from Python")
+
+    property image_id:
+        def __get__(self):
+            return self.image_id
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        PyBuffer_FillInfo(buffer, self, self.data, self.length, 1, flags)
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
+    def __len__(self):
+        return self.length
+
+    def __dealloc__(self):
+        if self.data:
+            despotify_free_image(self.data, self.length, self.mapped)
+
+    def __repr__(self):
+        return '<Image: %s (%d bytes)>' % (self.image_id, self.length)
+
+cdef Image create_image(bytes image_id, void* data, int length, bint mapped):
+    """Wrap image data returned by despotify_map_image, taking ownership."""
+    cdef Image instance = NEW_IMAGE(Image)
+    instance.image_id = image_id
+    instance.data = data
+    instance.length = length
+    instance.mapped = mapped
+    return instance
+
+def _prefetch_images(Spytify session, list image_ids):
+    for image_id in image_ids:
+        if image_id not in session.image_cache:
+            try:
+                session.get_image(image_id)
+            except SpytifyError:
+                pass
@@ -0,0 +1,98 @@
+# vim: set fileencoding=utf-8 filetype=pyrex :
+
+cdef class LazyList:
+    """Read-only sequence over a linked list of tracks, artists or albums.
+
+    Objects are only created when they are first accessed, and are then
+    kept, so accessing the same item twice returns the same object.
+    """
+    def __init__(self):
+        raise TypeError("This class cannot be instantiated from Python")
+
+    cdef void* next_node(self, void* node):
+        if self.kind == LAZY_TRACKS:
+            return (<track*>node).next
+        elif self.kind == LAZY_ARTISTS:
+            return (<artist*>node).next
+        else:
+            return (<album_browse*>node).next
+
+    cdef object wrap(self, void* node):
+        cdef SpotifyObject instance
+        if self.kind == LAZY_TRACKS:
+            instance = self.session.create_track(<track*>node)
+        elif self.kind == LAZY_ARTISTS:
+            instance = self.session.create_artist(<artist*>node)
+        else:
+            instance = self.session.create_album_full(<album_browse*>node)
+
+        instance.owner = self.session
+        return instance
+
+    cdef int count(self):
+        cdef void* node
+        if self.length < 0:
+            self.length = 0
+            node = self.head
+            while node:
+                self.length += 1
+                node = self.next_node(node)
+
+        if self.items is None:
+            self.items = [None] * self.length
+
+        return self.length
+
+    cdef object item(self, int index):
+        if self.items[index] is not None:
+            return self.items[index]
+
+        # Walk on from the last visited node if we can, so sequential
+        # access doesn't restart from the head of the list every time.
+        if self.cursor == NULL or index < self.cursor_index:
+            self.cursor = self.head
+            self.cursor_index = 0
+
+        while self.cursor_index < index:
+            self.cursor = self.next_node(self.cursor)
+            self.cursor_index += 1
+
+        self.items[index] = self.wrap(self.cursor)
+        return self.items[index]
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        cdef int length = self.count()
+        if isinstance(index, slice):
+            return [self.item(i) for i in range(*index.indices(length))]
+
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError('LazyList index out of range')
+
+        return self.item(index)
+
+    def __iter__(self):
+        return LazyListIterator(self)
+
+    def __repr__(self):
+        return repr(self[:])
+
+cdef class LazyListIterator:
+    def __init__(self, LazyList parent):
+        self.parent = parent
+        self.i = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.i >= self.parent.count():
+            raise StopIteration()
+
+        retval = self.parent.item(self.i)
+        self.i = self.i + 1
+        return retval
@@ -0,0 +1,150 @@
+# vim: set fileencoding=utf-8 filetype=pyrex :
+from collections import OrderedDict
+import threading
+import time
+
+cdef class LRUCache:
+    """In-memory cache of looked up objects, evicting the least recently used.
+
+    Entries expire after ttl seconds, and the least recently used entries
+    are evicted when there are more than max_entries of them or their
+    estimated size goes above max_bytes. It can be used from several
+    threads at once.
+    """
+    def __init__(self, int max_entries=10000, long max_bytes=64 * 1024 * 1024,
+                 double ttl=3600):
+        """Create an empty cache.
+
+        Args:
+            max_entries: Max number of entries, 0 disables the cache.
+            max_bytes: Max estimated size of the cached objects.
+            ttl: Seconds an entry stays valid, 0 means forever.
+        """
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Returns the object cached for key, or None."""
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, size, expires = entry
+            if expires and expires < time.time():
+                self.size -= size
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            # Reinsert to mark as most recently used.
+            self.entries[key] = entry
+            self.hits += 1
+            return value
+
+    def put(self, key, value, long size=0):
+        """Cache value for key.
+
+        Args:
+            key: Key to cache it under.
+            value: Object to cache.
+            size: Estimated size of value in bytes.
+        """
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+
+        expires = time.time() + self.ttl if self.ttl > 0 else 0
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry[1]
+
+            self.entries[key] = (value, size, expires)
+            self.size += size
+
+            while len(self.entries) > self.max_entries or \
+                  self.size > self.max_bytes:
+                key, entry = self.entries.popitem(last=False)
+                self.size -= entry[1]
+                self.evictions += 1
+
+    def discard(self, key):
+        """Remove key from the cache, if it's there."""
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry[1]
+
+    def clear(self):
+        """Remove all entries."""
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self):
+        """Returns a dict of entry count, estimated size and hit/miss counters."""
+        with self.lock:
+            return {
+                'entries': len(self.entries),
+                'bytes': self.size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __repr__(self):
+        return '<LRUCache: %d entries, %d bytes>' % (len(self.entries), self.size)
+
+cdef long track_size(track* t):
+    """Estimated memory used by a track and its artists."""
+    cdef long size = sizeof(track)
+    cdef artist* a = t.artist
+    while a:
+        size += sizeof(artist)
+        a = a.next
+
+    return size
+
+cdef long album_browse_size(album_browse* album):
+    """Estimated memory used by a browsed album, including its tracks."""
+    cdef long size
+    cdef track* t
+    if album == NULL:
+        return 0
+
+    size = sizeof(album_browse)
+    t = album.tracks
+    while t:
+        size += track_size(t)
+        t = t.next
+
+    return size
+
+cdef long artist_browse_size(artist_browse* artist):
+    """Estimated memory used by a browsed artist, including its albums."""
+    cdef long size
+    cdef album_browse* album
+    if artist == NULL:
+        return 0
+
+    size = sizeof(artist_browse)
+    album = artist.albums
+    while album:
+        size += album_browse_size(album)
+        album = album.next
+
+    return size
@@ -0,0 +1,128 @@
+# vim: set fileencoding=utf-8 filetype=pyrex :
+
+cdef extern from "Python.h":
+    int PyBUF_WRITABLE
+    int PyObject_GetBuffer(object obj, Py_buffer* view, int flags) except -1
+    void PyBuffer_Release(Py_buffer* view)
+
+cdef extern from "string.h":
+    void* memcpy(void* dest, void* src, size_t n) nogil
+
+cdef extern from "time.h":
+    time_t c_time "time" (time_t* t) nogil
+
+cdef class PCMStream:
+    """Decoded audio of a track, as signed 16 bit native endian PCM.
+
+    Use readinto() to fill a buffer with as much audio as fits, or iterate
+    over the stream to get memoryviews of the filled part of the buffer
+    passed to Spytify.pcm_stream(). The buffer is reused, so copy the data
+    out of a view before asking for the next one.
+    """
+    def __init__(self, Spytify session, Track track, object buffer):
+        self.session = session
+        self.track = track
+        self.ds = session.ds
+        self.buffer = buffer
+        self.pending = 0
+        self.pending_offset = 0
+        self.samplerate = 0
+        self.channels = 0
+        self.started = False
+        self.finished = False
+
+    cdef Py_ssize_t fill(self, char* out, Py_ssize_t size, int* error) nogil:
+        cdef Py_ssize_t filled = 0
+        cdef Py_ssize_t length
+        cdef time_t waiting_since = c_time(NULL)
+
+        error[0] = 0
+        while filled < size and not self.finished:
+            if self.pending == 0:
+                self.pcm.len = 0
+                error[0] = despotify_get_pcm(self.ds, &self.pcm)
+                if error[0]:
+                    self.finished = True
+                    break
+
+                if self.pcm.len == 0:
+                    # The decoder is gone once it has reached the end of
+                    # the track; before that, the data just isn't here yet.
+                    if self.started and not self.ds.vf and not self.ds.mf:
+                        self.finished = True
+                    elif not self.started and \
+                         c_time(NULL) - waiting_since > TIMEOUT:
+                        error[0] = -1
+                        self.finished = True
+                    continue
+
+                self.started = True
+                self.samplerate = self.pcm.samplerate
+                self.channels = self.pcm.channels
+                self.pending = self.pcm.len
+                self.pending_offset = 0
+
+            length = self.pending
+            if length > size - filled:
+                length = size - filled
+
+            memcpy(out + filled, self.pcm.buf + self.pending_offset, length)
+            filled += length
+            self.pending -= length
+            self.pending_offset += length
+
+        return filled
+
+    def readinto(self, buffer):
+        """Fill a buffer with decoded audio.
+
+        Args:
+            buffer: Writable buffer, like a bytearray or a memoryview.
+
+        Returns: Number of bytes written, 0 at the end of the track.
+        """
+        cdef Py_buffer view
+        cdef Py_ssize_t filled
+        cdef int error
+
+        # Not under the lock, which would hold up the session's requests
+        # while decoding; closing the session while reading isn't safe.
+        self.session.check_open()
+        PyObject_GetBuffer(buffer, &view, PyBUF_WRITABLE)
+        try:
+            with nogil:
+                filled = self.fill(<char*>view.buf, view.len, &error)
+        finally:
+            PyBuffer_Release(&view)
+
+        if error:
+            raise SpytifyError('Decoding %s failed (%d)' % (self.track.title,
+                                                             error))
+
+        return filled
+
+    def close(self):
+        """Stop decoding the track."""
+        cdef despotify_session* ds = self.ds
+        self.finished = True
+        with self.session.lock:
+            # Closing the session stopped the track already.
+            if self.session.ds == NULL:
+                return
+            with nogil:
+                despotify_stop(ds)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef Py_ssize_t filled = self.readinto(self.buffer)
+        if not filled:
+            raise StopIteration()
+
+        return memoryview(self.buffer)[:filled]
+
+    def __repr__(self):
+        return '<PCMStream: %s (%d Hz, %d channels)>' % (self.track.title,
+                                                        self.samplerate,
+                                                        self.channels)
@@ -6,11 +6,12 @@ cdef class Playlist(SpotifyObject):
         raise TypeError("This class cannot be instantiated from Python")
 
     def get_uri(self):
-        cdef char uri_id[23]
-        cdef bytes id = self.id[:-2] # Remove last two characters from id, as per despotify_playlist_to_uri
+        # Only the first 32 characters of the id, as per despotify_playlist_to_uri
+        cdef bytes id = self.id[:32]
+        return 'spotify:user:%s:playlist:%s' % (self.author, hex_to_base62(id))
 
-        despotify_id2uri(id, uri_id)
-        return 'spotify:user:%s:playlist:%s' % (self.author, uri_id)
+    cdef SpotifyId get_spotify_id(self):
+        return id_from_hex(<char*>self.data.playlist_id)
 
     property name:
         def __get__(self):
@@ -24,13 +25,89 @@ cdef class Playlist(SpotifyObject):
         def __get__(self):
             return <char*>self.data.playlist_id
 
+    property revision:
+        def __get__(self):
+            return self.data.revision
+
+    property checksum:
+        def __get__(self):
+            return self.data.checksum
+
     property is_collaborative:
         def __get__(self):
             return bool(self.data.is_collaborative)
 
     property tracks:
         def __get__(self):
-            return self.tracks_to_list(self.data.tracks)
+            self.load_all()
+            if self.track_list is None:
+                self.track_list = self.create_lazy_list(LAZY_TRACKS,
+                                                        self.data.tracks)
+            return self.track_list
+
+    property is_loaded:
+        """False while some tracks have no meta data loaded yet."""
+        def __get__(self):
+            return self.load_cursor == NULL
+
+    cdef int load_chunk(self) except -1:
+        """Load the meta data of the next chunk of tracks.
+
+        Returns: The number of tracks in the chunk, 0 once all are loaded.
+        """
+        cdef track* next
+        cdef track* t
+        cdef int loaded
+        cdef int count = 0
+        cdef bint use_cache
+
+        with self.load_lock:
+            if self.load_cursor == NULL:
+                return 0
+
+            next = self.load_cursor
+            with self.lock:
+                self.check_open()
+                use_cache = self.ds.use_cache
+                with nogil:
+                    loaded = despotify_load_playlist_tracks(self.ds, self.data,
+                                                            &next, use_cache)
+                if loaded < 0:
+                    raise session_error(self.ds)
+
+            t = self.load_cursor
+            while t != next:
+                count += 1
+                t = t.next
+            self.load_cursor = next
+            self.loaded += count
+
+        return count
+
+    cdef load_all(self):
+        while self.load_cursor != NULL:
+            self.load_chunk()
+
+    def iter_tracks(self):
+        """Iterates over the tracks, loading them a chunk at a time.
+
+        For playlists from Spytify.open_playlist(), the tracks of a chunk
+        are returned as soon as it has loaded, while the next chunk loads
+        in the background. Other playlists are loaded already, and this is
+        the same as iter(playlist.tracks).
+
+        Returns: Iterator over the Track objects of the playlist.
+        """
+        return PlaylistTrackIterator(self)
+
+    def to_table(self):
+        """Returns a TrackTable with a copy of the tracks on the playlist.
+
+        This uses a lot less memory than the Track objects in
+        Playlist.tracks, and is a lot faster to build for big playlists.
+        """
+        self.load_all()
+        return create_track_table(self.data.tracks)
 
     def __dealloc__(self):
         if self.take_owner:
@@ -39,6 +116,100 @@ cdef class Playlist(SpotifyObject):
     def __repr__(self):
         return '<Playlist: %s by %s (%s)>' % (self.name, self.author, self.id)
 
+cdef class PlaylistTrackIterator:
+    """Iterates over the tracks of a playlist while they load.
+
+    The tracks are counted up front, before anything loads in the
+    background, as the list mustn't be walked past the loaded tracks
+    while their meta data is being filled in.
+    """
+    def __init__(self, Playlist playlist):
+        cdef track* t = playlist.data.tracks
+        cdef int count = 0
+
+        self.playlist = playlist
+        if playlist.load_cursor == NULL:
+            self.tracks = playlist.tracks
+        else:
+            while t:
+                count += 1
+                t = t.next
+            self.tracks = playlist.create_lazy_list(LAZY_TRACKS,
+                                                    playlist.data.tracks,
+                                                    count)
+        self.i = 0
+        self.prefetch = None
+        self.start_prefetch()
+
+    cdef start_prefetch(self):
+        if self.playlist.load_cursor == NULL:
+            return
+
+        self.prefetched = None
+        self.prefetch = threading.Thread(target=self.fetch,
+                                         name='Spytify playlist prefetch')
+        self.prefetch.daemon = True
+        self.prefetch.start()
+
+    def fetch(self):
+        """Load the next chunk. Runs in the prefetch thread."""
+        try:
+            self.playlist.load_chunk()
+        except Exception as e:
+            self.prefetched = e
+
+    cdef int available(self):
+        if self.playlist.load_cursor == NULL:
+            return len(self.tracks)
+        return self.playlist.loaded
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while self.i >= self.available():
+            if self.prefetch is None:
+                raise StopIteration()
+
+            self.prefetch.join()
+            self.prefetch = None
+            if isinstance(self.prefetched, Exception):
+                raise self.prefetched
+            self.start_prefetch()
+
+        retval = self.tracks[self.i]
+        self.i = self.i + 1
+        return retval
+
+cdef list stored_playlist_ids(SessionStruct session,
+                              unsigned int* revision=NULL):
+    """Returns the ids of the stored playlists, without loading them.
+
+    Args:
+        revision: Set to the revision of the meta playlist, if not NULL.
+    """
+    cdef playlist* metalist
+    cdef playlist* p
+    cdef list ids = []
+
+    with session.lock:
+        session.check_open()
+        with nogil:
+            metalist = despotify_get_playlist(session.ds, NULL, False)
+        if not metalist:
+            raise session_error(session.ds)
+
+    if revision:
+        revision[0] = metalist.revision
+
+    p = metalist
+    while p and p.playlist_id[0]:
+        ids.append(<char*>p.playlist_id)
+        p = p.next
+    despotify_free_playlist(metalist)
+
+    return ids
+
 cdef class RootIterator:
     def __init__(self, RootList parent):
         self.parent = parent
@@ -60,9 +231,151 @@ cdef class RootList(SessionStruct):
         raise TypeError("This class cannot be instantiated from Python")
 
     cdef fetch(self):
+        cdef playlist* data
+        if self.playlists is not None:
+            return
+
+        with self.lock:
+            # Another thread may have fetched them while we waited.
+            if self.playlists is not None:
+                return
+
+            self.check_open()
+            with nogil:
+                data = despotify_get_stored_playlists(self.ds)
+            self.adopt(data)
+
+    cdef adopt(self, playlist* data):
+        """Take over a chain of playlists, in place of the current ones."""
+        cdef playlist* next
+        cdef list playlists = []
+
+        # Split the list up, so refresh() can replace one playlist
+        # without touching the others.
+        while data:
+            next = data.next
+            data.next = NULL
+            playlists.append(self.create_playlist(data, True))
+            data = next
+        self.playlists = playlists
+
+    cdef Playlist fetch_playlist(self, char* id):
+        cdef playlist* data
+        cdef bint use_cache
+        with self.lock:
+            self.check_open()
+            # The playlist changed, so the cached XML is stale: request it
+            # from the server, and store the fresh one in its place.
+            use_cache = self.ds.use_cache
+            self.ds.use_cache = False
+            with nogil:
+                data = despotify_get_playlist(self.ds, id, use_cache)
+            self.ds.use_cache = use_cache
+            if not data:
+                raise session_error(self.ds)
+
+        return self.create_playlist(data, True)
+
+    def refresh(self):
+        """Sync the playlists with the server.
+
+        Only playlists that were added, or whose revision or checksum
+        changed, are loaded again.
+
+        Returns:
+            Dict with lists of the 'added', 'removed' and 'changed'
+            playlists. Changed playlists are the reloaded ones; Playlist
+            objects from before the refresh keep their old contents.
+        """
+        cdef Playlist old
+        cdef char* id
+        cdef unsigned int revision
+        cdef unsigned int checksum
+        cdef unsigned int meta_revision
+        cdef bint found
+        cdef bint use_cache
+
         if self.playlists is None:
-            self.data = despotify_get_stored_playlists(self.ds)
-            self.playlists = self.playlists_to_list(self.data)
+            self.fetch()
+            return {'added': list(self.playlists), 'removed': [], 'changed': []}
+
+        ids = stored_playlist_ids(self, &meta_revision)
+        current = dict([(playlist.id, playlist) for playlist in self.playlists])
+        playlists = []
+        added = []
+        changed = []
+        for playlist_id in ids:
+            id = playlist_id
+            old = current.pop(playlist_id, None)
+            if old is not None:
+                with self.lock:
+                    self.check_open()
+                    use_cache = self.ds.use_cache
+                    with nogil:
+                        found = despotify_get_playlist_revision(
+                            self.ds, id, use_cache, &revision, &checksum)
+                    if not found:
+                        raise session_error(self.ds)
+
+                if revision == old.data.revision and \
+                   checksum == old.data.checksum:
+                    playlists.append(old)
+                    continue
+
+            playlist = self.fetch_playlist(id)
+            playlists.append(playlist)
+            if old is not None:
+                changed.append(playlist)
+            else:
+                added.append(playlist)
+
+        removed = [playlist for playlist in self.playlists
+                   if playlist.id in current]
+        self.playlists = playlists
+        self.meta_revision = meta_revision
+
+        return {'added': added, 'removed': removed, 'changed': changed}
+
+    def save_snapshot(self, bytes path):
+        """Save the playlists with their tracks to a file.
+
+        Spytify(snapshot=path) loads them from it on the next start, before
+        asking the server for them. The file is replaced in one go, so a
+        crash while saving leaves the old snapshot in place.
+
+        Args:
+            path: File to save the snapshot to.
+        """
+        cdef char* c_path = path
+        cdef playlist** lists
+        cdef Playlist item
+        cdef int count
+        cdef unsigned int meta_revision = self.meta_revision
+        cdef bint saved
+
+        self.fetch()
+        # Hold on to the list, in case refresh() replaces it meanwhile.
+        playlists = self.playlists
+        count = len(playlists)
+        # At least one entry, so there is no malloc(0) to tell apart.
+        lists = <playlist**>malloc((count + 1) * sizeof(playlist*))
+        if lists == NULL:
+            raise MemoryError()
+
+        try:
+            for i in range(count):
+                item = playlists[i]
+                item.load_all()
+                lists[i] = item.data
+
+            with nogil:
+                saved = despotify_save_snapshot(c_path, lists, count,
+                                                meta_revision)
+        finally:
+            free(lists)
+
+        if not saved:
+            raise SpytifyError('Could not save the snapshot to %s' % path)
 
     def __getitem__(self, item):
         self.fetch()
@@ -80,10 +393,6 @@ cdef class RootList(SessionStruct):
         self.fetch()
         return RootIterator(self)
 
-    def __dealloc__(self):
-        if self.data:
-            despotify_free_playlist(self.data)
-
     def __repr__(self):
         self.fetch()
         return '<RootList: %s>' % self.playlists
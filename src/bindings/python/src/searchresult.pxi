@@ -34,6 +34,82 @@ cdef class SearchResult(SpotifyObject):
         def __get__(self):
             return self.playlist
 
+    def to_table(self):
+        """Returns a TrackTable with a copy of the tracks found."""
+        return self.playlist.to_table()
+
     def __dealloc__(self):
         if self.take_owner:
             despotify_free_search(self.data)
+
+cdef class SearchIterator:
+    """Iterates over all tracks found by a search, a page at a time.
+
+    The next page is requested in the background while the tracks of the
+    current page are being iterated over. A page is freed once neither the
+    iterator nor any of its Track objects refer to it any more.
+    """
+    def __init__(self, Spytify session, bytes searchtext, int page_size):
+        self.session = session
+        self.searchtext = searchtext
+        self.page_size = page_size
+        self.offset = 0
+        self.tracks = None
+        self.i = 0
+        self.prefetch = None
+        self.start_prefetch()
+
+    cdef start_prefetch(self):
+        self.prefetched = None
+        self.prefetch = threading.Thread(target=self.fetch,
+                                         args=(self.offset,),
+                                         name='Spytify search prefetch')
+        self.prefetch.daemon = True
+        self.prefetch.start()
+
+    def fetch(self, int offset):
+        """Request the page at offset. Runs in the prefetch thread."""
+        try:
+            self.prefetched = self.session.search_page(self.searchtext,
+                                                       offset, self.page_size)
+        except Exception as e:
+            self.prefetched = e
+
+    cdef next_page(self):
+        cdef SearchResult page
+        cdef int num_tracks
+
+        self.prefetch.join()
+        self.prefetch = None
+        if isinstance(self.prefetched, Exception):
+            raise self.prefetched
+
+        page = self.prefetched
+        self.prefetched = None
+
+        # Empty searches still have a blank track, so go by num_tracks
+        # rather than the length of the list.
+        num_tracks = page.data.playlist.num_tracks
+        self.tracks = page.playlist.create_lazy_list(LAZY_TRACKS,
+                                                     page.data.tracks,
+                                                     num_tracks)
+        self.i = 0
+
+        # The server may return less than asked for, so carry on from the
+        # last track it did return.
+        self.offset += num_tracks
+        if num_tracks > 0 and self.offset < page.data.total_tracks:
+            self.start_prefetch()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while self.tracks is None or self.i >= len(self.tracks):
+            if self.prefetch is None:
+                raise StopIteration()
+            self.next_page()
+
+        retval = self.tracks[self.i]
+        self.i = self.i + 1
+        return retval
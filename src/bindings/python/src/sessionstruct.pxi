@@ -8,14 +8,29 @@ cdef extern from "spytify.h":
     cdef Playlist NEW_PLAYLIST "PY_NEW" (object t)
     cdef RootList NEW_ROOTLIST "PY_NEW" (object t)
     cdef Track NEW_TRACK "PY_NEW" (object t)
+    cdef LazyList NEW_LAZYLIST "PY_NEW" (object t)
 
 
 cdef class SessionStruct:
+    cdef Spytify get_session(self):
+        return self.session
+
+    cdef int check_open(self) except -1:
+        """Raises SpytifyConnectionError if the session was closed.
+
+        Objects keep a copy of the session's ds, which is freed when the
+        session is closed. Call this with the lock held before using it.
+        """
+        return self.session.check_open()
+
     cdef Album create_album(self, album* album, bint take_owner=False):
         cdef Album instance
 
         instance = NEW_ALBUM(Album)
         instance.ds = self.ds
+        instance.session = self.get_session()
+        instance.lock = self.lock
+        instance.cache = self.cache
         if not album:
             instance.data = None
         else:
@@ -34,6 +49,7 @@ cdef class SessionStruct:
         instance.data = AlbumDataFull()
         instance.full_data = instance.data
         instance.full_data.browse = album
+        instance.full_data.take_owner = take_owner
 
         return instance
 
@@ -42,6 +58,9 @@ cdef class SessionStruct:
 
         instance = NEW_ARTIST(Artist)
         instance.ds = self.ds
+        instance.session = self.get_session()
+        instance.lock = self.lock
+        instance.cache = self.cache
         if not artist:
             instance.data = None
         else:
@@ -60,6 +79,7 @@ cdef class SessionStruct:
         instance.data = ArtistDataFull()
         instance.full_data = instance.data
         instance.full_data.browse = artist
+        instance.full_data.take_owner = take_owner
 
         return instance
 
@@ -71,8 +91,12 @@ cdef class SessionStruct:
 
         instance = NEW_SEARCHRESULT(SearchResult)
         instance.ds = self.ds
+        instance.session = self.get_session()
+        instance.lock = self.lock
+        instance.cache = self.cache
         instance.data = result
         instance.playlist = self.create_playlist(result.playlist)
+        instance.playlist.owner = instance
         instance.take_owner = take_owner
 
         return instance
@@ -85,8 +109,12 @@ cdef class SessionStruct:
                 
         instance = NEW_PLAYLIST(Playlist)
         instance.ds = self.ds
+        instance.session = self.get_session()
+        instance.lock = self.lock
+        instance.cache = self.cache
         instance.data = playlist
         instance.take_owner = take_owner
+        instance.load_lock = threading.Lock()
 
         return instance
 
@@ -95,7 +123,9 @@ cdef class SessionStruct:
 
         instance = NEW_ROOTLIST(RootList)
         instance.ds = self.ds
-        instance.data = NULL
+        instance.session = self.get_session()
+        instance.lock = self.lock
+        instance.cache = self.cache
         instance.playlists = None
 
         return instance
@@ -108,37 +138,18 @@ cdef class SessionStruct:
 
         instance = NEW_TRACK(Track)
         instance.ds = self.ds
+        instance.session = self.get_session()
+        instance.lock = self.lock
+        instance.cache = self.cache
         instance.data = track
         return instance
     
-    cdef list albums_to_list(self, album_browse* albums):
-        cdef list l = []
-        while albums:
-            l.append(self.create_album_full(albums))
-            albums = albums.next
-
-        return l
-
-    cdef list artists_to_list(self, artist* artists):
-        cdef list l = []
-        while artists:
-            l.append(self.create_artist(artists))
-            artists = artists.next
-
-        return l
-
-    cdef list playlists_to_list(self, playlist* playlists):
-        cdef list l = []
-        while playlists:
-            l.append(self.create_playlist(playlists))
-            playlists = playlists.next
-
-        return l
-
-    cdef list tracks_to_list(self, track* tracks):
-        cdef list l = []
-        while tracks:
-            l.append(self.create_track(tracks))
-            tracks = tracks.next
-
-        return l
+    cdef LazyList create_lazy_list(self, int kind, void* head, int length=-1):
+        cdef LazyList instance
+
+        instance = NEW_LAZYLIST(LazyList)
+        instance.session = self
+        instance.kind = kind
+        instance.head = head
+        instance.length = length
+        return instance
@@ -4,10 +4,43 @@ cdef class SpotifyObject:
     """Implements stuff that's specific to Spotify Objects.
 
     A Spotify Object is basically anything that has a spotify URI.
+
+    Objects of the same type with the same spotify_id compare equal and hash
+    alike, so they can be deduplicated with sets and dicts.
     """
+    cdef SpotifyId get_spotify_id(self):
+        return None
+
+    property spotify_id:
+        """SpotifyId of the object, or None if it has none."""
+        def __get__(self):
+            if self.spotify_id_value is None:
+                self.spotify_id_value = self.get_spotify_id()
+            return self.spotify_id_value
+
+    def __hash__(self):
+        cdef SpotifyId sid = self.spotify_id
+        if sid is None:
+            return object.__hash__(self)
+        return sid.hash_value
+
+    def __richcmp__(self, other, int operator):
+        cdef SpotifyId sid, other_sid
+        if operator != 2 and operator != 3:
+            return NotImplemented
+        if type(self) is not type(other):
+            return operator == 3
+
+        sid = (<SpotifyObject>self).spotify_id
+        other_sid = (<SpotifyObject>other).spotify_id
+        if sid is None or other_sid is None:
+            equal = self is other
+        else:
+            equal = memcmp(sid.raw_id, other_sid.raw_id, 16) == 0
+        return equal == (operator == 2)
+
     def get_http_link(self):
         """Returns HTTP link to the object."""
-        parts = self.get_uri().split(':')
-        # We ignore the first part ('spotify'), replacing it
-        # with http://open.spotify.com/. Then we replace every : with /. :)
-        return 'http://open.spotify.com/%s' % '/'.join(parts[1:])
+        # Replace 'spotify:' with http://open.spotify.com/ and every
+        # other : with /.
+        return 'http://open.spotify.com/' + self.get_uri()[8:].replace(':', '/')
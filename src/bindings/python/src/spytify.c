@@ -1,13238 +0,0 @@
-/* Generated by Cython 0.12 on Fri Feb  5 17:19:27 2010 */
-
-#define PY_SSIZE_T_CLEAN
-#include "Python.h"
-#include "structmember.h"
-#ifndef Py_PYTHON_H
-    #error Python headers needed to compile C extensions, please install development version of Python.
-#else
-#ifndef PY_LONG_LONG
-  #define PY_LONG_LONG LONG_LONG
-#endif
-#ifndef DL_EXPORT
-  #define DL_EXPORT(t) t
-#endif
-#if PY_VERSION_HEX < 0x02040000
-  #define METH_COEXIST 0
-  #define PyDict_CheckExact(op) (Py_TYPE(op) == &PyDict_Type)
-  #define PyDict_Contains(d,o)   PySequence_Contains(d,o)
-#endif
-#if PY_VERSION_HEX < 0x02050000
-  typedef int Py_ssize_t;
-  #define PY_SSIZE_T_MAX INT_MAX
-  #define PY_SSIZE_T_MIN INT_MIN
-  #define PY_FORMAT_SIZE_T ""
-  #define PyInt_FromSsize_t(z) PyInt_FromLong(z)
-  #define PyInt_AsSsize_t(o)   PyInt_AsLong(o)
-  #define PyNumber_Index(o)    PyNumber_Int(o)
-  #define PyIndex_Check(o)     PyNumber_Check(o)
-#endif
-#if PY_VERSION_HEX < 0x02060000
-  #define Py_REFCNT(ob) (((PyObject*)(ob))->ob_refcnt)
-  #define Py_TYPE(ob)   (((PyObject*)(ob))->ob_type)
-  #define Py_SIZE(ob)   (((PyVarObject*)(ob))->ob_size)
-  #define PyVarObject_HEAD_INIT(type, size) \
-          PyObject_HEAD_INIT(type) size,
-  #define PyType_Modified(t)
-
-  typedef struct {
-       void *buf;
-       PyObject *obj;
-       Py_ssize_t len;
-       Py_ssize_t itemsize;
-       int readonly;
-       int ndim;
-       char *format;
-       Py_ssize_t *shape;
-       Py_ssize_t *strides;
-       Py_ssize_t *suboffsets;
-       void *internal;
-  } Py_buffer;
-
-  #define PyBUF_SIMPLE 0
-  #define PyBUF_WRITABLE 0x0001
-  #define PyBUF_FORMAT 0x0004
-  #define PyBUF_ND 0x0008
-  #define PyBUF_STRIDES (0x0010 | PyBUF_ND)
-  #define PyBUF_C_CONTIGUOUS (0x0020 | PyBUF_STRIDES)
-  #define PyBUF_F_CONTIGUOUS (0x0040 | PyBUF_STRIDES)
-  #define PyBUF_ANY_CONTIGUOUS (0x0080 | PyBUF_STRIDES)
-  #define PyBUF_INDIRECT (0x0100 | PyBUF_STRIDES)
-
-#endif
-#if PY_MAJOR_VERSION < 3
-  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
-#else
-  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define Py_TPFLAGS_CHECKTYPES 0
-  #define Py_TPFLAGS_HAVE_INDEX 0
-#endif
-#if (PY_VERSION_HEX < 0x02060000) || (PY_MAJOR_VERSION >= 3)
-  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyBaseString_Type            PyUnicode_Type
-  #define PyString_Type                PyUnicode_Type
-  #define PyString_CheckExact          PyUnicode_CheckExact
-#else
-  #define PyBytes_Type                 PyString_Type
-  #define PyBytes_CheckExact           PyString_CheckExact
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyInt_Type                   PyLong_Type
-  #define PyInt_Check(op)              PyLong_Check(op)
-  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
-  #define PyInt_FromString             PyLong_FromString
-  #define PyInt_FromUnicode            PyLong_FromUnicode
-  #define PyInt_FromLong               PyLong_FromLong
-  #define PyInt_FromSize_t             PyLong_FromSize_t
-  #define PyInt_FromSsize_t            PyLong_FromSsize_t
-  #define PyInt_AsLong                 PyLong_AsLong
-  #define PyInt_AS_LONG                PyLong_AS_LONG
-  #define PyInt_AsSsize_t              PyLong_AsSsize_t
-  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
-  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
-#else
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyMethod_New(func, self, klass) PyInstanceMethod_New(func)
-#endif
-#if !defined(WIN32) && !defined(MS_WINDOWS)
-  #ifndef __stdcall
-    #define __stdcall
-  #endif
-  #ifndef __cdecl
-    #define __cdecl
-  #endif
-  #ifndef __fastcall
-    #define __fastcall
-  #endif
-#else
-  #define _USE_MATH_DEFINES
-#endif
-#if PY_VERSION_HEX < 0x02050000
-  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),((char *)(n)))
-  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),((char *)(n)),(a))
-  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),((char *)(n)))
-#else
-  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),(n))
-  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),(n),(a))
-  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),(n))
-#endif
-#if PY_VERSION_HEX < 0x02050000
-  #define __Pyx_NAMESTR(n) ((char *)(n))
-  #define __Pyx_DOCSTR(n)  ((char *)(n))
-#else
-  #define __Pyx_NAMESTR(n) (n)
-  #define __Pyx_DOCSTR(n)  (n)
-#endif
-#ifdef __cplusplus
-#define __PYX_EXTERN_C extern "C"
-#else
-#define __PYX_EXTERN_C extern
-#endif
-#include <math.h>
-#define __PYX_HAVE_API__spytify
-#include "despotify.h"
-#include "audio_thread.h"
-#include "spytify.h"
-
-#ifdef __GNUC__
-#define INLINE __inline__
-#elif _WIN32
-#define INLINE __inline
-#else
-#define INLINE 
-#endif
-
-typedef struct {PyObject **p; char *s; const long n; const char* encoding; const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry; /*proto*/
-
-
-/* Type Conversion Predeclarations */
-
-#if PY_MAJOR_VERSION < 3
-#define __Pyx_PyBytes_FromString          PyString_FromString
-#define __Pyx_PyBytes_FromStringAndSize   PyString_FromStringAndSize
-#define __Pyx_PyBytes_AsString            PyString_AsString
-#else
-#define __Pyx_PyBytes_FromString          PyBytes_FromString
-#define __Pyx_PyBytes_FromStringAndSize   PyBytes_FromStringAndSize
-#define __Pyx_PyBytes_AsString            PyBytes_AsString
-#endif
-
-#define __Pyx_PyBytes_FromUString(s)      __Pyx_PyBytes_FromString((char*)s)
-#define __Pyx_PyBytes_AsUString(s)        ((unsigned char*) __Pyx_PyBytes_AsString(s))
-
-#define __Pyx_PyBool_FromLong(b) ((b) ? (Py_INCREF(Py_True), Py_True) : (Py_INCREF(Py_False), Py_False))
-static INLINE int __Pyx_PyObject_IsTrue(PyObject*);
-static INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
-
-#if !defined(T_PYSSIZET)
-#if PY_VERSION_HEX < 0x02050000
-#define T_PYSSIZET T_INT
-#elif !defined(T_LONGLONG)
-#define T_PYSSIZET \
-        ((sizeof(Py_ssize_t) == sizeof(int))  ? T_INT  : \
-        ((sizeof(Py_ssize_t) == sizeof(long)) ? T_LONG : -1))
-#else
-#define T_PYSSIZET \
-        ((sizeof(Py_ssize_t) == sizeof(int))          ? T_INT      : \
-        ((sizeof(Py_ssize_t) == sizeof(long))         ? T_LONG     : \
-        ((sizeof(Py_ssize_t) == sizeof(PY_LONG_LONG)) ? T_LONGLONG : -1)))
-#endif
-#endif
-
-
-#if !defined(T_ULONGLONG)
-#define __Pyx_T_UNSIGNED_INT(x) \
-        ((sizeof(x) == sizeof(unsigned char))  ? T_UBYTE : \
-        ((sizeof(x) == sizeof(unsigned short)) ? T_USHORT : \
-        ((sizeof(x) == sizeof(unsigned int))   ? T_UINT : \
-        ((sizeof(x) == sizeof(unsigned long))  ? T_ULONG : -1))))
-#else
-#define __Pyx_T_UNSIGNED_INT(x) \
-        ((sizeof(x) == sizeof(unsigned char))  ? T_UBYTE : \
-        ((sizeof(x) == sizeof(unsigned short)) ? T_USHORT : \
-        ((sizeof(x) == sizeof(unsigned int))   ? T_UINT : \
-        ((sizeof(x) == sizeof(unsigned long))  ? T_ULONG : \
-        ((sizeof(x) == sizeof(unsigned PY_LONG_LONG)) ? T_ULONGLONG : -1)))))
-#endif
-#if !defined(T_LONGLONG)
-#define __Pyx_T_SIGNED_INT(x) \
-        ((sizeof(x) == sizeof(char))  ? T_BYTE : \
-        ((sizeof(x) == sizeof(short)) ? T_SHORT : \
-        ((sizeof(x) == sizeof(int))   ? T_INT : \
-        ((sizeof(x) == sizeof(long))  ? T_LONG : -1))))
-#else
-#define __Pyx_T_SIGNED_INT(x) \
-        ((sizeof(x) == sizeof(char))  ? T_BYTE : \
-        ((sizeof(x) == sizeof(short)) ? T_SHORT : \
-        ((sizeof(x) == sizeof(int))   ? T_INT : \
-        ((sizeof(x) == sizeof(long))  ? T_LONG : \
-        ((sizeof(x) == sizeof(PY_LONG_LONG))   ? T_LONGLONG : -1)))))
-#endif
-
-#define __Pyx_T_FLOATING(x) \
-        ((sizeof(x) == sizeof(float)) ? T_FLOAT : \
-        ((sizeof(x) == sizeof(double)) ? T_DOUBLE : -1))
-
-#if !defined(T_SIZET)
-#if !defined(T_ULONGLONG)
-#define T_SIZET \
-        ((sizeof(size_t) == sizeof(unsigned int))  ? T_UINT  : \
-        ((sizeof(size_t) == sizeof(unsigned long)) ? T_ULONG : -1))
-#else
-#define T_SIZET \
-        ((sizeof(size_t) == sizeof(unsigned int))          ? T_UINT      : \
-        ((sizeof(size_t) == sizeof(unsigned long))         ? T_ULONG     : \
-        ((sizeof(size_t) == sizeof(unsigned PY_LONG_LONG)) ? T_ULONGLONG : -1)))
-#endif
-#endif
-
-static INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
-static INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
-static INLINE size_t __Pyx_PyInt_AsSize_t(PyObject*);
-
-#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
-
-
-#ifdef __GNUC__
-/* Test for GCC > 2.95 */
-#if __GNUC__ > 2 ||               (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)) 
-#define likely(x)   __builtin_expect(!!(x), 1)
-#define unlikely(x) __builtin_expect(!!(x), 0)
-#else /* __GNUC__ > 2 ... */
-#define likely(x)   (x)
-#define unlikely(x) (x)
-#endif /* __GNUC__ > 2 ... */
-#else /* __GNUC__ */
-#define likely(x)   (x)
-#define unlikely(x) (x)
-#endif /* __GNUC__ */
-    
-static PyObject *__pyx_m;
-static PyObject *__pyx_b;
-static PyObject *__pyx_empty_tuple;
-static PyObject *__pyx_empty_bytes;
-static int __pyx_lineno;
-static int __pyx_clineno = 0;
-static const char * __pyx_cfilenm= __FILE__;
-static const char *__pyx_filename;
-static const char **__pyx_f;
-
-
-/* Type declarations */
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":15
- * cdef class SessionStruct:
- *     cdef despotify_session* ds
- *     cdef Album create_album(self, album* album, bint take_owner=?)             # <<<<<<<<<<<<<<
- *     cdef Album create_album_full(self, album_browse* album, bint take_owner=?)
- * 
- */
-
-struct __pyx_opt_args_7spytify_13SessionStruct_create_album {
-  int __pyx_n;
-  int take_owner;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":16
- *     cdef despotify_session* ds
- *     cdef Album create_album(self, album* album, bint take_owner=?)
- *     cdef Album create_album_full(self, album_browse* album, bint take_owner=?)             # <<<<<<<<<<<<<<
- * 
- *     cdef Artist create_artist(self, artist* artist, bint take_owner=?)
- */
-
-struct __pyx_opt_args_7spytify_13SessionStruct_create_album_full {
-  int __pyx_n;
-  int take_owner;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":18
- *     cdef Album create_album_full(self, album_browse* album, bint take_owner=?)
- * 
- *     cdef Artist create_artist(self, artist* artist, bint take_owner=?)             # <<<<<<<<<<<<<<
- *     cdef Artist create_artist_full(self, artist_browse* artist, bint take_owner=?)
- * 
- */
-
-struct __pyx_opt_args_7spytify_13SessionStruct_create_artist {
-  int __pyx_n;
-  int take_owner;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":19
- * 
- *     cdef Artist create_artist(self, artist* artist, bint take_owner=?)
- *     cdef Artist create_artist_full(self, artist_browse* artist, bint take_owner=?)             # <<<<<<<<<<<<<<
- * 
- *     cdef Playlist create_playlist(self, playlist* playlist, bint take_owner=?)
- */
-
-struct __pyx_opt_args_7spytify_13SessionStruct_create_artist_full {
-  int __pyx_n;
-  int take_owner;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":21
- *     cdef Artist create_artist_full(self, artist_browse* artist, bint take_owner=?)
- * 
- *     cdef Playlist create_playlist(self, playlist* playlist, bint take_owner=?)             # <<<<<<<<<<<<<<
- *     cdef RootList create_rootlist(self)
- * 
- */
-
-struct __pyx_opt_args_7spytify_13SessionStruct_create_playlist {
-  int __pyx_n;
-  int take_owner;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":24
- *     cdef RootList create_rootlist(self)
- * 
- *     cdef SearchResult create_search_result(self, search_result* result, bint take_owner=?)             # <<<<<<<<<<<<<<
- *     cdef Track create_track(self, track* track)
- * 
- */
-
-struct __pyx_opt_args_7spytify_13SessionStruct_create_search_result {
-  int __pyx_n;
-  int take_owner;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":41
- *     cdef audio_thread.thread_state* thread
- * 
- * cdef class AlbumData:             # <<<<<<<<<<<<<<
- *     cdef album* data
- *     cdef char* name(self)
- */
-
-struct __pyx_obj_7spytify_AlbumData {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_7spytify_AlbumData *__pyx_vtab;
-  struct album *data;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":51
- *     cdef AlbumData next(self)
- * 
- * cdef class AlbumDataFull(AlbumData):             # <<<<<<<<<<<<<<
- *     cdef album_browse* browse
- *     cdef int num_tracks(self)
- */
-
-struct __pyx_obj_7spytify_AlbumDataFull {
-  struct __pyx_obj_7spytify_AlbumData __pyx_base;
-  struct album_browse *browse;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":102
- *     cdef list playlists
- * 
- * cdef class RootIterator:             # <<<<<<<<<<<<<<
- *     cdef RootList parent
- *     cdef int i
- */
-
-struct __pyx_obj_7spytify_RootIterator {
-  PyObject_HEAD
-  struct __pyx_obj_7spytify_RootList *parent;
-  int i;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":4
- * cimport audio_thread
- * 
- * cdef class SessionStruct             # <<<<<<<<<<<<<<
- * cdef class SpotifyObject(SessionStruct)
- * cdef class Album(SpotifyObject)
- */
-
-struct __pyx_obj_7spytify_SessionStruct {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_7spytify_SessionStruct *__pyx_vtab;
-  struct despotify_session *ds;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":5
- * 
- * cdef class SessionStruct
- * cdef class SpotifyObject(SessionStruct)             # <<<<<<<<<<<<<<
- * cdef class Album(SpotifyObject)
- * cdef class Artist(SpotifyObject)
- */
-
-struct __pyx_obj_7spytify_SpotifyObject {
-  struct __pyx_obj_7spytify_SessionStruct __pyx_base;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":8
- * cdef class Album(SpotifyObject)
- * cdef class Artist(SpotifyObject)
- * cdef class SearchResult(SpotifyObject)             # <<<<<<<<<<<<<<
- * cdef class Playlist(SpotifyObject)
- * cdef class RootList(SessionStruct)
- */
-
-struct __pyx_obj_7spytify_SearchResult {
-  struct __pyx_obj_7spytify_SpotifyObject __pyx_base;
-  struct search_result *data;
-  struct __pyx_obj_7spytify_Playlist *playlist;
-  int take_owner;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":11
- * cdef class Playlist(SpotifyObject)
- * cdef class RootList(SessionStruct)
- * cdef class Track(SpotifyObject)             # <<<<<<<<<<<<<<
- * 
- * cdef class SessionStruct:
- */
-
-struct __pyx_obj_7spytify_Track {
-  struct __pyx_obj_7spytify_SpotifyObject __pyx_base;
-  struct track *data;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":6
- * cdef class SessionStruct
- * cdef class SpotifyObject(SessionStruct)
- * cdef class Album(SpotifyObject)             # <<<<<<<<<<<<<<
- * cdef class Artist(SpotifyObject)
- * cdef class SearchResult(SpotifyObject)
- */
-
-struct __pyx_obj_7spytify_Album {
-  struct __pyx_obj_7spytify_SpotifyObject __pyx_base;
-  struct __pyx_obj_7spytify_AlbumData *data;
-  struct __pyx_obj_7spytify_AlbumDataFull *full_data;
-  int take_owner;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":35
- *     pass
- * 
- * cdef class Spytify(SessionStruct):             # <<<<<<<<<<<<<<
- *     cdef handle(self, int signal, void* data)
- *     cdef RootList stored_playlists
- */
-
-struct __pyx_obj_7spytify_Spytify {
-  struct __pyx_obj_7spytify_SessionStruct __pyx_base;
-  struct __pyx_obj_7spytify_RootList *stored_playlists;
-  PyObject *callback;
-  struct thread_state *thread;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":65
- *     cdef get_full_data(self)
- * 
- * cdef class ArtistData:             # <<<<<<<<<<<<<<
- *     cdef artist* data
- *     cdef char* name(self)
- */
-
-struct __pyx_obj_7spytify_ArtistData {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_7spytify_ArtistData *__pyx_vtab;
-  struct artist *data;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":10
- * cdef class SearchResult(SpotifyObject)
- * cdef class Playlist(SpotifyObject)
- * cdef class RootList(SessionStruct)             # <<<<<<<<<<<<<<
- * cdef class Track(SpotifyObject)
- * 
- */
-
-struct __pyx_obj_7spytify_RootList {
-  struct __pyx_obj_7spytify_SessionStruct __pyx_base;
-  struct playlist *data;
-  PyObject *playlists;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":7
- * cdef class SpotifyObject(SessionStruct)
- * cdef class Album(SpotifyObject)
- * cdef class Artist(SpotifyObject)             # <<<<<<<<<<<<<<
- * cdef class SearchResult(SpotifyObject)
- * cdef class Playlist(SpotifyObject)
- */
-
-struct __pyx_obj_7spytify_Artist {
-  struct __pyx_obj_7spytify_SpotifyObject __pyx_base;
-  struct __pyx_obj_7spytify_ArtistData *data;
-  struct __pyx_obj_7spytify_ArtistDataFull *full_data;
-  int take_owner;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":9
- * cdef class Artist(SpotifyObject)
- * cdef class SearchResult(SpotifyObject)
- * cdef class Playlist(SpotifyObject)             # <<<<<<<<<<<<<<
- * cdef class RootList(SessionStruct)
- * cdef class Track(SpotifyObject)
- */
-
-struct __pyx_obj_7spytify_Playlist {
-  struct __pyx_obj_7spytify_SpotifyObject __pyx_base;
-  struct playlist *data;
-  int take_owner;
-};
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":73
- *     cdef ArtistData next(self)
- * 
- * cdef class ArtistDataFull(ArtistData):             # <<<<<<<<<<<<<<
- *     cdef artist_browse* browse
- *     cdef char* text(self)
- */
-
-struct __pyx_obj_7spytify_ArtistDataFull {
-  struct __pyx_obj_7spytify_ArtistData __pyx_base;
-  struct artist_browse *browse;
-};
-
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":13
- * 
- * 
- * cdef class SessionStruct:             # <<<<<<<<<<<<<<
- *     cdef Album create_album(self, album* album, bint take_owner=False):
- *         cdef Album instance
- */
-
-struct __pyx_vtabstruct_7spytify_SessionStruct {
-  struct __pyx_obj_7spytify_Album *(*create_album)(struct __pyx_obj_7spytify_SessionStruct *, struct album *, struct __pyx_opt_args_7spytify_13SessionStruct_create_album *__pyx_optional_args);
-  struct __pyx_obj_7spytify_Album *(*create_album_full)(struct __pyx_obj_7spytify_SessionStruct *, struct album_browse *, struct __pyx_opt_args_7spytify_13SessionStruct_create_album_full *__pyx_optional_args);
-  struct __pyx_obj_7spytify_Artist *(*create_artist)(struct __pyx_obj_7spytify_SessionStruct *, struct artist *, struct __pyx_opt_args_7spytify_13SessionStruct_create_artist *__pyx_optional_args);
-  struct __pyx_obj_7spytify_Artist *(*create_artist_full)(struct __pyx_obj_7spytify_SessionStruct *, struct artist_browse *, struct __pyx_opt_args_7spytify_13SessionStruct_create_artist_full *__pyx_optional_args);
-  struct __pyx_obj_7spytify_Playlist *(*create_playlist)(struct __pyx_obj_7spytify_SessionStruct *, struct playlist *, struct __pyx_opt_args_7spytify_13SessionStruct_create_playlist *__pyx_optional_args);
-  struct __pyx_obj_7spytify_RootList *(*create_rootlist)(struct __pyx_obj_7spytify_SessionStruct *);
-  struct __pyx_obj_7spytify_SearchResult *(*create_search_result)(struct __pyx_obj_7spytify_SessionStruct *, struct search_result *, struct __pyx_opt_args_7spytify_13SessionStruct_create_search_result *__pyx_optional_args);
-  struct __pyx_obj_7spytify_Track *(*create_track)(struct __pyx_obj_7spytify_SessionStruct *, struct track *);
-  PyObject *(*albums_to_list)(struct __pyx_obj_7spytify_SessionStruct *, struct album_browse *);
-  PyObject *(*artists_to_list)(struct __pyx_obj_7spytify_SessionStruct *, struct artist *);
-  PyObject *(*playlists_to_list)(struct __pyx_obj_7spytify_SessionStruct *, struct playlist *);
-  PyObject *(*tracks_to_list)(struct __pyx_obj_7spytify_SessionStruct *, struct track *);
-};
-static struct __pyx_vtabstruct_7spytify_SessionStruct *__pyx_vtabptr_7spytify_SessionStruct;
-
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spotifyobject.pxi":3
- * # vim: set fileencoding=utf-8 filetype=pyrex :
- * 
- * cdef class SpotifyObject:             # <<<<<<<<<<<<<<
- *     """Implements stuff that's specific to Spotify Objects.
- * 
- */
-
-struct __pyx_vtabstruct_7spytify_SpotifyObject {
-  struct __pyx_vtabstruct_7spytify_SessionStruct __pyx_base;
-};
-static struct __pyx_vtabstruct_7spytify_SpotifyObject *__pyx_vtabptr_7spytify_SpotifyObject;
-
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":57
- *         return next
- * 
- * cdef class Album(SpotifyObject):             # <<<<<<<<<<<<<<
- *     def __init__(self):
- *         raise TypeError("This class cannot be instantiated from Python")
- */
-
-struct __pyx_vtabstruct_7spytify_Album {
-  struct __pyx_vtabstruct_7spytify_SpotifyObject __pyx_base;
-  PyObject *(*get_full_data)(struct __pyx_obj_7spytify_Album *);
-};
-static struct __pyx_vtabstruct_7spytify_Album *__pyx_vtabptr_7spytify_Album;
-
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":3
- * # vim: set fileencoding=utf-8 filetype=pyrex :
- * 
- * cdef class ArtistData:             # <<<<<<<<<<<<<<
- *     def __init__(self):
- *         self.data = NULL
- */
-
-struct __pyx_vtabstruct_7spytify_ArtistData {
-  char *(*name)(struct __pyx_obj_7spytify_ArtistData *);
-  char *(*id)(struct __pyx_obj_7spytify_ArtistData *);
-  char *(*portrait_id)(struct __pyx_obj_7spytify_ArtistData *);
-  float (*popularity)(struct __pyx_obj_7spytify_ArtistData *);
-  struct __pyx_obj_7spytify_ArtistData *(*next)(struct __pyx_obj_7spytify_ArtistData *);
-};
-static struct __pyx_vtabstruct_7spytify_ArtistData *__pyx_vtabptr_7spytify_ArtistData;
-
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":27
- *         return next
- * 
- * cdef class ArtistDataFull(ArtistData):             # <<<<<<<<<<<<<<
- *     def __init__(self):
- *         self.browse = NULL
- */
-
-struct __pyx_vtabstruct_7spytify_ArtistDataFull {
-  struct __pyx_vtabstruct_7spytify_ArtistData __pyx_base;
-  char *(*text)(struct __pyx_obj_7spytify_ArtistDataFull *);
-  char *(*genres)(struct __pyx_obj_7spytify_ArtistDataFull *);
-  char *(*years_active)(struct __pyx_obj_7spytify_ArtistDataFull *);
-  int (*num_albums)(struct __pyx_obj_7spytify_ArtistDataFull *);
-  struct album_browse *(*albums)(struct __pyx_obj_7spytify_ArtistDataFull *);
-};
-static struct __pyx_vtabstruct_7spytify_ArtistDataFull *__pyx_vtabptr_7spytify_ArtistDataFull;
-
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":24
- *     (<Spytify>python_obj).handle(signal, data)
- * 
- * cdef class Spytify:             # <<<<<<<<<<<<<<
- *     """Class representing a connection to the Spotify service.
- * 
- */
-
-struct __pyx_vtabstruct_7spytify_Spytify {
-  struct __pyx_vtabstruct_7spytify_SessionStruct __pyx_base;
-  PyObject *(*handle)(struct __pyx_obj_7spytify_Spytify *, int, void *);
-};
-static struct __pyx_vtabstruct_7spytify_Spytify *__pyx_vtabptr_7spytify_Spytify;
-
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":54
- * 
- * 
- * cdef class Artist(SpotifyObject):             # <<<<<<<<<<<<<<
- *     def __init__(self):
- *         raise TypeError("This class cannot be instantiated from Python")
- */
-
-struct __pyx_vtabstruct_7spytify_Artist {
-  struct __pyx_vtabstruct_7spytify_SpotifyObject __pyx_base;
-  PyObject *(*get_full_data)(struct __pyx_obj_7spytify_Artist *);
-};
-static struct __pyx_vtabstruct_7spytify_Artist *__pyx_vtabptr_7spytify_Artist;
-
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":57
- *         return retval
- * 
- * cdef class RootList(SessionStruct):             # <<<<<<<<<<<<<<
- *     def __init__(self):
- *         raise TypeError("This class cannot be instantiated from Python")
- */
-
-struct __pyx_vtabstruct_7spytify_RootList {
-  struct __pyx_vtabstruct_7spytify_SessionStruct __pyx_base;
-  PyObject *(*fetch)(struct __pyx_obj_7spytify_RootList *);
-};
-static struct __pyx_vtabstruct_7spytify_RootList *__pyx_vtabptr_7spytify_RootList;
-
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":3
- * # vim: set fileencoding=utf-8 filetype=pyrex :
- * 
- * cdef class AlbumData:             # <<<<<<<<<<<<<<
- *     def __init__(self):
- *         self.data = NULL
- */
-
-struct __pyx_vtabstruct_7spytify_AlbumData {
-  char *(*name)(struct __pyx_obj_7spytify_AlbumData *);
-  char *(*id)(struct __pyx_obj_7spytify_AlbumData *);
-  char *(*artist)(struct __pyx_obj_7spytify_AlbumData *);
-  char *(*artist_id)(struct __pyx_obj_7spytify_AlbumData *);
-  char *(*cover_id)(struct __pyx_obj_7spytify_AlbumData *);
-  float (*popularity)(struct __pyx_obj_7spytify_AlbumData *);
-  struct __pyx_obj_7spytify_AlbumData *(*next)(struct __pyx_obj_7spytify_AlbumData *);
-};
-static struct __pyx_vtabstruct_7spytify_AlbumData *__pyx_vtabptr_7spytify_AlbumData;
-
-
-struct __pyx_vtabstruct_7spytify_Playlist {
-  struct __pyx_vtabstruct_7spytify_SpotifyObject __pyx_base;
-};
-static struct __pyx_vtabstruct_7spytify_Playlist *__pyx_vtabptr_7spytify_Playlist;
-
-
-struct __pyx_vtabstruct_7spytify_SearchResult {
-  struct __pyx_vtabstruct_7spytify_SpotifyObject __pyx_base;
-};
-static struct __pyx_vtabstruct_7spytify_SearchResult *__pyx_vtabptr_7spytify_SearchResult;
-
-
-struct __pyx_vtabstruct_7spytify_Track {
-  struct __pyx_vtabstruct_7spytify_SpotifyObject __pyx_base;
-};
-static struct __pyx_vtabstruct_7spytify_Track *__pyx_vtabptr_7spytify_Track;
-
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":27
- *         return next
- * 
- * cdef class AlbumDataFull(AlbumData):             # <<<<<<<<<<<<<<
- *     def __init__(self):
- *         self.browse = NULL
- */
-
-struct __pyx_vtabstruct_7spytify_AlbumDataFull {
-  struct __pyx_vtabstruct_7spytify_AlbumData __pyx_base;
-  int (*num_tracks)(struct __pyx_obj_7spytify_AlbumDataFull *);
-  struct track *(*tracks)(struct __pyx_obj_7spytify_AlbumDataFull *);
-  int (*year)(struct __pyx_obj_7spytify_AlbumDataFull *);
-  struct __pyx_obj_7spytify_AlbumDataFull *(*next_full)(struct __pyx_obj_7spytify_AlbumDataFull *);
-};
-static struct __pyx_vtabstruct_7spytify_AlbumDataFull *__pyx_vtabptr_7spytify_AlbumDataFull;
-
-#ifndef CYTHON_REFNANNY
-  #define CYTHON_REFNANNY 0
-#endif
-
-#if CYTHON_REFNANNY
-  typedef struct {
-    void (*INCREF)(void*, PyObject*, int);
-    void (*DECREF)(void*, PyObject*, int);
-    void (*GOTREF)(void*, PyObject*, int);
-    void (*GIVEREF)(void*, PyObject*, int);
-    void* (*SetupContext)(const char*, int, const char*);
-    void (*FinishContext)(void**);
-  } __Pyx_RefNannyAPIStruct;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
-  static __Pyx_RefNannyAPIStruct * __Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-  end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
-  }
-  #define __Pyx_RefNannySetupContext(name)           void *__pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
-  #define __Pyx_RefNannyFinishContext()           __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
-  #define __Pyx_INCREF(r) __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_DECREF(r) __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GOTREF(r) __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_XDECREF(r) do { if((r) != NULL) {__Pyx_DECREF(r);} } while(0)
-#else
-  #define __Pyx_RefNannySetupContext(name)
-  #define __Pyx_RefNannyFinishContext()
-  #define __Pyx_INCREF(r) Py_INCREF(r)
-  #define __Pyx_DECREF(r) Py_DECREF(r)
-  #define __Pyx_GOTREF(r)
-  #define __Pyx_GIVEREF(r)
-  #define __Pyx_XDECREF(r) Py_XDECREF(r)
-#endif /* CYTHON_REFNANNY */
-#define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);} } while(0)
-#define __Pyx_XGOTREF(r) do { if((r) != NULL) {__Pyx_GOTREF(r);} } while(0)
-
-static INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type); /*proto*/
-
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found); /*proto*/
-
-static INLINE int __Pyx_CheckKeywordStrings(PyObject *kwdict,
-    const char* function_name, int kw_allowed); /*proto*/
-
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name, PyObject* kw_name); /*proto*/
-
-static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,     const char* function_name); /*proto*/
-
-
-static INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
-    PyObject *r;
-    if (!j) return NULL;
-    r = PyObject_GetItem(o, j);
-    Py_DECREF(j);
-    return r;
-}
-
-
-#define __Pyx_GetItemInt_List(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
-                                                    __Pyx_GetItemInt_List_Fast(o, i, size <= sizeof(long)) : \
-                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
-
-static INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
-    if (likely(o != Py_None)) {
-        if (likely((0 <= i) & (i < PyList_GET_SIZE(o)))) {
-            PyObject *r = PyList_GET_ITEM(o, i);
-            Py_INCREF(r);
-            return r;
-        }
-        else if ((-PyList_GET_SIZE(o) <= i) & (i < 0)) {
-            PyObject *r = PyList_GET_ITEM(o, PyList_GET_SIZE(o) + i);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    return __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
-}
-
-#define __Pyx_GetItemInt_Tuple(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
-                                                    __Pyx_GetItemInt_Tuple_Fast(o, i, size <= sizeof(long)) : \
-                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
-
-static INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
-    if (likely(o != Py_None)) {
-        if (likely((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
-            PyObject *r = PyTuple_GET_ITEM(o, i);
-            Py_INCREF(r);
-            return r;
-        }
-        else if ((-PyTuple_GET_SIZE(o) <= i) & (i < 0)) {
-            PyObject *r = PyTuple_GET_ITEM(o, PyTuple_GET_SIZE(o) + i);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    return __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
-}
-
-
-#define __Pyx_GetItemInt(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
-                                                    __Pyx_GetItemInt_Fast(o, i, size <= sizeof(long)) : \
-                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
-
-static INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
-    PyObject *r;
-    if (PyList_CheckExact(o) && ((0 <= i) & (i < PyList_GET_SIZE(o)))) {
-        r = PyList_GET_ITEM(o, i);
-        Py_INCREF(r);
-    }
-    else if (PyTuple_CheckExact(o) && ((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
-        r = PyTuple_GET_ITEM(o, i);
-        Py_INCREF(r);
-    }
-    else if (Py_TYPE(o)->tp_as_sequence && Py_TYPE(o)->tp_as_sequence->sq_item && (likely(i >= 0))) {
-        r = PySequence_GetItem(o, i);
-    }
-    else {
-        r = __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
-    }
-    return r;
-}
-
-static INLINE long __Pyx_NegateNonNeg(long b) { return unlikely(b < 0) ? b : !b; }
-static INLINE PyObject* __Pyx_PyBoolOrNull_FromLong(long b) {
-    return unlikely(b < 0) ? NULL : __Pyx_PyBool_FromLong(b);
-}
-
-static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact); /*proto*/
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list); /*proto*/
-
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
-
-static PyObject *__Pyx_CreateClass(PyObject *bases, PyObject *dict, PyObject *name, const char *modname); /*proto*/
-
-static INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-static INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-
-static INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
-
-static INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
-
-static INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject *);
-
-static INLINE char __Pyx_PyInt_AsChar(PyObject *);
-
-static INLINE short __Pyx_PyInt_AsShort(PyObject *);
-
-static INLINE int __Pyx_PyInt_AsInt(PyObject *);
-
-static INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject *);
-
-static INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject *);
-
-static INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject *);
-
-static INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject *);
-
-static INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject *);
-
-static INLINE long __Pyx_PyInt_AsLong(PyObject *);
-
-static INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject *);
-
-static INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject *);
-
-static INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject *);
-
-#ifndef __PYX_FORCE_INIT_THREADS
-#if PY_VERSION_HEX < 0x02040200
-#define __PYX_FORCE_INIT_THREADS 1
-#else
-#define __PYX_FORCE_INIT_THREADS 0
-#endif
-#endif
-
-static void __Pyx_WriteUnraisable(const char *name); /*proto*/
-
-static int __Pyx_SetVtable(PyObject *dict, void *vtable); /*proto*/
-
-static void __Pyx_AddTraceback(const char *funcname); /*proto*/
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
-/* Module declarations from despotify */
-
-/* Module declarations from audio_thread */
-
-/* Module declarations from spytify */
-
-static PyTypeObject *__pyx_ptype_7spytify_SessionStruct = 0;
-static PyTypeObject *__pyx_ptype_7spytify_SpotifyObject = 0;
-static PyTypeObject *__pyx_ptype_7spytify_Album = 0;
-static PyTypeObject *__pyx_ptype_7spytify_Artist = 0;
-static PyTypeObject *__pyx_ptype_7spytify_SearchResult = 0;
-static PyTypeObject *__pyx_ptype_7spytify_Playlist = 0;
-static PyTypeObject *__pyx_ptype_7spytify_RootList = 0;
-static PyTypeObject *__pyx_ptype_7spytify_Track = 0;
-static PyTypeObject *__pyx_ptype_7spytify_Spytify = 0;
-static PyTypeObject *__pyx_ptype_7spytify_AlbumData = 0;
-static PyTypeObject *__pyx_ptype_7spytify_AlbumDataFull = 0;
-static PyTypeObject *__pyx_ptype_7spytify_ArtistData = 0;
-static PyTypeObject *__pyx_ptype_7spytify_ArtistDataFull = 0;
-static PyTypeObject *__pyx_ptype_7spytify_RootIterator = 0;
-static void __pyx_f_7spytify_callback_handler(struct despotify_session *, int, void *, void *); /*proto*/
-#define __Pyx_MODULE_NAME "spytify"
-int __pyx_module_is_main_spytify = 0;
-
-/* Implementation of spytify */
-static PyObject *__pyx_builtin_Exception;
-static PyObject *__pyx_builtin_TypeError;
-static PyObject *__pyx_builtin_NotImplemented;
-static PyObject *__pyx_builtin_StopIteration;
-static PyObject *__pyx_builtin_ord;
-static char __pyx_k_1[] = ":";
-static char __pyx_k_2[] = "http://open.spotify.com/%s";
-static char __pyx_k_3[] = "/";
-static char __pyx_k_4[] = "This class cannot be instantiated from Python";
-static char __pyx_k_5[] = "spotify:album:%s";
-static char __pyx_k_6[] = "<Album: %s (%s)>";
-static char __pyx_k_7[] = "spotify:artist:%s";
-static char __pyx_k_8[] = "<Artist: %s (%s)>";
-static char __pyx_k_9[] = "spotify:track:%s";
-static char __pyx_k_10[] = "<Track: %s - %s - %s (%s)>";
-static char __pyx_k_11[] = ", ";
-static char __pyx_k_12[] = "spotify:user:%s:playlist:%s";
-static char __pyx_k_13[] = "<Playlist: %s by %s (%s)>";
-static char __pyx_k_14[] = "<RootList: %s>";
-static char __pyx_k_15[] = "spotify:search:%s";
-static char __pyx_k_18[] = "Ambigious URI specified: %s";
-static char __pyx_k_19[] = "URI not meant for us: %s";
-static char __pyx_k_20[] = "URI specifies invalid type: %s";
-static char __pyx_k_22[] = "create_search_result";
-static char __pyx_k_23[] = "";
-static char __pyx_k_24[] = "%02x";
-static char __pyx_k__i[] = "i";
-static char __pyx_k__ds[] = "ds";
-static char __pyx_k__id[] = "id";
-static char __pyx_k__pw[] = "pw";
-static char __pyx_k__ord[] = "ord";
-static char __pyx_k__data[] = "data";
-static char __pyx_k__join[] = "join";
-static char __pyx_k__name[] = "name";
-static char __pyx_k__next[] = "next";
-static char __pyx_k__text[] = "text";
-static char __pyx_k__user[] = "user";
-static char __pyx_k__year[] = "year";
-static char __pyx_k__album[] = "album";
-static char __pyx_k__fetch[] = "fetch";
-static char __pyx_k__lower[] = "lower";
-static char __pyx_k__query[] = "query";
-static char __pyx_k__split[] = "split";
-static char __pyx_k__title[] = "title";
-static char __pyx_k__track[] = "track";
-static char __pyx_k__albums[] = "albums";
-static char __pyx_k__artist[] = "artist";
-static char __pyx_k__atexit[] = "atexit";
-static char __pyx_k__author[] = "author";
-static char __pyx_k__browse[] = "browse";
-static char __pyx_k__genres[] = "genres";
-static char __pyx_k__handle[] = "handle";
-static char __pyx_k__length[] = "length";
-static char __pyx_k__parent[] = "parent";
-static char __pyx_k__thread[] = "thread";
-static char __pyx_k__tracks[] = "tracks";
-static char __pyx_k__artists[] = "artists";
-static char __pyx_k__file_id[] = "file_id";
-static char __pyx_k__get_uri[] = "get_uri";
-static char __pyx_k__spotify[] = "spotify";
-static char __pyx_k____main__[] = "__main__";
-static char __pyx_k___cleanup[] = "_cleanup";
-static char __pyx_k__callback[] = "callback";
-static char __pyx_k__cover_id[] = "cover_id";
-static char __pyx_k__max_hits[] = "max_hits";
-static char __pyx_k__playable[] = "playable";
-static char __pyx_k__playlist[] = "playlist";
-static char __pyx_k__register[] = "register";
-static char __pyx_k__track_id[] = "track_id";
-static char __pyx_k__Exception[] = "Exception";
-static char __pyx_k__TypeError[] = "TypeError";
-static char __pyx_k__artist_id[] = "artist_id";
-static char __pyx_k__full_data[] = "full_data";
-static char __pyx_k__playlists[] = "playlists";
-static char __pyx_k__use_cache[] = "use_cache";
-static char __pyx_k__num_albums[] = "num_albums";
-static char __pyx_k__num_tracks[] = "num_tracks";
-static char __pyx_k__popularity[] = "popularity";
-static char __pyx_k__searchtext[] = "searchtext";
-static char __pyx_k__suggestion[] = "suggestion";
-static char __pyx_k__take_owner[] = "take_owner";
-static char __pyx_k__playlist_id[] = "playlist_id";
-static char __pyx_k__portrait_id[] = "portrait_id";
-static char __pyx_k__tracknumber[] = "tracknumber";
-static char __pyx_k__SpytifyError[] = "SpytifyError";
-static char __pyx_k__create_album[] = "create_album";
-static char __pyx_k__create_track[] = "create_track";
-static char __pyx_k__high_bitrate[] = "high_bitrate";
-static char __pyx_k__total_albums[] = "total_albums";
-static char __pyx_k__total_tracks[] = "total_tracks";
-static char __pyx_k__years_active[] = "years_active";
-static char __pyx_k__StopIteration[] = "StopIteration";
-static char __pyx_k__create_artist[] = "create_artist";
-static char __pyx_k__get_full_data[] = "get_full_data";
-static char __pyx_k__has_meta_data[] = "has_meta_data";
-static char __pyx_k__total_artists[] = "total_artists";
-static char __pyx_k__NotImplemented[] = "NotImplemented";
-static char __pyx_k__albums_to_list[] = "albums_to_list";
-static char __pyx_k__starting_track[] = "starting_track";
-static char __pyx_k__tracks_to_list[] = "tracks_to_list";
-static char __pyx_k__artists_to_list[] = "artists_to_list";
-static char __pyx_k__create_playlist[] = "create_playlist";
-static char __pyx_k__create_rootlist[] = "create_rootlist";
-static char __pyx_k__is_collaborative[] = "is_collaborative";
-static char __pyx_k__stored_playlists[] = "stored_playlists";
-static char __pyx_k__create_album_full[] = "create_album_full";
-static char __pyx_k__playlists_to_list[] = "playlists_to_list";
-static char __pyx_k__create_artist_full[] = "create_artist_full";
-static PyObject *__pyx_kp_s_1;
-static PyObject *__pyx_kp_s_10;
-static PyObject *__pyx_kp_s_11;
-static PyObject *__pyx_kp_s_12;
-static PyObject *__pyx_kp_s_13;
-static PyObject *__pyx_kp_s_14;
-static PyObject *__pyx_kp_s_15;
-static PyObject *__pyx_kp_s_18;
-static PyObject *__pyx_kp_s_19;
-static PyObject *__pyx_kp_s_2;
-static PyObject *__pyx_kp_s_20;
-static PyObject *__pyx_n_s_22;
-static PyObject *__pyx_kp_s_23;
-static PyObject *__pyx_kp_s_24;
-static PyObject *__pyx_kp_s_3;
-static PyObject *__pyx_kp_s_4;
-static PyObject *__pyx_kp_s_5;
-static PyObject *__pyx_kp_s_6;
-static PyObject *__pyx_kp_s_7;
-static PyObject *__pyx_kp_s_8;
-static PyObject *__pyx_kp_s_9;
-static PyObject *__pyx_n_s__Exception;
-static PyObject *__pyx_n_s__NotImplemented;
-static PyObject *__pyx_n_s__SpytifyError;
-static PyObject *__pyx_n_s__StopIteration;
-static PyObject *__pyx_n_s__TypeError;
-static PyObject *__pyx_n_s____main__;
-static PyObject *__pyx_n_s___cleanup;
-static PyObject *__pyx_n_s__album;
-static PyObject *__pyx_n_s__albums;
-static PyObject *__pyx_n_s__albums_to_list;
-static PyObject *__pyx_n_s__artist;
-static PyObject *__pyx_n_s__artist_id;
-static PyObject *__pyx_n_s__artists;
-static PyObject *__pyx_n_s__artists_to_list;
-static PyObject *__pyx_n_s__atexit;
-static PyObject *__pyx_n_s__author;
-static PyObject *__pyx_n_s__browse;
-static PyObject *__pyx_n_s__callback;
-static PyObject *__pyx_n_s__cover_id;
-static PyObject *__pyx_n_s__create_album;
-static PyObject *__pyx_n_s__create_album_full;
-static PyObject *__pyx_n_s__create_artist;
-static PyObject *__pyx_n_s__create_artist_full;
-static PyObject *__pyx_n_s__create_playlist;
-static PyObject *__pyx_n_s__create_rootlist;
-static PyObject *__pyx_n_s__create_track;
-static PyObject *__pyx_n_s__data;
-static PyObject *__pyx_n_s__ds;
-static PyObject *__pyx_n_s__fetch;
-static PyObject *__pyx_n_s__file_id;
-static PyObject *__pyx_n_s__full_data;
-static PyObject *__pyx_n_s__genres;
-static PyObject *__pyx_n_s__get_full_data;
-static PyObject *__pyx_n_s__get_uri;
-static PyObject *__pyx_n_s__handle;
-static PyObject *__pyx_n_s__has_meta_data;
-static PyObject *__pyx_n_s__high_bitrate;
-static PyObject *__pyx_n_s__i;
-static PyObject *__pyx_n_s__id;
-static PyObject *__pyx_n_s__is_collaborative;
-static PyObject *__pyx_n_s__join;
-static PyObject *__pyx_n_s__length;
-static PyObject *__pyx_n_s__lower;
-static PyObject *__pyx_n_s__max_hits;
-static PyObject *__pyx_n_s__name;
-static PyObject *__pyx_n_s__next;
-static PyObject *__pyx_n_s__num_albums;
-static PyObject *__pyx_n_s__num_tracks;
-static PyObject *__pyx_n_s__ord;
-static PyObject *__pyx_n_s__parent;
-static PyObject *__pyx_n_s__playable;
-static PyObject *__pyx_n_s__playlist;
-static PyObject *__pyx_n_s__playlist_id;
-static PyObject *__pyx_n_s__playlists;
-static PyObject *__pyx_n_s__playlists_to_list;
-static PyObject *__pyx_n_s__popularity;
-static PyObject *__pyx_n_s__portrait_id;
-static PyObject *__pyx_n_s__pw;
-static PyObject *__pyx_n_s__query;
-static PyObject *__pyx_n_s__register;
-static PyObject *__pyx_n_s__searchtext;
-static PyObject *__pyx_n_s__split;
-static PyObject *__pyx_n_s__spotify;
-static PyObject *__pyx_n_s__starting_track;
-static PyObject *__pyx_n_s__stored_playlists;
-static PyObject *__pyx_n_s__suggestion;
-static PyObject *__pyx_n_s__take_owner;
-static PyObject *__pyx_n_s__text;
-static PyObject *__pyx_n_s__thread;
-static PyObject *__pyx_n_s__title;
-static PyObject *__pyx_n_s__total_albums;
-static PyObject *__pyx_n_s__total_artists;
-static PyObject *__pyx_n_s__total_tracks;
-static PyObject *__pyx_n_s__track;
-static PyObject *__pyx_n_s__track_id;
-static PyObject *__pyx_n_s__tracknumber;
-static PyObject *__pyx_n_s__tracks;
-static PyObject *__pyx_n_s__tracks_to_list;
-static PyObject *__pyx_n_s__use_cache;
-static PyObject *__pyx_n_s__user;
-static PyObject *__pyx_n_s__year;
-static PyObject *__pyx_n_s__years_active;
-static PyObject *__pyx_int_3;
-static PyObject *__pyx_k_16;
-static PyObject *__pyx_k_17;
-static int __pyx_k_21;
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":14
- * 
- * cdef class SessionStruct:
- *     cdef Album create_album(self, album* album, bint take_owner=False):             # <<<<<<<<<<<<<<
- *         cdef Album instance
- * 
- */
-
-static  struct __pyx_obj_7spytify_Album *__pyx_f_7spytify_13SessionStruct_create_album(struct __pyx_obj_7spytify_SessionStruct *__pyx_v_self, struct album *__pyx_v_album, struct __pyx_opt_args_7spytify_13SessionStruct_create_album *__pyx_optional_args) {
-  int __pyx_v_take_owner = ((int)0);
-  struct __pyx_obj_7spytify_Album *__pyx_v_instance;
-  struct __pyx_obj_7spytify_Album *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  __Pyx_RefNannySetupContext("create_album");
-  if (__pyx_optional_args) {
-    if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_take_owner = __pyx_optional_args->take_owner;
-    }
-  }
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __pyx_v_instance = ((struct __pyx_obj_7spytify_Album *)Py_None); __Pyx_INCREF(Py_None);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":17
- *         cdef Album instance
- * 
- *         instance = NEW_ALBUM(Album)             # <<<<<<<<<<<<<<
- *         instance.ds = self.ds
- *         if not album:
- */
-  __pyx_t_1 = ((PyObject *)PY_NEW(((PyObject *)((PyObject*)__pyx_ptype_7spytify_Album)))); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(((PyObject *)__pyx_v_instance));
-  __pyx_v_instance = ((struct __pyx_obj_7spytify_Album *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":18
- * 
- *         instance = NEW_ALBUM(Album)
- *         instance.ds = self.ds             # <<<<<<<<<<<<<<
- *         if not album:
- *             instance.data = None
- */
-  __pyx_v_instance->__pyx_base.__pyx_base.ds = __pyx_v_self->ds;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":19
- *         instance = NEW_ALBUM(Album)
- *         instance.ds = self.ds
- *         if not album:             # <<<<<<<<<<<<<<
- *             instance.data = None
- *         else:
- */
-  __pyx_t_2 = (!(__pyx_v_album != 0));
-  if (__pyx_t_2) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":20
- *         instance.ds = self.ds
- *         if not album:
- *             instance.data = None             # <<<<<<<<<<<<<<
- *         else:
- *             instance.data = AlbumData()
- */
-    __Pyx_INCREF(Py_None);
-    __Pyx_GIVEREF(Py_None);
-    __Pyx_GOTREF(__pyx_v_instance->data);
-    __Pyx_DECREF(((PyObject *)__pyx_v_instance->data));
-    __pyx_v_instance->data = ((struct __pyx_obj_7spytify_AlbumData *)Py_None);
-    goto __pyx_L3;
-  }
-  /*else*/ {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":22
- *             instance.data = None
- *         else:
- *             instance.data = AlbumData()             # <<<<<<<<<<<<<<
- *             instance.data.data = album
- * 
- */
-    __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_7spytify_AlbumData)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 22; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_1);
-    __Pyx_GOTREF(__pyx_v_instance->data);
-    __Pyx_DECREF(((PyObject *)__pyx_v_instance->data));
-    __pyx_v_instance->data = ((struct __pyx_obj_7spytify_AlbumData *)__pyx_t_1);
-    __pyx_t_1 = 0;
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":23
- *         else:
- *             instance.data = AlbumData()
- *             instance.data.data = album             # <<<<<<<<<<<<<<
- * 
- *         instance.take_owner = take_owner
- */
-    __pyx_v_instance->data->data = __pyx_v_album;
-  }
-  __pyx_L3:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":25
- *             instance.data.data = album
- * 
- *         instance.take_owner = take_owner             # <<<<<<<<<<<<<<
- * 
- *         return instance
- */
-  __pyx_v_instance->take_owner = __pyx_v_take_owner;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":27
- *         instance.take_owner = take_owner
- * 
- *         return instance             # <<<<<<<<<<<<<<
- * 
- *     cdef Album create_album_full(self, album_browse* album, bint take_owner=False):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_instance));
-  __pyx_r = __pyx_v_instance;
-  goto __pyx_L0;
-
-  __pyx_r = ((struct __pyx_obj_7spytify_Album *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.SessionStruct.create_album");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_instance);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":29
- *         return instance
- * 
- *     cdef Album create_album_full(self, album_browse* album, bint take_owner=False):             # <<<<<<<<<<<<<<
- *         cdef Album instance = self.create_album(NULL, take_owner)
- *         if instance is None:
- */
-
-static  struct __pyx_obj_7spytify_Album *__pyx_f_7spytify_13SessionStruct_create_album_full(struct __pyx_obj_7spytify_SessionStruct *__pyx_v_self, struct album_browse *__pyx_v_album, struct __pyx_opt_args_7spytify_13SessionStruct_create_album_full *__pyx_optional_args) {
-  int __pyx_v_take_owner = ((int)0);
-  struct __pyx_obj_7spytify_Album *__pyx_v_instance = 0;
-  struct __pyx_obj_7spytify_Album *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  struct __pyx_opt_args_7spytify_13SessionStruct_create_album __pyx_t_2;
-  int __pyx_t_3;
-  __Pyx_RefNannySetupContext("create_album_full");
-  if (__pyx_optional_args) {
-    if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_take_owner = __pyx_optional_args->take_owner;
-    }
-  }
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":30
- * 
- *     cdef Album create_album_full(self, album_browse* album, bint take_owner=False):
- *         cdef Album instance = self.create_album(NULL, take_owner)             # <<<<<<<<<<<<<<
- *         if instance is None:
- *             return instance
- */
-  __pyx_t_2.__pyx_n = 1;
-  __pyx_t_2.take_owner = __pyx_v_take_owner;
-  __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_SessionStruct *)__pyx_v_self->__pyx_vtab)->create_album(__pyx_v_self, NULL, &__pyx_t_2)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_instance = ((struct __pyx_obj_7spytify_Album *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":31
- *     cdef Album create_album_full(self, album_browse* album, bint take_owner=False):
- *         cdef Album instance = self.create_album(NULL, take_owner)
- *         if instance is None:             # <<<<<<<<<<<<<<
- *             return instance
- * 
- */
-  __pyx_t_3 = (((PyObject *)__pyx_v_instance) == Py_None);
-  if (__pyx_t_3) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":32
- *         cdef Album instance = self.create_album(NULL, take_owner)
- *         if instance is None:
- *             return instance             # <<<<<<<<<<<<<<
- * 
- *         instance.data = AlbumDataFull()
- */
-    __Pyx_XDECREF(((PyObject *)__pyx_r));
-    __Pyx_INCREF(((PyObject *)__pyx_v_instance));
-    __pyx_r = __pyx_v_instance;
-    goto __pyx_L0;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":34
- *             return instance
- * 
- *         instance.data = AlbumDataFull()             # <<<<<<<<<<<<<<
- *         instance.full_data = instance.data
- *         instance.full_data.browse = album
- */
-  __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_7spytify_AlbumDataFull)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF(__pyx_v_instance->data);
-  __Pyx_DECREF(((PyObject *)__pyx_v_instance->data));
-  __pyx_v_instance->data = ((struct __pyx_obj_7spytify_AlbumData *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":35
- * 
- *         instance.data = AlbumDataFull()
- *         instance.full_data = instance.data             # <<<<<<<<<<<<<<
- *         instance.full_data.browse = album
- * 
- */
-  if (!(likely(((((PyObject *)__pyx_v_instance->data)) == Py_None) || likely(__Pyx_TypeTest(((PyObject *)__pyx_v_instance->data), __pyx_ptype_7spytify_AlbumDataFull))))) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 35; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_INCREF(((PyObject *)__pyx_v_instance->data));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_instance->data));
-  __Pyx_GOTREF(__pyx_v_instance->full_data);
-  __Pyx_DECREF(((PyObject *)__pyx_v_instance->full_data));
-  __pyx_v_instance->full_data = ((struct __pyx_obj_7spytify_AlbumDataFull *)__pyx_v_instance->data);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":36
- *         instance.data = AlbumDataFull()
- *         instance.full_data = instance.data
- *         instance.full_data.browse = album             # <<<<<<<<<<<<<<
- * 
- *         return instance
- */
-  __pyx_v_instance->full_data->browse = __pyx_v_album;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":38
- *         instance.full_data.browse = album
- * 
- *         return instance             # <<<<<<<<<<<<<<
- * 
- *     cdef Artist create_artist(self, artist* artist, bint take_owner=False):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_instance));
-  __pyx_r = __pyx_v_instance;
-  goto __pyx_L0;
-
-  __pyx_r = ((struct __pyx_obj_7spytify_Album *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.SessionStruct.create_album_full");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_instance);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":40
- *         return instance
- * 
- *     cdef Artist create_artist(self, artist* artist, bint take_owner=False):             # <<<<<<<<<<<<<<
- *         cdef Artist instance
- * 
- */
-
-static  struct __pyx_obj_7spytify_Artist *__pyx_f_7spytify_13SessionStruct_create_artist(struct __pyx_obj_7spytify_SessionStruct *__pyx_v_self, struct artist *__pyx_v_artist, struct __pyx_opt_args_7spytify_13SessionStruct_create_artist *__pyx_optional_args) {
-  int __pyx_v_take_owner = ((int)0);
-  struct __pyx_obj_7spytify_Artist *__pyx_v_instance;
-  struct __pyx_obj_7spytify_Artist *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("create_artist");
-  if (__pyx_optional_args) {
-    if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_take_owner = __pyx_optional_args->take_owner;
-    }
-  }
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __pyx_v_instance = ((struct __pyx_obj_7spytify_Artist *)Py_None); __Pyx_INCREF(Py_None);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":43
- *         cdef Artist instance
- * 
- *         if not artist:             # <<<<<<<<<<<<<<
- *             return None
- * 
- */
-  __pyx_t_1 = (!(__pyx_v_artist != 0));
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":44
- * 
- *         if not artist:
- *             return None             # <<<<<<<<<<<<<<
- * 
- *         instance = NEW_ARTIST(Artist)
- */
-    __Pyx_XDECREF(((PyObject *)__pyx_r));
-    __Pyx_INCREF(Py_None);
-    __pyx_r = ((struct __pyx_obj_7spytify_Artist *)Py_None);
-    goto __pyx_L0;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":46
- *             return None
- * 
- *         instance = NEW_ARTIST(Artist)             # <<<<<<<<<<<<<<
- *         instance.ds = self.ds
- *         instance.data = ArtistData()
- */
-  __pyx_t_2 = ((PyObject *)PY_NEW(((PyObject *)((PyObject*)__pyx_ptype_7spytify_Artist)))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(((PyObject *)__pyx_v_instance));
-  __pyx_v_instance = ((struct __pyx_obj_7spytify_Artist *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":47
- * 
- *         instance = NEW_ARTIST(Artist)
- *         instance.ds = self.ds             # <<<<<<<<<<<<<<
- *         instance.data = ArtistData()
- *         instance.data.data = artist
- */
-  __pyx_v_instance->__pyx_base.__pyx_base.ds = __pyx_v_self->ds;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":48
- *         instance = NEW_ARTIST(Artist)
- *         instance.ds = self.ds
- *         instance.data = ArtistData()             # <<<<<<<<<<<<<<
- *         instance.data.data = artist
- * 
- */
-  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_7spytify_ArtistData)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __Pyx_GOTREF(__pyx_v_instance->data);
-  __Pyx_DECREF(((PyObject *)__pyx_v_instance->data));
-  __pyx_v_instance->data = ((struct __pyx_obj_7spytify_ArtistData *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":49
- *         instance.ds = self.ds
- *         instance.data = ArtistData()
- *         instance.data.data = artist             # <<<<<<<<<<<<<<
- * 
- *         instance.take_owner = take_owner
- */
-  __pyx_v_instance->data->data = __pyx_v_artist;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":51
- *         instance.data.data = artist
- * 
- *         instance.take_owner = take_owner             # <<<<<<<<<<<<<<
- * 
- *         return instance
- */
-  __pyx_v_instance->take_owner = __pyx_v_take_owner;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":53
- *         instance.take_owner = take_owner
- * 
- *         return instance             # <<<<<<<<<<<<<<
- * 
- *     cdef Artist create_artist_full(self, artist_browse* artist, bint take_owner=False):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_instance));
-  __pyx_r = __pyx_v_instance;
-  goto __pyx_L0;
-
-  __pyx_r = ((struct __pyx_obj_7spytify_Artist *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.SessionStruct.create_artist");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_instance);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":55
- *         return instance
- * 
- *     cdef Artist create_artist_full(self, artist_browse* artist, bint take_owner=False):             # <<<<<<<<<<<<<<
- *         cdef Artist instance = self.create_artist(NULL, take_owner)
- *         if instance is None:
- */
-
-static  struct __pyx_obj_7spytify_Artist *__pyx_f_7spytify_13SessionStruct_create_artist_full(struct __pyx_obj_7spytify_SessionStruct *__pyx_v_self, struct artist_browse *__pyx_v_artist, struct __pyx_opt_args_7spytify_13SessionStruct_create_artist_full *__pyx_optional_args) {
-  int __pyx_v_take_owner = ((int)0);
-  struct __pyx_obj_7spytify_Artist *__pyx_v_instance = 0;
-  struct __pyx_obj_7spytify_Artist *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  struct __pyx_opt_args_7spytify_13SessionStruct_create_artist __pyx_t_2;
-  int __pyx_t_3;
-  __Pyx_RefNannySetupContext("create_artist_full");
-  if (__pyx_optional_args) {
-    if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_take_owner = __pyx_optional_args->take_owner;
-    }
-  }
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":56
- * 
- *     cdef Artist create_artist_full(self, artist_browse* artist, bint take_owner=False):
- *         cdef Artist instance = self.create_artist(NULL, take_owner)             # <<<<<<<<<<<<<<
- *         if instance is None:
- *             return instance
- */
-  __pyx_t_2.__pyx_n = 1;
-  __pyx_t_2.take_owner = __pyx_v_take_owner;
-  __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_SessionStruct *)__pyx_v_self->__pyx_vtab)->create_artist(__pyx_v_self, NULL, &__pyx_t_2)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_instance = ((struct __pyx_obj_7spytify_Artist *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":57
- *     cdef Artist create_artist_full(self, artist_browse* artist, bint take_owner=False):
- *         cdef Artist instance = self.create_artist(NULL, take_owner)
- *         if instance is None:             # <<<<<<<<<<<<<<
- *             return instance
- * 
- */
-  __pyx_t_3 = (((PyObject *)__pyx_v_instance) == Py_None);
-  if (__pyx_t_3) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":58
- *         cdef Artist instance = self.create_artist(NULL, take_owner)
- *         if instance is None:
- *             return instance             # <<<<<<<<<<<<<<
- * 
- *         instance.data = ArtistDataFull()
- */
-    __Pyx_XDECREF(((PyObject *)__pyx_r));
-    __Pyx_INCREF(((PyObject *)__pyx_v_instance));
-    __pyx_r = __pyx_v_instance;
-    goto __pyx_L0;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":60
- *             return instance
- * 
- *         instance.data = ArtistDataFull()             # <<<<<<<<<<<<<<
- *         instance.full_data = instance.data
- *         instance.full_data.browse = artist
- */
-  __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_7spytify_ArtistDataFull)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF(__pyx_v_instance->data);
-  __Pyx_DECREF(((PyObject *)__pyx_v_instance->data));
-  __pyx_v_instance->data = ((struct __pyx_obj_7spytify_ArtistData *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":61
- * 
- *         instance.data = ArtistDataFull()
- *         instance.full_data = instance.data             # <<<<<<<<<<<<<<
- *         instance.full_data.browse = artist
- * 
- */
-  if (!(likely(((((PyObject *)__pyx_v_instance->data)) == Py_None) || likely(__Pyx_TypeTest(((PyObject *)__pyx_v_instance->data), __pyx_ptype_7spytify_ArtistDataFull))))) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 61; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_INCREF(((PyObject *)__pyx_v_instance->data));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_instance->data));
-  __Pyx_GOTREF(__pyx_v_instance->full_data);
-  __Pyx_DECREF(((PyObject *)__pyx_v_instance->full_data));
-  __pyx_v_instance->full_data = ((struct __pyx_obj_7spytify_ArtistDataFull *)__pyx_v_instance->data);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":62
- *         instance.data = ArtistDataFull()
- *         instance.full_data = instance.data
- *         instance.full_data.browse = artist             # <<<<<<<<<<<<<<
- * 
- *         return instance
- */
-  __pyx_v_instance->full_data->browse = __pyx_v_artist;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":64
- *         instance.full_data.browse = artist
- * 
- *         return instance             # <<<<<<<<<<<<<<
- * 
- *     cdef SearchResult create_search_result(self, search_result* result, bint take_owner=False):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_instance));
-  __pyx_r = __pyx_v_instance;
-  goto __pyx_L0;
-
-  __pyx_r = ((struct __pyx_obj_7spytify_Artist *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.SessionStruct.create_artist_full");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_instance);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":66
- *         return instance
- * 
- *     cdef SearchResult create_search_result(self, search_result* result, bint take_owner=False):             # <<<<<<<<<<<<<<
- *         cdef SearchResult instance
- * 
- */
-
-static  struct __pyx_obj_7spytify_SearchResult *__pyx_f_7spytify_13SessionStruct_create_search_result(struct __pyx_obj_7spytify_SessionStruct *__pyx_v_self, struct search_result *__pyx_v_result, struct __pyx_opt_args_7spytify_13SessionStruct_create_search_result *__pyx_optional_args) {
-  int __pyx_v_take_owner = ((int)0);
-  struct __pyx_obj_7spytify_SearchResult *__pyx_v_instance;
-  struct __pyx_obj_7spytify_SearchResult *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("create_search_result");
-  if (__pyx_optional_args) {
-    if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_take_owner = __pyx_optional_args->take_owner;
-    }
-  }
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __pyx_v_instance = ((struct __pyx_obj_7spytify_SearchResult *)Py_None); __Pyx_INCREF(Py_None);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":69
- *         cdef SearchResult instance
- * 
- *         if not result:             # <<<<<<<<<<<<<<
- *             return None
- * 
- */
-  __pyx_t_1 = (!(__pyx_v_result != 0));
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":70
- * 
- *         if not result:
- *             return None             # <<<<<<<<<<<<<<
- * 
- *         instance = NEW_SEARCHRESULT(SearchResult)
- */
-    __Pyx_XDECREF(((PyObject *)__pyx_r));
-    __Pyx_INCREF(Py_None);
-    __pyx_r = ((struct __pyx_obj_7spytify_SearchResult *)Py_None);
-    goto __pyx_L0;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":72
- *             return None
- * 
- *         instance = NEW_SEARCHRESULT(SearchResult)             # <<<<<<<<<<<<<<
- *         instance.ds = self.ds
- *         instance.data = result
- */
-  __pyx_t_2 = ((PyObject *)PY_NEW(((PyObject *)((PyObject*)__pyx_ptype_7spytify_SearchResult)))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(((PyObject *)__pyx_v_instance));
-  __pyx_v_instance = ((struct __pyx_obj_7spytify_SearchResult *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":73
- * 
- *         instance = NEW_SEARCHRESULT(SearchResult)
- *         instance.ds = self.ds             # <<<<<<<<<<<<<<
- *         instance.data = result
- *         instance.playlist = self.create_playlist(result.playlist)
- */
-  __pyx_v_instance->__pyx_base.__pyx_base.ds = __pyx_v_self->ds;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":74
- *         instance = NEW_SEARCHRESULT(SearchResult)
- *         instance.ds = self.ds
- *         instance.data = result             # <<<<<<<<<<<<<<
- *         instance.playlist = self.create_playlist(result.playlist)
- *         instance.take_owner = take_owner
- */
-  __pyx_v_instance->data = __pyx_v_result;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":75
- *         instance.ds = self.ds
- *         instance.data = result
- *         instance.playlist = self.create_playlist(result.playlist)             # <<<<<<<<<<<<<<
- *         instance.take_owner = take_owner
- * 
- */
-  __pyx_t_2 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_SessionStruct *)__pyx_v_self->__pyx_vtab)->create_playlist(__pyx_v_self, __pyx_v_result->playlist, NULL)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __Pyx_GOTREF(__pyx_v_instance->playlist);
-  __Pyx_DECREF(((PyObject *)__pyx_v_instance->playlist));
-  __pyx_v_instance->playlist = ((struct __pyx_obj_7spytify_Playlist *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":76
- *         instance.data = result
- *         instance.playlist = self.create_playlist(result.playlist)
- *         instance.take_owner = take_owner             # <<<<<<<<<<<<<<
- * 
- *         return instance
- */
-  __pyx_v_instance->take_owner = __pyx_v_take_owner;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":78
- *         instance.take_owner = take_owner
- * 
- *         return instance             # <<<<<<<<<<<<<<
- * 
- *     cdef Playlist create_playlist(self, playlist* playlist, bint take_owner=False):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_instance));
-  __pyx_r = __pyx_v_instance;
-  goto __pyx_L0;
-
-  __pyx_r = ((struct __pyx_obj_7spytify_SearchResult *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.SessionStruct.create_search_result");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_instance);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":80
- *         return instance
- * 
- *     cdef Playlist create_playlist(self, playlist* playlist, bint take_owner=False):             # <<<<<<<<<<<<<<
- *         cdef Playlist instance
- * 
- */
-
-static  struct __pyx_obj_7spytify_Playlist *__pyx_f_7spytify_13SessionStruct_create_playlist(struct __pyx_obj_7spytify_SessionStruct *__pyx_v_self, struct playlist *__pyx_v_playlist, struct __pyx_opt_args_7spytify_13SessionStruct_create_playlist *__pyx_optional_args) {
-  int __pyx_v_take_owner = ((int)0);
-  struct __pyx_obj_7spytify_Playlist *__pyx_v_instance;
-  struct __pyx_obj_7spytify_Playlist *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("create_playlist");
-  if (__pyx_optional_args) {
-    if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_take_owner = __pyx_optional_args->take_owner;
-    }
-  }
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __pyx_v_instance = ((struct __pyx_obj_7spytify_Playlist *)Py_None); __Pyx_INCREF(Py_None);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":83
- *         cdef Playlist instance
- * 
- *         if not playlist:             # <<<<<<<<<<<<<<
- *             return None
- * 
- */
-  __pyx_t_1 = (!(__pyx_v_playlist != 0));
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":84
- * 
- *         if not playlist:
- *             return None             # <<<<<<<<<<<<<<
- * 
- *         instance = NEW_PLAYLIST(Playlist)
- */
-    __Pyx_XDECREF(((PyObject *)__pyx_r));
-    __Pyx_INCREF(Py_None);
-    __pyx_r = ((struct __pyx_obj_7spytify_Playlist *)Py_None);
-    goto __pyx_L0;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":86
- *             return None
- * 
- *         instance = NEW_PLAYLIST(Playlist)             # <<<<<<<<<<<<<<
- *         instance.ds = self.ds
- *         instance.data = playlist
- */
-  __pyx_t_2 = ((PyObject *)PY_NEW(((PyObject *)((PyObject*)__pyx_ptype_7spytify_Playlist)))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(((PyObject *)__pyx_v_instance));
-  __pyx_v_instance = ((struct __pyx_obj_7spytify_Playlist *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":87
- * 
- *         instance = NEW_PLAYLIST(Playlist)
- *         instance.ds = self.ds             # <<<<<<<<<<<<<<
- *         instance.data = playlist
- *         instance.take_owner = take_owner
- */
-  __pyx_v_instance->__pyx_base.__pyx_base.ds = __pyx_v_self->ds;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":88
- *         instance = NEW_PLAYLIST(Playlist)
- *         instance.ds = self.ds
- *         instance.data = playlist             # <<<<<<<<<<<<<<
- *         instance.take_owner = take_owner
- * 
- */
-  __pyx_v_instance->data = __pyx_v_playlist;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":89
- *         instance.ds = self.ds
- *         instance.data = playlist
- *         instance.take_owner = take_owner             # <<<<<<<<<<<<<<
- * 
- *         return instance
- */
-  __pyx_v_instance->take_owner = __pyx_v_take_owner;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":91
- *         instance.take_owner = take_owner
- * 
- *         return instance             # <<<<<<<<<<<<<<
- * 
- *     cdef RootList create_rootlist(self):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_instance));
-  __pyx_r = __pyx_v_instance;
-  goto __pyx_L0;
-
-  __pyx_r = ((struct __pyx_obj_7spytify_Playlist *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.SessionStruct.create_playlist");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_instance);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":93
- *         return instance
- * 
- *     cdef RootList create_rootlist(self):             # <<<<<<<<<<<<<<
- *         cdef RootList instance
- * 
- */
-
-static  struct __pyx_obj_7spytify_RootList *__pyx_f_7spytify_13SessionStruct_create_rootlist(struct __pyx_obj_7spytify_SessionStruct *__pyx_v_self) {
-  struct __pyx_obj_7spytify_RootList *__pyx_v_instance;
-  struct __pyx_obj_7spytify_RootList *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("create_rootlist");
-  __pyx_v_instance = ((struct __pyx_obj_7spytify_RootList *)Py_None); __Pyx_INCREF(Py_None);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":96
- *         cdef RootList instance
- * 
- *         instance = NEW_ROOTLIST(RootList)             # <<<<<<<<<<<<<<
- *         instance.ds = self.ds
- *         instance.data = NULL
- */
-  __pyx_t_1 = ((PyObject *)PY_NEW(((PyObject *)((PyObject*)__pyx_ptype_7spytify_RootList)))); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 96; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(((PyObject *)__pyx_v_instance));
-  __pyx_v_instance = ((struct __pyx_obj_7spytify_RootList *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":97
- * 
- *         instance = NEW_ROOTLIST(RootList)
- *         instance.ds = self.ds             # <<<<<<<<<<<<<<
- *         instance.data = NULL
- *         instance.playlists = None
- */
-  __pyx_v_instance->__pyx_base.ds = __pyx_v_self->ds;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":98
- *         instance = NEW_ROOTLIST(RootList)
- *         instance.ds = self.ds
- *         instance.data = NULL             # <<<<<<<<<<<<<<
- *         instance.playlists = None
- * 
- */
-  __pyx_v_instance->data = NULL;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":99
- *         instance.ds = self.ds
- *         instance.data = NULL
- *         instance.playlists = None             # <<<<<<<<<<<<<<
- * 
- *         return instance
- */
-  __Pyx_INCREF(Py_None);
-  __Pyx_GIVEREF(Py_None);
-  __Pyx_GOTREF(__pyx_v_instance->playlists);
-  __Pyx_DECREF(((PyObject *)__pyx_v_instance->playlists));
-  __pyx_v_instance->playlists = ((PyObject *)Py_None);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":101
- *         instance.playlists = None
- * 
- *         return instance             # <<<<<<<<<<<<<<
- * 
- *     cdef Track create_track(self, track* track):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_instance));
-  __pyx_r = __pyx_v_instance;
-  goto __pyx_L0;
-
-  __pyx_r = ((struct __pyx_obj_7spytify_RootList *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.SessionStruct.create_rootlist");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_instance);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":103
- *         return instance
- * 
- *     cdef Track create_track(self, track* track):             # <<<<<<<<<<<<<<
- *         cdef Track instance
- * 
- */
-
-static  struct __pyx_obj_7spytify_Track *__pyx_f_7spytify_13SessionStruct_create_track(struct __pyx_obj_7spytify_SessionStruct *__pyx_v_self, struct track *__pyx_v_track) {
-  struct __pyx_obj_7spytify_Track *__pyx_v_instance;
-  struct __pyx_obj_7spytify_Track *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("create_track");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __pyx_v_instance = ((struct __pyx_obj_7spytify_Track *)Py_None); __Pyx_INCREF(Py_None);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":106
- *         cdef Track instance
- * 
- *         if not track:             # <<<<<<<<<<<<<<
- *             return None
- * 
- */
-  __pyx_t_1 = (!(__pyx_v_track != 0));
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":107
- * 
- *         if not track:
- *             return None             # <<<<<<<<<<<<<<
- * 
- *         instance = NEW_TRACK(Track)
- */
-    __Pyx_XDECREF(((PyObject *)__pyx_r));
-    __Pyx_INCREF(Py_None);
-    __pyx_r = ((struct __pyx_obj_7spytify_Track *)Py_None);
-    goto __pyx_L0;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":109
- *             return None
- * 
- *         instance = NEW_TRACK(Track)             # <<<<<<<<<<<<<<
- *         instance.ds = self.ds
- *         instance.data = track
- */
-  __pyx_t_2 = ((PyObject *)PY_NEW(((PyObject *)((PyObject*)__pyx_ptype_7spytify_Track)))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(((PyObject *)__pyx_v_instance));
-  __pyx_v_instance = ((struct __pyx_obj_7spytify_Track *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":110
- * 
- *         instance = NEW_TRACK(Track)
- *         instance.ds = self.ds             # <<<<<<<<<<<<<<
- *         instance.data = track
- *         return instance
- */
-  __pyx_v_instance->__pyx_base.__pyx_base.ds = __pyx_v_self->ds;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":111
- *         instance = NEW_TRACK(Track)
- *         instance.ds = self.ds
- *         instance.data = track             # <<<<<<<<<<<<<<
- *         return instance
- * 
- */
-  __pyx_v_instance->data = __pyx_v_track;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":112
- *         instance.ds = self.ds
- *         instance.data = track
- *         return instance             # <<<<<<<<<<<<<<
- * 
- *     cdef list albums_to_list(self, album_browse* albums):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_instance));
-  __pyx_r = __pyx_v_instance;
-  goto __pyx_L0;
-
-  __pyx_r = ((struct __pyx_obj_7spytify_Track *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.SessionStruct.create_track");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_instance);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":114
- *         return instance
- * 
- *     cdef list albums_to_list(self, album_browse* albums):             # <<<<<<<<<<<<<<
- *         cdef list l = []
- *         while albums:
- */
-
-static  PyObject *__pyx_f_7spytify_13SessionStruct_albums_to_list(struct __pyx_obj_7spytify_SessionStruct *__pyx_v_self, struct album_browse *__pyx_v_albums) {
-  PyObject *__pyx_v_l = 0;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  __Pyx_RefNannySetupContext("albums_to_list");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":115
- * 
- *     cdef list albums_to_list(self, album_browse* albums):
- *         cdef list l = []             # <<<<<<<<<<<<<<
- *         while albums:
- *             l.append(self.create_album_full(albums))
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_v_l = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":116
- *     cdef list albums_to_list(self, album_browse* albums):
- *         cdef list l = []
- *         while albums:             # <<<<<<<<<<<<<<
- *             l.append(self.create_album_full(albums))
- *             albums = albums.next
- */
-  while (1) {
-    __pyx_t_2 = (__pyx_v_albums != 0);
-    if (!__pyx_t_2) break;
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":117
- *         cdef list l = []
- *         while albums:
- *             l.append(self.create_album_full(albums))             # <<<<<<<<<<<<<<
- *             albums = albums.next
- * 
- */
-    if (unlikely(__pyx_v_l == Py_None)) {
-      PyErr_SetString(PyExc_AttributeError, "'NoneType' object has no attribute 'append'"); {__pyx_filename = __pyx_f[4]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;} 
-    }
-    __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_SessionStruct *)__pyx_v_self->__pyx_vtab)->create_album_full(__pyx_v_self, __pyx_v_albums, NULL)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = PyList_Append(((PyObject *)__pyx_v_l), __pyx_t_1); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":118
- *         while albums:
- *             l.append(self.create_album_full(albums))
- *             albums = albums.next             # <<<<<<<<<<<<<<
- * 
- *         return l
- */
-    __pyx_v_albums = __pyx_v_albums->next;
-  }
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":120
- *             albums = albums.next
- * 
- *         return l             # <<<<<<<<<<<<<<
- * 
- *     cdef list artists_to_list(self, artist* artists):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_l));
-  __pyx_r = __pyx_v_l;
-  goto __pyx_L0;
-
-  __pyx_r = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.SessionStruct.albums_to_list");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_l);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":122
- *         return l
- * 
- *     cdef list artists_to_list(self, artist* artists):             # <<<<<<<<<<<<<<
- *         cdef list l = []
- *         while artists:
- */
-
-static  PyObject *__pyx_f_7spytify_13SessionStruct_artists_to_list(struct __pyx_obj_7spytify_SessionStruct *__pyx_v_self, struct artist *__pyx_v_artists) {
-  PyObject *__pyx_v_l = 0;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  __Pyx_RefNannySetupContext("artists_to_list");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":123
- * 
- *     cdef list artists_to_list(self, artist* artists):
- *         cdef list l = []             # <<<<<<<<<<<<<<
- *         while artists:
- *             l.append(self.create_artist(artists))
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_v_l = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":124
- *     cdef list artists_to_list(self, artist* artists):
- *         cdef list l = []
- *         while artists:             # <<<<<<<<<<<<<<
- *             l.append(self.create_artist(artists))
- *             artists = artists.next
- */
-  while (1) {
-    __pyx_t_2 = (__pyx_v_artists != 0);
-    if (!__pyx_t_2) break;
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":125
- *         cdef list l = []
- *         while artists:
- *             l.append(self.create_artist(artists))             # <<<<<<<<<<<<<<
- *             artists = artists.next
- * 
- */
-    if (unlikely(__pyx_v_l == Py_None)) {
-      PyErr_SetString(PyExc_AttributeError, "'NoneType' object has no attribute 'append'"); {__pyx_filename = __pyx_f[4]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;} 
-    }
-    __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_SessionStruct *)__pyx_v_self->__pyx_vtab)->create_artist(__pyx_v_self, __pyx_v_artists, NULL)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = PyList_Append(((PyObject *)__pyx_v_l), __pyx_t_1); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":126
- *         while artists:
- *             l.append(self.create_artist(artists))
- *             artists = artists.next             # <<<<<<<<<<<<<<
- * 
- *         return l
- */
-    __pyx_v_artists = __pyx_v_artists->next;
-  }
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":128
- *             artists = artists.next
- * 
- *         return l             # <<<<<<<<<<<<<<
- * 
- *     cdef list playlists_to_list(self, playlist* playlists):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_l));
-  __pyx_r = __pyx_v_l;
-  goto __pyx_L0;
-
-  __pyx_r = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.SessionStruct.artists_to_list");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_l);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":130
- *         return l
- * 
- *     cdef list playlists_to_list(self, playlist* playlists):             # <<<<<<<<<<<<<<
- *         cdef list l = []
- *         while playlists:
- */
-
-static  PyObject *__pyx_f_7spytify_13SessionStruct_playlists_to_list(struct __pyx_obj_7spytify_SessionStruct *__pyx_v_self, struct playlist *__pyx_v_playlists) {
-  PyObject *__pyx_v_l = 0;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  __Pyx_RefNannySetupContext("playlists_to_list");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":131
- * 
- *     cdef list playlists_to_list(self, playlist* playlists):
- *         cdef list l = []             # <<<<<<<<<<<<<<
- *         while playlists:
- *             l.append(self.create_playlist(playlists))
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_v_l = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":132
- *     cdef list playlists_to_list(self, playlist* playlists):
- *         cdef list l = []
- *         while playlists:             # <<<<<<<<<<<<<<
- *             l.append(self.create_playlist(playlists))
- *             playlists = playlists.next
- */
-  while (1) {
-    __pyx_t_2 = (__pyx_v_playlists != 0);
-    if (!__pyx_t_2) break;
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":133
- *         cdef list l = []
- *         while playlists:
- *             l.append(self.create_playlist(playlists))             # <<<<<<<<<<<<<<
- *             playlists = playlists.next
- * 
- */
-    if (unlikely(__pyx_v_l == Py_None)) {
-      PyErr_SetString(PyExc_AttributeError, "'NoneType' object has no attribute 'append'"); {__pyx_filename = __pyx_f[4]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;} 
-    }
-    __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_SessionStruct *)__pyx_v_self->__pyx_vtab)->create_playlist(__pyx_v_self, __pyx_v_playlists, NULL)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = PyList_Append(((PyObject *)__pyx_v_l), __pyx_t_1); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":134
- *         while playlists:
- *             l.append(self.create_playlist(playlists))
- *             playlists = playlists.next             # <<<<<<<<<<<<<<
- * 
- *         return l
- */
-    __pyx_v_playlists = __pyx_v_playlists->next;
-  }
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":136
- *             playlists = playlists.next
- * 
- *         return l             # <<<<<<<<<<<<<<
- * 
- *     cdef list tracks_to_list(self, track* tracks):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_l));
-  __pyx_r = __pyx_v_l;
-  goto __pyx_L0;
-
-  __pyx_r = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.SessionStruct.playlists_to_list");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_l);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":138
- *         return l
- * 
- *     cdef list tracks_to_list(self, track* tracks):             # <<<<<<<<<<<<<<
- *         cdef list l = []
- *         while tracks:
- */
-
-static  PyObject *__pyx_f_7spytify_13SessionStruct_tracks_to_list(struct __pyx_obj_7spytify_SessionStruct *__pyx_v_self, struct track *__pyx_v_tracks) {
-  PyObject *__pyx_v_l = 0;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  __Pyx_RefNannySetupContext("tracks_to_list");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":139
- * 
- *     cdef list tracks_to_list(self, track* tracks):
- *         cdef list l = []             # <<<<<<<<<<<<<<
- *         while tracks:
- *             l.append(self.create_track(tracks))
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_v_l = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":140
- *     cdef list tracks_to_list(self, track* tracks):
- *         cdef list l = []
- *         while tracks:             # <<<<<<<<<<<<<<
- *             l.append(self.create_track(tracks))
- *             tracks = tracks.next
- */
-  while (1) {
-    __pyx_t_2 = (__pyx_v_tracks != 0);
-    if (!__pyx_t_2) break;
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":141
- *         cdef list l = []
- *         while tracks:
- *             l.append(self.create_track(tracks))             # <<<<<<<<<<<<<<
- *             tracks = tracks.next
- * 
- */
-    if (unlikely(__pyx_v_l == Py_None)) {
-      PyErr_SetString(PyExc_AttributeError, "'NoneType' object has no attribute 'append'"); {__pyx_filename = __pyx_f[4]; __pyx_lineno = 141; __pyx_clineno = __LINE__; goto __pyx_L1_error;} 
-    }
-    __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_SessionStruct *)__pyx_v_self->__pyx_vtab)->create_track(__pyx_v_self, __pyx_v_tracks)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 141; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = PyList_Append(((PyObject *)__pyx_v_l), __pyx_t_1); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 141; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":142
- *         while tracks:
- *             l.append(self.create_track(tracks))
- *             tracks = tracks.next             # <<<<<<<<<<<<<<
- * 
- *         return l
- */
-    __pyx_v_tracks = __pyx_v_tracks->next;
-  }
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/sessionstruct.pxi":144
- *             tracks = tracks.next
- * 
- *         return l             # <<<<<<<<<<<<<<
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_l));
-  __pyx_r = __pyx_v_l;
-  goto __pyx_L0;
-
-  __pyx_r = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.SessionStruct.tracks_to_list");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_l);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spotifyobject.pxi":8
- *     A Spotify Object is basically anything that has a spotify URI.
- *     """
- *     def get_http_link(self):             # <<<<<<<<<<<<<<
- *         """Returns HTTP link to the object."""
- *         parts = self.get_uri().split(':')
- */
-
-static PyObject *__pyx_pf_7spytify_13SpotifyObject_get_http_link(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static char __pyx_doc_7spytify_13SpotifyObject_get_http_link[] = "Returns HTTP link to the object.";
-static PyObject *__pyx_pf_7spytify_13SpotifyObject_get_http_link(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_v_parts;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("get_http_link");
-  __pyx_v_parts = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spotifyobject.pxi":10
- *     def get_http_link(self):
- *         """Returns HTTP link to the object."""
- *         parts = self.get_uri().split(':')             # <<<<<<<<<<<<<<
- *         # We ignore the first part ('spotify'), replacing it
- *         # with http://open.spotify.com/. Then we replace every : with /. :)
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__get_uri); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 10; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 10; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__split); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 10; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 10; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
-  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_1));
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 10; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_v_parts);
-  __pyx_v_parts = __pyx_t_3;
-  __pyx_t_3 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spotifyobject.pxi":13
- *         # We ignore the first part ('spotify'), replacing it
- *         # with http://open.spotify.com/. Then we replace every : with /. :)
- *         return 'http://open.spotify.com/%s' % '/'.join(parts[1:])             # <<<<<<<<<<<<<<
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = PyObject_GetAttr(((PyObject *)__pyx_kp_s_3), __pyx_n_s__join); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PySequence_GetSlice(__pyx_v_parts, 1, PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_2), __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("spytify.SpotifyObject.get_http_link");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_parts);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":4
- * 
- * cdef class AlbumData:
- *     def __init__(self):             # <<<<<<<<<<<<<<
- *         self.data = NULL
- * 
- */
-
-static int __pyx_pf_7spytify_9AlbumData___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_7spytify_9AlbumData___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":5
- * cdef class AlbumData:
- *     def __init__(self):
- *         self.data = NULL             # <<<<<<<<<<<<<<
- * 
- *     cdef char* name(self):
- */
-  ((struct __pyx_obj_7spytify_AlbumData *)__pyx_v_self)->data = NULL;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":7
- *         self.data = NULL
- * 
- *     cdef char* name(self):             # <<<<<<<<<<<<<<
- *         return self.data.name if self.data != NULL else NULL
- *     cdef char* id(self):
- */
-
-static  char *__pyx_f_7spytify_9AlbumData_name(struct __pyx_obj_7spytify_AlbumData *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("name");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":8
- * 
- *     cdef char* name(self):
- *         return self.data.name if self.data != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef char* id(self):
- *         return self.data.id if self.data != NULL else NULL
- */
-  if ((__pyx_v_self->data != NULL)) {
-    __pyx_t_1 = __pyx_v_self->data->name;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":9
- *     cdef char* name(self):
- *         return self.data.name if self.data != NULL else NULL
- *     cdef char* id(self):             # <<<<<<<<<<<<<<
- *         return self.data.id if self.data != NULL else NULL
- *     cdef char* artist(self):
- */
-
-static  char *__pyx_f_7spytify_9AlbumData_id(struct __pyx_obj_7spytify_AlbumData *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("id");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":10
- *         return self.data.name if self.data != NULL else NULL
- *     cdef char* id(self):
- *         return self.data.id if self.data != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef char* artist(self):
- *         return self.data.artist if self.data != NULL else NULL
- */
-  if ((__pyx_v_self->data != NULL)) {
-    __pyx_t_1 = __pyx_v_self->data->id;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":11
- *     cdef char* id(self):
- *         return self.data.id if self.data != NULL else NULL
- *     cdef char* artist(self):             # <<<<<<<<<<<<<<
- *         return self.data.artist if self.data != NULL else NULL
- *     cdef char* artist_id(self):
- */
-
-static  char *__pyx_f_7spytify_9AlbumData_artist(struct __pyx_obj_7spytify_AlbumData *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("artist");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":12
- *         return self.data.id if self.data != NULL else NULL
- *     cdef char* artist(self):
- *         return self.data.artist if self.data != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef char* artist_id(self):
- *         return self.data.artist_id if self.data != NULL else NULL
- */
-  if ((__pyx_v_self->data != NULL)) {
-    __pyx_t_1 = __pyx_v_self->data->artist;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":13
- *     cdef char* artist(self):
- *         return self.data.artist if self.data != NULL else NULL
- *     cdef char* artist_id(self):             # <<<<<<<<<<<<<<
- *         return self.data.artist_id if self.data != NULL else NULL
- *     cdef char* cover_id(self):
- */
-
-static  char *__pyx_f_7spytify_9AlbumData_artist_id(struct __pyx_obj_7spytify_AlbumData *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("artist_id");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":14
- *         return self.data.artist if self.data != NULL else NULL
- *     cdef char* artist_id(self):
- *         return self.data.artist_id if self.data != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef char* cover_id(self):
- *         return self.data.cover_id if self.data != NULL else NULL
- */
-  if ((__pyx_v_self->data != NULL)) {
-    __pyx_t_1 = __pyx_v_self->data->artist_id;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":15
- *     cdef char* artist_id(self):
- *         return self.data.artist_id if self.data != NULL else NULL
- *     cdef char* cover_id(self):             # <<<<<<<<<<<<<<
- *         return self.data.cover_id if self.data != NULL else NULL
- *     cdef float popularity(self):
- */
-
-static  char *__pyx_f_7spytify_9AlbumData_cover_id(struct __pyx_obj_7spytify_AlbumData *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("cover_id");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":16
- *         return self.data.artist_id if self.data != NULL else NULL
- *     cdef char* cover_id(self):
- *         return self.data.cover_id if self.data != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef float popularity(self):
- *         return self.data.popularity if self.data != NULL else 0.0
- */
-  if ((__pyx_v_self->data != NULL)) {
-    __pyx_t_1 = __pyx_v_self->data->cover_id;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":17
- *     cdef char* cover_id(self):
- *         return self.data.cover_id if self.data != NULL else NULL
- *     cdef float popularity(self):             # <<<<<<<<<<<<<<
- *         return self.data.popularity if self.data != NULL else 0.0
- * 
- */
-
-static  float __pyx_f_7spytify_9AlbumData_popularity(struct __pyx_obj_7spytify_AlbumData *__pyx_v_self) {
-  float __pyx_r;
-  double __pyx_t_1;
-  __Pyx_RefNannySetupContext("popularity");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":18
- *         return self.data.cover_id if self.data != NULL else NULL
- *     cdef float popularity(self):
- *         return self.data.popularity if self.data != NULL else 0.0             # <<<<<<<<<<<<<<
- * 
- *     cdef AlbumData next(self):
- */
-  if ((__pyx_v_self->data != NULL)) {
-    __pyx_t_1 = __pyx_v_self->data->popularity;
-  } else {
-    __pyx_t_1 = 0.0;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":20
- *         return self.data.popularity if self.data != NULL else 0.0
- * 
- *     cdef AlbumData next(self):             # <<<<<<<<<<<<<<
- *         if self.data == NULL:
- *             return None
- */
-
-static  struct __pyx_obj_7spytify_AlbumData *__pyx_f_7spytify_9AlbumData_next(struct __pyx_obj_7spytify_AlbumData *__pyx_v_self) {
-  struct __pyx_obj_7spytify_AlbumData *__pyx_v_next = 0;
-  struct __pyx_obj_7spytify_AlbumData *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("next");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":21
- * 
- *     cdef AlbumData next(self):
- *         if self.data == NULL:             # <<<<<<<<<<<<<<
- *             return None
- *         cdef AlbumData next = AlbumData()
- */
-  __pyx_t_1 = (__pyx_v_self->data == NULL);
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":22
- *     cdef AlbumData next(self):
- *         if self.data == NULL:
- *             return None             # <<<<<<<<<<<<<<
- *         cdef AlbumData next = AlbumData()
- *         next.data = self.data.next
- */
-    __Pyx_XDECREF(((PyObject *)__pyx_r));
-    __Pyx_INCREF(Py_None);
-    __pyx_r = ((struct __pyx_obj_7spytify_AlbumData *)Py_None);
-    goto __pyx_L0;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":23
- *         if self.data == NULL:
- *             return None
- *         cdef AlbumData next = AlbumData()             # <<<<<<<<<<<<<<
- *         next.data = self.data.next
- *         return next
- */
-  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_7spytify_AlbumData)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 23; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_v_next = ((struct __pyx_obj_7spytify_AlbumData *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":24
- *             return None
- *         cdef AlbumData next = AlbumData()
- *         next.data = self.data.next             # <<<<<<<<<<<<<<
- *         return next
- * 
- */
-  __pyx_v_next->data = __pyx_v_self->data->next;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":25
- *         cdef AlbumData next = AlbumData()
- *         next.data = self.data.next
- *         return next             # <<<<<<<<<<<<<<
- * 
- * cdef class AlbumDataFull(AlbumData):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_next));
-  __pyx_r = __pyx_v_next;
-  goto __pyx_L0;
-
-  __pyx_r = ((struct __pyx_obj_7spytify_AlbumData *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.AlbumData.next");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_next);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":28
- * 
- * cdef class AlbumDataFull(AlbumData):
- *     def __init__(self):             # <<<<<<<<<<<<<<
- *         self.browse = NULL
- * 
- */
-
-static int __pyx_pf_7spytify_13AlbumDataFull___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_7spytify_13AlbumDataFull___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":29
- * cdef class AlbumDataFull(AlbumData):
- *     def __init__(self):
- *         self.browse = NULL             # <<<<<<<<<<<<<<
- * 
- *     # Overwriting the ones in AlbumData.
- */
-  ((struct __pyx_obj_7spytify_AlbumDataFull *)__pyx_v_self)->browse = NULL;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":32
- * 
- *     # Overwriting the ones in AlbumData.
- *     cdef char* name(self):             # <<<<<<<<<<<<<<
- *         return self.browse.name if self.browse != NULL else NULL
- *     cdef char* id(self):
- */
-
-static  char *__pyx_f_7spytify_13AlbumDataFull_name(struct __pyx_obj_7spytify_AlbumDataFull *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("name");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":33
- *     # Overwriting the ones in AlbumData.
- *     cdef char* name(self):
- *         return self.browse.name if self.browse != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef char* id(self):
- *         return self.browse.id if self.browse != NULL else NULL
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->name;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":34
- *     cdef char* name(self):
- *         return self.browse.name if self.browse != NULL else NULL
- *     cdef char* id(self):             # <<<<<<<<<<<<<<
- *         return self.browse.id if self.browse != NULL else NULL
- *     cdef char* cover_id(self):
- */
-
-static  char *__pyx_f_7spytify_13AlbumDataFull_id(struct __pyx_obj_7spytify_AlbumDataFull *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("id");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":35
- *         return self.browse.name if self.browse != NULL else NULL
- *     cdef char* id(self):
- *         return self.browse.id if self.browse != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef char* cover_id(self):
- *         return self.browse.cover_id if self.browse != NULL else NULL
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->id;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":36
- *     cdef char* id(self):
- *         return self.browse.id if self.browse != NULL else NULL
- *     cdef char* cover_id(self):             # <<<<<<<<<<<<<<
- *         return self.browse.cover_id if self.browse != NULL else NULL
- *     cdef float popularity(self):
- */
-
-static  char *__pyx_f_7spytify_13AlbumDataFull_cover_id(struct __pyx_obj_7spytify_AlbumDataFull *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("cover_id");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":37
- *         return self.browse.id if self.browse != NULL else NULL
- *     cdef char* cover_id(self):
- *         return self.browse.cover_id if self.browse != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef float popularity(self):
- *         return self.browse.popularity if self.browse != NULL else 0.0
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->cover_id;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":38
- *     cdef char* cover_id(self):
- *         return self.browse.cover_id if self.browse != NULL else NULL
- *     cdef float popularity(self):             # <<<<<<<<<<<<<<
- *         return self.browse.popularity if self.browse != NULL else 0.0
- * 
- */
-
-static  float __pyx_f_7spytify_13AlbumDataFull_popularity(struct __pyx_obj_7spytify_AlbumDataFull *__pyx_v_self) {
-  float __pyx_r;
-  double __pyx_t_1;
-  __Pyx_RefNannySetupContext("popularity");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":39
- *         return self.browse.cover_id if self.browse != NULL else NULL
- *     cdef float popularity(self):
- *         return self.browse.popularity if self.browse != NULL else 0.0             # <<<<<<<<<<<<<<
- * 
- *     # New ones in Full
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->popularity;
-  } else {
-    __pyx_t_1 = 0.0;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":42
- * 
- *     # New ones in Full
- *     cdef int num_tracks(self):             # <<<<<<<<<<<<<<
- *         return self.browse.num_tracks if self.browse != NULL else 0
- *     cdef track* tracks(self):
- */
-
-static  int __pyx_f_7spytify_13AlbumDataFull_num_tracks(struct __pyx_obj_7spytify_AlbumDataFull *__pyx_v_self) {
-  int __pyx_r;
-  long __pyx_t_1;
-  __Pyx_RefNannySetupContext("num_tracks");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":43
- *     # New ones in Full
- *     cdef int num_tracks(self):
- *         return self.browse.num_tracks if self.browse != NULL else 0             # <<<<<<<<<<<<<<
- *     cdef track* tracks(self):
- *         return self.browse.tracks if self.browse != NULL else NULL
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->num_tracks;
-  } else {
-    __pyx_t_1 = 0;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":44
- *     cdef int num_tracks(self):
- *         return self.browse.num_tracks if self.browse != NULL else 0
- *     cdef track* tracks(self):             # <<<<<<<<<<<<<<
- *         return self.browse.tracks if self.browse != NULL else NULL
- *     cdef int year(self):
- */
-
-static  struct track *__pyx_f_7spytify_13AlbumDataFull_tracks(struct __pyx_obj_7spytify_AlbumDataFull *__pyx_v_self) {
-  struct track *__pyx_r;
-  struct track *__pyx_t_1;
-  __Pyx_RefNannySetupContext("tracks");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":45
- *         return self.browse.num_tracks if self.browse != NULL else 0
- *     cdef track* tracks(self):
- *         return self.browse.tracks if self.browse != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef int year(self):
- *         return self.browse.year if self.browse != NULL else 0
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->tracks;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":46
- *     cdef track* tracks(self):
- *         return self.browse.tracks if self.browse != NULL else NULL
- *     cdef int year(self):             # <<<<<<<<<<<<<<
- *         return self.browse.year if self.browse != NULL else 0
- * 
- */
-
-static  int __pyx_f_7spytify_13AlbumDataFull_year(struct __pyx_obj_7spytify_AlbumDataFull *__pyx_v_self) {
-  int __pyx_r;
-  long __pyx_t_1;
-  __Pyx_RefNannySetupContext("year");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":47
- *         return self.browse.tracks if self.browse != NULL else NULL
- *     cdef int year(self):
- *         return self.browse.year if self.browse != NULL else 0             # <<<<<<<<<<<<<<
- * 
- *     cdef AlbumDataFull next_full(self):
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->year;
-  } else {
-    __pyx_t_1 = 0;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":49
- *         return self.browse.year if self.browse != NULL else 0
- * 
- *     cdef AlbumDataFull next_full(self):             # <<<<<<<<<<<<<<
- *         if self.browse == NULL:
- *             return None
- */
-
-static  struct __pyx_obj_7spytify_AlbumDataFull *__pyx_f_7spytify_13AlbumDataFull_next_full(struct __pyx_obj_7spytify_AlbumDataFull *__pyx_v_self) {
-  struct __pyx_obj_7spytify_AlbumDataFull *__pyx_v_next = 0;
-  struct __pyx_obj_7spytify_AlbumDataFull *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("next_full");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":50
- * 
- *     cdef AlbumDataFull next_full(self):
- *         if self.browse == NULL:             # <<<<<<<<<<<<<<
- *             return None
- * 
- */
-  __pyx_t_1 = (__pyx_v_self->browse == NULL);
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":51
- *     cdef AlbumDataFull next_full(self):
- *         if self.browse == NULL:
- *             return None             # <<<<<<<<<<<<<<
- * 
- *         cdef AlbumDataFull next = AlbumDataFull()
- */
-    __Pyx_XDECREF(((PyObject *)__pyx_r));
-    __Pyx_INCREF(Py_None);
-    __pyx_r = ((struct __pyx_obj_7spytify_AlbumDataFull *)Py_None);
-    goto __pyx_L0;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":53
- *             return None
- * 
- *         cdef AlbumDataFull next = AlbumDataFull()             # <<<<<<<<<<<<<<
- *         next.browse = self.browse.next
- *         return next
- */
-  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_7spytify_AlbumDataFull)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_v_next = ((struct __pyx_obj_7spytify_AlbumDataFull *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":54
- * 
- *         cdef AlbumDataFull next = AlbumDataFull()
- *         next.browse = self.browse.next             # <<<<<<<<<<<<<<
- *         return next
- * 
- */
-  __pyx_v_next->browse = __pyx_v_self->browse->next;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":55
- *         cdef AlbumDataFull next = AlbumDataFull()
- *         next.browse = self.browse.next
- *         return next             # <<<<<<<<<<<<<<
- * 
- * cdef class Album(SpotifyObject):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_next));
-  __pyx_r = __pyx_v_next;
-  goto __pyx_L0;
-
-  __pyx_r = ((struct __pyx_obj_7spytify_AlbumDataFull *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.AlbumDataFull.next_full");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_next);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":58
- * 
- * cdef class Album(SpotifyObject):
- *     def __init__(self):             # <<<<<<<<<<<<<<
- *         raise TypeError("This class cannot be instantiated from Python")
- * 
- */
-
-static int __pyx_pf_7spytify_5Album___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_7spytify_5Album___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":59
- * cdef class Album(SpotifyObject):
- *     def __init__(self):
- *         raise TypeError("This class cannot be instantiated from Python")             # <<<<<<<<<<<<<<
- * 
- *     cdef get_full_data(self):
- */
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
-  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_kp_s_4));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
-  __pyx_t_2 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_Raise(__pyx_t_2, 0, 0);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  {__pyx_filename = __pyx_f[1]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.Album.__init__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":61
- *         raise TypeError("This class cannot be instantiated from Python")
- * 
- *     cdef get_full_data(self):             # <<<<<<<<<<<<<<
- *         if self.full_data == None:
- *             self.full_data = AlbumDataFull()
- */
-
-static  PyObject *__pyx_f_7spytify_5Album_get_full_data(struct __pyx_obj_7spytify_Album *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  __Pyx_RefNannySetupContext("get_full_data");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":62
- * 
- *     cdef get_full_data(self):
- *         if self.full_data == None:             # <<<<<<<<<<<<<<
- *             self.full_data = AlbumDataFull()
- *             self.full_data.browse = despotify_get_album(self.ds, self.data.id())
- */
-  __pyx_t_1 = PyObject_RichCompare(((PyObject *)__pyx_v_self->full_data), Py_None, Py_EQ); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_2) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":63
- *     cdef get_full_data(self):
- *         if self.full_data == None:
- *             self.full_data = AlbumDataFull()             # <<<<<<<<<<<<<<
- *             self.full_data.browse = despotify_get_album(self.ds, self.data.id())
- *             self.data = self.full_data
- */
-    __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_7spytify_AlbumDataFull)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_1);
-    __Pyx_GOTREF(__pyx_v_self->full_data);
-    __Pyx_DECREF(((PyObject *)__pyx_v_self->full_data));
-    __pyx_v_self->full_data = ((struct __pyx_obj_7spytify_AlbumDataFull *)__pyx_t_1);
-    __pyx_t_1 = 0;
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":64
- *         if self.full_data == None:
- *             self.full_data = AlbumDataFull()
- *             self.full_data.browse = despotify_get_album(self.ds, self.data.id())             # <<<<<<<<<<<<<<
- *             self.data = self.full_data
- * 
- */
-    __pyx_v_self->full_data->browse = despotify_get_album(__pyx_v_self->__pyx_base.__pyx_base.ds, ((struct __pyx_vtabstruct_7spytify_AlbumData *)__pyx_v_self->data->__pyx_vtab)->id(__pyx_v_self->data));
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":65
- *             self.full_data = AlbumDataFull()
- *             self.full_data.browse = despotify_get_album(self.ds, self.data.id())
- *             self.data = self.full_data             # <<<<<<<<<<<<<<
- * 
- *     def get_uri(self):
- */
-    __Pyx_INCREF(((PyObject *)__pyx_v_self->full_data));
-    __Pyx_GIVEREF(((PyObject *)__pyx_v_self->full_data));
-    __Pyx_GOTREF(__pyx_v_self->data);
-    __Pyx_DECREF(((PyObject *)__pyx_v_self->data));
-    __pyx_v_self->data = ((struct __pyx_obj_7spytify_AlbumData *)__pyx_v_self->full_data);
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Album.get_full_data");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":67
- *             self.data = self.full_data
- * 
- *     def get_uri(self):             # <<<<<<<<<<<<<<
- *         cdef char uri_id[23]
- *         despotify_id2uri(self.id, uri_id)
- */
-
-static PyObject *__pyx_pf_7spytify_5Album_get_uri(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Album_get_uri(PyObject *__pyx_v_self, PyObject *unused) {
-  char __pyx_v_uri_id[23];
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  char *__pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("get_uri");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":69
- *     def get_uri(self):
- *         cdef char uri_id[23]
- *         despotify_id2uri(self.id, uri_id)             # <<<<<<<<<<<<<<
- *         return 'spotify:album:%s' % uri_id
- * 
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__id); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyBytes_AsString(__pyx_t_1); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  despotify_id2uri(__pyx_t_2, __pyx_v_uri_id);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":70
- *         cdef char uri_id[23]
- *         despotify_id2uri(self.id, uri_id)
- *         return 'spotify:album:%s' % uri_id             # <<<<<<<<<<<<<<
- * 
- *     property name:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(__pyx_v_uri_id); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 70; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_5), __pyx_t_1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 70; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("spytify.Album.get_uri");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":73
- * 
- *     property name:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.name()
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Album_4name___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Album_4name___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":74
- *     property name:
- *         def __get__(self):
- *             return self.data.name()             # <<<<<<<<<<<<<<
- * 
- *     property id:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((struct __pyx_vtabstruct_7spytify_AlbumData *)((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->data->__pyx_vtab)->name(((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->data)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Album.name.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":77
- * 
- *     property id:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.id()
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Album_2id___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Album_2id___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":78
- *     property id:
- *         def __get__(self):
- *             return self.data.id()             # <<<<<<<<<<<<<<
- * 
- *     property tracks:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((struct __pyx_vtabstruct_7spytify_AlbumData *)((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->data->__pyx_vtab)->id(((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->data)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Album.id.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":81
- * 
- *     property tracks:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             self.get_full_data()
- *             return self.tracks_to_list(self.full_data.tracks())
- */
-
-static PyObject *__pyx_pf_7spytify_5Album_6tracks___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Album_6tracks___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":82
- *     property tracks:
- *         def __get__(self):
- *             self.get_full_data()             # <<<<<<<<<<<<<<
- *             return self.tracks_to_list(self.full_data.tracks())
- * 
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_7spytify_Album *)((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->__pyx_base.__pyx_base.__pyx_vtab)->get_full_data(((struct __pyx_obj_7spytify_Album *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 82; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":83
- *         def __get__(self):
- *             self.get_full_data()
- *             return self.tracks_to_list(self.full_data.tracks())             # <<<<<<<<<<<<<<
- * 
- *     property year:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_Album *)((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->__pyx_base.__pyx_base.__pyx_vtab)->__pyx_base.__pyx_base.tracks_to_list(((struct __pyx_obj_7spytify_SessionStruct *)__pyx_v_self), ((struct __pyx_vtabstruct_7spytify_AlbumDataFull *)((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->full_data->__pyx_base.__pyx_vtab)->tracks(((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->full_data))); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Album.tracks.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":86
- * 
- *     property year:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             self.get_full_data()
- *             return self.full_data.year()
- */
-
-static PyObject *__pyx_pf_7spytify_5Album_4year___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Album_4year___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":87
- *     property year:
- *         def __get__(self):
- *             self.get_full_data()             # <<<<<<<<<<<<<<
- *             return self.full_data.year()
- * 
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_7spytify_Album *)((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->__pyx_base.__pyx_base.__pyx_vtab)->get_full_data(((struct __pyx_obj_7spytify_Album *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":88
- *         def __get__(self):
- *             self.get_full_data()
- *             return self.full_data.year()             # <<<<<<<<<<<<<<
- * 
- *     property cover_id:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_vtabstruct_7spytify_AlbumDataFull *)((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->full_data->__pyx_base.__pyx_vtab)->year(((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->full_data)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Album.year.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":91
- * 
- *     property cover_id:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.cover_id()
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Album_8cover_id___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Album_8cover_id___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":92
- *     property cover_id:
- *         def __get__(self):
- *             return self.data.cover_id()             # <<<<<<<<<<<<<<
- * 
- *     property popularity:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((struct __pyx_vtabstruct_7spytify_AlbumData *)((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->data->__pyx_vtab)->cover_id(((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->data)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Album.cover_id.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":95
- * 
- *     property popularity:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.popularity()
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Album_10popularity___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Album_10popularity___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":96
- *     property popularity:
- *         def __get__(self):
- *             return self.data.popularity()             # <<<<<<<<<<<<<<
- * 
- *     def __dealloc__(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(((struct __pyx_vtabstruct_7spytify_AlbumData *)((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->data->__pyx_vtab)->popularity(((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->data)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 96; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Album.popularity.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":98
- *             return self.data.popularity()
- * 
- *     def __dealloc__(self):             # <<<<<<<<<<<<<<
- *         if self.take_owner:
- *             if self.full_data is not None:
- */
-
-static void __pyx_pf_7spytify_5Album___dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pf_7spytify_5Album___dealloc__(PyObject *__pyx_v_self) {
-  int __pyx_t_1;
-  __Pyx_RefNannySetupContext("__dealloc__");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":99
- * 
- *     def __dealloc__(self):
- *         if self.take_owner:             # <<<<<<<<<<<<<<
- *             if self.full_data is not None:
- *                 if self.full_data.browse != NULL:
- */
-  __pyx_t_1 = ((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->take_owner;
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":100
- *     def __dealloc__(self):
- *         if self.take_owner:
- *             if self.full_data is not None:             # <<<<<<<<<<<<<<
- *                 if self.full_data.browse != NULL:
- *                     despotify_free_album_browse(self.full_data.browse)
- */
-    __pyx_t_1 = (((PyObject *)((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->full_data) != Py_None);
-    if (__pyx_t_1) {
-
-      /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":101
- *         if self.take_owner:
- *             if self.full_data is not None:
- *                 if self.full_data.browse != NULL:             # <<<<<<<<<<<<<<
- *                     despotify_free_album_browse(self.full_data.browse)
- * 
- */
-      __pyx_t_1 = (((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->full_data->browse != NULL);
-      if (__pyx_t_1) {
-
-        /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":102
- *             if self.full_data is not None:
- *                 if self.full_data.browse != NULL:
- *                     despotify_free_album_browse(self.full_data.browse)             # <<<<<<<<<<<<<<
- * 
- *     def __repr__(self):
- */
-        despotify_free_album_browse(((struct __pyx_obj_7spytify_Album *)__pyx_v_self)->full_data->browse);
-        goto __pyx_L7;
-      }
-      __pyx_L7:;
-      goto __pyx_L6;
-    }
-    __pyx_L6:;
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":104
- *                     despotify_free_album_browse(self.full_data.browse)
- * 
- *     def __repr__(self):             # <<<<<<<<<<<<<<
- *         return '<Album: %s (%s)>' % (self.name, self.id)
- */
-
-static PyObject *__pyx_pf_7spytify_5Album___repr__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Album___repr__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("__repr__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/album.pxi":105
- * 
- *     def __repr__(self):
- *         return '<Album: %s (%s)>' % (self.name, self.id)             # <<<<<<<<<<<<<<
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__name); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__id); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_1 = 0;
-  __pyx_t_2 = 0;
-  __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_6), __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("spytify.Album.__repr__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":4
- * 
- * cdef class ArtistData:
- *     def __init__(self):             # <<<<<<<<<<<<<<
- *         self.data = NULL
- * 
- */
-
-static int __pyx_pf_7spytify_10ArtistData___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_7spytify_10ArtistData___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":5
- * cdef class ArtistData:
- *     def __init__(self):
- *         self.data = NULL             # <<<<<<<<<<<<<<
- * 
- *     cdef char* name(self):
- */
-  ((struct __pyx_obj_7spytify_ArtistData *)__pyx_v_self)->data = NULL;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":7
- *         self.data = NULL
- * 
- *     cdef char* name(self):             # <<<<<<<<<<<<<<
- *         return self.data.name if self.data != NULL else NULL
- * 
- */
-
-static  char *__pyx_f_7spytify_10ArtistData_name(struct __pyx_obj_7spytify_ArtistData *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("name");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":8
- * 
- *     cdef char* name(self):
- *         return self.data.name if self.data != NULL else NULL             # <<<<<<<<<<<<<<
- * 
- *     cdef char* id(self):
- */
-  if ((__pyx_v_self->data != NULL)) {
-    __pyx_t_1 = __pyx_v_self->data->name;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":10
- *         return self.data.name if self.data != NULL else NULL
- * 
- *     cdef char* id(self):             # <<<<<<<<<<<<<<
- *         return self.data.id if self.data != NULL else NULL
- * 
- */
-
-static  char *__pyx_f_7spytify_10ArtistData_id(struct __pyx_obj_7spytify_ArtistData *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("id");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":11
- * 
- *     cdef char* id(self):
- *         return self.data.id if self.data != NULL else NULL             # <<<<<<<<<<<<<<
- * 
- *     cdef char* portrait_id(self):
- */
-  if ((__pyx_v_self->data != NULL)) {
-    __pyx_t_1 = __pyx_v_self->data->id;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":13
- *         return self.data.id if self.data != NULL else NULL
- * 
- *     cdef char* portrait_id(self):             # <<<<<<<<<<<<<<
- *         return self.data.portrait_id if self.data != NULL else NULL
- * 
- */
-
-static  char *__pyx_f_7spytify_10ArtistData_portrait_id(struct __pyx_obj_7spytify_ArtistData *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("portrait_id");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":14
- * 
- *     cdef char* portrait_id(self):
- *         return self.data.portrait_id if self.data != NULL else NULL             # <<<<<<<<<<<<<<
- * 
- *     cdef float popularity(self):
- */
-  if ((__pyx_v_self->data != NULL)) {
-    __pyx_t_1 = __pyx_v_self->data->portrait_id;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":16
- *         return self.data.portrait_id if self.data != NULL else NULL
- * 
- *     cdef float popularity(self):             # <<<<<<<<<<<<<<
- *         return self.data.popularity if self.data != NULL else 0.0
- * 
- */
-
-static  float __pyx_f_7spytify_10ArtistData_popularity(struct __pyx_obj_7spytify_ArtistData *__pyx_v_self) {
-  float __pyx_r;
-  double __pyx_t_1;
-  __Pyx_RefNannySetupContext("popularity");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":17
- * 
- *     cdef float popularity(self):
- *         return self.data.popularity if self.data != NULL else 0.0             # <<<<<<<<<<<<<<
- * 
- *     cdef ArtistData next(self):
- */
-  if ((__pyx_v_self->data != NULL)) {
-    __pyx_t_1 = __pyx_v_self->data->popularity;
-  } else {
-    __pyx_t_1 = 0.0;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":19
- *         return self.data.popularity if self.data != NULL else 0.0
- * 
- *     cdef ArtistData next(self):             # <<<<<<<<<<<<<<
- *         if self.data == NULL:
- *             return None
- */
-
-static  struct __pyx_obj_7spytify_ArtistData *__pyx_f_7spytify_10ArtistData_next(struct __pyx_obj_7spytify_ArtistData *__pyx_v_self) {
-  struct __pyx_obj_7spytify_ArtistData *__pyx_v_next = 0;
-  struct __pyx_obj_7spytify_ArtistData *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("next");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":20
- * 
- *     cdef ArtistData next(self):
- *         if self.data == NULL:             # <<<<<<<<<<<<<<
- *             return None
- * 
- */
-  __pyx_t_1 = (__pyx_v_self->data == NULL);
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":21
- *     cdef ArtistData next(self):
- *         if self.data == NULL:
- *             return None             # <<<<<<<<<<<<<<
- * 
- *         cdef ArtistData next = ArtistData()
- */
-    __Pyx_XDECREF(((PyObject *)__pyx_r));
-    __Pyx_INCREF(Py_None);
-    __pyx_r = ((struct __pyx_obj_7spytify_ArtistData *)Py_None);
-    goto __pyx_L0;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":23
- *             return None
- * 
- *         cdef ArtistData next = ArtistData()             # <<<<<<<<<<<<<<
- *         next.data = self.data.next
- *         return next
- */
-  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_7spytify_ArtistData)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 23; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_v_next = ((struct __pyx_obj_7spytify_ArtistData *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":24
- * 
- *         cdef ArtistData next = ArtistData()
- *         next.data = self.data.next             # <<<<<<<<<<<<<<
- *         return next
- * 
- */
-  __pyx_v_next->data = __pyx_v_self->data->next;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":25
- *         cdef ArtistData next = ArtistData()
- *         next.data = self.data.next
- *         return next             # <<<<<<<<<<<<<<
- * 
- * cdef class ArtistDataFull(ArtistData):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_next));
-  __pyx_r = __pyx_v_next;
-  goto __pyx_L0;
-
-  __pyx_r = ((struct __pyx_obj_7spytify_ArtistData *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.ArtistData.next");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_next);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":28
- * 
- * cdef class ArtistDataFull(ArtistData):
- *     def __init__(self):             # <<<<<<<<<<<<<<
- *         self.browse = NULL
- * 
- */
-
-static int __pyx_pf_7spytify_14ArtistDataFull___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_7spytify_14ArtistDataFull___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":29
- * cdef class ArtistDataFull(ArtistData):
- *     def __init__(self):
- *         self.browse = NULL             # <<<<<<<<<<<<<<
- * 
- *     # Old ones from ArtistData, using self.browse.
- */
-  ((struct __pyx_obj_7spytify_ArtistDataFull *)__pyx_v_self)->browse = NULL;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":32
- * 
- *     # Old ones from ArtistData, using self.browse.
- *     cdef char* name(self):             # <<<<<<<<<<<<<<
- *         return self.browse.name if self.browse != NULL else NULL
- *     cdef char* id(self):
- */
-
-static  char *__pyx_f_7spytify_14ArtistDataFull_name(struct __pyx_obj_7spytify_ArtistDataFull *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("name");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":33
- *     # Old ones from ArtistData, using self.browse.
- *     cdef char* name(self):
- *         return self.browse.name if self.browse != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef char* id(self):
- *         return self.browse.id if self.browse != NULL else NULL
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->name;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":34
- *     cdef char* name(self):
- *         return self.browse.name if self.browse != NULL else NULL
- *     cdef char* id(self):             # <<<<<<<<<<<<<<
- *         return self.browse.id if self.browse != NULL else NULL
- *     cdef char* portrait_id(self):
- */
-
-static  char *__pyx_f_7spytify_14ArtistDataFull_id(struct __pyx_obj_7spytify_ArtistDataFull *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("id");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":35
- *         return self.browse.name if self.browse != NULL else NULL
- *     cdef char* id(self):
- *         return self.browse.id if self.browse != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef char* portrait_id(self):
- *         return self.browse.portrait_id if self.browse != NULL else NULL
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->id;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":36
- *     cdef char* id(self):
- *         return self.browse.id if self.browse != NULL else NULL
- *     cdef char* portrait_id(self):             # <<<<<<<<<<<<<<
- *         return self.browse.portrait_id if self.browse != NULL else NULL
- *     cdef float popularity(self):
- */
-
-static  char *__pyx_f_7spytify_14ArtistDataFull_portrait_id(struct __pyx_obj_7spytify_ArtistDataFull *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("portrait_id");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":37
- *         return self.browse.id if self.browse != NULL else NULL
- *     cdef char* portrait_id(self):
- *         return self.browse.portrait_id if self.browse != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef float popularity(self):
- *         return self.browse.popularity if self.browse != NULL else 0.0
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->portrait_id;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":38
- *     cdef char* portrait_id(self):
- *         return self.browse.portrait_id if self.browse != NULL else NULL
- *     cdef float popularity(self):             # <<<<<<<<<<<<<<
- *         return self.browse.popularity if self.browse != NULL else 0.0
- * 
- */
-
-static  float __pyx_f_7spytify_14ArtistDataFull_popularity(struct __pyx_obj_7spytify_ArtistDataFull *__pyx_v_self) {
-  float __pyx_r;
-  double __pyx_t_1;
-  __Pyx_RefNannySetupContext("popularity");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":39
- *         return self.browse.portrait_id if self.browse != NULL else NULL
- *     cdef float popularity(self):
- *         return self.browse.popularity if self.browse != NULL else 0.0             # <<<<<<<<<<<<<<
- * 
- *     # New ones.
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->popularity;
-  } else {
-    __pyx_t_1 = 0.0;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":42
- * 
- *     # New ones.
- *     cdef char* text(self):             # <<<<<<<<<<<<<<
- *         return self.browse.text if self.browse != NULL else NULL
- *     cdef char* genres(self):
- */
-
-static  char *__pyx_f_7spytify_14ArtistDataFull_text(struct __pyx_obj_7spytify_ArtistDataFull *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("text");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":43
- *     # New ones.
- *     cdef char* text(self):
- *         return self.browse.text if self.browse != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef char* genres(self):
- *         return self.browse.genres if self.browse != NULL else NULL
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->text;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":44
- *     cdef char* text(self):
- *         return self.browse.text if self.browse != NULL else NULL
- *     cdef char* genres(self):             # <<<<<<<<<<<<<<
- *         return self.browse.genres if self.browse != NULL else NULL
- *     cdef char* years_active(self):
- */
-
-static  char *__pyx_f_7spytify_14ArtistDataFull_genres(struct __pyx_obj_7spytify_ArtistDataFull *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("genres");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":45
- *         return self.browse.text if self.browse != NULL else NULL
- *     cdef char* genres(self):
- *         return self.browse.genres if self.browse != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef char* years_active(self):
- *         return self.browse.years_active if self.browse != NULL else NULL
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->genres;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":46
- *     cdef char* genres(self):
- *         return self.browse.genres if self.browse != NULL else NULL
- *     cdef char* years_active(self):             # <<<<<<<<<<<<<<
- *         return self.browse.years_active if self.browse != NULL else NULL
- *     cdef int num_albums(self):
- */
-
-static  char *__pyx_f_7spytify_14ArtistDataFull_years_active(struct __pyx_obj_7spytify_ArtistDataFull *__pyx_v_self) {
-  char *__pyx_r;
-  char *__pyx_t_1;
-  __Pyx_RefNannySetupContext("years_active");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":47
- *         return self.browse.genres if self.browse != NULL else NULL
- *     cdef char* years_active(self):
- *         return self.browse.years_active if self.browse != NULL else NULL             # <<<<<<<<<<<<<<
- *     cdef int num_albums(self):
- *         return self.browse.num_albums if self.browse != NULL else 0
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->years_active;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":48
- *     cdef char* years_active(self):
- *         return self.browse.years_active if self.browse != NULL else NULL
- *     cdef int num_albums(self):             # <<<<<<<<<<<<<<
- *         return self.browse.num_albums if self.browse != NULL else 0
- *     cdef album_browse* albums(self):
- */
-
-static  int __pyx_f_7spytify_14ArtistDataFull_num_albums(struct __pyx_obj_7spytify_ArtistDataFull *__pyx_v_self) {
-  int __pyx_r;
-  long __pyx_t_1;
-  __Pyx_RefNannySetupContext("num_albums");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":49
- *         return self.browse.years_active if self.browse != NULL else NULL
- *     cdef int num_albums(self):
- *         return self.browse.num_albums if self.browse != NULL else 0             # <<<<<<<<<<<<<<
- *     cdef album_browse* albums(self):
- *         return self.browse.albums if self.browse != NULL else NULL
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->num_albums;
-  } else {
-    __pyx_t_1 = 0;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":50
- *     cdef int num_albums(self):
- *         return self.browse.num_albums if self.browse != NULL else 0
- *     cdef album_browse* albums(self):             # <<<<<<<<<<<<<<
- *         return self.browse.albums if self.browse != NULL else NULL
- * 
- */
-
-static  struct album_browse *__pyx_f_7spytify_14ArtistDataFull_albums(struct __pyx_obj_7spytify_ArtistDataFull *__pyx_v_self) {
-  struct album_browse *__pyx_r;
-  struct album_browse *__pyx_t_1;
-  __Pyx_RefNannySetupContext("albums");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":51
- *         return self.browse.num_albums if self.browse != NULL else 0
- *     cdef album_browse* albums(self):
- *         return self.browse.albums if self.browse != NULL else NULL             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  if ((__pyx_v_self->browse != NULL)) {
-    __pyx_t_1 = __pyx_v_self->browse->albums;
-  } else {
-    __pyx_t_1 = NULL;
-  }
-  __pyx_r = __pyx_t_1;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":55
- * 
- * cdef class Artist(SpotifyObject):
- *     def __init__(self):             # <<<<<<<<<<<<<<
- *         raise TypeError("This class cannot be instantiated from Python")
- * 
- */
-
-static int __pyx_pf_7spytify_6Artist___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_7spytify_6Artist___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":56
- * cdef class Artist(SpotifyObject):
- *     def __init__(self):
- *         raise TypeError("This class cannot be instantiated from Python")             # <<<<<<<<<<<<<<
- * 
- *     def get_uri(self):
- */
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
-  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_kp_s_4));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
-  __pyx_t_2 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_Raise(__pyx_t_2, 0, 0);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  {__pyx_filename = __pyx_f[6]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.Artist.__init__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":58
- *         raise TypeError("This class cannot be instantiated from Python")
- * 
- *     def get_uri(self):             # <<<<<<<<<<<<<<
- *         cdef char uri_id[23]
- *         despotify_id2uri(self.id, uri_id)
- */
-
-static PyObject *__pyx_pf_7spytify_6Artist_get_uri(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_7spytify_6Artist_get_uri(PyObject *__pyx_v_self, PyObject *unused) {
-  char __pyx_v_uri_id[23];
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  char *__pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("get_uri");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":60
- *     def get_uri(self):
- *         cdef char uri_id[23]
- *         despotify_id2uri(self.id, uri_id)             # <<<<<<<<<<<<<<
- *         return 'spotify:artist:%s' % uri_id
- * 
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__id); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyBytes_AsString(__pyx_t_1); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  despotify_id2uri(__pyx_t_2, __pyx_v_uri_id);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":61
- *         cdef char uri_id[23]
- *         despotify_id2uri(self.id, uri_id)
- *         return 'spotify:artist:%s' % uri_id             # <<<<<<<<<<<<<<
- * 
- *     cdef get_full_data(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(__pyx_v_uri_id); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 61; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_7), __pyx_t_1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 61; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("spytify.Artist.get_uri");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":63
- *         return 'spotify:artist:%s' % uri_id
- * 
- *     cdef get_full_data(self):             # <<<<<<<<<<<<<<
- *         if self.full_data == None:
- *             self.full_data = ArtistDataFull()
- */
-
-static  PyObject *__pyx_f_7spytify_6Artist_get_full_data(struct __pyx_obj_7spytify_Artist *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  __Pyx_RefNannySetupContext("get_full_data");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":64
- * 
- *     cdef get_full_data(self):
- *         if self.full_data == None:             # <<<<<<<<<<<<<<
- *             self.full_data = ArtistDataFull()
- *             self.full_data.browse = despotify_get_artist(self.ds, self.data.id())
- */
-  __pyx_t_1 = PyObject_RichCompare(((PyObject *)__pyx_v_self->full_data), Py_None, Py_EQ); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_2) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":65
- *     cdef get_full_data(self):
- *         if self.full_data == None:
- *             self.full_data = ArtistDataFull()             # <<<<<<<<<<<<<<
- *             self.full_data.browse = despotify_get_artist(self.ds, self.data.id())
- *             self.data = self.full_data
- */
-    __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_7spytify_ArtistDataFull)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_1);
-    __Pyx_GOTREF(__pyx_v_self->full_data);
-    __Pyx_DECREF(((PyObject *)__pyx_v_self->full_data));
-    __pyx_v_self->full_data = ((struct __pyx_obj_7spytify_ArtistDataFull *)__pyx_t_1);
-    __pyx_t_1 = 0;
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":66
- *         if self.full_data == None:
- *             self.full_data = ArtistDataFull()
- *             self.full_data.browse = despotify_get_artist(self.ds, self.data.id())             # <<<<<<<<<<<<<<
- *             self.data = self.full_data
- * 
- */
-    __pyx_v_self->full_data->browse = despotify_get_artist(__pyx_v_self->__pyx_base.__pyx_base.ds, ((struct __pyx_vtabstruct_7spytify_ArtistData *)__pyx_v_self->data->__pyx_vtab)->id(__pyx_v_self->data));
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":67
- *             self.full_data = ArtistDataFull()
- *             self.full_data.browse = despotify_get_artist(self.ds, self.data.id())
- *             self.data = self.full_data             # <<<<<<<<<<<<<<
- * 
- *     property name:
- */
-    __Pyx_INCREF(((PyObject *)__pyx_v_self->full_data));
-    __Pyx_GIVEREF(((PyObject *)__pyx_v_self->full_data));
-    __Pyx_GOTREF(__pyx_v_self->data);
-    __Pyx_DECREF(((PyObject *)__pyx_v_self->data));
-    __pyx_v_self->data = ((struct __pyx_obj_7spytify_ArtistData *)__pyx_v_self->full_data);
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Artist.get_full_data");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":70
- * 
- *     property name:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.name()
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_6Artist_4name___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_6Artist_4name___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":71
- *     property name:
- *         def __get__(self):
- *             return self.data.name()             # <<<<<<<<<<<<<<
- * 
- *     property id:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((struct __pyx_vtabstruct_7spytify_ArtistData *)((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->data->__pyx_vtab)->name(((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->data)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Artist.name.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":74
- * 
- *     property id:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.id()
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_6Artist_2id___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_6Artist_2id___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":75
- *     property id:
- *         def __get__(self):
- *             return self.data.id()             # <<<<<<<<<<<<<<
- * 
- *     property text:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((struct __pyx_vtabstruct_7spytify_ArtistData *)((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->data->__pyx_vtab)->id(((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->data)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Artist.id.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":78
- * 
- *     property text:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             self.get_full_data()
- *             return self.full_data.text()
- */
-
-static PyObject *__pyx_pf_7spytify_6Artist_4text___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_6Artist_4text___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":79
- *     property text:
- *         def __get__(self):
- *             self.get_full_data()             # <<<<<<<<<<<<<<
- *             return self.full_data.text()
- * 
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_7spytify_Artist *)((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->__pyx_base.__pyx_base.__pyx_vtab)->get_full_data(((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 79; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":80
- *         def __get__(self):
- *             self.get_full_data()
- *             return self.full_data.text()             # <<<<<<<<<<<<<<
- * 
- *     property portrait_id:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((struct __pyx_vtabstruct_7spytify_ArtistDataFull *)((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->full_data->__pyx_base.__pyx_vtab)->text(((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->full_data)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Artist.text.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":83
- * 
- *     property portrait_id:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.portrait_id()
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_6Artist_11portrait_id___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_6Artist_11portrait_id___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":84
- *     property portrait_id:
- *         def __get__(self):
- *             return self.data.portrait_id()             # <<<<<<<<<<<<<<
- * 
- *     property genres:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((struct __pyx_vtabstruct_7spytify_ArtistData *)((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->data->__pyx_vtab)->portrait_id(((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->data)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Artist.portrait_id.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":87
- * 
- *     property genres:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             self.get_full_data()
- *             return self.full_data.genres()
- */
-
-static PyObject *__pyx_pf_7spytify_6Artist_6genres___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_6Artist_6genres___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":88
- *     property genres:
- *         def __get__(self):
- *             self.get_full_data()             # <<<<<<<<<<<<<<
- *             return self.full_data.genres()
- * 
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_7spytify_Artist *)((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->__pyx_base.__pyx_base.__pyx_vtab)->get_full_data(((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":89
- *         def __get__(self):
- *             self.get_full_data()
- *             return self.full_data.genres()             # <<<<<<<<<<<<<<
- * 
- *     property popularity:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((struct __pyx_vtabstruct_7spytify_ArtistDataFull *)((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->full_data->__pyx_base.__pyx_vtab)->genres(((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->full_data)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Artist.genres.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":92
- * 
- *     property popularity:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.popularity()
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_6Artist_10popularity___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_6Artist_10popularity___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":93
- *     property popularity:
- *         def __get__(self):
- *             return self.data.popularity()             # <<<<<<<<<<<<<<
- * 
- *     property albums:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(((struct __pyx_vtabstruct_7spytify_ArtistData *)((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->data->__pyx_vtab)->popularity(((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->data)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Artist.popularity.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":96
- * 
- *     property albums:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             self.get_full_data()
- *             return self.albums_to_list(self.full_data.albums())
- */
-
-static PyObject *__pyx_pf_7spytify_6Artist_6albums___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_6Artist_6albums___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":97
- *     property albums:
- *         def __get__(self):
- *             self.get_full_data()             # <<<<<<<<<<<<<<
- *             return self.albums_to_list(self.full_data.albums())
- * 
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_7spytify_Artist *)((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->__pyx_base.__pyx_base.__pyx_vtab)->get_full_data(((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":98
- *         def __get__(self):
- *             self.get_full_data()
- *             return self.albums_to_list(self.full_data.albums())             # <<<<<<<<<<<<<<
- * 
- *     def __dealloc__(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_Artist *)((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->__pyx_base.__pyx_base.__pyx_vtab)->__pyx_base.__pyx_base.albums_to_list(((struct __pyx_obj_7spytify_SessionStruct *)__pyx_v_self), ((struct __pyx_vtabstruct_7spytify_ArtistDataFull *)((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->full_data->__pyx_base.__pyx_vtab)->albums(((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->full_data))); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 98; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Artist.albums.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":100
- *             return self.albums_to_list(self.full_data.albums())
- * 
- *     def __dealloc__(self):             # <<<<<<<<<<<<<<
- *         if self.take_owner:
- *             if self.full_data is not None:
- */
-
-static void __pyx_pf_7spytify_6Artist___dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pf_7spytify_6Artist___dealloc__(PyObject *__pyx_v_self) {
-  int __pyx_t_1;
-  __Pyx_RefNannySetupContext("__dealloc__");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":101
- * 
- *     def __dealloc__(self):
- *         if self.take_owner:             # <<<<<<<<<<<<<<
- *             if self.full_data is not None:
- *                 if self.full_data.browse != NULL:
- */
-  __pyx_t_1 = ((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->take_owner;
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":102
- *     def __dealloc__(self):
- *         if self.take_owner:
- *             if self.full_data is not None:             # <<<<<<<<<<<<<<
- *                 if self.full_data.browse != NULL:
- *                     despotify_free_artist_browse(self.full_data.browse)
- */
-    __pyx_t_1 = (((PyObject *)((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->full_data) != Py_None);
-    if (__pyx_t_1) {
-
-      /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":103
- *         if self.take_owner:
- *             if self.full_data is not None:
- *                 if self.full_data.browse != NULL:             # <<<<<<<<<<<<<<
- *                     despotify_free_artist_browse(self.full_data.browse)
- * 
- */
-      __pyx_t_1 = (((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->full_data->browse != NULL);
-      if (__pyx_t_1) {
-
-        /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":104
- *             if self.full_data is not None:
- *                 if self.full_data.browse != NULL:
- *                     despotify_free_artist_browse(self.full_data.browse)             # <<<<<<<<<<<<<<
- * 
- * 
- */
-        despotify_free_artist_browse(((struct __pyx_obj_7spytify_Artist *)__pyx_v_self)->full_data->browse);
-        goto __pyx_L7;
-      }
-      __pyx_L7:;
-      goto __pyx_L6;
-    }
-    __pyx_L6:;
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":107
- * 
- * 
- *     def __repr__(self):             # <<<<<<<<<<<<<<
- *         return '<Artist: %s (%s)>' % (self.name, self.id)
- */
-
-static PyObject *__pyx_pf_7spytify_6Artist___repr__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_6Artist___repr__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("__repr__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/artist.pxi":108
- * 
- *     def __repr__(self):
- *         return '<Artist: %s (%s)>' % (self.name, self.id)             # <<<<<<<<<<<<<<
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__name); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__id); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_1 = 0;
-  __pyx_t_2 = 0;
-  __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_8), __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("spytify.Artist.__repr__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":4
- * 
- * cdef class Track(SpotifyObject):
- *     def __init__(self):             # <<<<<<<<<<<<<<
- *         raise TypeError("This class cannot be instantiated from Python")
- * 
- */
-
-static int __pyx_pf_7spytify_5Track___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_7spytify_5Track___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":5
- * cdef class Track(SpotifyObject):
- *     def __init__(self):
- *         raise TypeError("This class cannot be instantiated from Python")             # <<<<<<<<<<<<<<
- * 
- *     def get_uri(self):
- */
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 5; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
-  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_kp_s_4));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
-  __pyx_t_2 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 5; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_Raise(__pyx_t_2, 0, 0);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  {__pyx_filename = __pyx_f[2]; __pyx_lineno = 5; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.Track.__init__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":7
- *         raise TypeError("This class cannot be instantiated from Python")
- * 
- *     def get_uri(self):             # <<<<<<<<<<<<<<
- *         cdef char uri_id[23]
- *         despotify_id2uri(self.track_id, uri_id)
- */
-
-static PyObject *__pyx_pf_7spytify_5Track_get_uri(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Track_get_uri(PyObject *__pyx_v_self, PyObject *unused) {
-  char __pyx_v_uri_id[23];
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  char *__pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("get_uri");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":9
- *     def get_uri(self):
- *         cdef char uri_id[23]
- *         despotify_id2uri(self.track_id, uri_id)             # <<<<<<<<<<<<<<
- *         return 'spotify:track:%s' % uri_id
- * 
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__track_id); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyBytes_AsString(__pyx_t_1); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  despotify_id2uri(__pyx_t_2, __pyx_v_uri_id);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":10
- *         cdef char uri_id[23]
- *         despotify_id2uri(self.track_id, uri_id)
- *         return 'spotify:track:%s' % uri_id             # <<<<<<<<<<<<<<
- * 
- *     property track_id:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(__pyx_v_uri_id); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 10; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_9), __pyx_t_1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 10; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("spytify.Track.get_uri");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":13
- * 
- *     property track_id:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return <char*>self.data.track_id
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Track_8track_id___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Track_8track_id___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":14
- *     property track_id:
- *         def __get__(self):
- *             return <char*>self.data.track_id             # <<<<<<<<<<<<<<
- * 
- *     property file_id:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((char *)((struct __pyx_obj_7spytify_Track *)__pyx_v_self)->data->track_id)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 14; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Track.track_id.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":17
- * 
- *     property file_id:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return <char*>self.data.file_id
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Track_7file_id___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Track_7file_id___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":18
- *     property file_id:
- *         def __get__(self):
- *             return <char*>self.data.file_id             # <<<<<<<<<<<<<<
- * 
- *     def has_meta_data(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((char *)((struct __pyx_obj_7spytify_Track *)__pyx_v_self)->data->file_id)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 18; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Track.file_id.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":20
- *             return <char*>self.data.file_id
- * 
- *     def has_meta_data(self):             # <<<<<<<<<<<<<<
- *         return bool(self.data.has_meta_data)
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Track_has_meta_data(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Track_has_meta_data(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("has_meta_data");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":21
- * 
- *     def has_meta_data(self):
- *         return bool(self.data.has_meta_data)             # <<<<<<<<<<<<<<
- * 
- *     def is_playable(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBool_FromLong(((struct __pyx_obj_7spytify_Track *)__pyx_v_self)->data->has_meta_data); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 21; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 21; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)&PyBool_Type)), __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 21; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.Track.has_meta_data");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":23
- *         return bool(self.data.has_meta_data)
- * 
- *     def is_playable(self):             # <<<<<<<<<<<<<<
- *         return bool(self.data.playable)
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Track_is_playable(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Track_is_playable(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("is_playable");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":24
- * 
- *     def is_playable(self):
- *         return bool(self.data.playable)             # <<<<<<<<<<<<<<
- * 
- *     property title:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBool_FromLong(((struct __pyx_obj_7spytify_Track *)__pyx_v_self)->data->playable); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)&PyBool_Type)), __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.Track.is_playable");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":27
- * 
- *     property title:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.title
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Track_5title___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Track_5title___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":28
- *     property title:
- *         def __get__(self):
- *             return self.data.title             # <<<<<<<<<<<<<<
- * 
- *     property artists:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((struct __pyx_obj_7spytify_Track *)__pyx_v_self)->data->title); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Track.title.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":31
- * 
- *     property artists:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.artists_to_list(self.data.artist)
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Track_7artists___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Track_7artists___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":32
- *     property artists:
- *         def __get__(self):
- *             return self.artists_to_list(self.data.artist)             # <<<<<<<<<<<<<<
- * 
- *     property album:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_Track *)((struct __pyx_obj_7spytify_Track *)__pyx_v_self)->__pyx_base.__pyx_base.__pyx_vtab)->__pyx_base.__pyx_base.artists_to_list(((struct __pyx_obj_7spytify_SessionStruct *)__pyx_v_self), ((struct __pyx_obj_7spytify_Track *)__pyx_v_self)->data->artist)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Track.artists.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":35
- * 
- *     property album:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.album
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Track_5album___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Track_5album___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":36
- *     property album:
- *         def __get__(self):
- *             return self.data.album             # <<<<<<<<<<<<<<
- * 
- *     property length:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((struct __pyx_obj_7spytify_Track *)__pyx_v_self)->data->album); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Track.album.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":39
- * 
- *     property length:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.length
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Track_6length___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Track_6length___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":40
- *     property length:
- *         def __get__(self):
- *             return self.data.length             # <<<<<<<<<<<<<<
- * 
- *     property tracknumber:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_obj_7spytify_Track *)__pyx_v_self)->data->length); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Track.length.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":43
- * 
- *     property tracknumber:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.tracknumber
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Track_11tracknumber___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Track_11tracknumber___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":44
- *     property tracknumber:
- *         def __get__(self):
- *             return self.data.tracknumber             # <<<<<<<<<<<<<<
- * 
- *     property year:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_obj_7spytify_Track *)__pyx_v_self)->data->tracknumber); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Track.tracknumber.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":47
- * 
- *     property year:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.year
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Track_4year___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Track_4year___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":48
- *     property year:
- *         def __get__(self):
- *             return self.data.year             # <<<<<<<<<<<<<<
- * 
- *     property popularity:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_obj_7spytify_Track *)__pyx_v_self)->data->year); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Track.year.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":51
- * 
- *     property popularity:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.popularity
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_5Track_10popularity___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Track_10popularity___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":52
- *     property popularity:
- *         def __get__(self):
- *             return self.data.popularity             # <<<<<<<<<<<<<<
- * 
- *     def __richcmp__(Track self, Track other, int operator):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(((struct __pyx_obj_7spytify_Track *)__pyx_v_self)->data->popularity); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Track.popularity.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":54
- *             return self.data.popularity
- * 
- *     def __richcmp__(Track self, Track other, int operator):             # <<<<<<<<<<<<<<
- *         if not isinstance(other, Track):
- *            return NotImplemented
- */
-
-static PyObject *__pyx_pf_7spytify_5Track___richcmp__(PyObject *__pyx_v_self, PyObject *__pyx_v_other, int __pyx_v_operator); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Track___richcmp__(PyObject *__pyx_v_self, PyObject *__pyx_v_other, int __pyx_v_operator) {
-  PyObject *__pyx_r = NULL;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("__richcmp__");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF((PyObject *)__pyx_v_other);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_self), __pyx_ptype_7spytify_Track, 1, "self", 0))) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_other), __pyx_ptype_7spytify_Track, 1, "other", 0))) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":55
- * 
- *     def __richcmp__(Track self, Track other, int operator):
- *         if not isinstance(other, Track):             # <<<<<<<<<<<<<<
- *            return NotImplemented
- *         if operator == 2:
- */
-  __pyx_t_1 = PyObject_TypeCheck(__pyx_v_other, ((PyTypeObject *)((PyObject*)__pyx_ptype_7spytify_Track))); 
-  __pyx_t_2 = (!__pyx_t_1);
-  if (__pyx_t_2) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":56
- *     def __richcmp__(Track self, Track other, int operator):
- *         if not isinstance(other, Track):
- *            return NotImplemented             # <<<<<<<<<<<<<<
- *         if operator == 2:
- *            return self.data.track_id == other.data.track_id
- */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(__pyx_builtin_NotImplemented);
-    __pyx_r = __pyx_builtin_NotImplemented;
-    goto __pyx_L0;
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":57
- *         if not isinstance(other, Track):
- *            return NotImplemented
- *         if operator == 2:             # <<<<<<<<<<<<<<
- *            return self.data.track_id == other.data.track_id
- *         else:
- */
-  __pyx_t_2 = (__pyx_v_operator == 2);
-  if (__pyx_t_2) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":58
- *            return NotImplemented
- *         if operator == 2:
- *            return self.data.track_id == other.data.track_id             # <<<<<<<<<<<<<<
- *         else:
- *            return NotImplemented
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyBool_FromLong((((struct __pyx_obj_7spytify_Track *)__pyx_v_self)->data->track_id == ((struct __pyx_obj_7spytify_Track *)__pyx_v_other)->data->track_id)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_r = __pyx_t_3;
-    __pyx_t_3 = 0;
-    goto __pyx_L0;
-    goto __pyx_L6;
-  }
-  /*else*/ {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":60
- *            return self.data.track_id == other.data.track_id
- *         else:
- *            return NotImplemented             # <<<<<<<<<<<<<<
- * 
- *     def __repr__(self):
- */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(__pyx_builtin_NotImplemented);
-    __pyx_r = __pyx_builtin_NotImplemented;
-    goto __pyx_L0;
-  }
-  __pyx_L6:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("spytify.Track.__richcmp__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF((PyObject *)__pyx_v_other);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":62
- *            return NotImplemented
- * 
- *     def __repr__(self):             # <<<<<<<<<<<<<<
- *         return '<Track: %s - %s - %s (%s)>' % (", ".join([a.name for a in self.artists]), self.title, self.album, self.track_id)
- */
-
-static PyObject *__pyx_pf_7spytify_5Track___repr__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_5Track___repr__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_v_a;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  Py_ssize_t __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  __Pyx_RefNannySetupContext("__repr__");
-  __pyx_v_a = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/track.pxi":63
- * 
- *     def __repr__(self):
- *         return '<Track: %s - %s - %s (%s)>' % (", ".join([a.name for a in self.artists]), self.title, self.album, self.track_id)             # <<<<<<<<<<<<<<
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_kp_s_11), __pyx_n_s__join); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-  __pyx_t_4 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__artists); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  if (PyList_CheckExact(__pyx_t_4) || PyTuple_CheckExact(__pyx_t_4)) {
-    __pyx_t_3 = 0; __pyx_t_5 = __pyx_t_4; __Pyx_INCREF(__pyx_t_5);
-  } else {
-    __pyx_t_3 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-  }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_5))) {
-      if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_5)) break;
-      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_5))) {
-      if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
-      __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++;
-    } else {
-      __pyx_t_4 = PyIter_Next(__pyx_t_5);
-      if (!__pyx_t_4) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_4);
-    }
-    __Pyx_DECREF(__pyx_v_a);
-    __pyx_v_a = __pyx_t_4;
-    __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_GetAttr(__pyx_v_a, __pyx_n_s__name); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_6 = PyList_Append(__pyx_t_2, (PyObject*)__pyx_t_4); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_INCREF(((PyObject *)__pyx_t_2));
-  PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_t_2));
-  __Pyx_GIVEREF(((PyObject *)__pyx_t_2));
-  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__title); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__album); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__track_id); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_7 = PyTuple_New(4); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_5);
-  PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_7, 3, __pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_4);
-  __pyx_t_2 = 0;
-  __pyx_t_5 = 0;
-  __pyx_t_1 = 0;
-  __pyx_t_4 = 0;
-  __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_10), __pyx_t_7); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_r = __pyx_t_4;
-  __pyx_t_4 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("spytify.Track.__repr__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_a);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":4
- * 
- * cdef class Playlist(SpotifyObject):
- *     def __init__(self):             # <<<<<<<<<<<<<<
- *         raise TypeError("This class cannot be instantiated from Python")
- * 
- */
-
-static int __pyx_pf_7spytify_8Playlist___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_7spytify_8Playlist___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":5
- * cdef class Playlist(SpotifyObject):
- *     def __init__(self):
- *         raise TypeError("This class cannot be instantiated from Python")             # <<<<<<<<<<<<<<
- * 
- *     def get_uri(self):
- */
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 5; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
-  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_kp_s_4));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
-  __pyx_t_2 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 5; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_Raise(__pyx_t_2, 0, 0);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  {__pyx_filename = __pyx_f[3]; __pyx_lineno = 5; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.Playlist.__init__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":7
- *         raise TypeError("This class cannot be instantiated from Python")
- * 
- *     def get_uri(self):             # <<<<<<<<<<<<<<
- *         cdef char uri_id[23]
- *         cdef bytes id = self.id[:-2] # Remove last two characters from id, as per despotify_playlist_to_uri
- */
-
-static PyObject *__pyx_pf_7spytify_8Playlist_get_uri(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_7spytify_8Playlist_get_uri(PyObject *__pyx_v_self, PyObject *unused) {
-  char __pyx_v_uri_id[23];
-  PyObject *__pyx_v_id = 0;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  char *__pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  __Pyx_RefNannySetupContext("get_uri");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":9
- *     def get_uri(self):
- *         cdef char uri_id[23]
- *         cdef bytes id = self.id[:-2] # Remove last two characters from id, as per despotify_playlist_to_uri             # <<<<<<<<<<<<<<
- * 
- *         despotify_id2uri(id, uri_id)
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__id); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PySequence_GetSlice(__pyx_t_1, 0, -2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (!(likely(PyBytes_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected bytes, got %.200s", Py_TYPE(__pyx_t_2)->tp_name), 0))) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_id = ((PyObject *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":11
- *         cdef bytes id = self.id[:-2] # Remove last two characters from id, as per despotify_playlist_to_uri
- * 
- *         despotify_id2uri(id, uri_id)             # <<<<<<<<<<<<<<
- *         return 'spotify:user:%s:playlist:%s' % (self.author, uri_id)
- * 
- */
-  __pyx_t_3 = __Pyx_PyBytes_AsString(((PyObject *)__pyx_v_id)); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  despotify_id2uri(__pyx_t_3, __pyx_v_uri_id);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":12
- * 
- *         despotify_id2uri(id, uri_id)
- *         return 'spotify:user:%s:playlist:%s' % (self.author, uri_id)             # <<<<<<<<<<<<<<
- * 
- *     property name:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__author); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 12; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(__pyx_v_uri_id); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 12; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 12; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_2 = 0;
-  __pyx_t_1 = 0;
-  __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_12), __pyx_t_4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 12; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("spytify.Playlist.get_uri");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_id);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":15
- * 
- *     property name:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.name
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_8Playlist_4name___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_8Playlist_4name___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":16
- *     property name:
- *         def __get__(self):
- *             return self.data.name             # <<<<<<<<<<<<<<
- * 
- *     property author:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((struct __pyx_obj_7spytify_Playlist *)__pyx_v_self)->data->name); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 16; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Playlist.name.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":19
- * 
- *     property author:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.author
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_8Playlist_6author___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_8Playlist_6author___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":20
- *     property author:
- *         def __get__(self):
- *             return self.data.author             # <<<<<<<<<<<<<<
- * 
- *     property id:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((struct __pyx_obj_7spytify_Playlist *)__pyx_v_self)->data->author); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 20; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Playlist.author.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":23
- * 
- *     property id:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return <char*>self.data.playlist_id
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_8Playlist_2id___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_8Playlist_2id___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":24
- *     property id:
- *         def __get__(self):
- *             return <char*>self.data.playlist_id             # <<<<<<<<<<<<<<
- * 
- *     property is_collaborative:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((char *)((struct __pyx_obj_7spytify_Playlist *)__pyx_v_self)->data->playlist_id)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Playlist.id.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":27
- * 
- *     property is_collaborative:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return bool(self.data.is_collaborative)
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_8Playlist_16is_collaborative___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_8Playlist_16is_collaborative___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":28
- *     property is_collaborative:
- *         def __get__(self):
- *             return bool(self.data.is_collaborative)             # <<<<<<<<<<<<<<
- * 
- *     property tracks:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBool_FromLong(((struct __pyx_obj_7spytify_Playlist *)__pyx_v_self)->data->is_collaborative); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)&PyBool_Type)), __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.Playlist.is_collaborative.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":31
- * 
- *     property tracks:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.tracks_to_list(self.data.tracks)
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_8Playlist_6tracks___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_8Playlist_6tracks___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":32
- *     property tracks:
- *         def __get__(self):
- *             return self.tracks_to_list(self.data.tracks)             # <<<<<<<<<<<<<<
- * 
- *     def __dealloc__(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_Playlist *)((struct __pyx_obj_7spytify_Playlist *)__pyx_v_self)->__pyx_base.__pyx_base.__pyx_vtab)->__pyx_base.__pyx_base.tracks_to_list(((struct __pyx_obj_7spytify_SessionStruct *)__pyx_v_self), ((struct __pyx_obj_7spytify_Playlist *)__pyx_v_self)->data->tracks)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Playlist.tracks.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":34
- *             return self.tracks_to_list(self.data.tracks)
- * 
- *     def __dealloc__(self):             # <<<<<<<<<<<<<<
- *         if self.take_owner:
- *             despotify_free_playlist(self.data)
- */
-
-static void __pyx_pf_7spytify_8Playlist___dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pf_7spytify_8Playlist___dealloc__(PyObject *__pyx_v_self) {
-  int __pyx_t_1;
-  __Pyx_RefNannySetupContext("__dealloc__");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":35
- * 
- *     def __dealloc__(self):
- *         if self.take_owner:             # <<<<<<<<<<<<<<
- *             despotify_free_playlist(self.data)
- * 
- */
-  __pyx_t_1 = ((struct __pyx_obj_7spytify_Playlist *)__pyx_v_self)->take_owner;
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":36
- *     def __dealloc__(self):
- *         if self.take_owner:
- *             despotify_free_playlist(self.data)             # <<<<<<<<<<<<<<
- * 
- *     def __repr__(self):
- */
-    despotify_free_playlist(((struct __pyx_obj_7spytify_Playlist *)__pyx_v_self)->data);
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":38
- *             despotify_free_playlist(self.data)
- * 
- *     def __repr__(self):             # <<<<<<<<<<<<<<
- *         return '<Playlist: %s by %s (%s)>' % (self.name, self.author, self.id)
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_8Playlist___repr__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_8Playlist___repr__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  __Pyx_RefNannySetupContext("__repr__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":39
- * 
- *     def __repr__(self):
- *         return '<Playlist: %s by %s (%s)>' % (self.name, self.author, self.id)             # <<<<<<<<<<<<<<
- * 
- * cdef class RootIterator:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__name); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__author); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__id); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
-  __pyx_t_1 = 0;
-  __pyx_t_2 = 0;
-  __pyx_t_3 = 0;
-  __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_13), __pyx_t_4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("spytify.Playlist.__repr__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":42
- * 
- * cdef class RootIterator:
- *     def __init__(self, RootList parent):             # <<<<<<<<<<<<<<
- *         self.parent = parent
- *         self.i = 0
- */
-
-static int __pyx_pf_7spytify_12RootIterator___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_7spytify_12RootIterator___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  struct __pyx_obj_7spytify_RootList *__pyx_v_parent = 0;
-  int __pyx_r;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__parent,0};
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[1] = {0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__parent);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__init__") < 0)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_parent = ((struct __pyx_obj_7spytify_RootList *)values[0]);
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_parent = ((struct __pyx_obj_7spytify_RootList *)PyTuple_GET_ITEM(__pyx_args, 0));
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[3]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("spytify.RootIterator.__init__");
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_parent), __pyx_ptype_7spytify_RootList, 1, "parent", 0))) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":43
- * cdef class RootIterator:
- *     def __init__(self, RootList parent):
- *         self.parent = parent             # <<<<<<<<<<<<<<
- *         self.i = 0
- * 
- */
-  __Pyx_INCREF(((PyObject *)__pyx_v_parent));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_parent));
-  __Pyx_GOTREF(((struct __pyx_obj_7spytify_RootIterator *)__pyx_v_self)->parent);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_7spytify_RootIterator *)__pyx_v_self)->parent));
-  ((struct __pyx_obj_7spytify_RootIterator *)__pyx_v_self)->parent = __pyx_v_parent;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":44
- *     def __init__(self, RootList parent):
- *         self.parent = parent
- *         self.i = 0             # <<<<<<<<<<<<<<
- * 
- *     def __iter__(self):
- */
-  ((struct __pyx_obj_7spytify_RootIterator *)__pyx_v_self)->i = 0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("spytify.RootIterator.__init__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":46
- *         self.i = 0
- * 
- *     def __iter__(self):             # <<<<<<<<<<<<<<
- *         return self
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_12RootIterator___iter__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_12RootIterator___iter__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannySetupContext("__iter__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":47
- * 
- *     def __iter__(self):
- *         return self             # <<<<<<<<<<<<<<
- * 
- *     def __next__(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_self);
-  __pyx_r = __pyx_v_self;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":49
- *         return self
- * 
- *     def __next__(self):             # <<<<<<<<<<<<<<
- *         if self.i >= len(self.parent):
- *             raise StopIteration()
- */
-
-static PyObject *__pyx_pf_7spytify_12RootIterator___next__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_12RootIterator___next__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_v_retval;
-  PyObject *__pyx_r = NULL;
-  Py_ssize_t __pyx_t_1;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("__next__");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __pyx_v_retval = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":50
- * 
- *     def __next__(self):
- *         if self.i >= len(self.parent):             # <<<<<<<<<<<<<<
- *             raise StopIteration()
- * 
- */
-  __pyx_t_1 = PyObject_Length(((PyObject *)((struct __pyx_obj_7spytify_RootIterator *)__pyx_v_self)->parent)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = (((struct __pyx_obj_7spytify_RootIterator *)__pyx_v_self)->i >= __pyx_t_1);
-  if (__pyx_t_2) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":51
- *     def __next__(self):
- *         if self.i >= len(self.parent):
- *             raise StopIteration()             # <<<<<<<<<<<<<<
- * 
- *         retval = self.parent[self.i]
- */
-    __pyx_t_3 = PyObject_Call(__pyx_builtin_StopIteration, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_Raise(__pyx_t_3, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[3]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":53
- *             raise StopIteration()
- * 
- *         retval = self.parent[self.i]             # <<<<<<<<<<<<<<
- *         self.i = self.i + 1
- *         return retval
- */
-  __pyx_t_3 = __Pyx_GetItemInt(((PyObject *)((struct __pyx_obj_7spytify_RootIterator *)__pyx_v_self)->parent), ((struct __pyx_obj_7spytify_RootIterator *)__pyx_v_self)->i, sizeof(int), PyInt_FromLong); if (!__pyx_t_3) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_v_retval);
-  __pyx_v_retval = __pyx_t_3;
-  __pyx_t_3 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":54
- * 
- *         retval = self.parent[self.i]
- *         self.i = self.i + 1             # <<<<<<<<<<<<<<
- *         return retval
- * 
- */
-  ((struct __pyx_obj_7spytify_RootIterator *)__pyx_v_self)->i = (((struct __pyx_obj_7spytify_RootIterator *)__pyx_v_self)->i + 1);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":55
- *         retval = self.parent[self.i]
- *         self.i = self.i + 1
- *         return retval             # <<<<<<<<<<<<<<
- * 
- * cdef class RootList(SessionStruct):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_retval);
-  __pyx_r = __pyx_v_retval;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("spytify.RootIterator.__next__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_retval);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":58
- * 
- * cdef class RootList(SessionStruct):
- *     def __init__(self):             # <<<<<<<<<<<<<<
- *         raise TypeError("This class cannot be instantiated from Python")
- * 
- */
-
-static int __pyx_pf_7spytify_8RootList___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_7spytify_8RootList___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":59
- * cdef class RootList(SessionStruct):
- *     def __init__(self):
- *         raise TypeError("This class cannot be instantiated from Python")             # <<<<<<<<<<<<<<
- * 
- *     cdef fetch(self):
- */
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
-  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_kp_s_4));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
-  __pyx_t_2 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_Raise(__pyx_t_2, 0, 0);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  {__pyx_filename = __pyx_f[3]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.RootList.__init__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":61
- *         raise TypeError("This class cannot be instantiated from Python")
- * 
- *     cdef fetch(self):             # <<<<<<<<<<<<<<
- *         if self.playlists is None:
- *             self.data = despotify_get_stored_playlists(self.ds)
- */
-
-static  PyObject *__pyx_f_7spytify_8RootList_fetch(struct __pyx_obj_7spytify_RootList *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("fetch");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":62
- * 
- *     cdef fetch(self):
- *         if self.playlists is None:             # <<<<<<<<<<<<<<
- *             self.data = despotify_get_stored_playlists(self.ds)
- *             self.playlists = self.playlists_to_list(self.data)
- */
-  __pyx_t_1 = (__pyx_v_self->playlists == ((PyObject *)Py_None));
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":63
- *     cdef fetch(self):
- *         if self.playlists is None:
- *             self.data = despotify_get_stored_playlists(self.ds)             # <<<<<<<<<<<<<<
- *             self.playlists = self.playlists_to_list(self.data)
- * 
- */
-    __pyx_v_self->data = despotify_get_stored_playlists(__pyx_v_self->__pyx_base.ds);
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":64
- *         if self.playlists is None:
- *             self.data = despotify_get_stored_playlists(self.ds)
- *             self.playlists = self.playlists_to_list(self.data)             # <<<<<<<<<<<<<<
- * 
- *     def __getitem__(self, item):
- */
-    __pyx_t_2 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_RootList *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.playlists_to_list(((struct __pyx_obj_7spytify_SessionStruct *)__pyx_v_self), __pyx_v_self->data)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_GIVEREF(__pyx_t_2);
-    __Pyx_GOTREF(__pyx_v_self->playlists);
-    __Pyx_DECREF(((PyObject *)__pyx_v_self->playlists));
-    __pyx_v_self->playlists = ((PyObject *)__pyx_t_2);
-    __pyx_t_2 = 0;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.RootList.fetch");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":66
- *             self.playlists = self.playlists_to_list(self.data)
- * 
- *     def __getitem__(self, item):             # <<<<<<<<<<<<<<
- *         self.fetch()
- *         return self.playlists[item]
- */
-
-static PyObject *__pyx_pf_7spytify_8RootList___getitem__(PyObject *__pyx_v_self, PyObject *__pyx_v_item); /*proto*/
-static PyObject *__pyx_pf_7spytify_8RootList___getitem__(PyObject *__pyx_v_self, PyObject *__pyx_v_item) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__getitem__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":67
- * 
- *     def __getitem__(self, item):
- *         self.fetch()             # <<<<<<<<<<<<<<
- *         return self.playlists[item]
- * 
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_7spytify_RootList *)((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)->__pyx_base.__pyx_vtab)->fetch(((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 67; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":68
- *     def __getitem__(self, item):
- *         self.fetch()
- *         return self.playlists[item]             # <<<<<<<<<<<<<<
- * 
- *     def __len__(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetItem(((PyObject *)((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)->playlists), __pyx_v_item); if (!__pyx_t_1) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.RootList.__getitem__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":70
- *         return self.playlists[item]
- * 
- *     def __len__(self):             # <<<<<<<<<<<<<<
- *         self.fetch()
- *         return len(self.playlists)
- */
-
-static Py_ssize_t __pyx_pf_7spytify_8RootList___len__(PyObject *__pyx_v_self); /*proto*/
-static Py_ssize_t __pyx_pf_7spytify_8RootList___len__(PyObject *__pyx_v_self) {
-  Py_ssize_t __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  __Pyx_RefNannySetupContext("__len__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":71
- * 
- *     def __len__(self):
- *         self.fetch()             # <<<<<<<<<<<<<<
- *         return len(self.playlists)
- * 
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_7spytify_RootList *)((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)->__pyx_base.__pyx_vtab)->fetch(((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":72
- *     def __len__(self):
- *         self.fetch()
- *         return len(self.playlists)             # <<<<<<<<<<<<<<
- * 
- *     def __contains__(self, item):
- */
-  __pyx_t_2 = PyObject_Length(((PyObject *)((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)->playlists)); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_t_2;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.RootList.__len__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":74
- *         return len(self.playlists)
- * 
- *     def __contains__(self, item):             # <<<<<<<<<<<<<<
- *         self.fetch()
- *         return item in self.playlists
- */
-
-static int __pyx_pf_7spytify_8RootList___contains__(PyObject *__pyx_v_self, PyObject *__pyx_v_item); /*proto*/
-static int __pyx_pf_7spytify_8RootList___contains__(PyObject *__pyx_v_self, PyObject *__pyx_v_item) {
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  __Pyx_RefNannySetupContext("__contains__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":75
- * 
- *     def __contains__(self, item):
- *         self.fetch()             # <<<<<<<<<<<<<<
- *         return item in self.playlists
- * 
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_7spytify_RootList *)((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)->__pyx_base.__pyx_vtab)->fetch(((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":76
- *     def __contains__(self, item):
- *         self.fetch()
- *         return item in self.playlists             # <<<<<<<<<<<<<<
- * 
- *     def __iter__(self):
- */
-  __pyx_t_2 = ((PySequence_Contains(((PyObject *)((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)->playlists), __pyx_v_item))); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_t_2;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.RootList.__contains__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":78
- *         return item in self.playlists
- * 
- *     def __iter__(self):             # <<<<<<<<<<<<<<
- *         self.fetch()
- *         return RootIterator(self)
- */
-
-static PyObject *__pyx_pf_7spytify_8RootList___iter__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_8RootList___iter__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("__iter__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":79
- * 
- *     def __iter__(self):
- *         self.fetch()             # <<<<<<<<<<<<<<
- *         return RootIterator(self)
- * 
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_7spytify_RootList *)((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)->__pyx_base.__pyx_vtab)->fetch(((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 79; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":80
- *     def __iter__(self):
- *         self.fetch()
- *         return RootIterator(self)             # <<<<<<<<<<<<<<
- * 
- *     def __dealloc__(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_self);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_self);
-  __Pyx_GIVEREF(__pyx_v_self);
-  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_7spytify_RootIterator)), __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.RootList.__iter__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":82
- *         return RootIterator(self)
- * 
- *     def __dealloc__(self):             # <<<<<<<<<<<<<<
- *         if self.data:
- *             despotify_free_playlist(self.data)
- */
-
-static void __pyx_pf_7spytify_8RootList___dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pf_7spytify_8RootList___dealloc__(PyObject *__pyx_v_self) {
-  int __pyx_t_1;
-  __Pyx_RefNannySetupContext("__dealloc__");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":83
- * 
- *     def __dealloc__(self):
- *         if self.data:             # <<<<<<<<<<<<<<
- *             despotify_free_playlist(self.data)
- * 
- */
-  __pyx_t_1 = (((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)->data != 0);
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":84
- *     def __dealloc__(self):
- *         if self.data:
- *             despotify_free_playlist(self.data)             # <<<<<<<<<<<<<<
- * 
- *     def __repr__(self):
- */
-    despotify_free_playlist(((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)->data);
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":86
- *             despotify_free_playlist(self.data)
- * 
- *     def __repr__(self):             # <<<<<<<<<<<<<<
- *         self.fetch()
- *         return '<RootList: %s>' % self.playlists
- */
-
-static PyObject *__pyx_pf_7spytify_8RootList___repr__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_8RootList___repr__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__repr__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":87
- * 
- *     def __repr__(self):
- *         self.fetch()             # <<<<<<<<<<<<<<
- *         return '<RootList: %s>' % self.playlists
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_7spytify_RootList *)((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)->__pyx_base.__pyx_vtab)->fetch(((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/playlist.pxi":88
- *     def __repr__(self):
- *         self.fetch()
- *         return '<RootList: %s>' % self.playlists             # <<<<<<<<<<<<<<
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_14), ((PyObject *)((struct __pyx_obj_7spytify_RootList *)__pyx_v_self)->playlists)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.RootList.__repr__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":4
- * 
- * cdef class SearchResult(SpotifyObject):
- *     def __init__(self):             # <<<<<<<<<<<<<<
- *         raise TypeError("This class cannot be instantiated from Python")
- * 
- */
-
-static int __pyx_pf_7spytify_12SearchResult___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_7spytify_12SearchResult___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":5
- * cdef class SearchResult(SpotifyObject):
- *     def __init__(self):
- *         raise TypeError("This class cannot be instantiated from Python")             # <<<<<<<<<<<<<<
- * 
- *     def get_uri(self):
- */
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[7]; __pyx_lineno = 5; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
-  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_kp_s_4));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
-  __pyx_t_2 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[7]; __pyx_lineno = 5; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_Raise(__pyx_t_2, 0, 0);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  {__pyx_filename = __pyx_f[7]; __pyx_lineno = 5; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.SearchResult.__init__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":7
- *         raise TypeError("This class cannot be instantiated from Python")
- * 
- *     def get_uri(self):             # <<<<<<<<<<<<<<
- *         return 'spotify:search:%s' % self.query
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_12SearchResult_get_uri(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_7spytify_12SearchResult_get_uri(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("get_uri");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":8
- * 
- *     def get_uri(self):
- *         return 'spotify:search:%s' % self.query             # <<<<<<<<<<<<<<
- * 
- *     property query:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__query); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[7]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_15), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[7]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.SearchResult.get_uri");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":11
- * 
- *     property query:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return <char*>self.data.query
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_12SearchResult_5query___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_12SearchResult_5query___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":12
- *     property query:
- *         def __get__(self):
- *             return <char*>self.data.query             # <<<<<<<<<<<<<<
- * 
- *     property suggestion:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(((char *)((struct __pyx_obj_7spytify_SearchResult *)__pyx_v_self)->data->query)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[7]; __pyx_lineno = 12; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.SearchResult.query.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":15
- * 
- *     property suggestion:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             if self.data.suggestion:
- *                 return <char*>self.data.suggestion
- */
-
-static PyObject *__pyx_pf_7spytify_12SearchResult_10suggestion___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_12SearchResult_10suggestion___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":16
- *     property suggestion:
- *         def __get__(self):
- *             if self.data.suggestion:             # <<<<<<<<<<<<<<
- *                 return <char*>self.data.suggestion
- *             else:
- */
-  __pyx_t_1 = (((struct __pyx_obj_7spytify_SearchResult *)__pyx_v_self)->data->suggestion != 0);
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":17
- *         def __get__(self):
- *             if self.data.suggestion:
- *                 return <char*>self.data.suggestion             # <<<<<<<<<<<<<<
- *             else:
- *                 return None
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBytes_FromString(((char *)((struct __pyx_obj_7spytify_SearchResult *)__pyx_v_self)->data->suggestion)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[7]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_r = __pyx_t_2;
-    __pyx_t_2 = 0;
-    goto __pyx_L0;
-    goto __pyx_L5;
-  }
-  /*else*/ {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":19
- *                 return <char*>self.data.suggestion
- *             else:
- *                 return None             # <<<<<<<<<<<<<<
- * 
- *     property total_artists:
- */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
-    goto __pyx_L0;
-  }
-  __pyx_L5:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.SearchResult.suggestion.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":22
- * 
- *     property total_artists:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.total_artists
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_12SearchResult_13total_artists___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_12SearchResult_13total_artists___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":23
- *     property total_artists:
- *         def __get__(self):
- *             return self.data.total_artists             # <<<<<<<<<<<<<<
- * 
- *     property total_albums:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_obj_7spytify_SearchResult *)__pyx_v_self)->data->total_artists); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[7]; __pyx_lineno = 23; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.SearchResult.total_artists.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":26
- * 
- *     property total_albums:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.total_albums
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_12SearchResult_12total_albums___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_12SearchResult_12total_albums___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":27
- *     property total_albums:
- *         def __get__(self):
- *             return self.data.total_albums             # <<<<<<<<<<<<<<
- * 
- *     property total_tracks:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_obj_7spytify_SearchResult *)__pyx_v_self)->data->total_albums); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[7]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.SearchResult.total_albums.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":30
- * 
- *     property total_tracks:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.data.total_tracks
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_12SearchResult_12total_tracks___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_12SearchResult_12total_tracks___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":31
- *     property total_tracks:
- *         def __get__(self):
- *             return self.data.total_tracks             # <<<<<<<<<<<<<<
- * 
- *     property playlist:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_obj_7spytify_SearchResult *)__pyx_v_self)->data->total_tracks); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[7]; __pyx_lineno = 31; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.SearchResult.total_tracks.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":34
- * 
- *     property playlist:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.playlist
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_12SearchResult_8playlist___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_12SearchResult_8playlist___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":35
- *     property playlist:
- *         def __get__(self):
- *             return self.playlist             # <<<<<<<<<<<<<<
- * 
- *     def __dealloc__(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)((struct __pyx_obj_7spytify_SearchResult *)__pyx_v_self)->playlist));
-  __pyx_r = ((PyObject *)((struct __pyx_obj_7spytify_SearchResult *)__pyx_v_self)->playlist);
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":37
- *             return self.playlist
- * 
- *     def __dealloc__(self):             # <<<<<<<<<<<<<<
- *         if self.take_owner:
- *             despotify_free_search(self.data)
- */
-
-static void __pyx_pf_7spytify_12SearchResult___dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pf_7spytify_12SearchResult___dealloc__(PyObject *__pyx_v_self) {
-  int __pyx_t_1;
-  __Pyx_RefNannySetupContext("__dealloc__");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":38
- * 
- *     def __dealloc__(self):
- *         if self.take_owner:             # <<<<<<<<<<<<<<
- *             despotify_free_search(self.data)
- */
-  __pyx_t_1 = ((struct __pyx_obj_7spytify_SearchResult *)__pyx_v_self)->take_owner;
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/searchresult.pxi":39
- *     def __dealloc__(self):
- *         if self.take_owner:
- *             despotify_free_search(self.data)             # <<<<<<<<<<<<<<
- */
-    despotify_free_search(((struct __pyx_obj_7spytify_SearchResult *)__pyx_v_self)->data);
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":20
- * include "searchresult.pxi"
- * 
- * cdef void callback_handler(despotify_session* ds, int signal,             # <<<<<<<<<<<<<<
- *                            void* data, void *python_obj) with gil:
- *     (<Spytify>python_obj).handle(signal, data)
- */
-
-static  void __pyx_f_7spytify_callback_handler(struct despotify_session *__pyx_v_ds, int __pyx_v_signal, void *__pyx_v_data, void *__pyx_v_python_obj) {
-  PyObject *__pyx_t_1 = NULL;
-  PyGILState_STATE _save = PyGILState_Ensure();
-  __Pyx_RefNannySetupContext("callback_handler");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":22
- * cdef void callback_handler(despotify_session* ds, int signal,
- *                            void* data, void *python_obj) with gil:
- *     (<Spytify>python_obj).handle(signal, data)             # <<<<<<<<<<<<<<
- * 
- * cdef class Spytify:
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_7spytify_Spytify *)((struct __pyx_obj_7spytify_Spytify *)__pyx_v_python_obj)->__pyx_base.__pyx_vtab)->handle(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_python_obj), __pyx_v_signal, __pyx_v_data); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 22; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_WriteUnraisable("spytify.callback_handler");
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  PyGILState_Release(_save);
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":30
- *     class will most likely be instantiated by this class and returned.
- *     """
- *     def __init__(self, bytes user, bytes pw, bool high_bitrate=True, bool use_cache=True, object callback=None):             # <<<<<<<<<<<<<<
- *         """Create a new Spytify instance, and connect to Spotify.
- * 
- */
-
-static int __pyx_pf_7spytify_7Spytify___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7spytify_7Spytify___init__[] = "Create a new Spytify instance, and connect to Spotify.\n\n        Args:\n            user: Username to authenticate with\n            pw: Password to authenticate with\n            high_bitrate: Wether or not to request high bitrate data.\n        ";
-static int __pyx_pf_7spytify_7Spytify___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_user = 0;
-  PyObject *__pyx_v_pw = 0;
-  PyObject *__pyx_v_high_bitrate = 0;
-  PyObject *__pyx_v_use_cache = 0;
-  PyObject *__pyx_v_callback = 0;
-  int __pyx_r;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  char *__pyx_t_6;
-  char *__pyx_t_7;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__user,&__pyx_n_s__pw,&__pyx_n_s__high_bitrate,&__pyx_n_s__use_cache,&__pyx_n_s__callback,0};
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[5] = {0,0,0,0,0};
-    values[2] = (PyObject*)__pyx_k_16;
-    values[3] = (PyObject*)__pyx_k_17;
-    values[4] = ((PyObject *)Py_None);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__user);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__pw);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("__init__", 0, 2, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-      case  2:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__high_bitrate);
-        if (unlikely(value)) { values[2] = value; kw_args--; }
-      }
-      case  3:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__use_cache);
-        if (unlikely(value)) { values[3] = value; kw_args--; }
-      }
-      case  4:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__callback);
-        if (unlikely(value)) { values[4] = value; kw_args--; }
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_user = ((PyObject *)values[0]);
-    __pyx_v_pw = ((PyObject *)values[1]);
-    __pyx_v_high_bitrate = ((PyObject *)values[2]);
-    __pyx_v_use_cache = ((PyObject *)values[3]);
-    __pyx_v_callback = values[4];
-  } else {
-    __pyx_v_high_bitrate = __pyx_k_16;
-    __pyx_v_use_cache = __pyx_k_17;
-    __pyx_v_callback = ((PyObject *)Py_None);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  5:
-      __pyx_v_callback = PyTuple_GET_ITEM(__pyx_args, 4);
-      case  4:
-      __pyx_v_use_cache = ((PyObject *)PyTuple_GET_ITEM(__pyx_args, 3));
-      case  3:
-      __pyx_v_high_bitrate = ((PyObject *)PyTuple_GET_ITEM(__pyx_args, 2));
-      case  2:
-      __pyx_v_pw = ((PyObject *)PyTuple_GET_ITEM(__pyx_args, 1));
-      __pyx_v_user = ((PyObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-      break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 2, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("spytify.Spytify.__init__");
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_user);
-  __Pyx_INCREF(__pyx_v_pw);
-  __Pyx_INCREF(__pyx_v_high_bitrate);
-  __Pyx_INCREF(__pyx_v_use_cache);
-  __Pyx_INCREF(__pyx_v_callback);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_user), &PyBytes_Type, 1, "user", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pw), &PyBytes_Type, 1, "pw", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_high_bitrate), &PyBool_Type, 1, "high_bitrate", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_use_cache), &PyBool_Type, 1, "use_cache", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":38
- *             high_bitrate: Wether or not to request high bitrate data.
- *         """
- *         self.stored_playlists = None             # <<<<<<<<<<<<<<
- *         self.callback = callback
- * 
- */
-  __Pyx_INCREF(Py_None);
-  __Pyx_GIVEREF(Py_None);
-  __Pyx_GOTREF(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->stored_playlists);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->stored_playlists));
-  ((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->stored_playlists = ((struct __pyx_obj_7spytify_RootList *)Py_None);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":39
- *         """
- *         self.stored_playlists = None
- *         self.callback = callback             # <<<<<<<<<<<<<<
- * 
- *         self.ds = despotify_init_client(callback_handler, <void*>self, high_bitrate, use_cache)
- */
-  __Pyx_INCREF(__pyx_v_callback);
-  __Pyx_GIVEREF(__pyx_v_callback);
-  __Pyx_GOTREF(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->callback);
-  __Pyx_DECREF(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->callback);
-  ((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->callback = __pyx_v_callback;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":41
- *         self.callback = callback
- * 
- *         self.ds = despotify_init_client(callback_handler, <void*>self, high_bitrate, use_cache)             # <<<<<<<<<<<<<<
- *         if not self.ds:
- *             raise SpytifyError(despotify_get_error(self.ds))
- */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(((PyObject *)__pyx_v_high_bitrate)); if (unlikely((__pyx_t_1 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(((PyObject *)__pyx_v_use_cache)); if (unlikely((__pyx_t_2 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  ((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds = despotify_init_client(__pyx_f_7spytify_callback_handler, ((void *)__pyx_v_self), __pyx_t_1, __pyx_t_2);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":42
- * 
- *         self.ds = despotify_init_client(callback_handler, <void*>self, high_bitrate, use_cache)
- *         if not self.ds:             # <<<<<<<<<<<<<<
- *             raise SpytifyError(despotify_get_error(self.ds))
- * 
- */
-  __pyx_t_2 = (!(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds != 0));
-  if (__pyx_t_2) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":43
- *         self.ds = despotify_init_client(callback_handler, <void*>self, high_bitrate, use_cache)
- *         if not self.ds:
- *             raise SpytifyError(despotify_get_error(self.ds))             # <<<<<<<<<<<<<<
- * 
- *         if not despotify_authenticate(self.ds, user, pw):
- */
-    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__SpytifyError); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyBytes_FromString(despotify_get_error(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-    __Pyx_GIVEREF(__pyx_t_4);
-    __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":45
- *             raise SpytifyError(despotify_get_error(self.ds))
- * 
- *         if not despotify_authenticate(self.ds, user, pw):             # <<<<<<<<<<<<<<
- *             raise SpytifyError(despotify_get_error(self.ds))
- * 
- */
-  __pyx_t_6 = __Pyx_PyBytes_AsString(((PyObject *)__pyx_v_user)); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_7 = __Pyx_PyBytes_AsString(((PyObject *)__pyx_v_pw)); if (unlikely((!__pyx_t_7) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = (!despotify_authenticate(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds, __pyx_t_6, __pyx_t_7));
-  if (__pyx_t_2) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":46
- * 
- *         if not despotify_authenticate(self.ds, user, pw):
- *             raise SpytifyError(despotify_get_error(self.ds))             # <<<<<<<<<<<<<<
- * 
- *         PyEval_InitThreads()
- */
-    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__SpytifyError); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyBytes_FromString(despotify_get_error(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_5);
-    __pyx_t_5 = 0;
-    __pyx_t_5 = PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_Raise(__pyx_t_5, 0, 0);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L7;
-  }
-  __pyx_L7:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":48
- *             raise SpytifyError(despotify_get_error(self.ds))
- * 
- *         PyEval_InitThreads()             # <<<<<<<<<<<<<<
- *         self.thread = audio_thread.thread_init(self.ds)
- * 
- */
-  PyEval_InitThreads();
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":49
- * 
- *         PyEval_InitThreads()
- *         self.thread = audio_thread.thread_init(self.ds)             # <<<<<<<<<<<<<<
- * 
- *     cdef handle(self, int signal, void* data):
- */
-  ((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->thread = thread_init(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds);
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("spytify.Spytify.__init__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_user);
-  __Pyx_DECREF(__pyx_v_pw);
-  __Pyx_DECREF(__pyx_v_high_bitrate);
-  __Pyx_DECREF(__pyx_v_use_cache);
-  __Pyx_DECREF(__pyx_v_callback);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":51
- *         self.thread = audio_thread.thread_init(self.ds)
- * 
- *     cdef handle(self, int signal, void* data):             # <<<<<<<<<<<<<<
- *         cdef double *d
- *         if self.callback:
- */
-
-static  PyObject *__pyx_f_7spytify_7Spytify_handle(struct __pyx_obj_7spytify_Spytify *__pyx_v_self, int __pyx_v_signal, void *__pyx_v_data) {
-  double *__pyx_v_d;
-  PyObject *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  __Pyx_RefNannySetupContext("handle");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":53
- *     cdef handle(self, int signal, void* data):
- *         cdef double *d
- *         if self.callback:             # <<<<<<<<<<<<<<
- *             if signal == DESPOTIFY_TIME_TELL:
- *                 d = <double*> data
- */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->callback); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":54
- *         cdef double *d
- *         if self.callback:
- *             if signal == DESPOTIFY_TIME_TELL:             # <<<<<<<<<<<<<<
- *                 d = <double*> data
- *                 self.callback(signal, d[0])
- */
-    __pyx_t_1 = (__pyx_v_signal == DESPOTIFY_TIME_TELL);
-    if (__pyx_t_1) {
-
-      /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":55
- *         if self.callback:
- *             if signal == DESPOTIFY_TIME_TELL:
- *                 d = <double*> data             # <<<<<<<<<<<<<<
- *                 self.callback(signal, d[0])
- *             elif signal == DESPOTIFY_NEW_TRACK:
- */
-      __pyx_v_d = ((double *)__pyx_v_data);
-
-      /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":56
- *             if signal == DESPOTIFY_TIME_TELL:
- *                 d = <double*> data
- *                 self.callback(signal, d[0])             # <<<<<<<<<<<<<<
- *             elif signal == DESPOTIFY_NEW_TRACK:
- *                 self.callback(signal, self.create_track(<track*>data))
- */
-      __pyx_t_2 = PyInt_FromLong(__pyx_v_signal); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyFloat_FromDouble((__pyx_v_d[0])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_2);
-      PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_3);
-      __pyx_t_2 = 0;
-      __pyx_t_3 = 0;
-      __pyx_t_3 = PyObject_Call(__pyx_v_self->callback, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      goto __pyx_L4;
-    }
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":57
- *                 d = <double*> data
- *                 self.callback(signal, d[0])
- *             elif signal == DESPOTIFY_NEW_TRACK:             # <<<<<<<<<<<<<<
- *                 self.callback(signal, self.create_track(<track*>data))
- *             else:
- */
-    __pyx_t_1 = (__pyx_v_signal == DESPOTIFY_NEW_TRACK);
-    if (__pyx_t_1) {
-
-      /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":58
- *                 self.callback(signal, d[0])
- *             elif signal == DESPOTIFY_NEW_TRACK:
- *                 self.callback(signal, self.create_track(<track*>data))             # <<<<<<<<<<<<<<
- *             else:
- *                 self.callback(signal, None)
- */
-      __pyx_t_3 = PyInt_FromLong(__pyx_v_signal); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_Spytify *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.create_track(((struct __pyx_obj_7spytify_SessionStruct *)__pyx_v_self), ((struct track *)__pyx_v_data))); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_4);
-      __Pyx_GIVEREF(__pyx_t_4);
-      __pyx_t_3 = 0;
-      __pyx_t_4 = 0;
-      __pyx_t_4 = PyObject_Call(__pyx_v_self->callback, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      goto __pyx_L4;
-    }
-    /*else*/ {
-
-      /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":60
- *                 self.callback(signal, self.create_track(<track*>data))
- *             else:
- *                 self.callback(signal, None)             # <<<<<<<<<<<<<<
- * 
- *     property stored_playlists:
- */
-      __pyx_t_4 = PyInt_FromLong(__pyx_v_signal); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
-      __Pyx_GIVEREF(__pyx_t_4);
-      __Pyx_INCREF(Py_None);
-      PyTuple_SET_ITEM(__pyx_t_2, 1, Py_None);
-      __Pyx_GIVEREF(Py_None);
-      __pyx_t_4 = 0;
-      __pyx_t_4 = PyObject_Call(__pyx_v_self->callback, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    }
-    __pyx_L4:;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("spytify.Spytify.handle");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":63
- * 
- *     property stored_playlists:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             if self.stored_playlists is None:
- *                 self.stored_playlists = self.create_rootlist()
- */
-
-static PyObject *__pyx_pf_7spytify_7Spytify_16stored_playlists___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_7Spytify_16stored_playlists___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":64
- *     property stored_playlists:
- *         def __get__(self):
- *             if self.stored_playlists is None:             # <<<<<<<<<<<<<<
- *                 self.stored_playlists = self.create_rootlist()
- * 
- */
-  __pyx_t_1 = (((PyObject *)((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->stored_playlists) == Py_None);
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":65
- *         def __get__(self):
- *             if self.stored_playlists is None:
- *                 self.stored_playlists = self.create_rootlist()             # <<<<<<<<<<<<<<
- * 
- *             return self.stored_playlists
- */
-    __pyx_t_2 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_Spytify *)((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.__pyx_vtab)->__pyx_base.create_rootlist(((struct __pyx_obj_7spytify_SessionStruct *)__pyx_v_self))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_GIVEREF(__pyx_t_2);
-    __Pyx_GOTREF(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->stored_playlists);
-    __Pyx_DECREF(((PyObject *)((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->stored_playlists));
-    ((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->stored_playlists = ((struct __pyx_obj_7spytify_RootList *)__pyx_t_2);
-    __pyx_t_2 = 0;
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":67
- *                 self.stored_playlists = self.create_rootlist()
- * 
- *             return self.stored_playlists             # <<<<<<<<<<<<<<
- * 
- *     property current_track:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->stored_playlists));
-  __pyx_r = ((PyObject *)((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->stored_playlists);
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("spytify.Spytify.stored_playlists.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":70
- * 
- *     property current_track:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self.create_track(despotify_get_current_track(self.ds))
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_7Spytify_13current_track___get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pf_7spytify_7Spytify_13current_track___get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__get__");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":71
- *     property current_track:
- *         def __get__(self):
- *             return self.create_track(despotify_get_current_track(self.ds))             # <<<<<<<<<<<<<<
- * 
- *     def flush_stored_playlists(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_Spytify *)((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.__pyx_vtab)->__pyx_base.create_track(((struct __pyx_obj_7spytify_SessionStruct *)__pyx_v_self), despotify_get_current_track(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds))); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Spytify.current_track.__get__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":73
- *             return self.create_track(despotify_get_current_track(self.ds))
- * 
- *     def flush_stored_playlists(self):             # <<<<<<<<<<<<<<
- *         """Clear cached playlists."""
- *         self.stored_playlists = self.create_rootlist()
- */
-
-static PyObject *__pyx_pf_7spytify_7Spytify_flush_stored_playlists(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static char __pyx_doc_7spytify_7Spytify_flush_stored_playlists[] = "Clear cached playlists.";
-static PyObject *__pyx_pf_7spytify_7Spytify_flush_stored_playlists(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("flush_stored_playlists");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":75
- *     def flush_stored_playlists(self):
- *         """Clear cached playlists."""
- *         self.stored_playlists = self.create_rootlist()             # <<<<<<<<<<<<<<
- * 
- *     def lookup(self, str uri):
- */
-  __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_Spytify *)((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.__pyx_vtab)->__pyx_base.create_rootlist(((struct __pyx_obj_7spytify_SessionStruct *)__pyx_v_self))); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->stored_playlists);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->stored_playlists));
-  ((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->stored_playlists = ((struct __pyx_obj_7spytify_RootList *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("spytify.Spytify.flush_stored_playlists");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":77
- *         self.stored_playlists = self.create_rootlist()
- * 
- *     def lookup(self, str uri):             # <<<<<<<<<<<<<<
- *         """Looks up URIs like spotify:track:32a2n4NPXhH3OI06VPLwTA.
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_7Spytify_lookup(PyObject *__pyx_v_self, PyObject *__pyx_v_uri); /*proto*/
-static char __pyx_doc_7spytify_7Spytify_lookup[] = "Looks up URIs like spotify:track:32a2n4NPXhH3OI06VPLwTA.\n\n        Args:\n            uri: URI like\n                spotify:track:32a2n4NPXhH3OI06VPLwTA\n                or track:32a2n4NPXhH3OI06VPLwTA\n        Returns:\n            Artist, Track or Album object for the id.\n        ";
-static PyObject *__pyx_pf_7spytify_7Spytify_lookup(PyObject *__pyx_v_self, PyObject *__pyx_v_uri) {
-  PyObject *__pyx_v_parts = 0;
-  PyObject *__pyx_v_type;
-  PyObject *__pyx_v_uri_id;
-  char __pyx_v_id[32];
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  int __pyx_t_7;
-  char *__pyx_t_8;
-  __Pyx_RefNannySetupContext("lookup");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_uri);
-  __pyx_v_type = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_uri_id = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_uri), &PyString_Type, 1, "uri", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":88
- *         """
- * 
- *         cdef list parts = uri.split(':', 3)             # <<<<<<<<<<<<<<
- *         if len(parts) < 2:
- *             raise SpytifyError('Ambigious URI specified: %s' % uri)
- */
-  __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_uri), __pyx_n_s__split); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
-  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_1));
-  __Pyx_INCREF(__pyx_int_3);
-  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_int_3);
-  __Pyx_GIVEREF(__pyx_int_3);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (!(likely(PyList_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected list, got %.200s", Py_TYPE(__pyx_t_3)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_parts = ((PyObject *)__pyx_t_3);
-  __pyx_t_3 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":89
- * 
- *         cdef list parts = uri.split(':', 3)
- *         if len(parts) < 2:             # <<<<<<<<<<<<<<
- *             raise SpytifyError('Ambigious URI specified: %s' % uri)
- *         if len(parts) > 2 and parts[0] != 'spotify':
- */
-  __pyx_t_4 = PyObject_Length(((PyObject *)__pyx_v_parts)); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = (__pyx_t_4 < 2);
-  if (__pyx_t_5) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":90
- *         cdef list parts = uri.split(':', 3)
- *         if len(parts) < 2:
- *             raise SpytifyError('Ambigious URI specified: %s' % uri)             # <<<<<<<<<<<<<<
- *         if len(parts) > 2 and parts[0] != 'spotify':
- *             raise SpytifyError('URI not meant for us: %s' % uri)
- */
-    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__SpytifyError); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_18), ((PyObject *)__pyx_v_uri)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
-    __Pyx_GIVEREF(__pyx_t_2);
-    __pyx_t_2 = 0;
-    __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_Raise(__pyx_t_2, 0, 0);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":91
- *         if len(parts) < 2:
- *             raise SpytifyError('Ambigious URI specified: %s' % uri)
- *         if len(parts) > 2 and parts[0] != 'spotify':             # <<<<<<<<<<<<<<
- *             raise SpytifyError('URI not meant for us: %s' % uri)
- * 
- */
-  __pyx_t_4 = PyObject_Length(((PyObject *)__pyx_v_parts)); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = (__pyx_t_4 > 2);
-  if (__pyx_t_5) {
-    __pyx_t_2 = __Pyx_GetItemInt_List(((PyObject *)__pyx_v_parts), 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = PyObject_RichCompare(__pyx_t_2, ((PyObject *)__pyx_n_s__spotify), Py_NE); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_7 = __pyx_t_6;
-  } else {
-    __pyx_t_7 = __pyx_t_5;
-  }
-  if (__pyx_t_7) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":92
- *             raise SpytifyError('Ambigious URI specified: %s' % uri)
- *         if len(parts) > 2 and parts[0] != 'spotify':
- *             raise SpytifyError('URI not meant for us: %s' % uri)             # <<<<<<<<<<<<<<
- * 
- *         cdef str type
- */
-    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__SpytifyError); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_19), ((PyObject *)__pyx_v_uri)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
-    __Pyx_GIVEREF(__pyx_t_2);
-    __pyx_t_2 = 0;
-    __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_Raise(__pyx_t_2, 0, 0);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":97
- *         cdef bytes uri_id
- *         cdef char id[32]
- *         type, uri_id = parts[-2].lower(), parts[-1]             # <<<<<<<<<<<<<<
- * 
- *         despotify_uri2id(uri_id, id)
- */
-  __pyx_t_2 = __Pyx_GetItemInt_List(((PyObject *)__pyx_v_parts), -2, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__lower); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (!(likely(PyString_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected str, got %.200s", Py_TYPE(__pyx_t_2)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __Pyx_GetItemInt_List(((PyObject *)__pyx_v_parts), -1, sizeof(long), PyInt_FromLong); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  if (!(likely(PyBytes_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected bytes, got %.200s", Py_TYPE(__pyx_t_3)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(((PyObject *)__pyx_v_type));
-  __pyx_v_type = ((PyObject *)__pyx_t_2);
-  __pyx_t_2 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_v_uri_id));
-  __pyx_v_uri_id = ((PyObject *)__pyx_t_3);
-  __pyx_t_3 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":99
- *         type, uri_id = parts[-2].lower(), parts[-1]
- * 
- *         despotify_uri2id(uri_id, id)             # <<<<<<<<<<<<<<
- * 
- *         if type == 'artist':
- */
-  __pyx_t_8 = __Pyx_PyBytes_AsString(((PyObject *)__pyx_v_uri_id)); if (unlikely((!__pyx_t_8) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  despotify_uri2id(__pyx_t_8, __pyx_v_id);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":101
- *         despotify_uri2id(uri_id, id)
- * 
- *         if type == 'artist':             # <<<<<<<<<<<<<<
- *             return self.create_artist_full(despotify_get_artist(self.ds, id))
- *         elif type =='album':
- */
-  __pyx_t_3 = PyObject_RichCompare(((PyObject *)__pyx_v_type), ((PyObject *)__pyx_n_s__artist), Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 101; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 101; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (__pyx_t_7) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":102
- * 
- *         if type == 'artist':
- *             return self.create_artist_full(despotify_get_artist(self.ds, id))             # <<<<<<<<<<<<<<
- *         elif type =='album':
- *             return self.create_album_full(despotify_get_album(self.ds, id))
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_Spytify *)((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.__pyx_vtab)->__pyx_base.create_artist_full(((struct __pyx_obj_7spytify_SessionStruct *)__pyx_v_self), despotify_get_artist(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds, __pyx_v_id), NULL)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_r = __pyx_t_3;
-    __pyx_t_3 = 0;
-    goto __pyx_L0;
-    goto __pyx_L7;
-  }
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":103
- *         if type == 'artist':
- *             return self.create_artist_full(despotify_get_artist(self.ds, id))
- *         elif type =='album':             # <<<<<<<<<<<<<<
- *             return self.create_album_full(despotify_get_album(self.ds, id))
- *         elif type =='track':
- */
-  __pyx_t_3 = PyObject_RichCompare(((PyObject *)__pyx_v_type), ((PyObject *)__pyx_n_s__album), Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (__pyx_t_7) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":104
- *             return self.create_artist_full(despotify_get_artist(self.ds, id))
- *         elif type =='album':
- *             return self.create_album_full(despotify_get_album(self.ds, id))             # <<<<<<<<<<<<<<
- *         elif type =='track':
- *             return self.create_track(despotify_get_track(self.ds, id))
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_Spytify *)((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.__pyx_vtab)->__pyx_base.create_album_full(((struct __pyx_obj_7spytify_SessionStruct *)__pyx_v_self), despotify_get_album(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds, __pyx_v_id), NULL)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_r = __pyx_t_3;
-    __pyx_t_3 = 0;
-    goto __pyx_L0;
-    goto __pyx_L7;
-  }
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":105
- *         elif type =='album':
- *             return self.create_album_full(despotify_get_album(self.ds, id))
- *         elif type =='track':             # <<<<<<<<<<<<<<
- *             return self.create_track(despotify_get_track(self.ds, id))
- *         else:
- */
-  __pyx_t_3 = PyObject_RichCompare(((PyObject *)__pyx_v_type), ((PyObject *)__pyx_n_s__track), Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (__pyx_t_7) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":106
- *             return self.create_album_full(despotify_get_album(self.ds, id))
- *         elif type =='track':
- *             return self.create_track(despotify_get_track(self.ds, id))             # <<<<<<<<<<<<<<
- *         else:
- *             raise SpytifyError('URI specifies invalid type: %s' % type)
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_Spytify *)((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.__pyx_vtab)->__pyx_base.create_track(((struct __pyx_obj_7spytify_SessionStruct *)__pyx_v_self), despotify_get_track(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds, __pyx_v_id))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_r = __pyx_t_3;
-    __pyx_t_3 = 0;
-    goto __pyx_L0;
-    goto __pyx_L7;
-  }
-  /*else*/ {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":108
- *             return self.create_track(despotify_get_track(self.ds, id))
- *         else:
- *             raise SpytifyError('URI specifies invalid type: %s' % type)             # <<<<<<<<<<<<<<
- * 
- *     def search(self, bytes searchtext, int max_hits=MAX_SEARCH_RESULTS):
- */
-    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__SpytifyError); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_20), ((PyObject *)__pyx_v_type)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
-    __Pyx_GIVEREF(__pyx_t_2);
-    __pyx_t_2 = 0;
-    __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_Raise(__pyx_t_2, 0, 0);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_L7:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("spytify.Spytify.lookup");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_parts);
-  __Pyx_DECREF(__pyx_v_type);
-  __Pyx_DECREF(__pyx_v_uri_id);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_uri);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":110
- *             raise SpytifyError('URI specifies invalid type: %s' % type)
- * 
- *     def search(self, bytes searchtext, int max_hits=MAX_SEARCH_RESULTS):             # <<<<<<<<<<<<<<
- *         """Search for a string like the normal Spotify client.
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_7Spytify_search(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7spytify_7Spytify_search[] = "Search for a string like the normal Spotify client.\n\n        Args:\n            searchtext: What you want to search for. \n                (http://www.spotify.com/blog/archives/2008/01/22/searching-spotify/)\n            max_hits: Max number of hits, cannot be higher than MAX_SEARCH_RESULTS in despotify.h.\n\n        Returns: None if search failed, a SearchResult if search was OK.\n        ";
-static PyObject *__pyx_pf_7spytify_7Spytify_search(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_searchtext = 0;
-  int __pyx_v_max_hits;
-  struct search_result *__pyx_v_search;
-  PyObject *__pyx_r = NULL;
-  char *__pyx_t_1;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  struct __pyx_opt_args_7spytify_13SessionStruct_create_search_result __pyx_t_4;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__searchtext,&__pyx_n_s__max_hits,0};
-  __Pyx_RefNannySetupContext("search");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[2] = {0,0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__searchtext);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__max_hits);
-        if (unlikely(value)) { values[1] = value; kw_args--; }
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "search") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_searchtext = ((PyObject *)values[0]);
-    if (values[1]) {
-      __pyx_v_max_hits = __Pyx_PyInt_AsInt(values[1]); if (unlikely((__pyx_v_max_hits == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_max_hits = __pyx_k_21;
-    }
-  } else {
-    __pyx_v_max_hits = __pyx_k_21;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  2: __pyx_v_max_hits = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_max_hits == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  1: __pyx_v_searchtext = ((PyObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-      break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("search", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("spytify.Spytify.search");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_searchtext);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_searchtext), &PyBytes_Type, 1, "searchtext", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":120
- *         Returns: None if search failed, a SearchResult if search was OK.
- *         """
- *         cdef search_result* search = despotify_search(self.ds, searchtext, max_hits)             # <<<<<<<<<<<<<<
- *         if not search:
- *             return None
- */
-  __pyx_t_1 = __Pyx_PyBytes_AsString(((PyObject *)__pyx_v_searchtext)); if (unlikely((!__pyx_t_1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_search = despotify_search(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds, __pyx_t_1, __pyx_v_max_hits);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":121
- *         """
- *         cdef search_result* search = despotify_search(self.ds, searchtext, max_hits)
- *         if not search:             # <<<<<<<<<<<<<<
- *             return None
- *         else:
- */
-  __pyx_t_2 = (!(__pyx_v_search != 0));
-  if (__pyx_t_2) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":122
- *         cdef search_result* search = despotify_search(self.ds, searchtext, max_hits)
- *         if not search:
- *             return None             # <<<<<<<<<<<<<<
- *         else:
- *             return self.create_search_result(search, True)
- */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
-    goto __pyx_L0;
-    goto __pyx_L6;
-  }
-  /*else*/ {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":124
- *             return None
- *         else:
- *             return self.create_search_result(search, True)             # <<<<<<<<<<<<<<
- * 
- *     def play_list(self, Playlist playlist, Track starting_track=None):
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_4.__pyx_n = 1;
-    __pyx_t_4.take_owner = 1;
-    __pyx_t_3 = ((PyObject *)((struct __pyx_vtabstruct_7spytify_Spytify *)((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.__pyx_vtab)->__pyx_base.create_search_result(((struct __pyx_obj_7spytify_SessionStruct *)__pyx_v_self), __pyx_v_search, &__pyx_t_4)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 124; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_r = __pyx_t_3;
-    __pyx_t_3 = 0;
-    goto __pyx_L0;
-  }
-  __pyx_L6:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("spytify.Spytify.search");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_searchtext);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":126
- *             return self.create_search_result(search, True)
- * 
- *     def play_list(self, Playlist playlist, Track starting_track=None):             # <<<<<<<<<<<<<<
- *         """Play a playlist, continuing to the next song when finished.
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_7Spytify_play_list(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7spytify_7Spytify_play_list[] = "Play a playlist, continuing to the next song when finished.\n\n        Args:\n            playlist: Playlist to play from.\n            starting_track: If not None (default), then track to start playback from.\n        ";
-static PyObject *__pyx_pf_7spytify_7Spytify_play_list(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  struct __pyx_obj_7spytify_Playlist *__pyx_v_playlist = 0;
-  struct __pyx_obj_7spytify_Track *__pyx_v_starting_track = 0;
-  struct track *__pyx_v_starting_track_ptr;
-  PyObject *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__playlist,&__pyx_n_s__starting_track,0};
-  __Pyx_RefNannySetupContext("play_list");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[2] = {0,0};
-    values[1] = (PyObject*)((struct __pyx_obj_7spytify_Track *)Py_None);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__playlist);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__starting_track);
-        if (unlikely(value)) { values[1] = value; kw_args--; }
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "play_list") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_playlist = ((struct __pyx_obj_7spytify_Playlist *)values[0]);
-    __pyx_v_starting_track = ((struct __pyx_obj_7spytify_Track *)values[1]);
-  } else {
-    __pyx_v_starting_track = ((struct __pyx_obj_7spytify_Track *)Py_None);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  2: __pyx_v_starting_track = ((struct __pyx_obj_7spytify_Track *)PyTuple_GET_ITEM(__pyx_args, 1));
-      case  1: __pyx_v_playlist = ((struct __pyx_obj_7spytify_Playlist *)PyTuple_GET_ITEM(__pyx_args, 0));
-      break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("play_list", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("spytify.Spytify.play_list");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF((PyObject *)__pyx_v_playlist);
-  __Pyx_INCREF((PyObject *)__pyx_v_starting_track);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_playlist), __pyx_ptype_7spytify_Playlist, 1, "playlist", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_starting_track), __pyx_ptype_7spytify_Track, 1, "starting_track", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":133
- *             starting_track: If not None (default), then track to start playback from.
- *         """
- *         cdef track* starting_track_ptr = playlist.data.tracks             # <<<<<<<<<<<<<<
- *         if starting_track is not None:
- *             starting_track_ptr = starting_track.data
- */
-  __pyx_v_starting_track_ptr = __pyx_v_playlist->data->tracks;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":134
- *         """
- *         cdef track* starting_track_ptr = playlist.data.tracks
- *         if starting_track is not None:             # <<<<<<<<<<<<<<
- *             starting_track_ptr = starting_track.data
- * 
- */
-  __pyx_t_1 = (((PyObject *)__pyx_v_starting_track) != Py_None);
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":135
- *         cdef track* starting_track_ptr = playlist.data.tracks
- *         if starting_track is not None:
- *             starting_track_ptr = starting_track.data             # <<<<<<<<<<<<<<
- * 
- *         if not despotify_play(self.ds, starting_track_ptr, True):
- */
-    __pyx_v_starting_track_ptr = __pyx_v_starting_track->data;
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":137
- *             starting_track_ptr = starting_track.data
- * 
- *         if not despotify_play(self.ds, starting_track_ptr, True):             # <<<<<<<<<<<<<<
- *             raise SpytifyError(despotify_get_error(self.ds))
- * 
- */
-  __pyx_t_1 = (!despotify_play(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds, __pyx_v_starting_track_ptr, 1));
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":138
- * 
- *         if not despotify_play(self.ds, starting_track_ptr, True):
- *             raise SpytifyError(despotify_get_error(self.ds))             # <<<<<<<<<<<<<<
- * 
- *         audio_thread.thread_play(self.thread)
- */
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__SpytifyError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = __Pyx_PyBytes_FromString(despotify_get_error(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-    __Pyx_GIVEREF(__pyx_t_3);
-    __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L7;
-  }
-  __pyx_L7:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":140
- *             raise SpytifyError(despotify_get_error(self.ds))
- * 
- *         audio_thread.thread_play(self.thread)             # <<<<<<<<<<<<<<
- * 
- *     def play(self, Track track):
- */
-  thread_play(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->thread);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("spytify.Spytify.play_list");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF((PyObject *)__pyx_v_playlist);
-  __Pyx_DECREF((PyObject *)__pyx_v_starting_track);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":142
- *         audio_thread.thread_play(self.thread)
- * 
- *     def play(self, Track track):             # <<<<<<<<<<<<<<
- *         """Start playback of a given track.
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_7Spytify_play(PyObject *__pyx_v_self, PyObject *__pyx_v_track); /*proto*/
-static char __pyx_doc_7spytify_7Spytify_play[] = "Start playback of a given track.\n\n        Args:\n            track: Play this track.\n        ";
-static PyObject *__pyx_pf_7spytify_7Spytify_play(PyObject *__pyx_v_self, PyObject *__pyx_v_track) {
-  PyObject *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  __Pyx_RefNannySetupContext("play");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF((PyObject *)__pyx_v_track);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_track), __pyx_ptype_7spytify_Track, 1, "track", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":148
- *             track: Play this track.
- *         """
- *         if not despotify_play(self.ds, track.data, False):             # <<<<<<<<<<<<<<
- *             raise SpytifyError(despotify_get_error(self.ds))
- * 
- */
-  __pyx_t_1 = (!despotify_play(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds, ((struct __pyx_obj_7spytify_Track *)__pyx_v_track)->data, 0));
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":149
- *         """
- *         if not despotify_play(self.ds, track.data, False):
- *             raise SpytifyError(despotify_get_error(self.ds))             # <<<<<<<<<<<<<<
- * 
- *         audio_thread.thread_play(self.thread)
- */
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__SpytifyError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = __Pyx_PyBytes_FromString(despotify_get_error(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-    __Pyx_GIVEREF(__pyx_t_3);
-    __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":151
- *             raise SpytifyError(despotify_get_error(self.ds))
- * 
- *         audio_thread.thread_play(self.thread)             # <<<<<<<<<<<<<<
- * 
- *     def stop(self):
- */
-  thread_play(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->thread);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("spytify.Spytify.play");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF((PyObject *)__pyx_v_track);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":153
- *         audio_thread.thread_play(self.thread)
- * 
- *     def stop(self):             # <<<<<<<<<<<<<<
- *         """Stop playback."""
- *         if not despotify_stop(self.ds):
- */
-
-static PyObject *__pyx_pf_7spytify_7Spytify_stop(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static char __pyx_doc_7spytify_7Spytify_stop[] = "Stop playback.";
-static PyObject *__pyx_pf_7spytify_7Spytify_stop(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  __Pyx_RefNannySetupContext("stop");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":155
- *     def stop(self):
- *         """Stop playback."""
- *         if not despotify_stop(self.ds):             # <<<<<<<<<<<<<<
- *             raise SpytifyError(despotify_get_error(self.ds))
- * 
- */
-  __pyx_t_1 = (!despotify_stop(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds));
-  if (__pyx_t_1) {
-
-    /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":156
- *         """Stop playback."""
- *         if not despotify_stop(self.ds):
- *             raise SpytifyError(despotify_get_error(self.ds))             # <<<<<<<<<<<<<<
- * 
- *     def pause(self):
- */
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__SpytifyError); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = __Pyx_PyBytes_FromString(despotify_get_error(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-    __Pyx_GIVEREF(__pyx_t_3);
-    __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("spytify.Spytify.stop");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":158
- *             raise SpytifyError(despotify_get_error(self.ds))
- * 
- *     def pause(self):             # <<<<<<<<<<<<<<
- *         """Pause playback."""
- *         audio_thread.thread_pause(self.thread)
- */
-
-static PyObject *__pyx_pf_7spytify_7Spytify_pause(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static char __pyx_doc_7spytify_7Spytify_pause[] = "Pause playback.";
-static PyObject *__pyx_pf_7spytify_7Spytify_pause(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannySetupContext("pause");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":160
- *     def pause(self):
- *         """Pause playback."""
- *         audio_thread.thread_pause(self.thread)             # <<<<<<<<<<<<<<
- * 
- *     def resume(self):
- */
-  thread_pause(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->thread);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":162
- *         audio_thread.thread_pause(self.thread)
- * 
- *     def resume(self):             # <<<<<<<<<<<<<<
- *         """Resume playback."""
- *         audio_thread.thread_play(self.thread)
- */
-
-static PyObject *__pyx_pf_7spytify_7Spytify_resume(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static char __pyx_doc_7spytify_7Spytify_resume[] = "Resume playback.";
-static PyObject *__pyx_pf_7spytify_7Spytify_resume(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannySetupContext("resume");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":164
- *     def resume(self):
- *         """Resume playback."""
- *         audio_thread.thread_play(self.thread)             # <<<<<<<<<<<<<<
- * 
- *     def next(self):
- */
-  thread_play(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->thread);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":166
- *         audio_thread.thread_play(self.thread)
- * 
- *     def next(self):             # <<<<<<<<<<<<<<
- *         """Play next song in playlist."""
- *         despotify_next(self.ds)
- */
-
-static PyObject *__pyx_pf_7spytify_7Spytify_next(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static char __pyx_doc_7spytify_7Spytify_next[] = "Play next song in playlist.";
-static PyObject *__pyx_pf_7spytify_7Spytify_next(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannySetupContext("next");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":168
- *     def next(self):
- *         """Play next song in playlist."""
- *         despotify_next(self.ds)             # <<<<<<<<<<<<<<
- * 
- *     def close(self):
- */
-  despotify_next(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":170
- *         despotify_next(self.ds)
- * 
- *     def close(self):             # <<<<<<<<<<<<<<
- *         """Close the session with the server."""
- *         audio_thread.thread_exit(self.thread)
- */
-
-static PyObject *__pyx_pf_7spytify_7Spytify_close(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static char __pyx_doc_7spytify_7Spytify_close[] = "Close the session with the server.";
-static PyObject *__pyx_pf_7spytify_7Spytify_close(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannySetupContext("close");
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":172
- *     def close(self):
- *         """Close the session with the server."""
- *         audio_thread.thread_exit(self.thread)             # <<<<<<<<<<<<<<
- *         despotify_exit(self.ds)
- * 
- */
-  thread_exit(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->thread);
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":173
- *         """Close the session with the server."""
- *         audio_thread.thread_exit(self.thread)
- *         despotify_exit(self.ds)             # <<<<<<<<<<<<<<
- * 
- * def bytestr_to_hexstr(str bytes):
- */
-  despotify_exit(((struct __pyx_obj_7spytify_Spytify *)__pyx_v_self)->__pyx_base.ds);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":175
- *         despotify_exit(self.ds)
- * 
- * def bytestr_to_hexstr(str bytes):             # <<<<<<<<<<<<<<
- *     return ''.join(["%02x" % ord(c) for c in bytes])
- * 
- */
-
-static PyObject *__pyx_pf_7spytify_bytestr_to_hexstr(PyObject *__pyx_self, PyObject *__pyx_v_bytes); /*proto*/
-static PyObject *__pyx_pf_7spytify_bytestr_to_hexstr(PyObject *__pyx_self, PyObject *__pyx_v_bytes) {
-  PyObject *__pyx_v_c;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  Py_ssize_t __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
-  __Pyx_RefNannySetupContext("bytestr_to_hexstr");
-  __pyx_self = __pyx_self;
-  __pyx_v_c = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bytes), &PyString_Type, 1, "bytes", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":176
- * 
- * def bytestr_to_hexstr(str bytes):
- *     return ''.join(["%02x" % ord(c) for c in bytes])             # <<<<<<<<<<<<<<
- * 
- * # Wrapper for despotify_cleanup.
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_kp_s_23), __pyx_n_s__join); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-  __pyx_t_3 = -1; __pyx_t_4 = PyObject_GetIter(((PyObject *)__pyx_v_bytes)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  for (;;) {
-    {
-      __pyx_t_5 = PyIter_Next(__pyx_t_4);
-      if (!__pyx_t_5) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_5);
-    }
-    __Pyx_DECREF(__pyx_v_c);
-    __pyx_v_c = __pyx_t_5;
-    __pyx_t_5 = 0;
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_INCREF(__pyx_v_c);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_c);
-    __Pyx_GIVEREF(__pyx_v_c);
-    __pyx_t_6 = PyObject_Call(__pyx_builtin_ord, __pyx_t_5, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_24), __pyx_t_6); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_7 = PyList_Append(__pyx_t_2, (PyObject*)__pyx_t_5); if (unlikely(__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_INCREF(((PyObject *)__pyx_t_2));
-  PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_t_2));
-  __Pyx_GIVEREF(((PyObject *)__pyx_t_2));
-  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("spytify.bytestr_to_hexstr");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_c);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":179
- * 
- * # Wrapper for despotify_cleanup.
- * def _cleanup():             # <<<<<<<<<<<<<<
- *     assert(despotify_cleanup())
- * 
- */
-
-static PyObject *__pyx_pf_7spytify__cleanup(PyObject *__pyx_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_7spytify__cleanup(PyObject *__pyx_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannySetupContext("_cleanup");
-  __pyx_self = __pyx_self;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":180
- * # Wrapper for despotify_cleanup.
- * def _cleanup():
- *     assert(despotify_cleanup())             # <<<<<<<<<<<<<<
- * 
- * assert(despotify_init())
- */
-  #ifndef PYREX_WITHOUT_ASSERTIONS
-  if (unlikely(!despotify_cleanup())) {
-    PyErr_SetNone(PyExc_AssertionError);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  #endif
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("spytify._cleanup");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-static struct __pyx_vtabstruct_7spytify_SessionStruct __pyx_vtable_7spytify_SessionStruct;
-
-static PyObject *__pyx_tp_new_7spytify_SessionStruct(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7spytify_SessionStruct *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_7spytify_SessionStruct *)o);
-  p->__pyx_vtab = __pyx_vtabptr_7spytify_SessionStruct;
-  return o;
-}
-
-static void __pyx_tp_dealloc_7spytify_SessionStruct(PyObject *o) {
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static struct PyMethodDef __pyx_methods_7spytify_SessionStruct[] = {
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_SessionStruct = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_SessionStruct = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_SessionStruct = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_SessionStruct = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_7spytify_SessionStruct = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("spytify.SessionStruct"), /*tp_name*/
-  sizeof(struct __pyx_obj_7spytify_SessionStruct), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7spytify_SessionStruct, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_SessionStruct, /*tp_as_number*/
-  &__pyx_tp_as_sequence_SessionStruct, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_SessionStruct, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_SessionStruct, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_7spytify_SessionStruct, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_7spytify_SessionStruct, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_7spytify_SpotifyObject __pyx_vtable_7spytify_SpotifyObject;
-
-static PyObject *__pyx_tp_new_7spytify_SpotifyObject(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7spytify_SpotifyObject *p;
-  PyObject *o = __pyx_tp_new_7spytify_SessionStruct(t, a, k);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_7spytify_SpotifyObject *)o);
-  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_7spytify_SessionStruct*)__pyx_vtabptr_7spytify_SpotifyObject;
-  return o;
-}
-
-static struct PyMethodDef __pyx_methods_7spytify_SpotifyObject[] = {
-  {__Pyx_NAMESTR("get_http_link"), (PyCFunction)__pyx_pf_7spytify_13SpotifyObject_get_http_link, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_7spytify_13SpotifyObject_get_http_link)},
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_SpotifyObject = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_SpotifyObject = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_SpotifyObject = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_SpotifyObject = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_7spytify_SpotifyObject = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("spytify.SpotifyObject"), /*tp_name*/
-  sizeof(struct __pyx_obj_7spytify_SpotifyObject), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7spytify_SessionStruct, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_SpotifyObject, /*tp_as_number*/
-  &__pyx_tp_as_sequence_SpotifyObject, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_SpotifyObject, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_SpotifyObject, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  __Pyx_DOCSTR("Implements stuff that's specific to Spotify Objects.\n\n    A Spotify Object is basically anything that has a spotify URI.\n    "), /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_7spytify_SpotifyObject, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_7spytify_SpotifyObject, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_7spytify_Album __pyx_vtable_7spytify_Album;
-
-static PyObject *__pyx_tp_new_7spytify_Album(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7spytify_Album *p;
-  PyObject *o = __pyx_tp_new_7spytify_SessionStruct(t, a, k);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_7spytify_Album *)o);
-  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_7spytify_SessionStruct*)__pyx_vtabptr_7spytify_Album;
-  p->data = ((struct __pyx_obj_7spytify_AlbumData *)Py_None); Py_INCREF(Py_None);
-  p->full_data = ((struct __pyx_obj_7spytify_AlbumDataFull *)Py_None); Py_INCREF(Py_None);
-  return o;
-}
-
-static void __pyx_tp_dealloc_7spytify_Album(PyObject *o) {
-  struct __pyx_obj_7spytify_Album *p = (struct __pyx_obj_7spytify_Album *)o;
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
-    __pyx_pf_7spytify_5Album___dealloc__(o);
-    if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
-    --Py_REFCNT(o);
-    PyErr_Restore(etype, eval, etb);
-  }
-  Py_XDECREF(((PyObject *)p->data));
-  Py_XDECREF(((PyObject *)p->full_data));
-  __pyx_tp_dealloc_7spytify_SessionStruct(o);
-}
-
-static int __pyx_tp_traverse_7spytify_Album(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_7spytify_Album *p = (struct __pyx_obj_7spytify_Album *)o;
-  if (__pyx_ptype_7spytify_SpotifyObject->tp_traverse) {
-    e = __pyx_ptype_7spytify_SpotifyObject->tp_traverse(o, v, a); if (e) return e;
-  }
-  if (p->data) {
-    e = (*v)(((PyObject*)p->data), a); if (e) return e;
-  }
-  if (p->full_data) {
-    e = (*v)(((PyObject*)p->full_data), a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_7spytify_Album(PyObject *o) {
-  struct __pyx_obj_7spytify_Album *p = (struct __pyx_obj_7spytify_Album *)o;
-  PyObject* tmp;
-  if (__pyx_ptype_7spytify_SpotifyObject->tp_clear) {
-    __pyx_ptype_7spytify_SpotifyObject->tp_clear(o);
-  }
-  tmp = ((PyObject*)p->data);
-  p->data = ((struct __pyx_obj_7spytify_AlbumData *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->full_data);
-  p->full_data = ((struct __pyx_obj_7spytify_AlbumDataFull *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static PyObject *__pyx_getprop_7spytify_5Album_name(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Album_4name___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_5Album_id(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Album_2id___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_5Album_tracks(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Album_6tracks___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_5Album_year(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Album_4year___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_5Album_cover_id(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Album_8cover_id___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_5Album_popularity(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Album_10popularity___get__(o);
-}
-
-static struct PyMethodDef __pyx_methods_7spytify_Album[] = {
-  {__Pyx_NAMESTR("get_uri"), (PyCFunction)__pyx_pf_7spytify_5Album_get_uri, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("__repr__"), (PyCFunction)__pyx_pf_7spytify_5Album___repr__, METH_NOARGS|METH_COEXIST, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static struct PyGetSetDef __pyx_getsets_7spytify_Album[] = {
-  {(char *)"name", __pyx_getprop_7spytify_5Album_name, 0, 0, 0},
-  {(char *)"id", __pyx_getprop_7spytify_5Album_id, 0, 0, 0},
-  {(char *)"tracks", __pyx_getprop_7spytify_5Album_tracks, 0, 0, 0},
-  {(char *)"year", __pyx_getprop_7spytify_5Album_year, 0, 0, 0},
-  {(char *)"cover_id", __pyx_getprop_7spytify_5Album_cover_id, 0, 0, 0},
-  {(char *)"popularity", __pyx_getprop_7spytify_5Album_popularity, 0, 0, 0},
-  {0, 0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_Album = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_Album = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_Album = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_Album = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_7spytify_Album = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("spytify.Album"), /*tp_name*/
-  sizeof(struct __pyx_obj_7spytify_Album), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7spytify_Album, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  __pyx_pf_7spytify_5Album___repr__, /*tp_repr*/
-  &__pyx_tp_as_number_Album, /*tp_as_number*/
-  &__pyx_tp_as_sequence_Album, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_Album, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_Album, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_7spytify_Album, /*tp_traverse*/
-  __pyx_tp_clear_7spytify_Album, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_7spytify_Album, /*tp_methods*/
-  0, /*tp_members*/
-  __pyx_getsets_7spytify_Album, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_7spytify_5Album___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_7spytify_Album, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_7spytify_Artist __pyx_vtable_7spytify_Artist;
-
-static PyObject *__pyx_tp_new_7spytify_Artist(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7spytify_Artist *p;
-  PyObject *o = __pyx_tp_new_7spytify_SessionStruct(t, a, k);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_7spytify_Artist *)o);
-  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_7spytify_SessionStruct*)__pyx_vtabptr_7spytify_Artist;
-  p->data = ((struct __pyx_obj_7spytify_ArtistData *)Py_None); Py_INCREF(Py_None);
-  p->full_data = ((struct __pyx_obj_7spytify_ArtistDataFull *)Py_None); Py_INCREF(Py_None);
-  return o;
-}
-
-static void __pyx_tp_dealloc_7spytify_Artist(PyObject *o) {
-  struct __pyx_obj_7spytify_Artist *p = (struct __pyx_obj_7spytify_Artist *)o;
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
-    __pyx_pf_7spytify_6Artist___dealloc__(o);
-    if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
-    --Py_REFCNT(o);
-    PyErr_Restore(etype, eval, etb);
-  }
-  Py_XDECREF(((PyObject *)p->data));
-  Py_XDECREF(((PyObject *)p->full_data));
-  __pyx_tp_dealloc_7spytify_SessionStruct(o);
-}
-
-static int __pyx_tp_traverse_7spytify_Artist(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_7spytify_Artist *p = (struct __pyx_obj_7spytify_Artist *)o;
-  if (__pyx_ptype_7spytify_SpotifyObject->tp_traverse) {
-    e = __pyx_ptype_7spytify_SpotifyObject->tp_traverse(o, v, a); if (e) return e;
-  }
-  if (p->data) {
-    e = (*v)(((PyObject*)p->data), a); if (e) return e;
-  }
-  if (p->full_data) {
-    e = (*v)(((PyObject*)p->full_data), a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_7spytify_Artist(PyObject *o) {
-  struct __pyx_obj_7spytify_Artist *p = (struct __pyx_obj_7spytify_Artist *)o;
-  PyObject* tmp;
-  if (__pyx_ptype_7spytify_SpotifyObject->tp_clear) {
-    __pyx_ptype_7spytify_SpotifyObject->tp_clear(o);
-  }
-  tmp = ((PyObject*)p->data);
-  p->data = ((struct __pyx_obj_7spytify_ArtistData *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->full_data);
-  p->full_data = ((struct __pyx_obj_7spytify_ArtistDataFull *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static PyObject *__pyx_getprop_7spytify_6Artist_name(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_6Artist_4name___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_6Artist_id(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_6Artist_2id___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_6Artist_text(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_6Artist_4text___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_6Artist_portrait_id(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_6Artist_11portrait_id___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_6Artist_genres(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_6Artist_6genres___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_6Artist_popularity(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_6Artist_10popularity___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_6Artist_albums(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_6Artist_6albums___get__(o);
-}
-
-static struct PyMethodDef __pyx_methods_7spytify_Artist[] = {
-  {__Pyx_NAMESTR("get_uri"), (PyCFunction)__pyx_pf_7spytify_6Artist_get_uri, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("__repr__"), (PyCFunction)__pyx_pf_7spytify_6Artist___repr__, METH_NOARGS|METH_COEXIST, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static struct PyGetSetDef __pyx_getsets_7spytify_Artist[] = {
-  {(char *)"name", __pyx_getprop_7spytify_6Artist_name, 0, 0, 0},
-  {(char *)"id", __pyx_getprop_7spytify_6Artist_id, 0, 0, 0},
-  {(char *)"text", __pyx_getprop_7spytify_6Artist_text, 0, 0, 0},
-  {(char *)"portrait_id", __pyx_getprop_7spytify_6Artist_portrait_id, 0, 0, 0},
-  {(char *)"genres", __pyx_getprop_7spytify_6Artist_genres, 0, 0, 0},
-  {(char *)"popularity", __pyx_getprop_7spytify_6Artist_popularity, 0, 0, 0},
-  {(char *)"albums", __pyx_getprop_7spytify_6Artist_albums, 0, 0, 0},
-  {0, 0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_Artist = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_Artist = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_Artist = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_Artist = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_7spytify_Artist = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("spytify.Artist"), /*tp_name*/
-  sizeof(struct __pyx_obj_7spytify_Artist), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7spytify_Artist, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  __pyx_pf_7spytify_6Artist___repr__, /*tp_repr*/
-  &__pyx_tp_as_number_Artist, /*tp_as_number*/
-  &__pyx_tp_as_sequence_Artist, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_Artist, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_Artist, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_7spytify_Artist, /*tp_traverse*/
-  __pyx_tp_clear_7spytify_Artist, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_7spytify_Artist, /*tp_methods*/
-  0, /*tp_members*/
-  __pyx_getsets_7spytify_Artist, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_7spytify_6Artist___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_7spytify_Artist, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_7spytify_SearchResult __pyx_vtable_7spytify_SearchResult;
-
-static PyObject *__pyx_tp_new_7spytify_SearchResult(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7spytify_SearchResult *p;
-  PyObject *o = __pyx_tp_new_7spytify_SessionStruct(t, a, k);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_7spytify_SearchResult *)o);
-  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_7spytify_SessionStruct*)__pyx_vtabptr_7spytify_SearchResult;
-  p->playlist = ((struct __pyx_obj_7spytify_Playlist *)Py_None); Py_INCREF(Py_None);
-  return o;
-}
-
-static void __pyx_tp_dealloc_7spytify_SearchResult(PyObject *o) {
-  struct __pyx_obj_7spytify_SearchResult *p = (struct __pyx_obj_7spytify_SearchResult *)o;
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
-    __pyx_pf_7spytify_12SearchResult___dealloc__(o);
-    if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
-    --Py_REFCNT(o);
-    PyErr_Restore(etype, eval, etb);
-  }
-  Py_XDECREF(((PyObject *)p->playlist));
-  __pyx_tp_dealloc_7spytify_SessionStruct(o);
-}
-
-static int __pyx_tp_traverse_7spytify_SearchResult(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_7spytify_SearchResult *p = (struct __pyx_obj_7spytify_SearchResult *)o;
-  if (__pyx_ptype_7spytify_SpotifyObject->tp_traverse) {
-    e = __pyx_ptype_7spytify_SpotifyObject->tp_traverse(o, v, a); if (e) return e;
-  }
-  if (p->playlist) {
-    e = (*v)(((PyObject*)p->playlist), a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_7spytify_SearchResult(PyObject *o) {
-  struct __pyx_obj_7spytify_SearchResult *p = (struct __pyx_obj_7spytify_SearchResult *)o;
-  PyObject* tmp;
-  if (__pyx_ptype_7spytify_SpotifyObject->tp_clear) {
-    __pyx_ptype_7spytify_SpotifyObject->tp_clear(o);
-  }
-  tmp = ((PyObject*)p->playlist);
-  p->playlist = ((struct __pyx_obj_7spytify_Playlist *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static PyObject *__pyx_getprop_7spytify_12SearchResult_query(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_12SearchResult_5query___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_12SearchResult_suggestion(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_12SearchResult_10suggestion___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_12SearchResult_total_artists(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_12SearchResult_13total_artists___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_12SearchResult_total_albums(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_12SearchResult_12total_albums___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_12SearchResult_total_tracks(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_12SearchResult_12total_tracks___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_12SearchResult_playlist(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_12SearchResult_8playlist___get__(o);
-}
-
-static struct PyMethodDef __pyx_methods_7spytify_SearchResult[] = {
-  {__Pyx_NAMESTR("get_uri"), (PyCFunction)__pyx_pf_7spytify_12SearchResult_get_uri, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static struct PyGetSetDef __pyx_getsets_7spytify_SearchResult[] = {
-  {(char *)"query", __pyx_getprop_7spytify_12SearchResult_query, 0, 0, 0},
-  {(char *)"suggestion", __pyx_getprop_7spytify_12SearchResult_suggestion, 0, 0, 0},
-  {(char *)"total_artists", __pyx_getprop_7spytify_12SearchResult_total_artists, 0, 0, 0},
-  {(char *)"total_albums", __pyx_getprop_7spytify_12SearchResult_total_albums, 0, 0, 0},
-  {(char *)"total_tracks", __pyx_getprop_7spytify_12SearchResult_total_tracks, 0, 0, 0},
-  {(char *)"playlist", __pyx_getprop_7spytify_12SearchResult_playlist, 0, 0, 0},
-  {0, 0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_SearchResult = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_SearchResult = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_SearchResult = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_SearchResult = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_7spytify_SearchResult = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("spytify.SearchResult"), /*tp_name*/
-  sizeof(struct __pyx_obj_7spytify_SearchResult), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7spytify_SearchResult, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_SearchResult, /*tp_as_number*/
-  &__pyx_tp_as_sequence_SearchResult, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_SearchResult, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_SearchResult, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_7spytify_SearchResult, /*tp_traverse*/
-  __pyx_tp_clear_7spytify_SearchResult, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_7spytify_SearchResult, /*tp_methods*/
-  0, /*tp_members*/
-  __pyx_getsets_7spytify_SearchResult, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_7spytify_12SearchResult___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_7spytify_SearchResult, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_7spytify_Playlist __pyx_vtable_7spytify_Playlist;
-
-static PyObject *__pyx_tp_new_7spytify_Playlist(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7spytify_Playlist *p;
-  PyObject *o = __pyx_tp_new_7spytify_SessionStruct(t, a, k);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_7spytify_Playlist *)o);
-  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_7spytify_SessionStruct*)__pyx_vtabptr_7spytify_Playlist;
-  return o;
-}
-
-static void __pyx_tp_dealloc_7spytify_Playlist(PyObject *o) {
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
-    __pyx_pf_7spytify_8Playlist___dealloc__(o);
-    if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
-    --Py_REFCNT(o);
-    PyErr_Restore(etype, eval, etb);
-  }
-  __pyx_tp_dealloc_7spytify_SessionStruct(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_8Playlist_name(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_8Playlist_4name___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_8Playlist_author(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_8Playlist_6author___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_8Playlist_id(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_8Playlist_2id___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_8Playlist_is_collaborative(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_8Playlist_16is_collaborative___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_8Playlist_tracks(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_8Playlist_6tracks___get__(o);
-}
-
-static struct PyMethodDef __pyx_methods_7spytify_Playlist[] = {
-  {__Pyx_NAMESTR("get_uri"), (PyCFunction)__pyx_pf_7spytify_8Playlist_get_uri, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("__repr__"), (PyCFunction)__pyx_pf_7spytify_8Playlist___repr__, METH_NOARGS|METH_COEXIST, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static struct PyGetSetDef __pyx_getsets_7spytify_Playlist[] = {
-  {(char *)"name", __pyx_getprop_7spytify_8Playlist_name, 0, 0, 0},
-  {(char *)"author", __pyx_getprop_7spytify_8Playlist_author, 0, 0, 0},
-  {(char *)"id", __pyx_getprop_7spytify_8Playlist_id, 0, 0, 0},
-  {(char *)"is_collaborative", __pyx_getprop_7spytify_8Playlist_is_collaborative, 0, 0, 0},
-  {(char *)"tracks", __pyx_getprop_7spytify_8Playlist_tracks, 0, 0, 0},
-  {0, 0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_Playlist = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_Playlist = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_Playlist = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_Playlist = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_7spytify_Playlist = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("spytify.Playlist"), /*tp_name*/
-  sizeof(struct __pyx_obj_7spytify_Playlist), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7spytify_Playlist, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  __pyx_pf_7spytify_8Playlist___repr__, /*tp_repr*/
-  &__pyx_tp_as_number_Playlist, /*tp_as_number*/
-  &__pyx_tp_as_sequence_Playlist, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_Playlist, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_Playlist, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_7spytify_Playlist, /*tp_methods*/
-  0, /*tp_members*/
-  __pyx_getsets_7spytify_Playlist, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_7spytify_8Playlist___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_7spytify_Playlist, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_7spytify_RootList __pyx_vtable_7spytify_RootList;
-
-static PyObject *__pyx_tp_new_7spytify_RootList(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7spytify_RootList *p;
-  PyObject *o = __pyx_tp_new_7spytify_SessionStruct(t, a, k);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_7spytify_RootList *)o);
-  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_7spytify_SessionStruct*)__pyx_vtabptr_7spytify_RootList;
-  p->playlists = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  return o;
-}
-
-static void __pyx_tp_dealloc_7spytify_RootList(PyObject *o) {
-  struct __pyx_obj_7spytify_RootList *p = (struct __pyx_obj_7spytify_RootList *)o;
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
-    __pyx_pf_7spytify_8RootList___dealloc__(o);
-    if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
-    --Py_REFCNT(o);
-    PyErr_Restore(etype, eval, etb);
-  }
-  Py_XDECREF(((PyObject *)p->playlists));
-  __pyx_tp_dealloc_7spytify_SessionStruct(o);
-}
-
-static int __pyx_tp_traverse_7spytify_RootList(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_7spytify_RootList *p = (struct __pyx_obj_7spytify_RootList *)o;
-  if (__pyx_ptype_7spytify_SessionStruct->tp_traverse) {
-    e = __pyx_ptype_7spytify_SessionStruct->tp_traverse(o, v, a); if (e) return e;
-  }
-  if (p->playlists) {
-    e = (*v)(p->playlists, a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_7spytify_RootList(PyObject *o) {
-  struct __pyx_obj_7spytify_RootList *p = (struct __pyx_obj_7spytify_RootList *)o;
-  PyObject* tmp;
-  if (__pyx_ptype_7spytify_SessionStruct->tp_clear) {
-    __pyx_ptype_7spytify_SessionStruct->tp_clear(o);
-  }
-  tmp = ((PyObject*)p->playlists);
-  p->playlists = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-static PyObject *__pyx_sq_item_7spytify_RootList(PyObject *o, Py_ssize_t i) {
-  PyObject *r;
-  PyObject *x = PyInt_FromSsize_t(i); if(!x) return 0;
-  r = Py_TYPE(o)->tp_as_mapping->mp_subscript(o, x);
-  Py_DECREF(x);
-  return r;
-}
-
-static struct PyMethodDef __pyx_methods_7spytify_RootList[] = {
-  {__Pyx_NAMESTR("__getitem__"), (PyCFunction)__pyx_pf_7spytify_8RootList___getitem__, METH_O|METH_COEXIST, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("__iter__"), (PyCFunction)__pyx_pf_7spytify_8RootList___iter__, METH_NOARGS|METH_COEXIST, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("__repr__"), (PyCFunction)__pyx_pf_7spytify_8RootList___repr__, METH_NOARGS|METH_COEXIST, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_RootList = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_RootList = {
-  __pyx_pf_7spytify_8RootList___len__, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  __pyx_sq_item_7spytify_RootList, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  __pyx_pf_7spytify_8RootList___contains__, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_RootList = {
-  __pyx_pf_7spytify_8RootList___len__, /*mp_length*/
-  __pyx_pf_7spytify_8RootList___getitem__, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_RootList = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_7spytify_RootList = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("spytify.RootList"), /*tp_name*/
-  sizeof(struct __pyx_obj_7spytify_RootList), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7spytify_RootList, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  __pyx_pf_7spytify_8RootList___repr__, /*tp_repr*/
-  &__pyx_tp_as_number_RootList, /*tp_as_number*/
-  &__pyx_tp_as_sequence_RootList, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_RootList, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_RootList, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_7spytify_RootList, /*tp_traverse*/
-  __pyx_tp_clear_7spytify_RootList, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  __pyx_pf_7spytify_8RootList___iter__, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_7spytify_RootList, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_7spytify_8RootList___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_7spytify_RootList, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_7spytify_Track __pyx_vtable_7spytify_Track;
-
-static PyObject *__pyx_tp_new_7spytify_Track(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7spytify_Track *p;
-  PyObject *o = __pyx_tp_new_7spytify_SessionStruct(t, a, k);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_7spytify_Track *)o);
-  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_7spytify_SessionStruct*)__pyx_vtabptr_7spytify_Track;
-  return o;
-}
-
-static PyObject *__pyx_getprop_7spytify_5Track_track_id(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Track_8track_id___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_5Track_file_id(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Track_7file_id___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_5Track_title(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Track_5title___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_5Track_artists(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Track_7artists___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_5Track_album(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Track_5album___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_5Track_length(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Track_6length___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_5Track_tracknumber(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Track_11tracknumber___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_5Track_year(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Track_4year___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_5Track_popularity(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_5Track_10popularity___get__(o);
-}
-
-static struct PyMethodDef __pyx_methods_7spytify_Track[] = {
-  {__Pyx_NAMESTR("get_uri"), (PyCFunction)__pyx_pf_7spytify_5Track_get_uri, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("has_meta_data"), (PyCFunction)__pyx_pf_7spytify_5Track_has_meta_data, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("is_playable"), (PyCFunction)__pyx_pf_7spytify_5Track_is_playable, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("__repr__"), (PyCFunction)__pyx_pf_7spytify_5Track___repr__, METH_NOARGS|METH_COEXIST, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static struct PyGetSetDef __pyx_getsets_7spytify_Track[] = {
-  {(char *)"track_id", __pyx_getprop_7spytify_5Track_track_id, 0, 0, 0},
-  {(char *)"file_id", __pyx_getprop_7spytify_5Track_file_id, 0, 0, 0},
-  {(char *)"title", __pyx_getprop_7spytify_5Track_title, 0, 0, 0},
-  {(char *)"artists", __pyx_getprop_7spytify_5Track_artists, 0, 0, 0},
-  {(char *)"album", __pyx_getprop_7spytify_5Track_album, 0, 0, 0},
-  {(char *)"length", __pyx_getprop_7spytify_5Track_length, 0, 0, 0},
-  {(char *)"tracknumber", __pyx_getprop_7spytify_5Track_tracknumber, 0, 0, 0},
-  {(char *)"year", __pyx_getprop_7spytify_5Track_year, 0, 0, 0},
-  {(char *)"popularity", __pyx_getprop_7spytify_5Track_popularity, 0, 0, 0},
-  {0, 0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_Track = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_Track = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_Track = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_Track = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_7spytify_Track = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("spytify.Track"), /*tp_name*/
-  sizeof(struct __pyx_obj_7spytify_Track), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7spytify_SessionStruct, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  __pyx_pf_7spytify_5Track___repr__, /*tp_repr*/
-  &__pyx_tp_as_number_Track, /*tp_as_number*/
-  &__pyx_tp_as_sequence_Track, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_Track, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_Track, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  __pyx_pf_7spytify_5Track___richcmp__, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_7spytify_Track, /*tp_methods*/
-  0, /*tp_members*/
-  __pyx_getsets_7spytify_Track, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_7spytify_5Track___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_7spytify_Track, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_7spytify_Spytify __pyx_vtable_7spytify_Spytify;
-
-static PyObject *__pyx_tp_new_7spytify_Spytify(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7spytify_Spytify *p;
-  PyObject *o = __pyx_tp_new_7spytify_SessionStruct(t, a, k);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_7spytify_Spytify *)o);
-  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_7spytify_SessionStruct*)__pyx_vtabptr_7spytify_Spytify;
-  p->stored_playlists = ((struct __pyx_obj_7spytify_RootList *)Py_None); Py_INCREF(Py_None);
-  p->callback = Py_None; Py_INCREF(Py_None);
-  return o;
-}
-
-static void __pyx_tp_dealloc_7spytify_Spytify(PyObject *o) {
-  struct __pyx_obj_7spytify_Spytify *p = (struct __pyx_obj_7spytify_Spytify *)o;
-  Py_XDECREF(((PyObject *)p->stored_playlists));
-  Py_XDECREF(p->callback);
-  __pyx_tp_dealloc_7spytify_SessionStruct(o);
-}
-
-static int __pyx_tp_traverse_7spytify_Spytify(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_7spytify_Spytify *p = (struct __pyx_obj_7spytify_Spytify *)o;
-  if (__pyx_ptype_7spytify_SessionStruct->tp_traverse) {
-    e = __pyx_ptype_7spytify_SessionStruct->tp_traverse(o, v, a); if (e) return e;
-  }
-  if (p->stored_playlists) {
-    e = (*v)(((PyObject*)p->stored_playlists), a); if (e) return e;
-  }
-  if (p->callback) {
-    e = (*v)(p->callback, a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_7spytify_Spytify(PyObject *o) {
-  struct __pyx_obj_7spytify_Spytify *p = (struct __pyx_obj_7spytify_Spytify *)o;
-  PyObject* tmp;
-  if (__pyx_ptype_7spytify_SessionStruct->tp_clear) {
-    __pyx_ptype_7spytify_SessionStruct->tp_clear(o);
-  }
-  tmp = ((PyObject*)p->stored_playlists);
-  p->stored_playlists = ((struct __pyx_obj_7spytify_RootList *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->callback);
-  p->callback = Py_None; Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static PyObject *__pyx_getprop_7spytify_7Spytify_stored_playlists(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_7Spytify_16stored_playlists___get__(o);
-}
-
-static PyObject *__pyx_getprop_7spytify_7Spytify_current_track(PyObject *o, void *x) {
-  return __pyx_pf_7spytify_7Spytify_13current_track___get__(o);
-}
-
-static struct PyMethodDef __pyx_methods_7spytify_Spytify[] = {
-  {__Pyx_NAMESTR("flush_stored_playlists"), (PyCFunction)__pyx_pf_7spytify_7Spytify_flush_stored_playlists, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_7spytify_7Spytify_flush_stored_playlists)},
-  {__Pyx_NAMESTR("lookup"), (PyCFunction)__pyx_pf_7spytify_7Spytify_lookup, METH_O, __Pyx_DOCSTR(__pyx_doc_7spytify_7Spytify_lookup)},
-  {__Pyx_NAMESTR("search"), (PyCFunction)__pyx_pf_7spytify_7Spytify_search, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_7spytify_7Spytify_search)},
-  {__Pyx_NAMESTR("play_list"), (PyCFunction)__pyx_pf_7spytify_7Spytify_play_list, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_7spytify_7Spytify_play_list)},
-  {__Pyx_NAMESTR("play"), (PyCFunction)__pyx_pf_7spytify_7Spytify_play, METH_O, __Pyx_DOCSTR(__pyx_doc_7spytify_7Spytify_play)},
-  {__Pyx_NAMESTR("stop"), (PyCFunction)__pyx_pf_7spytify_7Spytify_stop, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_7spytify_7Spytify_stop)},
-  {__Pyx_NAMESTR("pause"), (PyCFunction)__pyx_pf_7spytify_7Spytify_pause, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_7spytify_7Spytify_pause)},
-  {__Pyx_NAMESTR("resume"), (PyCFunction)__pyx_pf_7spytify_7Spytify_resume, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_7spytify_7Spytify_resume)},
-  {__Pyx_NAMESTR("next"), (PyCFunction)__pyx_pf_7spytify_7Spytify_next, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_7spytify_7Spytify_next)},
-  {__Pyx_NAMESTR("close"), (PyCFunction)__pyx_pf_7spytify_7Spytify_close, METH_NOARGS, __Pyx_DOCSTR(__pyx_doc_7spytify_7Spytify_close)},
-  {0, 0, 0, 0}
-};
-
-static struct PyGetSetDef __pyx_getsets_7spytify_Spytify[] = {
-  {(char *)"stored_playlists", __pyx_getprop_7spytify_7Spytify_stored_playlists, 0, 0, 0},
-  {(char *)"current_track", __pyx_getprop_7spytify_7Spytify_current_track, 0, 0, 0},
-  {0, 0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_Spytify = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_Spytify = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_Spytify = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_Spytify = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_7spytify_Spytify = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("spytify.Spytify"), /*tp_name*/
-  sizeof(struct __pyx_obj_7spytify_Spytify), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7spytify_Spytify, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_Spytify, /*tp_as_number*/
-  &__pyx_tp_as_sequence_Spytify, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_Spytify, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_Spytify, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  __Pyx_DOCSTR("Class representing a connection to the Spotify service.\n    \n    This should be any scripts \"entrypoint\" into this module; any other\n    class will most likely be instantiated by this class and returned.\n    "), /*tp_doc*/
-  __pyx_tp_traverse_7spytify_Spytify, /*tp_traverse*/
-  __pyx_tp_clear_7spytify_Spytify, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_7spytify_Spytify, /*tp_methods*/
-  0, /*tp_members*/
-  __pyx_getsets_7spytify_Spytify, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_7spytify_7Spytify___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_7spytify_Spytify, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_7spytify_AlbumData __pyx_vtable_7spytify_AlbumData;
-
-static PyObject *__pyx_tp_new_7spytify_AlbumData(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7spytify_AlbumData *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_7spytify_AlbumData *)o);
-  p->__pyx_vtab = __pyx_vtabptr_7spytify_AlbumData;
-  return o;
-}
-
-static void __pyx_tp_dealloc_7spytify_AlbumData(PyObject *o) {
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static struct PyMethodDef __pyx_methods_7spytify_AlbumData[] = {
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_AlbumData = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_AlbumData = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_AlbumData = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_AlbumData = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_7spytify_AlbumData = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("spytify.AlbumData"), /*tp_name*/
-  sizeof(struct __pyx_obj_7spytify_AlbumData), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7spytify_AlbumData, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_AlbumData, /*tp_as_number*/
-  &__pyx_tp_as_sequence_AlbumData, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_AlbumData, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_AlbumData, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_7spytify_AlbumData, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_7spytify_9AlbumData___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_7spytify_AlbumData, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_7spytify_AlbumDataFull __pyx_vtable_7spytify_AlbumDataFull;
-
-static PyObject *__pyx_tp_new_7spytify_AlbumDataFull(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7spytify_AlbumDataFull *p;
-  PyObject *o = __pyx_tp_new_7spytify_AlbumData(t, a, k);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_7spytify_AlbumDataFull *)o);
-  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_7spytify_AlbumData*)__pyx_vtabptr_7spytify_AlbumDataFull;
-  return o;
-}
-
-static struct PyMethodDef __pyx_methods_7spytify_AlbumDataFull[] = {
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_AlbumDataFull = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_AlbumDataFull = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_AlbumDataFull = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_AlbumDataFull = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_7spytify_AlbumDataFull = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("spytify.AlbumDataFull"), /*tp_name*/
-  sizeof(struct __pyx_obj_7spytify_AlbumDataFull), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7spytify_AlbumData, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_AlbumDataFull, /*tp_as_number*/
-  &__pyx_tp_as_sequence_AlbumDataFull, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_AlbumDataFull, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_AlbumDataFull, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_7spytify_AlbumDataFull, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_7spytify_13AlbumDataFull___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_7spytify_AlbumDataFull, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_7spytify_ArtistData __pyx_vtable_7spytify_ArtistData;
-
-static PyObject *__pyx_tp_new_7spytify_ArtistData(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7spytify_ArtistData *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_7spytify_ArtistData *)o);
-  p->__pyx_vtab = __pyx_vtabptr_7spytify_ArtistData;
-  return o;
-}
-
-static void __pyx_tp_dealloc_7spytify_ArtistData(PyObject *o) {
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static struct PyMethodDef __pyx_methods_7spytify_ArtistData[] = {
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_ArtistData = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_ArtistData = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_ArtistData = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_ArtistData = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_7spytify_ArtistData = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("spytify.ArtistData"), /*tp_name*/
-  sizeof(struct __pyx_obj_7spytify_ArtistData), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7spytify_ArtistData, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_ArtistData, /*tp_as_number*/
-  &__pyx_tp_as_sequence_ArtistData, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_ArtistData, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_ArtistData, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_7spytify_ArtistData, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_7spytify_10ArtistData___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_7spytify_ArtistData, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_7spytify_ArtistDataFull __pyx_vtable_7spytify_ArtistDataFull;
-
-static PyObject *__pyx_tp_new_7spytify_ArtistDataFull(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7spytify_ArtistDataFull *p;
-  PyObject *o = __pyx_tp_new_7spytify_ArtistData(t, a, k);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_7spytify_ArtistDataFull *)o);
-  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_7spytify_ArtistData*)__pyx_vtabptr_7spytify_ArtistDataFull;
-  return o;
-}
-
-static struct PyMethodDef __pyx_methods_7spytify_ArtistDataFull[] = {
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_ArtistDataFull = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_ArtistDataFull = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_ArtistDataFull = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_ArtistDataFull = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_7spytify_ArtistDataFull = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("spytify.ArtistDataFull"), /*tp_name*/
-  sizeof(struct __pyx_obj_7spytify_ArtistDataFull), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7spytify_ArtistData, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_ArtistDataFull, /*tp_as_number*/
-  &__pyx_tp_as_sequence_ArtistDataFull, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_ArtistDataFull, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_ArtistDataFull, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_7spytify_ArtistDataFull, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_7spytify_14ArtistDataFull___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_7spytify_ArtistDataFull, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-
-static PyObject *__pyx_tp_new_7spytify_RootIterator(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7spytify_RootIterator *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_7spytify_RootIterator *)o);
-  p->parent = ((struct __pyx_obj_7spytify_RootList *)Py_None); Py_INCREF(Py_None);
-  return o;
-}
-
-static void __pyx_tp_dealloc_7spytify_RootIterator(PyObject *o) {
-  struct __pyx_obj_7spytify_RootIterator *p = (struct __pyx_obj_7spytify_RootIterator *)o;
-  Py_XDECREF(((PyObject *)p->parent));
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static int __pyx_tp_traverse_7spytify_RootIterator(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_7spytify_RootIterator *p = (struct __pyx_obj_7spytify_RootIterator *)o;
-  if (p->parent) {
-    e = (*v)(((PyObject*)p->parent), a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_7spytify_RootIterator(PyObject *o) {
-  struct __pyx_obj_7spytify_RootIterator *p = (struct __pyx_obj_7spytify_RootIterator *)o;
-  PyObject* tmp;
-  tmp = ((PyObject*)p->parent);
-  p->parent = ((struct __pyx_obj_7spytify_RootList *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static struct PyMethodDef __pyx_methods_7spytify_RootIterator[] = {
-  {__Pyx_NAMESTR("__iter__"), (PyCFunction)__pyx_pf_7spytify_12RootIterator___iter__, METH_NOARGS|METH_COEXIST, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("__next__"), (PyCFunction)__pyx_pf_7spytify_12RootIterator___next__, METH_NOARGS|METH_COEXIST, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_RootIterator = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_RootIterator = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_RootIterator = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_RootIterator = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_7spytify_RootIterator = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("spytify.RootIterator"), /*tp_name*/
-  sizeof(struct __pyx_obj_7spytify_RootIterator), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7spytify_RootIterator, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_RootIterator, /*tp_as_number*/
-  &__pyx_tp_as_sequence_RootIterator, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_RootIterator, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_RootIterator, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_7spytify_RootIterator, /*tp_traverse*/
-  __pyx_tp_clear_7spytify_RootIterator, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  __pyx_pf_7spytify_12RootIterator___iter__, /*tp_iter*/
-  __pyx_pf_7spytify_12RootIterator___next__, /*tp_iternext*/
-  __pyx_methods_7spytify_RootIterator, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_7spytify_12RootIterator___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_7spytify_RootIterator, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-
-static struct PyMethodDef __pyx_methods[] = {
-  {__Pyx_NAMESTR("bytestr_to_hexstr"), (PyCFunction)__pyx_pf_7spytify_bytestr_to_hexstr, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("_cleanup"), (PyCFunction)__pyx_pf_7spytify__cleanup, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static void __pyx_init_filenames(void); /*proto*/
-
-#if PY_MAJOR_VERSION >= 3
-static struct PyModuleDef __pyx_moduledef = {
-    PyModuleDef_HEAD_INIT,
-    __Pyx_NAMESTR("spytify"),
-    0, /* m_doc */
-    -1, /* m_size */
-    __pyx_methods /* m_methods */,
-    NULL, /* m_reload */
-    NULL, /* m_traverse */
-    NULL, /* m_clear */
-    NULL /* m_free */
-};
-#endif
-
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_s_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 0, 1, 0},
-  {&__pyx_kp_s_10, __pyx_k_10, sizeof(__pyx_k_10), 0, 0, 1, 0},
-  {&__pyx_kp_s_11, __pyx_k_11, sizeof(__pyx_k_11), 0, 0, 1, 0},
-  {&__pyx_kp_s_12, __pyx_k_12, sizeof(__pyx_k_12), 0, 0, 1, 0},
-  {&__pyx_kp_s_13, __pyx_k_13, sizeof(__pyx_k_13), 0, 0, 1, 0},
-  {&__pyx_kp_s_14, __pyx_k_14, sizeof(__pyx_k_14), 0, 0, 1, 0},
-  {&__pyx_kp_s_15, __pyx_k_15, sizeof(__pyx_k_15), 0, 0, 1, 0},
-  {&__pyx_kp_s_18, __pyx_k_18, sizeof(__pyx_k_18), 0, 0, 1, 0},
-  {&__pyx_kp_s_19, __pyx_k_19, sizeof(__pyx_k_19), 0, 0, 1, 0},
-  {&__pyx_kp_s_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_20, __pyx_k_20, sizeof(__pyx_k_20), 0, 0, 1, 0},
-  {&__pyx_n_s_22, __pyx_k_22, sizeof(__pyx_k_22), 0, 0, 1, 1},
-  {&__pyx_kp_s_23, __pyx_k_23, sizeof(__pyx_k_23), 0, 0, 1, 0},
-  {&__pyx_kp_s_24, __pyx_k_24, sizeof(__pyx_k_24), 0, 0, 1, 0},
-  {&__pyx_kp_s_3, __pyx_k_3, sizeof(__pyx_k_3), 0, 0, 1, 0},
-  {&__pyx_kp_s_4, __pyx_k_4, sizeof(__pyx_k_4), 0, 0, 1, 0},
-  {&__pyx_kp_s_5, __pyx_k_5, sizeof(__pyx_k_5), 0, 0, 1, 0},
-  {&__pyx_kp_s_6, __pyx_k_6, sizeof(__pyx_k_6), 0, 0, 1, 0},
-  {&__pyx_kp_s_7, __pyx_k_7, sizeof(__pyx_k_7), 0, 0, 1, 0},
-  {&__pyx_kp_s_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 0, 1, 0},
-  {&__pyx_kp_s_9, __pyx_k_9, sizeof(__pyx_k_9), 0, 0, 1, 0},
-  {&__pyx_n_s__Exception, __pyx_k__Exception, sizeof(__pyx_k__Exception), 0, 0, 1, 1},
-  {&__pyx_n_s__NotImplemented, __pyx_k__NotImplemented, sizeof(__pyx_k__NotImplemented), 0, 0, 1, 1},
-  {&__pyx_n_s__SpytifyError, __pyx_k__SpytifyError, sizeof(__pyx_k__SpytifyError), 0, 0, 1, 1},
-  {&__pyx_n_s__StopIteration, __pyx_k__StopIteration, sizeof(__pyx_k__StopIteration), 0, 0, 1, 1},
-  {&__pyx_n_s__TypeError, __pyx_k__TypeError, sizeof(__pyx_k__TypeError), 0, 0, 1, 1},
-  {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
-  {&__pyx_n_s___cleanup, __pyx_k___cleanup, sizeof(__pyx_k___cleanup), 0, 0, 1, 1},
-  {&__pyx_n_s__album, __pyx_k__album, sizeof(__pyx_k__album), 0, 0, 1, 1},
-  {&__pyx_n_s__albums, __pyx_k__albums, sizeof(__pyx_k__albums), 0, 0, 1, 1},
-  {&__pyx_n_s__albums_to_list, __pyx_k__albums_to_list, sizeof(__pyx_k__albums_to_list), 0, 0, 1, 1},
-  {&__pyx_n_s__artist, __pyx_k__artist, sizeof(__pyx_k__artist), 0, 0, 1, 1},
-  {&__pyx_n_s__artist_id, __pyx_k__artist_id, sizeof(__pyx_k__artist_id), 0, 0, 1, 1},
-  {&__pyx_n_s__artists, __pyx_k__artists, sizeof(__pyx_k__artists), 0, 0, 1, 1},
-  {&__pyx_n_s__artists_to_list, __pyx_k__artists_to_list, sizeof(__pyx_k__artists_to_list), 0, 0, 1, 1},
-  {&__pyx_n_s__atexit, __pyx_k__atexit, sizeof(__pyx_k__atexit), 0, 0, 1, 1},
-  {&__pyx_n_s__author, __pyx_k__author, sizeof(__pyx_k__author), 0, 0, 1, 1},
-  {&__pyx_n_s__browse, __pyx_k__browse, sizeof(__pyx_k__browse), 0, 0, 1, 1},
-  {&__pyx_n_s__callback, __pyx_k__callback, sizeof(__pyx_k__callback), 0, 0, 1, 1},
-  {&__pyx_n_s__cover_id, __pyx_k__cover_id, sizeof(__pyx_k__cover_id), 0, 0, 1, 1},
-  {&__pyx_n_s__create_album, __pyx_k__create_album, sizeof(__pyx_k__create_album), 0, 0, 1, 1},
-  {&__pyx_n_s__create_album_full, __pyx_k__create_album_full, sizeof(__pyx_k__create_album_full), 0, 0, 1, 1},
-  {&__pyx_n_s__create_artist, __pyx_k__create_artist, sizeof(__pyx_k__create_artist), 0, 0, 1, 1},
-  {&__pyx_n_s__create_artist_full, __pyx_k__create_artist_full, sizeof(__pyx_k__create_artist_full), 0, 0, 1, 1},
-  {&__pyx_n_s__create_playlist, __pyx_k__create_playlist, sizeof(__pyx_k__create_playlist), 0, 0, 1, 1},
-  {&__pyx_n_s__create_rootlist, __pyx_k__create_rootlist, sizeof(__pyx_k__create_rootlist), 0, 0, 1, 1},
-  {&__pyx_n_s__create_track, __pyx_k__create_track, sizeof(__pyx_k__create_track), 0, 0, 1, 1},
-  {&__pyx_n_s__data, __pyx_k__data, sizeof(__pyx_k__data), 0, 0, 1, 1},
-  {&__pyx_n_s__ds, __pyx_k__ds, sizeof(__pyx_k__ds), 0, 0, 1, 1},
-  {&__pyx_n_s__fetch, __pyx_k__fetch, sizeof(__pyx_k__fetch), 0, 0, 1, 1},
-  {&__pyx_n_s__file_id, __pyx_k__file_id, sizeof(__pyx_k__file_id), 0, 0, 1, 1},
-  {&__pyx_n_s__full_data, __pyx_k__full_data, sizeof(__pyx_k__full_data), 0, 0, 1, 1},
-  {&__pyx_n_s__genres, __pyx_k__genres, sizeof(__pyx_k__genres), 0, 0, 1, 1},
-  {&__pyx_n_s__get_full_data, __pyx_k__get_full_data, sizeof(__pyx_k__get_full_data), 0, 0, 1, 1},
-  {&__pyx_n_s__get_uri, __pyx_k__get_uri, sizeof(__pyx_k__get_uri), 0, 0, 1, 1},
-  {&__pyx_n_s__handle, __pyx_k__handle, sizeof(__pyx_k__handle), 0, 0, 1, 1},
-  {&__pyx_n_s__has_meta_data, __pyx_k__has_meta_data, sizeof(__pyx_k__has_meta_data), 0, 0, 1, 1},
-  {&__pyx_n_s__high_bitrate, __pyx_k__high_bitrate, sizeof(__pyx_k__high_bitrate), 0, 0, 1, 1},
-  {&__pyx_n_s__i, __pyx_k__i, sizeof(__pyx_k__i), 0, 0, 1, 1},
-  {&__pyx_n_s__id, __pyx_k__id, sizeof(__pyx_k__id), 0, 0, 1, 1},
-  {&__pyx_n_s__is_collaborative, __pyx_k__is_collaborative, sizeof(__pyx_k__is_collaborative), 0, 0, 1, 1},
-  {&__pyx_n_s__join, __pyx_k__join, sizeof(__pyx_k__join), 0, 0, 1, 1},
-  {&__pyx_n_s__length, __pyx_k__length, sizeof(__pyx_k__length), 0, 0, 1, 1},
-  {&__pyx_n_s__lower, __pyx_k__lower, sizeof(__pyx_k__lower), 0, 0, 1, 1},
-  {&__pyx_n_s__max_hits, __pyx_k__max_hits, sizeof(__pyx_k__max_hits), 0, 0, 1, 1},
-  {&__pyx_n_s__name, __pyx_k__name, sizeof(__pyx_k__name), 0, 0, 1, 1},
-  {&__pyx_n_s__next, __pyx_k__next, sizeof(__pyx_k__next), 0, 0, 1, 1},
-  {&__pyx_n_s__num_albums, __pyx_k__num_albums, sizeof(__pyx_k__num_albums), 0, 0, 1, 1},
-  {&__pyx_n_s__num_tracks, __pyx_k__num_tracks, sizeof(__pyx_k__num_tracks), 0, 0, 1, 1},
-  {&__pyx_n_s__ord, __pyx_k__ord, sizeof(__pyx_k__ord), 0, 0, 1, 1},
-  {&__pyx_n_s__parent, __pyx_k__parent, sizeof(__pyx_k__parent), 0, 0, 1, 1},
-  {&__pyx_n_s__playable, __pyx_k__playable, sizeof(__pyx_k__playable), 0, 0, 1, 1},
-  {&__pyx_n_s__playlist, __pyx_k__playlist, sizeof(__pyx_k__playlist), 0, 0, 1, 1},
-  {&__pyx_n_s__playlist_id, __pyx_k__playlist_id, sizeof(__pyx_k__playlist_id), 0, 0, 1, 1},
-  {&__pyx_n_s__playlists, __pyx_k__playlists, sizeof(__pyx_k__playlists), 0, 0, 1, 1},
-  {&__pyx_n_s__playlists_to_list, __pyx_k__playlists_to_list, sizeof(__pyx_k__playlists_to_list), 0, 0, 1, 1},
-  {&__pyx_n_s__popularity, __pyx_k__popularity, sizeof(__pyx_k__popularity), 0, 0, 1, 1},
-  {&__pyx_n_s__portrait_id, __pyx_k__portrait_id, sizeof(__pyx_k__portrait_id), 0, 0, 1, 1},
-  {&__pyx_n_s__pw, __pyx_k__pw, sizeof(__pyx_k__pw), 0, 0, 1, 1},
-  {&__pyx_n_s__query, __pyx_k__query, sizeof(__pyx_k__query), 0, 0, 1, 1},
-  {&__pyx_n_s__register, __pyx_k__register, sizeof(__pyx_k__register), 0, 0, 1, 1},
-  {&__pyx_n_s__searchtext, __pyx_k__searchtext, sizeof(__pyx_k__searchtext), 0, 0, 1, 1},
-  {&__pyx_n_s__split, __pyx_k__split, sizeof(__pyx_k__split), 0, 0, 1, 1},
-  {&__pyx_n_s__spotify, __pyx_k__spotify, sizeof(__pyx_k__spotify), 0, 0, 1, 1},
-  {&__pyx_n_s__starting_track, __pyx_k__starting_track, sizeof(__pyx_k__starting_track), 0, 0, 1, 1},
-  {&__pyx_n_s__stored_playlists, __pyx_k__stored_playlists, sizeof(__pyx_k__stored_playlists), 0, 0, 1, 1},
-  {&__pyx_n_s__suggestion, __pyx_k__suggestion, sizeof(__pyx_k__suggestion), 0, 0, 1, 1},
-  {&__pyx_n_s__take_owner, __pyx_k__take_owner, sizeof(__pyx_k__take_owner), 0, 0, 1, 1},
-  {&__pyx_n_s__text, __pyx_k__text, sizeof(__pyx_k__text), 0, 0, 1, 1},
-  {&__pyx_n_s__thread, __pyx_k__thread, sizeof(__pyx_k__thread), 0, 0, 1, 1},
-  {&__pyx_n_s__title, __pyx_k__title, sizeof(__pyx_k__title), 0, 0, 1, 1},
-  {&__pyx_n_s__total_albums, __pyx_k__total_albums, sizeof(__pyx_k__total_albums), 0, 0, 1, 1},
-  {&__pyx_n_s__total_artists, __pyx_k__total_artists, sizeof(__pyx_k__total_artists), 0, 0, 1, 1},
-  {&__pyx_n_s__total_tracks, __pyx_k__total_tracks, sizeof(__pyx_k__total_tracks), 0, 0, 1, 1},
-  {&__pyx_n_s__track, __pyx_k__track, sizeof(__pyx_k__track), 0, 0, 1, 1},
-  {&__pyx_n_s__track_id, __pyx_k__track_id, sizeof(__pyx_k__track_id), 0, 0, 1, 1},
-  {&__pyx_n_s__tracknumber, __pyx_k__tracknumber, sizeof(__pyx_k__tracknumber), 0, 0, 1, 1},
-  {&__pyx_n_s__tracks, __pyx_k__tracks, sizeof(__pyx_k__tracks), 0, 0, 1, 1},
-  {&__pyx_n_s__tracks_to_list, __pyx_k__tracks_to_list, sizeof(__pyx_k__tracks_to_list), 0, 0, 1, 1},
-  {&__pyx_n_s__use_cache, __pyx_k__use_cache, sizeof(__pyx_k__use_cache), 0, 0, 1, 1},
-  {&__pyx_n_s__user, __pyx_k__user, sizeof(__pyx_k__user), 0, 0, 1, 1},
-  {&__pyx_n_s__year, __pyx_k__year, sizeof(__pyx_k__year), 0, 0, 1, 1},
-  {&__pyx_n_s__years_active, __pyx_k__years_active, sizeof(__pyx_k__years_active), 0, 0, 1, 1},
-  {0, 0, 0, 0, 0, 0, 0}
-};
-static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_Exception = __Pyx_GetName(__pyx_b, __pyx_n_s__Exception); if (!__pyx_builtin_Exception) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_TypeError = __Pyx_GetName(__pyx_b, __pyx_n_s__TypeError); if (!__pyx_builtin_TypeError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_NotImplemented = __Pyx_GetName(__pyx_b, __pyx_n_s__NotImplemented); if (!__pyx_builtin_NotImplemented) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_StopIteration = __Pyx_GetName(__pyx_b, __pyx_n_s__StopIteration); if (!__pyx_builtin_StopIteration) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_ord = __Pyx_GetName(__pyx_b, __pyx_n_s__ord); if (!__pyx_builtin_ord) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-static int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-#if PY_MAJOR_VERSION < 3
-PyMODINIT_FUNC initspytify(void); /*proto*/
-PyMODINIT_FUNC initspytify(void)
-#else
-PyMODINIT_FUNC PyInit_spytify(void); /*proto*/
-PyMODINIT_FUNC PyInit_spytify(void)
-#endif
-{
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  #if CYTHON_REFNANNY
-  void* __pyx_refnanny = NULL;
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-  if (!__Pyx_RefNanny) {
-      PyErr_Clear();
-      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-      if (!__Pyx_RefNanny)
-          Py_FatalError("failed to import 'refnanny' module");
-  }
-  __pyx_refnanny = __Pyx_RefNanny->SetupContext("PyMODINIT_FUNC PyInit_spytify(void)", __LINE__, __FILE__);
-  #endif
-  __pyx_init_filenames();
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #if PY_MAJOR_VERSION < 3
-  __pyx_empty_bytes = PyString_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #else
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  /*--- Library function declarations ---*/
-  /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
-  PyEval_InitThreads();
-  #endif
-  #endif
-  /*--- Module creation code ---*/
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("spytify"), __pyx_methods, 0, 0, PYTHON_API_VERSION);
-  #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  #endif
-  if (!__pyx_m) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  #if PY_MAJOR_VERSION < 3
-  Py_INCREF(__pyx_m);
-  #endif
-  __pyx_b = PyImport_AddModule(__Pyx_NAMESTR(__Pyx_BUILTIN_MODULE_NAME));
-  if (!__pyx_b) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  if (__Pyx_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  /*--- Initialize various global constants etc. ---*/
-  if (unlikely(__Pyx_InitGlobals() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__pyx_module_is_main_spytify) {
-    if (__Pyx_SetAttrString(__pyx_m, "__name__", __pyx_n_s____main__) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  }
-  /*--- Builtin init code ---*/
-  if (unlikely(__Pyx_InitCachedBuiltins() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Global init code ---*/
-  /*--- Function export code ---*/
-  /*--- Type init code ---*/
-  __pyx_vtabptr_7spytify_SessionStruct = &__pyx_vtable_7spytify_SessionStruct;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_7spytify_SessionStruct.create_album = (struct __pyx_obj_7spytify_Album *(*)(struct __pyx_obj_7spytify_SessionStruct *, struct album *, struct __pyx_opt_args_7spytify_13SessionStruct_create_album *__pyx_optional_args))__pyx_f_7spytify_13SessionStruct_create_album;
-  __pyx_vtable_7spytify_SessionStruct.create_album_full = (struct __pyx_obj_7spytify_Album *(*)(struct __pyx_obj_7spytify_SessionStruct *, struct album_browse *, struct __pyx_opt_args_7spytify_13SessionStruct_create_album_full *__pyx_optional_args))__pyx_f_7spytify_13SessionStruct_create_album_full;
-  __pyx_vtable_7spytify_SessionStruct.create_artist = (struct __pyx_obj_7spytify_Artist *(*)(struct __pyx_obj_7spytify_SessionStruct *, struct artist *, struct __pyx_opt_args_7spytify_13SessionStruct_create_artist *__pyx_optional_args))__pyx_f_7spytify_13SessionStruct_create_artist;
-  __pyx_vtable_7spytify_SessionStruct.create_artist_full = (struct __pyx_obj_7spytify_Artist *(*)(struct __pyx_obj_7spytify_SessionStruct *, struct artist_browse *, struct __pyx_opt_args_7spytify_13SessionStruct_create_artist_full *__pyx_optional_args))__pyx_f_7spytify_13SessionStruct_create_artist_full;
-  __pyx_vtable_7spytify_SessionStruct.create_playlist = (struct __pyx_obj_7spytify_Playlist *(*)(struct __pyx_obj_7spytify_SessionStruct *, struct playlist *, struct __pyx_opt_args_7spytify_13SessionStruct_create_playlist *__pyx_optional_args))__pyx_f_7spytify_13SessionStruct_create_playlist;
-  __pyx_vtable_7spytify_SessionStruct.create_rootlist = (struct __pyx_obj_7spytify_RootList *(*)(struct __pyx_obj_7spytify_SessionStruct *))__pyx_f_7spytify_13SessionStruct_create_rootlist;
-  __pyx_vtable_7spytify_SessionStruct.create_search_result = (struct __pyx_obj_7spytify_SearchResult *(*)(struct __pyx_obj_7spytify_SessionStruct *, struct search_result *, struct __pyx_opt_args_7spytify_13SessionStruct_create_search_result *__pyx_optional_args))__pyx_f_7spytify_13SessionStruct_create_search_result;
-  __pyx_vtable_7spytify_SessionStruct.create_track = (struct __pyx_obj_7spytify_Track *(*)(struct __pyx_obj_7spytify_SessionStruct *, struct track *))__pyx_f_7spytify_13SessionStruct_create_track;
-  __pyx_vtable_7spytify_SessionStruct.albums_to_list = (PyObject *(*)(struct __pyx_obj_7spytify_SessionStruct *, struct album_browse *))__pyx_f_7spytify_13SessionStruct_albums_to_list;
-  __pyx_vtable_7spytify_SessionStruct.artists_to_list = (PyObject *(*)(struct __pyx_obj_7spytify_SessionStruct *, struct artist *))__pyx_f_7spytify_13SessionStruct_artists_to_list;
-  __pyx_vtable_7spytify_SessionStruct.playlists_to_list = (PyObject *(*)(struct __pyx_obj_7spytify_SessionStruct *, struct playlist *))__pyx_f_7spytify_13SessionStruct_playlists_to_list;
-  __pyx_vtable_7spytify_SessionStruct.tracks_to_list = (PyObject *(*)(struct __pyx_obj_7spytify_SessionStruct *, struct track *))__pyx_f_7spytify_13SessionStruct_tracks_to_list;
-  #else
-  *(void(**)(void))&__pyx_vtable_7spytify_SessionStruct.create_album = (void(*)(void))__pyx_f_7spytify_13SessionStruct_create_album;
-  *(void(**)(void))&__pyx_vtable_7spytify_SessionStruct.create_album_full = (void(*)(void))__pyx_f_7spytify_13SessionStruct_create_album_full;
-  *(void(**)(void))&__pyx_vtable_7spytify_SessionStruct.create_artist = (void(*)(void))__pyx_f_7spytify_13SessionStruct_create_artist;
-  *(void(**)(void))&__pyx_vtable_7spytify_SessionStruct.create_artist_full = (void(*)(void))__pyx_f_7spytify_13SessionStruct_create_artist_full;
-  *(void(**)(void))&__pyx_vtable_7spytify_SessionStruct.create_playlist = (void(*)(void))__pyx_f_7spytify_13SessionStruct_create_playlist;
-  *(void(**)(void))&__pyx_vtable_7spytify_SessionStruct.create_rootlist = (void(*)(void))__pyx_f_7spytify_13SessionStruct_create_rootlist;
-  *(void(**)(void))&__pyx_vtable_7spytify_SessionStruct.create_search_result = (void(*)(void))__pyx_f_7spytify_13SessionStruct_create_search_result;
-  *(void(**)(void))&__pyx_vtable_7spytify_SessionStruct.create_track = (void(*)(void))__pyx_f_7spytify_13SessionStruct_create_track;
-  *(void(**)(void))&__pyx_vtable_7spytify_SessionStruct.albums_to_list = (void(*)(void))__pyx_f_7spytify_13SessionStruct_albums_to_list;
-  *(void(**)(void))&__pyx_vtable_7spytify_SessionStruct.artists_to_list = (void(*)(void))__pyx_f_7spytify_13SessionStruct_artists_to_list;
-  *(void(**)(void))&__pyx_vtable_7spytify_SessionStruct.playlists_to_list = (void(*)(void))__pyx_f_7spytify_13SessionStruct_playlists_to_list;
-  *(void(**)(void))&__pyx_vtable_7spytify_SessionStruct.tracks_to_list = (void(*)(void))__pyx_f_7spytify_13SessionStruct_tracks_to_list;
-  #endif
-  if (PyType_Ready(&__pyx_type_7spytify_SessionStruct) < 0) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_7spytify_SessionStruct.tp_dict, __pyx_vtabptr_7spytify_SessionStruct) < 0) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "SessionStruct", (PyObject *)&__pyx_type_7spytify_SessionStruct) < 0) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_7spytify_SessionStruct = &__pyx_type_7spytify_SessionStruct;
-  __pyx_vtabptr_7spytify_SpotifyObject = &__pyx_vtable_7spytify_SpotifyObject;
-  __pyx_vtable_7spytify_SpotifyObject.__pyx_base = *__pyx_vtabptr_7spytify_SessionStruct;
-  __pyx_type_7spytify_SpotifyObject.tp_base = __pyx_ptype_7spytify_SessionStruct;
-  if (PyType_Ready(&__pyx_type_7spytify_SpotifyObject) < 0) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_7spytify_SpotifyObject.tp_dict, __pyx_vtabptr_7spytify_SpotifyObject) < 0) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "SpotifyObject", (PyObject *)&__pyx_type_7spytify_SpotifyObject) < 0) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_7spytify_SpotifyObject = &__pyx_type_7spytify_SpotifyObject;
-  __pyx_vtabptr_7spytify_Album = &__pyx_vtable_7spytify_Album;
-  __pyx_vtable_7spytify_Album.__pyx_base = *__pyx_vtabptr_7spytify_SpotifyObject;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_7spytify_Album.get_full_data = (PyObject *(*)(struct __pyx_obj_7spytify_Album *))__pyx_f_7spytify_5Album_get_full_data;
-  #else
-  *(void(**)(void))&__pyx_vtable_7spytify_Album.get_full_data = (void(*)(void))__pyx_f_7spytify_5Album_get_full_data;
-  #endif
-  __pyx_type_7spytify_Album.tp_base = __pyx_ptype_7spytify_SpotifyObject;
-  if (PyType_Ready(&__pyx_type_7spytify_Album) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_7spytify_Album.tp_dict, __pyx_vtabptr_7spytify_Album) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "Album", (PyObject *)&__pyx_type_7spytify_Album) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_7spytify_Album = &__pyx_type_7spytify_Album;
-  __pyx_vtabptr_7spytify_Artist = &__pyx_vtable_7spytify_Artist;
-  __pyx_vtable_7spytify_Artist.__pyx_base = *__pyx_vtabptr_7spytify_SpotifyObject;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_7spytify_Artist.get_full_data = (PyObject *(*)(struct __pyx_obj_7spytify_Artist *))__pyx_f_7spytify_6Artist_get_full_data;
-  #else
-  *(void(**)(void))&__pyx_vtable_7spytify_Artist.get_full_data = (void(*)(void))__pyx_f_7spytify_6Artist_get_full_data;
-  #endif
-  __pyx_type_7spytify_Artist.tp_base = __pyx_ptype_7spytify_SpotifyObject;
-  if (PyType_Ready(&__pyx_type_7spytify_Artist) < 0) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_7spytify_Artist.tp_dict, __pyx_vtabptr_7spytify_Artist) < 0) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "Artist", (PyObject *)&__pyx_type_7spytify_Artist) < 0) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_7spytify_Artist = &__pyx_type_7spytify_Artist;
-  __pyx_vtabptr_7spytify_SearchResult = &__pyx_vtable_7spytify_SearchResult;
-  __pyx_vtable_7spytify_SearchResult.__pyx_base = *__pyx_vtabptr_7spytify_SpotifyObject;
-  __pyx_type_7spytify_SearchResult.tp_base = __pyx_ptype_7spytify_SpotifyObject;
-  if (PyType_Ready(&__pyx_type_7spytify_SearchResult) < 0) {__pyx_filename = __pyx_f[7]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_7spytify_SearchResult.tp_dict, __pyx_vtabptr_7spytify_SearchResult) < 0) {__pyx_filename = __pyx_f[7]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "SearchResult", (PyObject *)&__pyx_type_7spytify_SearchResult) < 0) {__pyx_filename = __pyx_f[7]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_7spytify_SearchResult = &__pyx_type_7spytify_SearchResult;
-  __pyx_vtabptr_7spytify_Playlist = &__pyx_vtable_7spytify_Playlist;
-  __pyx_vtable_7spytify_Playlist.__pyx_base = *__pyx_vtabptr_7spytify_SpotifyObject;
-  __pyx_type_7spytify_Playlist.tp_base = __pyx_ptype_7spytify_SpotifyObject;
-  if (PyType_Ready(&__pyx_type_7spytify_Playlist) < 0) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_7spytify_Playlist.tp_dict, __pyx_vtabptr_7spytify_Playlist) < 0) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "Playlist", (PyObject *)&__pyx_type_7spytify_Playlist) < 0) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_7spytify_Playlist = &__pyx_type_7spytify_Playlist;
-  __pyx_vtabptr_7spytify_RootList = &__pyx_vtable_7spytify_RootList;
-  __pyx_vtable_7spytify_RootList.__pyx_base = *__pyx_vtabptr_7spytify_SessionStruct;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_7spytify_RootList.fetch = (PyObject *(*)(struct __pyx_obj_7spytify_RootList *))__pyx_f_7spytify_8RootList_fetch;
-  #else
-  *(void(**)(void))&__pyx_vtable_7spytify_RootList.fetch = (void(*)(void))__pyx_f_7spytify_8RootList_fetch;
-  #endif
-  __pyx_type_7spytify_RootList.tp_base = __pyx_ptype_7spytify_SessionStruct;
-  if (PyType_Ready(&__pyx_type_7spytify_RootList) < 0) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_7spytify_RootList.tp_dict, __pyx_vtabptr_7spytify_RootList) < 0) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "RootList", (PyObject *)&__pyx_type_7spytify_RootList) < 0) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_7spytify_RootList = &__pyx_type_7spytify_RootList;
-  __pyx_vtabptr_7spytify_Track = &__pyx_vtable_7spytify_Track;
-  __pyx_vtable_7spytify_Track.__pyx_base = *__pyx_vtabptr_7spytify_SpotifyObject;
-  __pyx_type_7spytify_Track.tp_base = __pyx_ptype_7spytify_SpotifyObject;
-  if (PyType_Ready(&__pyx_type_7spytify_Track) < 0) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_7spytify_Track.tp_dict, __pyx_vtabptr_7spytify_Track) < 0) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "Track", (PyObject *)&__pyx_type_7spytify_Track) < 0) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_7spytify_Track = &__pyx_type_7spytify_Track;
-  __pyx_vtabptr_7spytify_Spytify = &__pyx_vtable_7spytify_Spytify;
-  __pyx_vtable_7spytify_Spytify.__pyx_base = *__pyx_vtabptr_7spytify_SessionStruct;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_7spytify_Spytify.handle = (PyObject *(*)(struct __pyx_obj_7spytify_Spytify *, int, void *))__pyx_f_7spytify_7Spytify_handle;
-  #else
-  *(void(**)(void))&__pyx_vtable_7spytify_Spytify.handle = (void(*)(void))__pyx_f_7spytify_7Spytify_handle;
-  #endif
-  __pyx_type_7spytify_Spytify.tp_base = __pyx_ptype_7spytify_SessionStruct;
-  if (PyType_Ready(&__pyx_type_7spytify_Spytify) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_7spytify_Spytify.tp_dict, __pyx_vtabptr_7spytify_Spytify) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "Spytify", (PyObject *)&__pyx_type_7spytify_Spytify) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_7spytify_Spytify = &__pyx_type_7spytify_Spytify;
-  __pyx_vtabptr_7spytify_AlbumData = &__pyx_vtable_7spytify_AlbumData;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_7spytify_AlbumData.name = (char *(*)(struct __pyx_obj_7spytify_AlbumData *))__pyx_f_7spytify_9AlbumData_name;
-  __pyx_vtable_7spytify_AlbumData.id = (char *(*)(struct __pyx_obj_7spytify_AlbumData *))__pyx_f_7spytify_9AlbumData_id;
-  __pyx_vtable_7spytify_AlbumData.artist = (char *(*)(struct __pyx_obj_7spytify_AlbumData *))__pyx_f_7spytify_9AlbumData_artist;
-  __pyx_vtable_7spytify_AlbumData.artist_id = (char *(*)(struct __pyx_obj_7spytify_AlbumData *))__pyx_f_7spytify_9AlbumData_artist_id;
-  __pyx_vtable_7spytify_AlbumData.cover_id = (char *(*)(struct __pyx_obj_7spytify_AlbumData *))__pyx_f_7spytify_9AlbumData_cover_id;
-  __pyx_vtable_7spytify_AlbumData.popularity = (float (*)(struct __pyx_obj_7spytify_AlbumData *))__pyx_f_7spytify_9AlbumData_popularity;
-  __pyx_vtable_7spytify_AlbumData.next = (struct __pyx_obj_7spytify_AlbumData *(*)(struct __pyx_obj_7spytify_AlbumData *))__pyx_f_7spytify_9AlbumData_next;
-  #else
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumData.name = (void(*)(void))__pyx_f_7spytify_9AlbumData_name;
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumData.id = (void(*)(void))__pyx_f_7spytify_9AlbumData_id;
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumData.artist = (void(*)(void))__pyx_f_7spytify_9AlbumData_artist;
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumData.artist_id = (void(*)(void))__pyx_f_7spytify_9AlbumData_artist_id;
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumData.cover_id = (void(*)(void))__pyx_f_7spytify_9AlbumData_cover_id;
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumData.popularity = (void(*)(void))__pyx_f_7spytify_9AlbumData_popularity;
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumData.next = (void(*)(void))__pyx_f_7spytify_9AlbumData_next;
-  #endif
-  if (PyType_Ready(&__pyx_type_7spytify_AlbumData) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_7spytify_AlbumData.tp_dict, __pyx_vtabptr_7spytify_AlbumData) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "AlbumData", (PyObject *)&__pyx_type_7spytify_AlbumData) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_7spytify_AlbumData = &__pyx_type_7spytify_AlbumData;
-  __pyx_vtabptr_7spytify_AlbumDataFull = &__pyx_vtable_7spytify_AlbumDataFull;
-  __pyx_vtable_7spytify_AlbumDataFull.__pyx_base = *__pyx_vtabptr_7spytify_AlbumData;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_7spytify_AlbumDataFull.__pyx_base.name = (char *(*)(struct __pyx_obj_7spytify_AlbumData *))__pyx_f_7spytify_13AlbumDataFull_name;
-  __pyx_vtable_7spytify_AlbumDataFull.__pyx_base.id = (char *(*)(struct __pyx_obj_7spytify_AlbumData *))__pyx_f_7spytify_13AlbumDataFull_id;
-  __pyx_vtable_7spytify_AlbumDataFull.__pyx_base.cover_id = (char *(*)(struct __pyx_obj_7spytify_AlbumData *))__pyx_f_7spytify_13AlbumDataFull_cover_id;
-  __pyx_vtable_7spytify_AlbumDataFull.__pyx_base.popularity = (float (*)(struct __pyx_obj_7spytify_AlbumData *))__pyx_f_7spytify_13AlbumDataFull_popularity;
-  __pyx_vtable_7spytify_AlbumDataFull.num_tracks = (int (*)(struct __pyx_obj_7spytify_AlbumDataFull *))__pyx_f_7spytify_13AlbumDataFull_num_tracks;
-  __pyx_vtable_7spytify_AlbumDataFull.tracks = (struct track *(*)(struct __pyx_obj_7spytify_AlbumDataFull *))__pyx_f_7spytify_13AlbumDataFull_tracks;
-  __pyx_vtable_7spytify_AlbumDataFull.year = (int (*)(struct __pyx_obj_7spytify_AlbumDataFull *))__pyx_f_7spytify_13AlbumDataFull_year;
-  __pyx_vtable_7spytify_AlbumDataFull.next_full = (struct __pyx_obj_7spytify_AlbumDataFull *(*)(struct __pyx_obj_7spytify_AlbumDataFull *))__pyx_f_7spytify_13AlbumDataFull_next_full;
-  #else
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumDataFull.__pyx_base.name = (void(*)(void))__pyx_f_7spytify_13AlbumDataFull_name;
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumDataFull.__pyx_base.id = (void(*)(void))__pyx_f_7spytify_13AlbumDataFull_id;
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumDataFull.__pyx_base.cover_id = (void(*)(void))__pyx_f_7spytify_13AlbumDataFull_cover_id;
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumDataFull.__pyx_base.popularity = (void(*)(void))__pyx_f_7spytify_13AlbumDataFull_popularity;
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumDataFull.num_tracks = (void(*)(void))__pyx_f_7spytify_13AlbumDataFull_num_tracks;
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumDataFull.tracks = (void(*)(void))__pyx_f_7spytify_13AlbumDataFull_tracks;
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumDataFull.year = (void(*)(void))__pyx_f_7spytify_13AlbumDataFull_year;
-  *(void(**)(void))&__pyx_vtable_7spytify_AlbumDataFull.next_full = (void(*)(void))__pyx_f_7spytify_13AlbumDataFull_next_full;
-  #endif
-  __pyx_type_7spytify_AlbumDataFull.tp_base = __pyx_ptype_7spytify_AlbumData;
-  if (PyType_Ready(&__pyx_type_7spytify_AlbumDataFull) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_7spytify_AlbumDataFull.tp_dict, __pyx_vtabptr_7spytify_AlbumDataFull) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "AlbumDataFull", (PyObject *)&__pyx_type_7spytify_AlbumDataFull) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_7spytify_AlbumDataFull = &__pyx_type_7spytify_AlbumDataFull;
-  __pyx_vtabptr_7spytify_ArtistData = &__pyx_vtable_7spytify_ArtistData;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_7spytify_ArtistData.name = (char *(*)(struct __pyx_obj_7spytify_ArtistData *))__pyx_f_7spytify_10ArtistData_name;
-  __pyx_vtable_7spytify_ArtistData.id = (char *(*)(struct __pyx_obj_7spytify_ArtistData *))__pyx_f_7spytify_10ArtistData_id;
-  __pyx_vtable_7spytify_ArtistData.portrait_id = (char *(*)(struct __pyx_obj_7spytify_ArtistData *))__pyx_f_7spytify_10ArtistData_portrait_id;
-  __pyx_vtable_7spytify_ArtistData.popularity = (float (*)(struct __pyx_obj_7spytify_ArtistData *))__pyx_f_7spytify_10ArtistData_popularity;
-  __pyx_vtable_7spytify_ArtistData.next = (struct __pyx_obj_7spytify_ArtistData *(*)(struct __pyx_obj_7spytify_ArtistData *))__pyx_f_7spytify_10ArtistData_next;
-  #else
-  *(void(**)(void))&__pyx_vtable_7spytify_ArtistData.name = (void(*)(void))__pyx_f_7spytify_10ArtistData_name;
-  *(void(**)(void))&__pyx_vtable_7spytify_ArtistData.id = (void(*)(void))__pyx_f_7spytify_10ArtistData_id;
-  *(void(**)(void))&__pyx_vtable_7spytify_ArtistData.portrait_id = (void(*)(void))__pyx_f_7spytify_10ArtistData_portrait_id;
-  *(void(**)(void))&__pyx_vtable_7spytify_ArtistData.popularity = (void(*)(void))__pyx_f_7spytify_10ArtistData_popularity;
-  *(void(**)(void))&__pyx_vtable_7spytify_ArtistData.next = (void(*)(void))__pyx_f_7spytify_10ArtistData_next;
-  #endif
-  if (PyType_Ready(&__pyx_type_7spytify_ArtistData) < 0) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_7spytify_ArtistData.tp_dict, __pyx_vtabptr_7spytify_ArtistData) < 0) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "ArtistData", (PyObject *)&__pyx_type_7spytify_ArtistData) < 0) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_7spytify_ArtistData = &__pyx_type_7spytify_ArtistData;
-  __pyx_vtabptr_7spytify_ArtistDataFull = &__pyx_vtable_7spytify_ArtistDataFull;
-  __pyx_vtable_7spytify_ArtistDataFull.__pyx_base = *__pyx_vtabptr_7spytify_ArtistData;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_7spytify_ArtistDataFull.__pyx_base.name = (char *(*)(struct __pyx_obj_7spytify_ArtistData *))__pyx_f_7spytify_14ArtistDataFull_name;
-  __pyx_vtable_7spytify_ArtistDataFull.__pyx_base.id = (char *(*)(struct __pyx_obj_7spytify_ArtistData *))__pyx_f_7spytify_14ArtistDataFull_id;
-  __pyx_vtable_7spytify_ArtistDataFull.__pyx_base.portrait_id = (char *(*)(struct __pyx_obj_7spytify_ArtistData *))__pyx_f_7spytify_14ArtistDataFull_portrait_id;
-  __pyx_vtable_7spytify_ArtistDataFull.__pyx_base.popularity = (float (*)(struct __pyx_obj_7spytify_ArtistData *))__pyx_f_7spytify_14ArtistDataFull_popularity;
-  __pyx_vtable_7spytify_ArtistDataFull.text = (char *(*)(struct __pyx_obj_7spytify_ArtistDataFull *))__pyx_f_7spytify_14ArtistDataFull_text;
-  __pyx_vtable_7spytify_ArtistDataFull.genres = (char *(*)(struct __pyx_obj_7spytify_ArtistDataFull *))__pyx_f_7spytify_14ArtistDataFull_genres;
-  __pyx_vtable_7spytify_ArtistDataFull.years_active = (char *(*)(struct __pyx_obj_7spytify_ArtistDataFull *))__pyx_f_7spytify_14ArtistDataFull_years_active;
-  __pyx_vtable_7spytify_ArtistDataFull.num_albums = (int (*)(struct __pyx_obj_7spytify_ArtistDataFull *))__pyx_f_7spytify_14ArtistDataFull_num_albums;
-  __pyx_vtable_7spytify_ArtistDataFull.albums = (struct album_browse *(*)(struct __pyx_obj_7spytify_ArtistDataFull *))__pyx_f_7spytify_14ArtistDataFull_albums;
-  #else
-  *(void(**)(void))&__pyx_vtable_7spytify_ArtistDataFull.__pyx_base.name = (void(*)(void))__pyx_f_7spytify_14ArtistDataFull_name;
-  *(void(**)(void))&__pyx_vtable_7spytify_ArtistDataFull.__pyx_base.id = (void(*)(void))__pyx_f_7spytify_14ArtistDataFull_id;
-  *(void(**)(void))&__pyx_vtable_7spytify_ArtistDataFull.__pyx_base.portrait_id = (void(*)(void))__pyx_f_7spytify_14ArtistDataFull_portrait_id;
-  *(void(**)(void))&__pyx_vtable_7spytify_ArtistDataFull.__pyx_base.popularity = (void(*)(void))__pyx_f_7spytify_14ArtistDataFull_popularity;
-  *(void(**)(void))&__pyx_vtable_7spytify_ArtistDataFull.text = (void(*)(void))__pyx_f_7spytify_14ArtistDataFull_text;
-  *(void(**)(void))&__pyx_vtable_7spytify_ArtistDataFull.genres = (void(*)(void))__pyx_f_7spytify_14ArtistDataFull_genres;
-  *(void(**)(void))&__pyx_vtable_7spytify_ArtistDataFull.years_active = (void(*)(void))__pyx_f_7spytify_14ArtistDataFull_years_active;
-  *(void(**)(void))&__pyx_vtable_7spytify_ArtistDataFull.num_albums = (void(*)(void))__pyx_f_7spytify_14ArtistDataFull_num_albums;
-  *(void(**)(void))&__pyx_vtable_7spytify_ArtistDataFull.albums = (void(*)(void))__pyx_f_7spytify_14ArtistDataFull_albums;
-  #endif
-  __pyx_type_7spytify_ArtistDataFull.tp_base = __pyx_ptype_7spytify_ArtistData;
-  if (PyType_Ready(&__pyx_type_7spytify_ArtistDataFull) < 0) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_7spytify_ArtistDataFull.tp_dict, __pyx_vtabptr_7spytify_ArtistDataFull) < 0) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "ArtistDataFull", (PyObject *)&__pyx_type_7spytify_ArtistDataFull) < 0) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_7spytify_ArtistDataFull = &__pyx_type_7spytify_ArtistDataFull;
-  if (PyType_Ready(&__pyx_type_7spytify_RootIterator) < 0) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "RootIterator", (PyObject *)&__pyx_type_7spytify_RootIterator) < 0) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_7spytify_RootIterator = &__pyx_type_7spytify_RootIterator;
-  /*--- Type import code ---*/
-  /*--- Function import code ---*/
-  /*--- Execution code ---*/
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":1
- * import atexit             # <<<<<<<<<<<<<<
- * 
- * cdef extern from "Python.h":
- */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__atexit), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__atexit, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":8
- * 
- * 
- * class SpytifyError(Exception):             # <<<<<<<<<<<<<<
- *     pass
- * 
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_builtin_Exception);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_builtin_Exception);
-  __Pyx_GIVEREF(__pyx_builtin_Exception);
-  __pyx_t_3 = __Pyx_CreateClass(__pyx_t_2, ((PyObject *)__pyx_t_1), __pyx_n_s__SpytifyError, "spytify"); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__SpytifyError, __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":30
- *     class will most likely be instantiated by this class and returned.
- *     """
- *     def __init__(self, bytes user, bytes pw, bool high_bitrate=True, bool use_cache=True, object callback=None):             # <<<<<<<<<<<<<<
- *         """Create a new Spytify instance, and connect to Spotify.
- * 
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (!(likely(PyBool_Check(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected bool, got %.200s", Py_TYPE(__pyx_t_1)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_k_16 = ((PyObject *)__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (!(likely(PyBool_Check(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected bool, got %.200s", Py_TYPE(__pyx_t_1)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_k_17 = ((PyObject *)__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":110
- *             raise SpytifyError('URI specifies invalid type: %s' % type)
- * 
- *     def search(self, bytes searchtext, int max_hits=MAX_SEARCH_RESULTS):             # <<<<<<<<<<<<<<
- *         """Search for a string like the normal Spotify client.
- * 
- */
-  __pyx_k_21 = MAX_SEARCH_RESULTS;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":182
- *     assert(despotify_cleanup())
- * 
- * assert(despotify_init())             # <<<<<<<<<<<<<<
- * atexit.register(_cleanup)
- */
-  #ifndef PYREX_WITHOUT_ASSERTIONS
-  if (unlikely(!despotify_init())) {
-    PyErr_SetNone(PyExc_AssertionError);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  #endif
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pyx":183
- * 
- * assert(despotify_init())
- * atexit.register(_cleanup)             # <<<<<<<<<<<<<<
- */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__atexit); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__register); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s___cleanup); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/Users/jorgenpt/Projects/despotify/bindings/python/src/spytify.pxd":1
- * from despotify cimport *             # <<<<<<<<<<<<<<
- * cimport audio_thread
- * 
- */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  if (__pyx_m) {
-    __Pyx_AddTraceback("init spytify");
-    Py_DECREF(__pyx_m); __pyx_m = 0;
-  } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init spytify");
-  }
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  #if PY_MAJOR_VERSION < 3
-  return;
-  #else
-  return __pyx_m;
-  #endif
-}
-
-static const char *__pyx_filenames[] = {
-  "spytify.pyx",
-  "album.pxi",
-  "track.pxi",
-  "playlist.pxi",
-  "sessionstruct.pxi",
-  "spotifyobject.pxi",
-  "artist.pxi",
-  "searchresult.pxi",
-};
-
-/* Runtime support code */
-
-static void __pyx_init_filenames(void) {
-  __pyx_f = __pyx_filenames;
-}
-
-static INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
-    if (unlikely(!type)) {
-        PyErr_Format(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (likely(PyObject_TypeCheck(obj, type)))
-        return 1;
-    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
-                 Py_TYPE(obj)->tp_name, type->tp_name);
-    return 0;
-}
-
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *number, *more_or_less;
-
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
-    } else {
-        num_expected = num_max;
-        more_or_less = "at most";
-    }
-    if (exact) {
-        more_or_less = "exactly";
-    }
-    number = (num_expected == 1) ? "" : "s";
-    PyErr_Format(PyExc_TypeError,
-        #if PY_VERSION_HEX < 0x02050000
-            "%s() takes %s %d positional argument%s (%d given)",
-        #else
-            "%s() takes %s %zd positional argument%s (%zd given)",
-        #endif
-        func_name, more_or_less, num_expected, number, num_found);
-}
-
-static INLINE int __Pyx_CheckKeywordStrings(
-    PyObject *kwdict,
-    const char* function_name,
-    int kw_allowed)
-{
-    PyObject* key = 0;
-    Py_ssize_t pos = 0;
-    while (PyDict_Next(kwdict, &pos, &key, 0)) {
-        #if PY_MAJOR_VERSION < 3
-        if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key)))
-        #else
-        if (unlikely(!PyUnicode_CheckExact(key)) && unlikely(!PyUnicode_Check(key)))
-        #endif
-            goto invalid_keyword_type;
-    }
-    if ((!kw_allowed) && unlikely(key))
-        goto invalid_keyword;
-    return 1;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%s() keywords must be strings", function_name);
-    return 0;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%s() got an unexpected keyword argument '%s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-    return 0;
-}
-
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name,
-    PyObject* kw_name)
-{
-    PyErr_Format(PyExc_TypeError,
-        #if PY_MAJOR_VERSION >= 3
-        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
-        #else
-        "%s() got multiple values for keyword argument '%s'", func_name,
-        PyString_AS_STRING(kw_name));
-        #endif
-}
-
-static int __Pyx_ParseOptionalKeywords(
-    PyObject *kwds,
-    PyObject **argnames[],
-    PyObject *kwds2,
-    PyObject *values[],
-    Py_ssize_t num_pos_args,
-    const char* function_name)
-{
-    PyObject *key = 0, *value = 0;
-    Py_ssize_t pos = 0;
-    PyObject*** name;
-    PyObject*** first_kw_arg = argnames + num_pos_args;
-
-    while (PyDict_Next(kwds, &pos, &key, &value)) {
-        name = first_kw_arg;
-        while (*name && (**name != key)) name++;
-        if (*name) {
-            values[name-argnames] = value;
-        } else {
-            #if PY_MAJOR_VERSION < 3
-            if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key))) {
-            #else
-            if (unlikely(!PyUnicode_CheckExact(key)) && unlikely(!PyUnicode_Check(key))) {
-            #endif
-                goto invalid_keyword_type;
-            } else {
-                for (name = first_kw_arg; *name; name++) {
-                    #if PY_MAJOR_VERSION >= 3
-                    if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
-                        PyUnicode_Compare(**name, key) == 0) break;
-                    #else
-                    if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
-                        _PyString_Eq(**name, key)) break;
-                    #endif
-                }
-                if (*name) {
-                    values[name-argnames] = value;
-                } else {
-                    /* unexpected keyword found */
-                    for (name=argnames; name != first_kw_arg; name++) {
-                        if (**name == key) goto arg_passed_twice;
-                        #if PY_MAJOR_VERSION >= 3
-                        if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
-                            PyUnicode_Compare(**name, key) == 0) goto arg_passed_twice;
-                        #else
-                        if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
-                            _PyString_Eq(**name, key)) goto arg_passed_twice;
-                        #endif
-                    }
-                    if (kwds2) {
-                        if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-                    } else {
-                        goto invalid_keyword;
-                    }
-                }
-            }
-        }
-    }
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, **name);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%s() got an unexpected keyword argument '%s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-bad:
-    return -1;
-}
-
-
-static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact)
-{
-    if (!type) {
-        PyErr_Format(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (none_allowed && obj == Py_None) return 1;
-    else if (exact) {
-        if (Py_TYPE(obj) == type) return 1;
-    }
-    else {
-        if (PyObject_TypeCheck(obj, type)) return 1;
-    }
-    PyErr_Format(PyExc_TypeError,
-        "Argument '%s' has incorrect type (expected %s, got %s)",
-        name, type->tp_name, Py_TYPE(obj)->tp_name);
-    return 0;
-}
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list) {
-    PyObject *__import__ = 0;
-    PyObject *empty_list = 0;
-    PyObject *module = 0;
-    PyObject *global_dict = 0;
-    PyObject *empty_dict = 0;
-    PyObject *list;
-    __import__ = __Pyx_GetAttrString(__pyx_b, "__import__");
-    if (!__import__)
-        goto bad;
-    if (from_list)
-        list = from_list;
-    else {
-        empty_list = PyList_New(0);
-        if (!empty_list)
-            goto bad;
-        list = empty_list;
-    }
-    global_dict = PyModule_GetDict(__pyx_m);
-    if (!global_dict)
-        goto bad;
-    empty_dict = PyDict_New();
-    if (!empty_dict)
-        goto bad;
-    module = PyObject_CallFunctionObjArgs(__import__,
-        name, global_dict, empty_dict, list, NULL);
-bad:
-    Py_XDECREF(empty_list);
-    Py_XDECREF(__import__);
-    Py_XDECREF(empty_dict);
-    return module;
-}
-
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
-    PyObject *result;
-    result = PyObject_GetAttr(dict, name);
-    if (!result)
-        PyErr_SetObject(PyExc_NameError, name);
-    return result;
-}
-
-static PyObject *__Pyx_CreateClass(
-    PyObject *bases, PyObject *dict, PyObject *name, const char *modname)
-{
-    PyObject *py_modname;
-    PyObject *result = 0;
-
-    #if PY_MAJOR_VERSION < 3
-    py_modname = PyString_FromString(modname);
-    #else
-    py_modname = PyUnicode_FromString(modname);
-    #endif
-    if (!py_modname)
-        goto bad;
-    if (PyDict_SetItemString(dict, "__module__", py_modname) < 0)
-        goto bad;
-    #if PY_MAJOR_VERSION < 3
-    result = PyClass_New(bases, dict, name);
-    #else
-    result = PyObject_CallFunctionObjArgs((PyObject *)&PyType_Type, name, bases, dict, NULL);
-    #endif
-bad:
-    Py_XDECREF(py_modname);
-    return result;
-}
-
-static INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-
-static INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-}
-
-
-#if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
-    Py_XINCREF(type);
-    Py_XINCREF(value);
-    Py_XINCREF(tb);
-    /* First, check the traceback argument, replacing None with NULL. */
-    if (tb == Py_None) {
-        Py_DECREF(tb);
-        tb = 0;
-    }
-    else if (tb != NULL && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto raise_error;
-    }
-    /* Next, replace a missing value with None */
-    if (value == NULL) {
-        value = Py_None;
-        Py_INCREF(value);
-    }
-    #if PY_VERSION_HEX < 0x02050000
-    if (!PyClass_Check(type))
-    #else
-    if (!PyType_Check(type))
-    #endif
-    {
-        /* Raising an instance.  The value should be a dummy. */
-        if (value != Py_None) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        /* Normalize to raise <class>, <instance> */
-        Py_DECREF(value);
-        value = type;
-        #if PY_VERSION_HEX < 0x02050000
-            if (PyInstance_Check(type)) {
-                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
-                Py_INCREF(type);
-            }
-            else {
-                type = 0;
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception must be an old-style class or instance");
-                goto raise_error;
-            }
-        #else
-            type = (PyObject*) Py_TYPE(type);
-            Py_INCREF(type);
-            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception class must be a subclass of BaseException");
-                goto raise_error;
-            }
-        #endif
-    }
-
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
-}
-
-#else /* Python 3+ */
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
-    }
-    if (value == Py_None)
-        value = 0;
-
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (!PyExceptionClass_Check(type)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-
-    PyErr_SetObject(type, value);
-
-    if (tb) {
-        PyThreadState *tstate = PyThreadState_GET();
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
-    }
-
-bad:
-    return;
-}
-#endif
-
-static INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
-    const unsigned char neg_one = (unsigned char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned char" :
-                    "value too large to convert to unsigned char");
-            }
-            return (unsigned char)-1;
-        }
-        return (unsigned char)val;
-    }
-    return (unsigned char)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
-    const unsigned short neg_one = (unsigned short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned short" :
-                    "value too large to convert to unsigned short");
-            }
-            return (unsigned short)-1;
-        }
-        return (unsigned short)val;
-    }
-    return (unsigned short)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
-    const unsigned int neg_one = (unsigned int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned int" :
-                    "value too large to convert to unsigned int");
-            }
-            return (unsigned int)-1;
-        }
-        return (unsigned int)val;
-    }
-    return (unsigned int)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
-    const char neg_one = (char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to char" :
-                    "value too large to convert to char");
-            }
-            return (char)-1;
-        }
-        return (char)val;
-    }
-    return (char)__Pyx_PyInt_AsLong(x);
-}
-
-static INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
-    const short neg_one = (short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to short" :
-                    "value too large to convert to short");
-            }
-            return (short)-1;
-        }
-        return (short)val;
-    }
-    return (short)__Pyx_PyInt_AsLong(x);
-}
-
-static INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
-    const int neg_one = (int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to int" :
-                    "value too large to convert to int");
-            }
-            return (int)-1;
-        }
-        return (int)val;
-    }
-    return (int)__Pyx_PyInt_AsLong(x);
-}
-
-static INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
-    const signed char neg_one = (signed char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed char" :
-                    "value too large to convert to signed char");
-            }
-            return (signed char)-1;
-        }
-        return (signed char)val;
-    }
-    return (signed char)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
-    const signed short neg_one = (signed short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed short" :
-                    "value too large to convert to signed short");
-            }
-            return (signed short)-1;
-        }
-        return (signed short)val;
-    }
-    return (signed short)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
-    const signed int neg_one = (signed int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed int" :
-                    "value too large to convert to signed int");
-            }
-            return (signed int)-1;
-        }
-        return (signed int)val;
-    }
-    return (signed int)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
-    const unsigned long neg_one = (unsigned long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to unsigned long");
-            return (unsigned long)-1;
-        }
-        return (unsigned long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to unsigned long");
-                return (unsigned long)-1;
-            }
-            return PyLong_AsUnsignedLong(x);
-        } else {
-            return PyLong_AsLong(x);
-        }
-    } else {
-        unsigned long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (unsigned long)-1;
-        val = __Pyx_PyInt_AsUnsignedLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x) {
-    const unsigned PY_LONG_LONG neg_one = (unsigned PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to unsigned PY_LONG_LONG");
-            return (unsigned PY_LONG_LONG)-1;
-        }
-        return (unsigned PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to unsigned PY_LONG_LONG");
-                return (unsigned PY_LONG_LONG)-1;
-            }
-            return PyLong_AsUnsignedLongLong(x);
-        } else {
-            return PyLong_AsLongLong(x);
-        }
-    } else {
-        unsigned PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (unsigned PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsUnsignedLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
-    const long neg_one = (long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to long");
-            return (long)-1;
-        }
-        return (long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to long");
-                return (long)-1;
-            }
-            return PyLong_AsUnsignedLong(x);
-        } else {
-            return PyLong_AsLong(x);
-        }
-    } else {
-        long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (long)-1;
-        val = __Pyx_PyInt_AsLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
-    const PY_LONG_LONG neg_one = (PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to PY_LONG_LONG");
-            return (PY_LONG_LONG)-1;
-        }
-        return (PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to PY_LONG_LONG");
-                return (PY_LONG_LONG)-1;
-            }
-            return PyLong_AsUnsignedLongLong(x);
-        } else {
-            return PyLong_AsLongLong(x);
-        }
-    } else {
-        PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
-    const signed long neg_one = (signed long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to signed long");
-            return (signed long)-1;
-        }
-        return (signed long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to signed long");
-                return (signed long)-1;
-            }
-            return PyLong_AsUnsignedLong(x);
-        } else {
-            return PyLong_AsLong(x);
-        }
-    } else {
-        signed long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (signed long)-1;
-        val = __Pyx_PyInt_AsSignedLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject* x) {
-    const signed PY_LONG_LONG neg_one = (signed PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to signed PY_LONG_LONG");
-            return (signed PY_LONG_LONG)-1;
-        }
-        return (signed PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to signed PY_LONG_LONG");
-                return (signed PY_LONG_LONG)-1;
-            }
-            return PyLong_AsUnsignedLongLong(x);
-        } else {
-            return PyLong_AsLongLong(x);
-        }
-    } else {
-        signed PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (signed PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsSignedLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static void __Pyx_WriteUnraisable(const char *name) {
-    PyObject *old_exc, *old_val, *old_tb;
-    PyObject *ctx;
-    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
-    #if PY_MAJOR_VERSION < 3
-    ctx = PyString_FromString(name);
-    #else
-    ctx = PyUnicode_FromString(name);
-    #endif
-    __Pyx_ErrRestore(old_exc, old_val, old_tb);
-    if (!ctx) {
-        PyErr_WriteUnraisable(Py_None);
-    } else {
-        PyErr_WriteUnraisable(ctx);
-        Py_DECREF(ctx);
-    }
-}
-
-static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
-#if PY_VERSION_HEX < 0x03010000
-    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
-#else
-    PyObject *ob = PyCapsule_New(vtable, 0, 0);
-#endif
-    if (!ob)
-        goto bad;
-    if (PyDict_SetItemString(dict, "__pyx_vtable__", ob) < 0)
-        goto bad;
-    Py_DECREF(ob);
-    return 0;
-bad:
-    Py_XDECREF(ob);
-    return -1;
-}
-
-#include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
-
-static void __Pyx_AddTraceback(const char *funcname) {
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
-    PyObject *py_globals = 0;
-    PyCodeObject *py_code = 0;
-    PyFrameObject *py_frame = 0;
-
-    #if PY_MAJOR_VERSION < 3
-    py_srcfile = PyString_FromString(__pyx_filename);
-    #else
-    py_srcfile = PyUnicode_FromString(__pyx_filename);
-    #endif
-    if (!py_srcfile) goto bad;
-    if (__pyx_clineno) {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
-        #else
-        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
-        #endif
-    }
-    else {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
-        #endif
-    }
-    if (!py_funcname) goto bad;
-    py_globals = PyModule_GetDict(__pyx_m);
-    if (!py_globals) goto bad;
-    py_code = PyCode_New(
-        0,            /*int argcount,*/
-        #if PY_MAJOR_VERSION >= 3
-        0,            /*int kwonlyargcount,*/
-        #endif
-        0,            /*int nlocals,*/
-        0,            /*int stacksize,*/
-        0,            /*int flags,*/
-        __pyx_empty_bytes, /*PyObject *code,*/
-        __pyx_empty_tuple,  /*PyObject *consts,*/
-        __pyx_empty_tuple,  /*PyObject *names,*/
-        __pyx_empty_tuple,  /*PyObject *varnames,*/
-        __pyx_empty_tuple,  /*PyObject *freevars,*/
-        __pyx_empty_tuple,  /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        __pyx_lineno,   /*int firstlineno,*/
-        __pyx_empty_bytes  /*PyObject *lnotab*/
-    );
-    if (!py_code) goto bad;
-    py_frame = PyFrame_New(
-        PyThreadState_GET(), /*PyThreadState *tstate,*/
-        py_code,             /*PyCodeObject *code,*/
-        py_globals,          /*PyObject *globals,*/
-        0                    /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    py_frame->f_lineno = __pyx_lineno;
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_srcfile);
-    Py_XDECREF(py_funcname);
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
-}
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
-    while (t->p) {
-        #if PY_MAJOR_VERSION < 3
-        if (t->is_unicode) {
-            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
-        } else if (t->intern) {
-            *t->p = PyString_InternFromString(t->s);
-        } else {
-            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
-        }
-        #else  /* Python 3+ has unicode identifiers */
-        if (t->is_unicode | t->is_str) {
-            if (t->intern) {
-                *t->p = PyUnicode_InternFromString(t->s);
-            } else if (t->encoding) {
-                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
-            } else {
-                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
-            }
-        } else {
-            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
-        }
-        #endif
-        if (!*t->p)
-            return -1;
-        ++t;
-    }
-    return 0;
-}
-
-/* Type Conversion Functions */
-
-static INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
-   if (x == Py_True) return 1;
-   else if ((x == Py_False) | (x == Py_None)) return 0;
-   else return PyObject_IsTrue(x);
-}
-
-static INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
-  PyNumberMethods *m;
-  const char *name = NULL;
-  PyObject *res = NULL;
-#if PY_VERSION_HEX < 0x03000000
-  if (PyInt_Check(x) || PyLong_Check(x))
-#else
-  if (PyLong_Check(x))
-#endif
-    return Py_INCREF(x), x;
-  m = Py_TYPE(x)->tp_as_number;
-#if PY_VERSION_HEX < 0x03000000
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Int(x);
-  }
-  else if (m && m->nb_long) {
-    name = "long";
-    res = PyNumber_Long(x);
-  }
-#else
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Long(x);
-  }
-#endif
-  if (res) {
-#if PY_VERSION_HEX < 0x03000000
-    if (!PyInt_Check(res) && !PyLong_Check(res)) {
-#else
-    if (!PyLong_Check(res)) {
-#endif
-      PyErr_Format(PyExc_TypeError,
-                   "__%s__ returned non-%s (type %.200s)",
-                   name, name, Py_TYPE(res)->tp_name);
-      Py_DECREF(res);
-      return NULL;
-    }
-  }
-  else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_TypeError,
-                    "an integer is required");
-  }
-  return res;
-}
-
-static INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
-  Py_ssize_t ival;
-  PyObject* x = PyNumber_Index(b);
-  if (!x) return -1;
-  ival = PyInt_AsSsize_t(x);
-  Py_DECREF(x);
-  return ival;
-}
-
-static INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
-#if PY_VERSION_HEX < 0x02050000
-   if (ival <= LONG_MAX)
-       return PyInt_FromLong((long)ival);
-   else {
-       unsigned char *bytes = (unsigned char *) &ival;
-       int one = 1; int little = (int)*(unsigned char*)&one;
-       return _PyLong_FromByteArray(bytes, sizeof(size_t), little, 0);
-   }
-#else
-   return PyInt_FromSize_t(ival);
-#endif
-}
-
-static INLINE size_t __Pyx_PyInt_AsSize_t(PyObject* x) {
-   unsigned PY_LONG_LONG val = __Pyx_PyInt_AsUnsignedLongLong(x);
-   if (unlikely(val == (unsigned PY_LONG_LONG)-1 && PyErr_Occurred())) {
-       return (size_t)-1;
-   } else if (unlikely(val != (unsigned PY_LONG_LONG)(size_t)val)) {
-       PyErr_SetString(PyExc_OverflowError,
-                       "value too large to convert to size_t");
-       return (size_t)-1;
-   }
-   return (size_t)val;
-}
-
-
-#endif /* Py_PYTHON_H */
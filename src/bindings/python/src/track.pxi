@@ -5,9 +5,10 @@ cdef class Track(SpotifyObject):
         raise TypeError("This class cannot be instantiated from Python")
 
     def get_uri(self):
-        cdef char uri_id[23]
-        despotify_id2uri(self.track_id, uri_id)
-        return 'spotify:track:%s' % uri_id
+        return 'spotify:track:' + hex_to_base62(<char*>self.data.track_id)
+
+    cdef SpotifyId get_spotify_id(self):
+        return id_from_hex(<char*>self.data.track_id)
 
     property track_id:
         def __get__(self):
@@ -29,12 +30,29 @@ cdef class Track(SpotifyObject):
 
     property artists:
         def __get__(self):
-            return self.artists_to_list(self.data.artist)
+            if self.artist_list is None:
+                self.artist_list = self.create_lazy_list(LAZY_ARTISTS,
+                                                         self.data.artist)
+            return self.artist_list
+
+    property artist_names:
+        """Names of the artists, without creating Artist objects."""
+        def __get__(self):
+            cdef artist* a = self.data.artist
+            names = []
+            while a:
+                names.append(<char*>a.name)
+                a = a.next
+            return names
 
     property album:
         def __get__(self):
             return self.data.album
 
+    property album_id:
+        def __get__(self):
+            return <char*>self.data.album_id
+
     property length:
         def __get__(self):
             return self.data.length
@@ -51,13 +69,12 @@ cdef class Track(SpotifyObject):
         def __get__(self):
             return self.data.popularity
 
-    def __richcmp__(Track self, Track other, int operator):
-        if not isinstance(other, Track):
-           return NotImplemented
-        if operator == 2:
-           return self.data.track_id == other.data.track_id
-        else:
-           return NotImplemented
-
     def __repr__(self):
-        return '<Track: %s - %s - %s (%s)>' % (", ".join([a.name for a in self.artists]), self.title, self.album, self.track_id)
+        return '<Track: %s - %s - %s (%s)>' % (", ".join(self.artist_names), self.title, self.album, self.track_id)
+
+cdef class OwnedTrack:
+    """Frees a track struct of its own, and the tracks chained after it,
+    once the Tracks using them are gone."""
+    def __dealloc__(self):
+        if self.data != NULL:
+            despotify_free_track(self.data)
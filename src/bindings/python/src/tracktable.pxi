@@ -0,0 +1,175 @@
+# vim: set fileencoding=utf-8 filetype=pyrex :
+from array import array
+
+cdef extern from "spytify.h":
+    cdef TrackTable NEW_TRACKTABLE "PY_NEW" (object t)
+
+cdef class TrackTable:
+    """Compact, columnar copy of a list of tracks.
+
+    Ids are stored as fixed width byte strings, numbers in arrays, and
+    titles, artist and album names as indices into a table of unique
+    strings. Indexing the table returns a TrackRow, which reads its
+    values from the table when they're accessed.
+    """
+    def __init__(self):
+        raise TypeError("This class cannot be instantiated from Python")
+
+    cdef int intern(self, char* s):
+        cdef bytes value = s
+        index = self.string_index.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(value)
+            self.string_index[value] = index
+
+        return index
+
+    cdef bytes fixed_id(self, bytes column, int width, int index):
+        return column[index * width:(index + 1) * width].rstrip(b'\0')
+
+    def column(self, name):
+        """Returns the values of a TrackRow attribute for all rows."""
+        return [getattr(row, name) for row in self]
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [TrackRow(self, i) for i in range(*index.indices(self.rows))]
+
+        if index < 0:
+            index += self.rows
+        if index < 0 or index >= self.rows:
+            raise IndexError('TrackTable index out of range')
+
+        return TrackRow(self, index)
+
+    def __repr__(self):
+        return '<TrackTable: %d tracks, %d strings>' % (self.rows,
+                                                        len(self.strings))
+
+cdef class TrackRow:
+    """A track in a TrackTable."""
+    def __init__(self, TrackTable table, int index):
+        self.table = table
+        self.index = index
+
+    def get_uri(self):
+        return 'spotify:track:' + hex_to_base62(self.track_id)
+
+    property track_id:
+        def __get__(self):
+            return self.table.fixed_id(self.table.track_ids, 32, self.index)
+
+    property spotify_id:
+        def __get__(self):
+            return id_from_hex(self.track_id)
+
+    property file_id:
+        def __get__(self):
+            return self.table.fixed_id(self.table.file_ids, 40, self.index)
+
+    property album_id:
+        def __get__(self):
+            return self.table.fixed_id(self.table.album_ids, 32, self.index)
+
+    def has_meta_data(self):
+        return bool(self.table.has_meta_data[self.index])
+
+    def is_playable(self):
+        return bool(self.table.playable[self.index])
+
+    property title:
+        def __get__(self):
+            return self.table.strings[self.table.titles[self.index]]
+
+    property artist_names:
+        def __get__(self):
+            cdef int start = self.table.artist_offsets[self.index]
+            cdef int end = self.table.artist_offsets[self.index + 1]
+            return [self.table.strings[i]
+                    for i in self.table.artist_names[start:end]]
+
+    property album:
+        def __get__(self):
+            return self.table.strings[self.table.albums[self.index]]
+
+    property length:
+        def __get__(self):
+            return self.table.lengths[self.index]
+
+    property tracknumber:
+        def __get__(self):
+            return self.table.tracknumbers[self.index]
+
+    property year:
+        def __get__(self):
+            return self.table.years[self.index]
+
+    property popularity:
+        def __get__(self):
+            return self.table.popularity[self.index]
+
+    def __repr__(self):
+        return '<TrackRow: %s - %s - %s (%s)>' % (", ".join(self.artist_names), self.title, self.album, self.track_id)
+
+cdef bytes fixed_width(char* s, int width):
+    cdef bytes value = s
+    return value[:width].ljust(width, b'\0')
+
+cdef TrackTable create_track_table(track* tracks):
+    """Copy a linked list of tracks into a new TrackTable."""
+    cdef TrackTable table = NEW_TRACKTABLE(TrackTable)
+    cdef list track_ids = []
+    cdef list file_ids = []
+    cdef list album_ids = []
+    cdef artist* a
+
+    table.rows = 0
+    table.strings = []
+    table.string_index = {}
+    table.has_meta_data = array('b')
+    table.playable = array('b')
+    table.titles = array('i')
+    table.artist_offsets = array('i', [0])
+    table.artist_names = array('i')
+    table.albums = array('i')
+    table.lengths = array('i')
+    table.tracknumbers = array('i')
+    table.years = array('i')
+    table.popularity = array('f')
+
+    while tracks:
+        track_ids.append(fixed_width(<char*>tracks.track_id, 32))
+        file_ids.append(fixed_width(<char*>tracks.file_id, 40))
+        album_ids.append(fixed_width(<char*>tracks.album_id, 32))
+
+        table.has_meta_data.append(tracks.has_meta_data)
+        table.playable.append(tracks.playable)
+        table.titles.append(table.intern(tracks.title))
+
+        a = tracks.artist
+        while a:
+            table.artist_names.append(table.intern(a.name))
+            a = a.next
+        table.artist_offsets.append(len(table.artist_names))
+
+        table.albums.append(table.intern(tracks.album))
+        table.lengths.append(tracks.length)
+        table.tracknumbers.append(tracks.tracknumber)
+        table.years.append(tracks.year)
+        table.popularity.append(tracks.popularity)
+
+        table.rows += 1
+        tracks = tracks.next
+
+    table.track_ids = b''.join(track_ids)
+    table.file_ids = b''.join(file_ids)
+    table.album_ids = b''.join(album_ids)
+
+    # Only needed while building the table.
+    table.string_index = None
+
+    return table
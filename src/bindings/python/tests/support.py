@@ -0,0 +1,57 @@
+# vim: set fileencoding=utf-8 :
+# Shared setup of the spytify tests: a fake server from clients/fakeserver
+# for the sessions to log in to, and a scratch cache directory.
+#
+# The tests are skipped when the extension isn't built, or the fake server
+# isn't (make FAKESERVER=1 -C ../..). Set $FAKESERVER to use another
+# binary.
+
+import atexit
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    import spytify
+    from spytify.benchmark import FakeServer, PASSWORD, USER
+except ImportError:
+    spytify = None
+
+FAKESERVER = os.environ.get('FAKESERVER', os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir,
+    os.pardir, 'clients', 'fakeserver', 'fakeserver'))
+
+# The cache directory is set up when the first session is created, so it
+# is the same for every test of the run.
+_cache = tempfile.mkdtemp(prefix='spytify-test-')
+os.environ['XDG_CACHE_HOME'] = _cache
+atexit.register(shutil.rmtree, _cache, True)
+
+class FakeServerTest(unittest.TestCase):
+    """Runs a fake server for the tests of the class.
+
+    server_args are passed on to FakeServer, see spytify.benchmark.
+    """
+    server_args = {}
+
+    @classmethod
+    def setUpClass(cls):
+        if spytify is None:
+            raise unittest.SkipTest('the spytify extension is not built')
+        if not os.access(FAKESERVER, os.X_OK):
+            raise unittest.SkipTest('no fake server at %s' % FAKESERVER)
+
+        cls.server = FakeServer(FAKESERVER, **cls.server_args)
+        os.environ['DESPOTIFY_SERVER'] = cls.server.address
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+
+    def connect(self, **kwargs):
+        """Returns a session logged in to the fake server, closed after
+        the test."""
+        session = spytify.Spytify(USER, PASSWORD, **kwargs)
+        self.addCleanup(session.close)
+        return session
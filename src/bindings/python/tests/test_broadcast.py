@@ -0,0 +1,114 @@
+# vim: set fileencoding=utf-8 :
+# Tests of spytify.broadcast dropping listeners that can't keep up.
+
+import socket
+import threading
+import time
+import unittest
+
+from tests.support import FakeServerTest, spytify
+
+if spytify is not None:
+    from spytify.broadcast import (BroadcastServer, Channel, asyncio,
+                                   playlist_source)
+
+class BroadcastTest(FakeServerTest):
+    server_args = {'playlist_tracks': 2, 'seconds': 10}
+
+    def setUp(self):
+        session = self.connect()
+        session.flush_stored_playlists()
+        source = playlist_source(session, session.stored_playlists[0],
+                                 repeat=False)
+
+        self.loop = asyncio.new_event_loop()
+        self.server = BroadcastServer(self.loop, write_buffer=16 * 1024)
+        listening = self.loop.run_until_complete(self.server.start(port=0))
+        self.port = listening.sockets[0].getsockname()[1]
+
+        # Decoded as fast as it goes, into a ring of two seconds. It is
+        # started once the listeners are in.
+        self.channel = Channel('test', source, self.loop, seconds=2,
+                               lead=3600)
+        self.server.channels['test'] = self.channel
+
+        self.thread = threading.Thread(target=self.loop.run_forever)
+        self.thread.start()
+        self.addCleanup(self.stop)
+
+    def stop(self):
+        self.channel.stop()
+        if self.channel.thread is not None:
+            self.channel.thread.join()
+        self.loop.call_soon_threadsafe(self.server.close)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    def listen(self, receive_buffer=None):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.addCleanup(sock.close)
+        if receive_buffer is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF,
+                            receive_buffer)
+        sock.connect(('127.0.0.1', self.port))
+        sock.sendall(b'GET /test HTTP/1.0\r\n\r\n')
+        return sock
+
+    def wait_for(self, condition, timeout=10):
+        deadline = time.time() + timeout
+        while not condition():
+            if time.time() > deadline:
+                self.fail('timed out')
+            time.sleep(0.01)
+
+    def test_slow_listener_is_dropped(self):
+        slow = self.listen(receive_buffer=4096)
+        fast = self.listen()
+        self.wait_for(lambda: len(self.channel.listeners) == 2)
+
+        # Read until nothing came for a second.
+        received = []
+        def read():
+            fast.settimeout(1)
+            try:
+                while True:
+                    data = fast.recv(64 * 1024)
+                    if not data:
+                        break
+                    received.append(data)
+            except socket.timeout:
+                pass
+        reader = threading.Thread(target=read)
+        reader.start()
+
+        self.channel.start()
+        self.channel.thread.join()
+        reader.join()
+
+        self.assertEqual(self.channel.error, None)
+        self.assertEqual(self.channel.dropped, 1)
+        self.assertEqual(len(self.channel.listeners), 1)
+        self.assertTrue(self.channel.ring.end > self.channel.ring.capacity)
+
+        # The fast listener got all of the audio.
+        head, body = b''.join(received).split(b'\r\n\r\n', 1)
+        self.assertTrue(head.startswith(b'HTTP/1.0 200 OK'))
+        self.assertEqual(body[:4], b'RIFF')
+        self.assertEqual(len(body), 44 + self.channel.ring.end)
+
+        # The slow one was cut off.
+        slow.settimeout(5)
+        length = 0
+        try:
+            while True:
+                data = slow.recv(64 * 1024)
+                if not data:
+                    break
+                length += len(data)
+        except socket.error:
+            pass
+        self.assertTrue(length < self.channel.ring.end)
+
+if __name__ == '__main__':
+    unittest.main()
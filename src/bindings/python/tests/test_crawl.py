@@ -0,0 +1,126 @@
+# vim: set fileencoding=utf-8 :
+# Tests of how spytify.crawl gets through failing pages.
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests.support import FakeServerTest, spytify
+
+if spytify is not None:
+    from spytify.crawl import Crawler
+
+SEED = 'spotify:search:crawl'
+
+class _Flaky(object):
+    """Stands in for a session, failing lookups of one kind of URI.
+
+    Args:
+        session: Session to pass the other requests on to.
+        kind: Kind of URI to fail, like 'artist'.
+        error: Exception to raise, or None to find nothing.
+    """
+    def __init__(self, session, kind, error=None):
+        self.session = session
+        self.kind = kind
+        self.error = error
+
+    def lookup(self, uri):
+        if uri.split(':')[1] != self.kind:
+            return self.session.lookup(uri)
+        if self.error is not None:
+            raise self.error
+        return None
+
+    def search(self, query):
+        return self.session.search(query)
+
+class _FullOutput(io.BytesIO):
+    def write(self, data):
+        raise IOError('No space left on device')
+
+def _keys(data):
+    records = [json.loads(line) for line in data.decode('ascii').splitlines()]
+    return [(record['type'], record['id']) for record in records]
+
+class CrawlerTest(FakeServerTest):
+    server_args = {'search_hits': 5}
+
+    def setUp(self):
+        self.sessions = [self.connect() for i in range(2)]
+
+    def crawl(self, sessions, output=None, seed=SEED, **kwargs):
+        if output is None:
+            output = io.BytesIO()
+        crawler = Crawler(sessions, output, max_depth=1, **kwargs)
+        crawler.add_seed(seed)
+        return crawler, crawler.run()
+
+    def test_crawl_writes_every_page_once(self):
+        output = io.BytesIO()
+        crawler, stats = self.crawl(self.sessions, output)
+
+        keys = _keys(output.getvalue())
+        self.assertEqual(len(keys), len(set(keys)))
+        self.assertEqual(set(kind for kind, id in keys),
+                         set(['search', 'artist', 'album']))
+        self.assertEqual(stats['records'], len(keys))
+        self.assertEqual((stats['errors'], stats['pending'],
+                          stats['in_flight']), (0, 0, 0))
+
+    def test_unexpected_errors_fail_the_page(self):
+        sessions = [_Flaky(session, 'artist', RuntimeError('boom'))
+                    for session in self.sessions]
+        crawler, stats = self.crawl(sessions)
+
+        self.assertTrue(stats['errors'] > 0)
+        self.assertEqual((stats['pending'], stats['in_flight']), (0, 0))
+        for (depth, kind, id), error in crawler.failed:
+            self.assertEqual(kind, 'artist')
+            self.assertEqual(error, 'RuntimeError: boom')
+
+    def test_missing_tracks_are_counted(self):
+        uri = self.sessions[0].search(b'crawl').playlist.tracks[0].get_uri()
+        sessions = [_Flaky(session, 'track') for session in self.sessions]
+        crawler, stats = self.crawl(sessions, seed=uri)
+
+        self.assertEqual((stats['pages'], stats['missing'], stats['errors'],
+                          stats['records']), (1, 1, 0, 0))
+
+    def test_output_errors_stop_the_crawl(self):
+        crawler = Crawler(self.sessions, _FullOutput(), max_depth=1)
+        crawler.add_seed(SEED)
+
+        self.assertRaises(IOError, crawler.run)
+        self.assertEqual(crawler.stats()['in_flight'], 0)
+
+    def test_failed_pages_are_crawled_again(self):
+        directory = tempfile.mkdtemp(prefix='spytify-test-')
+        self.addCleanup(shutil.rmtree, directory, True)
+        path = os.path.join(directory, 'crawl.jsonl')
+        checkpoint = os.path.join(directory, 'crawl.checkpoint')
+
+        sessions = [_Flaky(session, 'artist', RuntimeError('boom'))
+                    for session in self.sessions]
+        with open(path, 'ab') as output:
+            self.crawl(sessions, output, checkpoint=checkpoint)
+
+        with open(path, 'ab') as output:
+            crawler = Crawler(self.sessions, output, max_depth=1,
+                              checkpoint=checkpoint)
+            self.assertTrue(crawler.resume())
+            stats = crawler.run()
+        self.assertEqual(stats['errors'], 0)
+
+        expected = io.BytesIO()
+        self.crawl(self.sessions, expected)
+        with open(path, 'rb') as f:
+            keys = _keys(f.read())
+        self.assertEqual(len(keys), len(set(keys)))
+        self.assertEqual(set(keys), set(_keys(expected.getvalue())))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# vim: set fileencoding=utf-8 :
+# Tests of the queue of playback events, and what happens when it fills up.
+
+import gc
+import unittest
+
+from tests.support import FakeServerTest
+
+# Signals from despotify.h
+NEW_TRACK = 1
+TIME_TELL = 2
+END_OF_PLAYLIST = 3
+
+# Size of the ring of events of a session
+RING_SIZE = 256
+
+def _decode(session, track):
+    stream = session.pcm_stream(track)
+    try:
+        for chunk in stream:
+            pass
+    finally:
+        stream.close()
+
+def _queued(events):
+    return [(signal, data) for signal, data in events if signal != TIME_TELL]
+
+class EventRingTest(FakeServerTest):
+    server_args = {'search_hits': 10, 'seconds': 1}
+
+    def setUp(self):
+        self.session = self.connect()
+        self.tracks = self.session.search(b'events').playlist.tracks
+
+    def test_decoding_queues_new_track_and_end_of_playlist(self):
+        _decode(self.session, self.tracks[0])
+
+        events = _queued(self.session.poll_events())
+        self.assertEqual([signal for signal, data in events],
+                         [NEW_TRACK, END_OF_PLAYLIST])
+        self.assertEqual(events[0][1].track_id, self.tracks[0].track_id)
+        self.assertEqual(self.session.poll_events(), [])
+
+    def test_overflow_drops_events_and_drains(self):
+        # Every track queues two events.
+        decoded = []
+        while len(decoded) * 2 <= RING_SIZE + 10:
+            track = self.tracks[len(decoded) % len(self.tracks)]
+            _decode(self.session, track)
+            decoded.append(track.track_id)
+
+        self.assertEqual(self.session.events_dropped,
+                         len(decoded) * 2 - RING_SIZE)
+
+        events = _queued(self.session.poll_events())
+        self.assertEqual(len(events), RING_SIZE)
+        self.assertEqual([data.track_id for signal, data in events
+                          if signal == NEW_TRACK],
+                         decoded[:RING_SIZE // 2])
+
+        # Drained, the ring takes events again.
+        _decode(self.session, self.tracks[0])
+        self.assertEqual(len(_queued(self.session.poll_events())), 2)
+
+    def test_event_tracks_outlive_the_search(self):
+        _decode(self.session, self.tracks[0])
+        title = self.tracks[0].title
+        self.tracks = None
+        gc.collect()
+
+        signal, track = _queued(self.session.poll_events())[0]
+        self.assertEqual(signal, NEW_TRACK)
+        self.assertEqual(track.title, title)
+
+if __name__ == '__main__':
+    unittest.main()
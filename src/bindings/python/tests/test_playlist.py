@@ -0,0 +1,49 @@
+# vim: set fileencoding=utf-8 :
+# Tests of loading a big playlist a chunk at a time.
+
+import unittest
+
+from tests.support import FakeServerTest
+
+# More than four browse requests of MAX_BROWSE_REQ (244) tracks
+TRACKS = 1000
+
+def _position(track):
+    # The fake server numbers the tracks of a playlist in their id.
+    return int(track.track_id[16:24], 16)
+
+class PlaylistLoadingTest(FakeServerTest):
+    server_args = {'playlist_tracks': TRACKS}
+
+    def setUp(self):
+        self.session = self.connect()
+
+    def test_iter_tracks_returns_tracks_while_loading(self):
+        playlist = self.session.open_stored_playlists()[0]
+        self.assertFalse(playlist.is_loaded)
+
+        tracks = playlist.iter_tracks()
+        first = next(tracks)
+        self.assertTrue(first.has_meta_data())
+        self.assertFalse(playlist.is_loaded)
+
+        positions = [_position(first)]
+        for track in tracks:
+            self.assertTrue(track.has_meta_data())
+            positions.append(_position(track))
+
+        self.assertEqual(positions, list(range(TRACKS)))
+        self.assertTrue(playlist.is_loaded)
+
+    def test_tracks_loads_the_rest(self):
+        playlist = self.session.open_stored_playlists()[0]
+        tracks = playlist.iter_tracks()
+        for i in range(10):
+            next(tracks)
+
+        self.assertEqual([_position(track) for track in playlist.tracks],
+                         list(range(TRACKS)))
+        self.assertTrue(playlist.is_loaded)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# vim: set fileencoding=utf-8 :
+# Tests of when spytify.pool reconnects its sessions.
+
+import unittest
+
+from tests.support import FakeServerTest, spytify
+
+if spytify is not None:
+    from spytify import SpytifyConnectionError, SpytifyError
+    from spytify.benchmark import PASSWORD, USER
+    from spytify.pool import SpytifyPool
+
+def _close_first(closed):
+    """Returns a lookup that closes the first session it is run on."""
+    def lookup(session, uri):
+        if not closed:
+            closed.append(session)
+            session.close()
+        return session.lookup(uri)
+    return lookup
+
+class PoolReconnectTest(FakeServerTest):
+    def setUp(self):
+        self.pool = SpytifyPool(USER, PASSWORD, size=2)
+        self.addCleanup(self.pool.close)
+        self.uri = self.pool.search(b'pool').playlist.tracks[0].get_uri()
+
+    def test_connection_error_reconnects_and_retries(self):
+        closed = []
+        track = self.pool.run(_close_first(closed), self.uri)
+
+        self.assertTrue(track.has_meta_data())
+        self.assertEqual(len(self.pool.sessions), 2)
+        self.assertNotIn(closed[0], self.pool.sessions)
+        for session in self.pool.sessions:
+            self.assertTrue(session.connected)
+
+    def test_second_connection_error_is_raised(self):
+        def lookup(session, uri):
+            session.close()
+            return session.lookup(uri)
+
+        self.assertRaises(SpytifyConnectionError, self.pool.run, lookup,
+                          self.uri)
+
+        # Both sessions were replaced, and the pool still works.
+        for session in self.pool.sessions:
+            self.assertTrue(session.connected)
+        self.assertTrue(self.pool.lookup(self.uri).has_meta_data())
+
+    def test_other_errors_keep_the_session(self):
+        sessions = list(self.pool.sessions)
+        uri = self.uri.replace('spotify:track:', 'spotify:image:')
+
+        self.assertRaises(SpytifyError, self.pool.lookup, uri)
+        self.assertEqual(self.pool.sessions, sessions)
+
+    def test_check_reconnects_closed_sessions(self):
+        closed = self.pool.sessions[0]
+        closed.close()
+
+        self.assertEqual(self.pool.check(), 1)
+        self.assertNotIn(closed, self.pool.sessions)
+        self.assertEqual(self.pool.check(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
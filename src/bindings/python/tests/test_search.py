@@ -0,0 +1,40 @@
+# vim: set fileencoding=utf-8 :
+# Tests of paging through search results.
+
+import unittest
+
+from tests.support import FakeServerTest
+
+HITS = 250
+
+def _position(track):
+    # The fake server numbers the tracks of a search in their id.
+    return int(track.track_id[16:24], 16)
+
+class SearchPagingTest(FakeServerTest):
+    server_args = {'search_hits': HITS}
+
+    def setUp(self):
+        self.session = self.connect()
+
+    def test_search_page_starts_at_offset(self):
+        page = self.session.search_page(b'paging', 30, 10)
+
+        self.assertEqual(page.total_tracks, HITS)
+        self.assertEqual([_position(track) for track in page.playlist.tracks],
+                         list(range(30, 40)))
+
+    def test_iter_search_returns_every_track_once(self):
+        for page_size in (1, 7, 100):
+            positions = [_position(track) for track in
+                         self.session.iter_search(b'paging', page_size)]
+            self.assertEqual(positions, list(range(HITS)))
+
+    def test_iter_search_checks_page_size(self):
+        # MAX_SEARCH_RESULTS in despotify.h is 100.
+        for page_size in (0, -1, 101):
+            self.assertRaises(ValueError, self.session.iter_search,
+                              b'paging', page_size)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+/*
+ * Micro-benchmark of the decrypt stage of audio channel packets.
+ *
+ * Times what happens to every packet of a file between the channel and
+ * the sound fifo: getting a buffer, decrypting into it, and freeing it
+ * once the player is done with it. The library's pooled path is compared
+ * with the path it replaced, kept here as reference(): a new buffer and
+ * buffer struct for every packet, and the keystream made and applied a
+ * block of 16 bytes at a time. Both must give the same plaintext.
+ *
+ * $Id$
+ *
+ */
+
+#include <getopt.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include "aes.h"
+#include "aesctr.h"
+#include "despotify.h"
+#include "sndqueue.h"
+
+static double now(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec / 1e9;
+}
+
+/* The decrypt stage as it was, one packet */
+static struct snd_buffer* reference(struct aes_ctr* aes, unsigned char* buf,
+                                    unsigned short len,
+                                    unsigned char* keystream)
+{
+    int block;
+    unsigned char* plaintext = (unsigned char *) malloc (len + 1024);
+    struct snd_buffer* b = malloc(sizeof(struct snd_buffer));
+
+    for (block = 0; block < len / 1024; block++) {
+        int i;
+
+        unsigned char* ciphertext = plaintext + block * 1024;
+        unsigned char* w = buf + block * 1024 + 0 * 256;
+        unsigned char* x = buf + block * 1024 + 1 * 256;
+        unsigned char* y = buf + block * 1024 + 2 * 256;
+        unsigned char* z = buf + block * 1024 + 3 * 256;
+
+        for (i = 0; i < 1024 && (block * 1024 + i) < len; i += 4) {
+            *ciphertext++ = *w++;
+            *ciphertext++ = *x++;
+            *ciphertext++ = *y++;
+            *ciphertext++ = *z++;
+        }
+
+        for (i = 0; i < 1024 && (block * 1024 + i) < len; i += 16) {
+            int j;
+
+            rijndaelEncrypt(aes->state, 10, aes->IV, keystream);
+
+            for (j = 15; j >= 0; j--) {
+                aes->IV[j] += 1;
+                if (aes->IV[j] != 0)
+                    break;
+            }
+
+            for (j = 0; j < 16; j++)
+                plaintext[block * 1024 + i + j] ^= keystream[j];
+        }
+    }
+
+    memset(b, 0, sizeof(struct snd_buffer));
+    b->cmd = SND_CMD_DATA;
+    b->length = len;
+    b->ptr = plaintext;
+    return b;
+}
+
+static struct snd_buffer* pooled(struct despotify_session* ds,
+                                 struct aes_ctr* aes, unsigned char* buf,
+                                 unsigned short len)
+{
+    struct snd_buffer* b = snd_buffer_new(ds, len);
+
+    b->cmd = SND_CMD_DATA;
+    b->length = len;
+    aes_ctr_decrypt(aes, b->ptr, buf, len);
+    return b;
+}
+
+static void usage(const char* name)
+{
+    fprintf(stderr,
+            "Usage: %s [options]\n"
+            "  -s BYTES    size of a channel packet (default 16384)\n"
+            "  -m MB       megabytes to decrypt per run (default 64)\n"
+            "  -r N        runs of each path, the best is kept (default 5)\n",
+            name);
+    exit(1);
+}
+
+int main(int argc, char** argv)
+{
+    static const unsigned char key[16] = "benchmark key 16";
+    int packet_size = 16384, megabytes = 64, runs = 5;
+    struct despotify_session ds;
+    struct aes_ctr aes;
+    unsigned char keystream[16];
+    unsigned char* packet;
+    double best_reference = 0, best_pooled = 0;
+    int opt, packets;
+
+    while ((opt = getopt(argc, argv, "s:m:r:h")) != -1) {
+        switch (opt) {
+        case 's': packet_size = atoi(optarg); break;
+        case 'm': megabytes = atoi(optarg); break;
+        case 'r': runs = atoi(optarg); break;
+        default: usage(argv[0]);
+        }
+    }
+
+    if (packet_size < 1 || packet_size > 65535 || megabytes < 1 || runs < 1)
+        usage(argv[0]);
+
+    packets = megabytes * 1024 * 1024 / packet_size;
+    packet = malloc(packet_size);
+    for (int i = 0; i < packet_size; i++)
+        packet[i] = rand();
+
+    memset(&ds, 0, sizeof ds);
+    if (!snd_init(&ds)) {
+        fprintf(stderr, "snd_init() failed\n");
+        return 1;
+    }
+
+    /* same plaintext, across packets too */
+    struct aes_ctr check_aes;
+    aes_ctr_init(&aes, key);
+    aes_ctr_init(&check_aes, key);
+    for (int i = 0; i < 3; i++) {
+        struct snd_buffer* a = reference(&check_aes, packet, packet_size,
+                                         keystream);
+        struct snd_buffer* b = pooled(&ds, &aes, packet, packet_size);
+        int whole = packet_size / 1024 * 1024;
+
+        if (memcmp(a->ptr, b->ptr, whole)) {
+            fprintf(stderr, "Plaintexts differ in packet %d\n", i);
+            return 1;
+        }
+        snd_buffer_free(&ds, a);
+        snd_buffer_free(&ds, b);
+    }
+
+    for (int run = 0; run < runs; run++) {
+        double started, seconds;
+
+        aes_ctr_init(&aes, key);
+        started = now();
+        for (int i = 0; i < packets; i++)
+            snd_buffer_free(&ds, reference(&aes, packet, packet_size,
+                                           keystream));
+        seconds = now() - started;
+        if (!run || seconds < best_reference)
+            best_reference = seconds;
+
+        aes_ctr_init(&aes, key);
+        started = now();
+        for (int i = 0; i < packets; i++)
+            snd_buffer_free(&ds, pooled(&ds, &aes, packet, packet_size));
+        seconds = now() - started;
+        if (!run || seconds < best_pooled)
+            best_pooled = seconds;
+    }
+
+    double bytes = (double) packets * packet_size / (1024 * 1024);
+    printf("packet size  %d bytes, %d packets per run\n",
+           packet_size, packets);
+    printf("reference    %8.1f MB/s  %6.0f ns/packet\n",
+           bytes / best_reference, best_reference / packets * 1e9);
+    printf("pooled       %8.1f MB/s  %6.0f ns/packet\n",
+           bytes / best_pooled, best_pooled / packets * 1e9);
+    printf("speedup      %8.2fx\n", best_reference / best_pooled);
+
+    snd_destroy(&ds);
+    free(packet);
+    return 0;
+}
@@ -0,0 +1,24 @@
+OBJS = decryptbench.o
+LIBDIR = ../../lib
+LIB = $(LIBDIR)/libdespotify.la
+
+CFLAGS += -I$(LIBDIR)
+
+all: decryptbench
+
+# These are the files we depgen for. :-)
+CFILES = $(OBJS:.o=.c)
+include ../depgen.mk
+
+decryptbench: $(OBJS) $(LIB)
+	@echo LD $@
+	$(SILENT)$(LT) --mode=link $(CC) -o $@ $(CFLAGS) $(LDFLAGS) $(OBJS) $(LIB)
+
+clean:
+	$(LT) --mode=clean rm -f decryptbench
+	rm -f $(OBJS) Makefile.dep
+
+# Only used for benchmarking, never installed.
+install:
+
+uninstall:
@@ -0,0 +1,795 @@
+/*
+ * A stand-in for the Spotify access point, for benchmarks and tests that
+ * have to run without network access.
+ *
+ * It speaks the session and channel protocol of the library, accepts any
+ * user whose password matches -P, and makes up everything it serves:
+ *
+ *  - the stored playlists are -p lists of the given sizes,
+ *  - searches return -s tracks made up from the query,
+ *  - track, album and artist browsing describes whatever ids are asked
+ *    for, gzipped like the real thing,
+ *  - every file is the same Ogg Vorbis stream of a -t seconds tone,
+ *    encrypted with a fixed key,
+ *  - images are -i bytes of noise behind a JPEG marker.
+ *
+ * Ids encode what they stand for, so no state is kept between requests.
+ * Every connection is served by a process of its own. Point a client at
+ * the server with DESPOTIFY_SERVER=127.0.0.1:<port>, the port is printed
+ * on stdout once the server listens.
+ *
+ * $Id$
+ *
+ */
+
+#include <getopt.h>
+#include <math.h>
+#include <signal.h>
+#include <stdarg.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include <unistd.h>
+#include <zlib.h>
+
+#include <sys/types.h>
+#include <sys/socket.h>
+#include <netinet/in.h>
+#include <netinet/tcp.h>
+#include <arpa/inet.h>
+
+#include <openssl/rand.h>
+#include <vorbis/vorbisenc.h>
+
+#include "aes.h"
+#include "auth.h"
+#include "buf.h"
+#include "commands.h"
+#include "keyexchange.h"
+#include "packet.h"
+#include "session.h"
+#include "util.h"
+
+/* Kinds of ids, in their first four bytes */
+enum {
+    ID_PLAYLIST = 1,
+    ID_TRACK,
+    ID_ALBUM,
+    ID_ARTIST,
+    ID_FILE,
+    ID_IMAGE
+};
+
+#define MAX_PLAYLISTS 64
+#define CHUNK_SIZE 4096 /* bytes of file data per channel packet */
+
+static struct {
+    char* password;
+    int port;
+    int delay;            /* milliseconds before every reply */
+    int puzzle;           /* puzzle difficulty, in bits */
+    int search_hits;
+    int image_size;
+    int seconds;
+    int num_playlists;
+    int playlists[MAX_PLAYLISTS];
+} config = {
+    "bench", 0, 0, 0, 100, 16 * 1024, 30, 1, { 10000 }
+};
+
+/* The file served for every track, padded to whole substream pages */
+static unsigned char* ogg;
+static int ogg_len;
+
+static const unsigned char file_key[16] = "despotify-bench!";
+static const unsigned char file_IV[16] =
+    "\x72\xe0\x67\xfb\xdd\xcb\xcf\x77"
+    "\xeb\xe8\xbc\x64\x3f\x63\x0d\x93";
+
+/****************************************************
+ *
+ *  Synthetic data
+ *
+ */
+
+static void make_id(char* hex, int size, int kind, unsigned int a,
+                    unsigned int b)
+{
+    unsigned char id[20];
+
+    memset(id, 0, sizeof id);
+    id[3] = kind;
+    *(unsigned int*)(id + 4) = htonl(a);
+    *(unsigned int*)(id + 8) = htonl(b);
+    hex_bytes_to_ascii(id, hex, size);
+    hex[size * 2] = 0;
+}
+
+static void parse_id(unsigned char* id, int* kind, unsigned int* a,
+                     unsigned int* b)
+{
+    *kind = id[3];
+    *a = ntohl(*(unsigned int*)(id + 4));
+    *b = ntohl(*(unsigned int*)(id + 8));
+}
+
+static unsigned int hash_string(const char* s, int len)
+{
+    unsigned int h = 2166136261u;
+
+    while (len--)
+        h = (h ^ (unsigned char)*s++) * 16777619u;
+
+    return h;
+}
+
+static void append_string(struct buf* b, const char* s)
+{
+    buf_append_data(b, (void*)s, strlen(s));
+}
+
+static void append_printf(struct buf* b, const char* fmt, ...)
+{
+    char tmp[1024];
+    va_list ap;
+
+    va_start(ap, fmt);
+    vsnprintf(tmp, sizeof tmp, fmt, ap);
+    va_end(ap);
+
+    append_string(b, tmp);
+}
+
+/* Track b of album a, by artist a */
+static void append_track(struct buf* b, unsigned int a, unsigned int n)
+{
+    char track_id[33], album_id[33], artist_id[33], file_id[41], cover_id[41];
+
+    make_id(track_id, 16, ID_TRACK, a, n);
+    make_id(album_id, 16, ID_ALBUM, a, 0);
+    make_id(artist_id, 16, ID_ARTIST, a, 0);
+    make_id(file_id, 20, ID_FILE, a, n);
+    make_id(cover_id, 20, ID_IMAGE, a, 0);
+
+    append_printf(b,
+        "<track><id>%s</id><title>Track %u</title>"
+        "<artist-id>%s</artist-id><artist>Artist %u</artist>"
+        "<album>Album %u</album><album-id>%s</album-id>"
+        "<cover>%s</cover><year>2009</year>"
+        "<track-number>%u</track-number><length>%d</length>"
+        "<popularity>0.5</popularity>"
+        "<files><file id=\"%s\" format=\"Ogg Vorbis,320000,1,32,4\"/>"
+        "<file id=\"%s\" format=\"Ogg Vorbis,160000,1,32,4\"/></files>"
+        "</track>\n",
+        track_id, n, artist_id, a, a, album_id, cover_id, n % 100 + 1,
+        config.seconds * 1000, file_id, file_id);
+}
+
+static void append_album(struct buf* b, unsigned int a, int tracks)
+{
+    char album_id[33], artist_id[33], cover_id[41];
+
+    make_id(album_id, 16, ID_ALBUM, a, 0);
+    make_id(artist_id, 16, ID_ARTIST, a, 0);
+    make_id(cover_id, 20, ID_IMAGE, a, 0);
+
+    append_printf(b,
+        "<album><name>Album %u</name><id>%s</id>"
+        "<artist-name>Artist %u</artist-name><artist-id>%s</artist-id>"
+        "<cover>%s</cover><year>2009</year><popularity>0.5</popularity>"
+        "<discs><disc>",
+        a, album_id, a, artist_id, cover_id);
+    for (int i = 0; i < tracks; i++)
+        append_track(b, a, i);
+    append_string(b, "</disc></discs></album>\n");
+}
+
+/* Compress like the server does: a gzip stream, of which the client
+   skips the 10 byte header */
+static struct buf* gzip(struct buf* in)
+{
+    struct buf* out = buf_new();
+    z_stream z;
+
+    memset(&z, 0, sizeof z);
+    deflateInit2(&z, Z_DEFAULT_COMPRESSION, Z_DEFLATED, 16 + MAX_WBITS, 8,
+                 Z_DEFAULT_STRATEGY);
+
+    buf_extend(out, deflateBound(&z, in->len));
+    z.next_in = in->ptr;
+    z.avail_in = in->len;
+    z.next_out = out->ptr;
+    z.avail_out = out->size;
+    deflate(&z, Z_FINISH);
+    out->len = z.total_out;
+    deflateEnd(&z);
+
+    buf_free(in);
+    return out;
+}
+
+/* A stereo 44.1 kHz tone of config.seconds, encoded like a Spotify file */
+static void encode_ogg(void)
+{
+    vorbis_info vi;
+    vorbis_comment vc;
+    vorbis_dsp_state vd;
+    vorbis_block vb;
+    ogg_stream_state os;
+    ogg_page og;
+    ogg_packet op, header, header_comm, header_code;
+    struct buf* b = buf_new();
+    long frames = config.seconds * 44100L;
+    long done = 0;
+    int eos = 0;
+
+    vorbis_info_init(&vi);
+    vorbis_encode_init_vbr(&vi, 2, 44100, 0.4);
+    vorbis_comment_init(&vc);
+    vorbis_comment_add_tag(&vc, "ENCODER", "despotify fakeserver");
+    vorbis_analysis_init(&vd, &vi);
+    vorbis_block_init(&vd, &vb);
+    ogg_stream_init(&os, 1);
+
+    vorbis_analysis_headerout(&vd, &vc, &header, &header_comm, &header_code);
+    ogg_stream_packetin(&os, &header);
+    ogg_stream_packetin(&os, &header_comm);
+    ogg_stream_packetin(&os, &header_code);
+    while (ogg_stream_flush(&os, &og)) {
+        buf_append_data(b, og.header, og.header_len);
+        buf_append_data(b, og.body, og.body_len);
+    }
+
+    while (!eos) {
+        long n = frames - done < 1024 ? frames - done : 1024;
+
+        if (n > 0) {
+            float** pcm = vorbis_analysis_buffer(&vd, n);
+            for (long i = 0; i < n; i++) {
+                float t = (float)(done + i) / 44100;
+                pcm[0][i] = 0.25f * sinf(2 * M_PI * 440 * t);
+                pcm[1][i] = 0.25f * sinf(2 * M_PI * 660 * t);
+            }
+            done += n;
+        }
+        vorbis_analysis_wrote(&vd, n);
+
+        while (vorbis_analysis_blockout(&vd, &vb) == 1) {
+            vorbis_analysis(&vb, NULL);
+            vorbis_bitrate_addblock(&vb);
+
+            while (vorbis_bitrate_flushpacket(&vd, &op)) {
+                ogg_stream_packetin(&os, &op);
+                while (ogg_stream_pageout(&os, &og)) {
+                    buf_append_data(b, og.header, og.header_len);
+                    buf_append_data(b, og.body, og.body_len);
+                    if (ogg_page_eos(&og))
+                        eos = 1;
+                }
+            }
+        }
+    }
+
+    ogg_stream_clear(&os);
+    vorbis_block_clear(&vb);
+    vorbis_dsp_clear(&vd);
+    vorbis_comment_clear(&vc);
+    vorbis_info_clear(&vi);
+
+    ogg = b->ptr;
+    ogg_len = b->len;
+    free(b);
+}
+
+static void load_ogg(const char* path)
+{
+    FILE* f = fopen(path, "rb");
+    struct buf* b = buf_new();
+    char tmp[4096];
+    size_t n;
+
+    if (!f) {
+        perror(path);
+        exit(1);
+    }
+    while ((n = fread(tmp, 1, sizeof tmp, f)) > 0)
+        buf_append_data(b, tmp, n);
+    fclose(f);
+
+    ogg = b->ptr;
+    ogg_len = b->len;
+    free(b);
+}
+
+/* Pad the file to whole 4 KB pages, the unit substreams are asked in */
+static void pad_ogg(void)
+{
+    int padded = (ogg_len + 4095) & ~4095;
+
+    ogg = realloc(ogg, padded);
+    memset(ogg + ogg_len, 0, padded - ogg_len);
+    ogg_len = padded;
+}
+
+/****************************************************
+ *
+ *  Replies
+ *
+ */
+
+static void delay(void)
+{
+    if (config.delay)
+        usleep(config.delay * 1000);
+}
+
+/* Send data on a channel: an empty header, the data, and the end mark */
+static int send_channel(SESSION* s, unsigned short channel,
+                        unsigned char* data, int len)
+{
+    struct buf* b = buf_new();
+    int ret = 0;
+
+    buf_append_u16(b, channel);
+    buf_append_u16(b, 0);
+    ret |= packet_write(s, CMD_CHANNELDATA, b->ptr, b->len);
+
+    for (int off = 0; off < len && !ret; off += CHUNK_SIZE) {
+        int n = len - off < CHUNK_SIZE ? len - off : CHUNK_SIZE;
+        b->len = 0;
+        buf_append_u16(b, channel);
+        buf_append_data(b, data + off, n);
+        ret |= packet_write(s, CMD_CHANNELDATA, b->ptr, b->len);
+    }
+
+    b->len = 0;
+    buf_append_u16(b, channel);
+    ret |= packet_write(s, CMD_CHANNELDATA, b->ptr, b->len);
+
+    buf_free(b);
+    return ret;
+}
+
+static int send_buf(SESSION* s, unsigned short channel, struct buf* b)
+{
+    int ret = send_channel(s, channel, b->ptr, b->len);
+    buf_free(b);
+    return ret;
+}
+
+static int handle_search(SESSION* s, unsigned char* p, int len)
+{
+    unsigned short channel = ntohs(*(unsigned short*)p);
+    unsigned int offset = ntohl(*(unsigned int*)(p + 2));
+    unsigned int limit = ntohl(*(unsigned int*)(p + 6));
+    int query_len = p[12];
+    unsigned int query = hash_string((char*)p + 13,
+                                     query_len < len - 13 ? query_len
+                                                          : len - 13);
+    struct buf* b = buf_new();
+    char artist_id[33];
+
+    make_id(artist_id, 16, ID_ARTIST, query, 0);
+    append_printf(b, "<?xml version=\"1.0\" encoding=\"utf-8\" ?>\n"
+                     "<result><did-you-mean></did-you-mean>"
+                     "<total-artists>1</total-artists>"
+                     "<total-albums>1</total-albums>"
+                     "<total-tracks>%d</total-tracks>",
+                  config.search_hits);
+
+    append_printf(b, "<artists><artist><name>Artist %u</name>"
+                     "<id>%s</id><popularity>0.5</popularity>"
+                     "</artist></artists><albums>", query, artist_id);
+    append_album(b, query, 0);
+    append_string(b, "</albums><tracks>\n");
+
+    for (unsigned int i = offset;
+         i < offset + limit && i < (unsigned int)config.search_hits; i++)
+        append_track(b, query, i);
+    append_string(b, "</tracks></result>\n");
+
+    delay();
+    return send_buf(s, channel, gzip(b));
+}
+
+static int handle_browse(SESSION* s, unsigned char* p, int len)
+{
+    unsigned short channel = ntohs(*(unsigned short*)p);
+    int browse_kind = p[2];
+    struct buf* b = buf_new();
+    int kind;
+    unsigned int a, n;
+
+    append_string(b, "<?xml version=\"1.0\" encoding=\"utf-8\" ?>\n");
+
+    if (browse_kind == BROWSE_TRACK) {
+        append_string(b, "<result><tracks>\n");
+        for (int off = 3; off + 16 <= len; off += 16) {
+            parse_id(p + off, &kind, &a, &n);
+            append_track(b, a, n);
+        }
+        append_string(b, "</tracks></result>\n");
+    }
+    else if (browse_kind == BROWSE_ALBUM) {
+        parse_id(p + 3, &kind, &a, &n);
+        append_album(b, a, 12);
+    }
+    else {
+        char artist_id[33];
+
+        parse_id(p + 3, &kind, &a, &n);
+        make_id(artist_id, 16, ID_ARTIST, a, 0);
+        append_printf(b, "<artist><name>Artist %u</name><id>%s</id>"
+                         "<genres>Test</genres><popularity>0.5</popularity>"
+                         "<bios><bio><text>Made up.</text></bio></bios>"
+                         "<albums>", a, artist_id);
+        for (unsigned int i = 0; i < 3; i++)
+            append_album(b, a + i, 12);
+        append_string(b, "</albums></artist>\n");
+    }
+
+    delay();
+    return send_buf(s, channel, gzip(b));
+}
+
+static int handle_getplaylist(SESSION* s, unsigned char* p)
+{
+    unsigned short channel = ntohs(*(unsigned short*)p);
+    struct buf* b = buf_new();
+    char id[35];
+    int kind, count;
+    unsigned int a, n;
+
+    parse_id(p + 2, &kind, &a, &n);
+    append_string(b, "<next-change><change><ops><add><items>");
+
+    if (kind != ID_PLAYLIST) {
+        /* the list of playlists */
+        count = config.num_playlists;
+        for (int i = 0; i < count; i++) {
+            make_id(id, 17, ID_PLAYLIST, i, config.playlists[i]);
+            append_printf(b, "%s%s", i ? "," : "", id);
+        }
+        append_string(b, "</items></add></ops>");
+    }
+    else {
+        count = n;
+        for (unsigned int i = 0; i < n; i++) {
+            make_id(id, 16, ID_TRACK, a, i);
+            append_printf(b, "%s%s01", i ? "," : "", id);
+        }
+        append_printf(b, "</items></add><name>Playlist %u</name></ops>", a);
+    }
+
+    append_printf(b, "<user>%s</user></change>"
+                     "<version>%010u,%010d,%010u,0</version>"
+                     "</next-change>\n</playlist>\n",
+                  s->username, 1, count, 0);
+
+    delay();
+    return send_buf(s, channel, b);
+}
+
+static int handle_image(SESSION* s, unsigned char* p)
+{
+    unsigned short channel = ntohs(*(unsigned short*)p);
+    unsigned char* image = malloc(config.image_size);
+
+    for (int i = 0; i < config.image_size; i++)
+        image[i] = (unsigned char)(i * 2654435761u >> 24);
+    memcpy(image, "\xff\xd8\xff\xe0", 4);
+
+    delay();
+    int ret = send_channel(s, channel, image, config.image_size);
+    free(image);
+
+    return ret;
+}
+
+static int handle_reqkey(SESSION* s, unsigned char* p)
+{
+    struct buf* b = buf_new();
+
+    buf_append_u16(b, 0);
+    buf_append_data(b, p + 38, 2); /* channel */
+    buf_append_data(b, (void*)file_key, sizeof file_key);
+
+    delay();
+    int ret = packet_write(s, CMD_AESKEY, b->ptr, b->len);
+    buf_free(b);
+
+    return ret;
+}
+
+/* Encrypt a part of the file like the client expects it: AES in counter
+   mode from a static IV, in blocks of 1024 bytes interleaved 4 x 256 */
+static void encrypt_chunk(u32* state, unsigned int offset, unsigned char* in,
+                          unsigned char* out, int len)
+{
+    unsigned char IV[16], keystream[16], block[1024];
+    unsigned int counter = offset / 16;
+
+    memcpy(IV, file_IV, 16);
+    for (int j = 15; j >= 0 && counter; j--) {
+        counter += IV[j];
+        IV[j] = counter & 0xff;
+        counter >>= 8;
+    }
+
+    for (int off = 0; off < len; off += 1024) {
+        for (int i = 0; i < 1024; i += 16) {
+            rijndaelEncrypt(state, 10, IV, keystream);
+            for (int j = 15; j >= 0; j--) {
+                if (++IV[j] != 0)
+                    break;
+            }
+
+            for (int j = 0; j < 16; j++)
+                block[i + j] = in[off + i + j] ^ keystream[j];
+        }
+
+        for (int i = 0; i < 1024; i++)
+            out[off + (i % 4) * 256 + i / 4] = block[i];
+    }
+}
+
+static int handle_substream(SESSION* s, u32* state, unsigned char* p)
+{
+    unsigned short channel = ntohs(*(unsigned short*)p);
+    unsigned int start = ntohl(*(unsigned int*)(p + 36)) << 2;
+    unsigned int end = ntohl(*(unsigned int*)(p + 40)) << 2;
+    unsigned char* data;
+
+    if (start > (unsigned int)ogg_len)
+        start = ogg_len;
+    if (end > (unsigned int)ogg_len)
+        end = ogg_len;
+
+    data = malloc(end - start + 1);
+    encrypt_chunk(state, start, ogg + start, data, end - start);
+
+    delay();
+    int ret = send_channel(s, channel, data, end - start);
+    free(data);
+
+    return ret;
+}
+
+/****************************************************
+ *
+ *  Sessions
+ *
+ */
+
+/* Key exchange and authentication, from the other end: returns 0 when
+   the client is logged in */
+static int login(SESSION* s)
+{
+    unsigned char hdr[4], *init;
+    struct buf* b;
+    int len;
+
+    /* initial client packet */
+    if (block_read(s->ap_sock, hdr, 4) != 4)
+        return -1;
+    len = (hdr[2] << 8 | hdr[3]) - 4;
+    if (len < 273)
+        return -1;
+    init = malloc(len);
+    if (block_read(s->ap_sock, init, len) != len) {
+        free(init);
+        return -1;
+    }
+    memcpy(s->client_random_16, init + 28, 16);
+    memcpy(s->remote_pub_key, init + 44, 96);
+    memcpy(s->rsa_pub_exp, init + 140, 128);
+    s->username_len = init[269];
+    memcpy(s->username, init + 272, s->username_len);
+    s->username[s->username_len] = 0;
+    free(init);
+
+    /* initial server packet */
+    memset(s->server_random_16, 0, 2);
+    RAND_bytes(s->server_random_16 + 2, 14);
+    RAND_bytes(s->random_256, 256);
+    RAND_bytes(s->salt, 10);
+
+    b = buf_new();
+    buf_append_data(b, s->server_random_16, 16);
+    buf_append_data(b, s->my_pub_key, 96);
+    buf_append_data(b, s->random_256, 256);
+    buf_append_data(b, s->salt, 10);
+    buf_append_u8(b, 1); /* padding length */
+    buf_append_u8(b, s->username_len);
+    buf_append_u16(b, 6); /* puzzle length */
+    buf_append_u16(b, 0);
+    buf_append_u16(b, 0);
+    buf_append_u16(b, 0);
+    buf_append_u8(b, 0); /* padding */
+    buf_append_data(b, s->username, s->username_len);
+    buf_append_u8(b, 1); /* puzzle */
+    buf_append_u8(b, config.puzzle);
+    buf_append_u32(b, 0); /* magic */
+    len = block_write(s->ap_sock, b->ptr, b->len);
+    buf_free(b);
+    if (len <= 0)
+        return -1;
+
+    /* Both ends derive the same keys; what the client sends with, we
+       receive with */
+    DSFYstrncpy(s->password, config.password, sizeof s->password);
+    auth_generate_auth_hash(s);
+    if (key_init(s) < 0)
+        return -1;
+    shn_ctx shn = s->shn_send;
+    s->shn_send = s->shn_recv;
+    s->shn_recv = shn;
+
+    /* client authentication, which isn't checked: a wrong password
+       leaves the client unable to read our packets */
+    unsigned char auth[36];
+    if (block_read(s->ap_sock, auth, sizeof auth) != sizeof auth)
+        return -1;
+    if (block_write(s->ap_sock, (void*)"\x00\x01\x00", 3) != 3)
+        return -1;
+
+    /* secret block, with the client's RSA modulus echoed back */
+    unsigned char secret[336];
+    memset(secret, 0, sizeof secret);
+    *(unsigned int*)secret = htonl(time(NULL));
+    *(unsigned int*)(secret + 4) = htonl(time(NULL) + 3600);
+    memcpy(secret + 16, s->rsa_pub_exp, 128);
+    if (packet_write(s, CMD_SECRETBLK, secret, sizeof secret))
+        return -1;
+
+    const char* prodinfo = "<products><product><type>premium</type>"
+                           "<expiry>2147483647</expiry></product></products>";
+    if (packet_write(s, CMD_COUNTRYCODE, (unsigned char*)"SE", 2) ||
+        packet_write(s, CMD_PRODINFO, (unsigned char*)prodinfo,
+                     strlen(prodinfo)) ||
+        packet_write(s, CMD_WELCOME, NULL, 0))
+        return -1;
+
+    return 0;
+}
+
+static void serve(SESSION* s)
+{
+    u32 state[4 * (10 + 1)];
+    PHEADER hdr;
+    unsigned char* payload;
+    int error = 0;
+
+    rijndaelKeySetupEnc(state, file_key, 128);
+
+    if (login(s))
+        return;
+
+    while (!error && !packet_read(s, &hdr, &payload)) {
+        switch (hdr.cmd) {
+        case CMD_SEARCH:
+            error = handle_search(s, payload, hdr.len);
+            break;
+
+        case CMD_BROWSE:
+            error = handle_browse(s, payload, hdr.len);
+            break;
+
+        case CMD_GETPLAYLIST:
+            error = handle_getplaylist(s, payload);
+            break;
+
+        case CMD_IMAGE:
+            error = handle_image(s, payload);
+            break;
+
+        case CMD_REQKEY:
+            error = handle_reqkey(s, payload);
+            break;
+
+        case 0x08: /* substream */
+            error = handle_substream(s, state, payload);
+            break;
+
+        default:
+            /* cache hash, pongs, play notifications... */
+            break;
+        }
+
+        free(payload);
+    }
+}
+
+static void usage(const char* name)
+{
+    fprintf(stderr,
+            "Usage: %s [options]\n"
+            "  -l PORT     port to listen on, 0 for any (default 0)\n"
+            "  -P PASS     password of every user (default bench)\n"
+            "  -p N[,N..]  sizes of the stored playlists (default 10000)\n"
+            "  -s N        search hits (default 100)\n"
+            "  -t SECONDS  length of the tracks (default 30)\n"
+            "  -o FILE     serve an Ogg Vorbis file instead of a tone\n"
+            "  -i BYTES    size of images (default 16384)\n"
+            "  -d MS       delay before every reply (default 0)\n"
+            "  -z BITS     login puzzle difficulty (default 0)\n",
+            name);
+    exit(1);
+}
+
+int main(int argc, char** argv)
+{
+    struct sockaddr_in addr;
+    socklen_t addr_len = sizeof addr;
+    char* ogg_path = NULL;
+    int opt, fd, one = 1;
+
+    while ((opt = getopt(argc, argv, "l:P:p:s:t:o:i:d:z:h")) != -1) {
+        switch (opt) {
+        case 'l': config.port = atoi(optarg); break;
+        case 'P': config.password = optarg; break;
+        case 's': config.search_hits = atoi(optarg); break;
+        case 't': config.seconds = atoi(optarg); break;
+        case 'o': ogg_path = optarg; break;
+        case 'i': config.image_size = atoi(optarg) > 4 ? atoi(optarg) : 4;
+                  break;
+        case 'd': config.delay = atoi(optarg); break;
+        case 'z': config.puzzle = atoi(optarg); break;
+
+        case 'p':
+            config.num_playlists = 0;
+            for (char* n = strtok(optarg, ","); n && config.num_playlists <
+                 MAX_PLAYLISTS; n = strtok(NULL, ","))
+                config.playlists[config.num_playlists++] = atoi(n);
+            break;
+
+        default:
+            usage(argv[0]);
+        }
+    }
+
+    if (ogg_path)
+        load_ogg(ogg_path);
+    else
+        encode_ogg();
+    pad_ogg();
+
+    /* one set of keys serves every connection */
+    SESSION* session = session_init_client();
+
+    fd = socket(AF_INET, SOCK_STREAM, 0);
+    setsockopt(fd, SOL_SOCKET, SO_REUSEADDR, &one, sizeof one);
+    memset(&addr, 0, sizeof addr);
+    addr.sin_family = AF_INET;
+    addr.sin_addr.s_addr = htonl(INADDR_LOOPBACK);
+    addr.sin_port = htons(config.port);
+    if (bind(fd, (struct sockaddr*)&addr, sizeof addr) ||
+        listen(fd, 16) ||
+        getsockname(fd, (struct sockaddr*)&addr, &addr_len)) {
+        perror("fakeserver");
+        return 1;
+    }
+
+    signal(SIGCHLD, SIG_IGN);
+    printf("%d\n", ntohs(addr.sin_port));
+    fflush(stdout);
+
+    while (1) {
+        int client = accept(fd, NULL, NULL);
+        if (client < 0)
+            continue;
+
+        setsockopt(client, IPPROTO_TCP, TCP_NODELAY, &one, sizeof one);
+        if (fork() == 0) {
+            close(fd);
+            session->ap_sock = client;
+            serve(session);
+            close(client);
+            _exit(0);
+        }
+        close(client);
+    }
+
+    return 0;
+}
@@ -0,0 +1,25 @@
+OBJS = fakeserver.o
+LIBDIR = ../../lib
+LIB = $(LIBDIR)/libdespotify.la
+
+CFLAGS += -I$(LIBDIR)
+LDFLAGS += -lvorbisenc -lvorbis -logg -lm
+
+all: fakeserver
+
+# These are the files we depgen for. :-)
+CFILES = $(OBJS:.o=.c)
+include ../depgen.mk
+
+fakeserver: $(OBJS) $(LIB)
+	@echo LD $@
+	$(SILENT)$(LT) --mode=link $(CC) -o $@ $(CFLAGS) $(LDFLAGS) $(OBJS) $(LIB)
+
+clean:
+	$(LT) --mode=clean rm -f fakeserver
+	rm -f $(OBJS) Makefile.dep
+
+# Only used by benchmarks and tests, never installed.
+install:
+
+uninstall:
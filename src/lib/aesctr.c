@@ -0,0 +1,87 @@
+/*
+ * Decryption of audio files, AES-128 in counter mode.
+ *
+ * Files are sent in blocks of 1024 bytes, each interleaved as 4 x 256
+ * bytes. The counter starts at a fixed IV and runs on across the channel
+ * packets and substreams of a file, so the state of a file is a struct
+ * aes_ctr.
+ *
+ * $Id$
+ */
+
+#include <string.h>
+
+#include "aes.h"
+#include "aesctr.h"
+
+#define BLOCK_SIZE 1024
+
+static const unsigned char aes_ctr_IV[16] =
+    "\x72\xe0\x67\xfb\xdd\xcb\xcf\x77"
+    "\xeb\xe8\xbc\x64\x3f\x63\x0d\x93";
+
+/* Set up aes to decrypt a file from its start */
+void aes_ctr_init(struct aes_ctr* aes, const unsigned char* key)
+{
+    rijndaelKeySetupEnc(aes->state, key, 128);
+    memcpy(aes->IV, aes_ctr_IV, 16);
+}
+
+/* Produce the keystream of a whole block, advancing the counter */
+static void aes_ctr_keystream(struct aes_ctr* aes, unsigned char* out)
+{
+    int i, j;
+
+    for (i = 0; i < BLOCK_SIZE; i += 16) {
+        rijndaelEncrypt(aes->state, 10, aes->IV, out + i);
+
+        /* the counter is big endian, carry only when the low byte wraps */
+        if (++aes->IV[15] == 0)
+            for (j = 14; j >= 0 && ++aes->IV[j] == 0; j--)
+                ;
+    }
+}
+
+/*
+ * Decrypt a channel packet of len bytes from in to out, which may not
+ * overlap. Only whole blocks are decrypted, a trailing partial block is
+ * copied as it is.
+ */
+void aes_ctr_decrypt(struct aes_ctr* aes, unsigned char* out,
+                     const unsigned char* in, int len)
+{
+    union {
+        unsigned char bytes[BLOCK_SIZE];
+        unsigned long words[BLOCK_SIZE / sizeof(unsigned long)];
+    } keystream;
+    int block, i;
+
+    for (block = 0; block + BLOCK_SIZE <= len; block += BLOCK_SIZE) {
+        const unsigned char* w = in + block + 0 * 256;
+        const unsigned char* x = in + block + 1 * 256;
+        const unsigned char* y = in + block + 2 * 256;
+        const unsigned char* z = in + block + 3 * 256;
+        unsigned char* p = out + block;
+
+        /* Deinterleave the 4x256 byte blocks */
+        for (i = 0; i < 256; i++) {
+            p[4 * i] = w[i];
+            p[4 * i + 1] = x[i];
+            p[4 * i + 2] = y[i];
+            p[4 * i + 3] = z[i];
+        }
+
+        aes_ctr_keystream(aes, keystream.bytes);
+
+        /* XOR a word at a time, out need not be aligned */
+        for (i = 0; i < BLOCK_SIZE / (int) sizeof(unsigned long); i++) {
+            unsigned long word;
+            memcpy(&word, p + i * sizeof word, sizeof word);
+            word ^= keystream.words[i];
+            memcpy(p + i * sizeof word, &word, sizeof word);
+        }
+    }
+
+    if (block < len)
+        memcpy(out + block, in + block, len - block);
+}
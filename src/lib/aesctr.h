@@ -0,0 +1,16 @@
+/*
+ * Decryption of audio files, AES-128 in counter mode.
+ *
+ * $Id$
+ */
+
+#ifndef DESPOTIFY_AESCTR_H
+#define DESPOTIFY_AESCTR_H
+
+#include "despotify.h"
+
+void aes_ctr_init(struct aes_ctr* aes, const unsigned char* key);
+void aes_ctr_decrypt(struct aes_ctr* aes, unsigned char* out,
+                     const unsigned char* in, int len);
+
+#endif
@@ -1,18 +1,231 @@
 #include <dirent.h>
 #include <errno.h>
+#include <fcntl.h>
 #include <limits.h>
+#include <pthread.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
+#include <sys/mman.h>
 #include <sys/stat.h>
+#include <unistd.h>
 
+#include "despotify.h"
 #include "util.h"
 #include "cache.h"
 
-char cache_directory[PATH_MAX];
-char cache_filename[PATH_MAX];
+#define CACHE_BUCKETS 4096
+#define CACHE_ID_LENGTH 64
+
+/* An entry in the in-memory index of the cache directory. */
+struct cache_entry
+{
+    char id[CACHE_ID_LENGTH];
+    unsigned long size;
+    time_t mtime;
+
+    struct cache_entry *hash_next; /* next entry in the same bucket */
+    struct cache_entry *prev;      /* LRU list, most recently used first */
+    struct cache_entry *next;
+};
+
+static char cache_directory[PATH_MAX];
+static bool cache_initialized = false;
+
+/* Protects everything below. */
+static pthread_mutex_t cache_mutex = PTHREAD_MUTEX_INITIALIZER;
+static struct cache_entry *cache_buckets[CACHE_BUCKETS];
+static struct cache_entry *lru_head = NULL;
+static struct cache_entry *lru_tail = NULL;
+static struct cache_stats stats = { 0, 0, CACHE_DEFAULT_MAX_SIZE, 0, 0, 0 };
+
+static void cache_path(char *path, const char *id){
+    snprintf(path, PATH_MAX, "%s/%s", cache_directory, id);
+}
 
-bool cache_init(){
+static unsigned int cache_hash(const char *id){
+    unsigned int hash = 5381;
+
+    while(*id){
+        hash = hash * 33 + (unsigned char)*id++;
+    }
+
+    return hash % CACHE_BUCKETS;
+}
+
+static struct cache_entry *cache_find(const char *id){
+    struct cache_entry *e;
+
+    for(e = cache_buckets[cache_hash(id)]; e; e = e->hash_next){
+        if(!strcmp(e->id, id)){
+            return e;
+        }
+    }
+
+    return NULL;
+}
+
+static void lru_unlink(struct cache_entry *e){
+    if(e->prev)
+        e->prev->next = e->next;
+    else
+        lru_head = e->next;
+
+    if(e->next)
+        e->next->prev = e->prev;
+    else
+        lru_tail = e->prev;
+
+    e->prev = e->next = NULL;
+}
+
+static void lru_push_front(struct cache_entry *e){
+    e->prev = NULL;
+    e->next = lru_head;
+
+    if(lru_head)
+        lru_head->prev = e;
+    else
+        lru_tail = e;
+
+    lru_head = e;
+}
+
+/* Add an entry to the index, or update the size of an existing one,
+   and mark it as most recently used. */
+static void cache_index(const char *id, unsigned long size){
+    struct cache_entry *e = cache_find(id);
+
+    if(e){
+        lru_unlink(e);
+        stats.bytes -= e->size;
+    }
+    else{
+        unsigned int bucket = cache_hash(id);
+
+        if((e = calloc(1, sizeof(struct cache_entry))) == NULL){
+            DSFYDEBUG("Error allocating memory for cache entry.\n");
+
+            return;
+        }
+
+        DSFYstrncpy(e->id, id, sizeof e->id);
+        e->hash_next = cache_buckets[bucket];
+        cache_buckets[bucket] = e;
+        stats.entries++;
+    }
+
+    e->size = size;
+    stats.bytes += size;
+    lru_push_front(e);
+}
+
+/* Remove an entry from the index, and its file if remove_file is set. */
+static void cache_drop(struct cache_entry *e, bool remove_file){
+    struct cache_entry **p = &cache_buckets[cache_hash(e->id)];
+
+    while(*p != e){
+        p = &(*p)->hash_next;
+    }
+    *p = e->hash_next;
+
+    lru_unlink(e);
+    stats.entries--;
+    stats.bytes -= e->size;
+
+    if(remove_file){
+        char path[PATH_MAX];
+
+        cache_path(path, e->id);
+        remove(path);
+    }
+
+    free(e);
+}
+
+/* Evict least recently used entries until the cache fits in max_bytes. */
+static void cache_evict(){
+    while(stats.max_bytes && stats.bytes > stats.max_bytes && lru_tail){
+        DSFYDEBUG("Evicting cache entry '%s'.\n", lru_tail->id);
+
+        cache_drop(lru_tail, true);
+        stats.evictions++;
+    }
+}
+
+static int cache_compare_mtime(const void *a, const void *b){
+    time_t ma = (*(struct cache_entry **)a)->mtime;
+    time_t mb = (*(struct cache_entry **)b)->mtime;
+
+    return (ma > mb) - (ma < mb);
+}
+
+/* Build the index from the files in the cache directory, using their
+   modification times as a first guess at the LRU order. */
+static void cache_scan(){
+    DIR *dir = opendir(cache_directory);
+    struct dirent *dirp;
+    struct stat st;
+    char path[PATH_MAX];
+    struct cache_entry **found = NULL;
+    int count = 0, allocated = 0;
+
+    if(!dir){
+        DSFYDEBUG("Error opening cache directory.\n");
+
+        return;
+    }
+
+    while((dirp = readdir(dir)) != NULL){
+        if(dirp->d_name[0] == '.' ||
+           !strcmp(dirp->d_name, "meta_playlist_revision") ||
+           strlen(dirp->d_name) >= CACHE_ID_LENGTH){
+            continue;
+        }
+
+        cache_path(path, dirp->d_name);
+        if(stat(path, &st) != 0 || !S_ISREG(st.st_mode)){
+            continue;
+        }
+
+        if(count == allocated){
+            struct cache_entry **grown;
+
+            allocated = allocated ? allocated * 2 : 256;
+            grown = realloc(found, allocated * sizeof(struct cache_entry *));
+            if(!grown){
+                DSFYDEBUG("Error allocating memory for cache index.\n");
+
+                break;
+            }
+            found = grown;
+        }
+
+        if((found[count] = calloc(1, sizeof(struct cache_entry))) == NULL){
+            break;
+        }
+        DSFYstrncpy(found[count]->id, dirp->d_name, sizeof found[count]->id);
+        found[count]->size = st.st_size;
+        found[count]->mtime = st.st_mtime;
+        count++;
+    }
+
+    closedir(dir);
+
+    /* Oldest first, so the newest ends up at the front of the LRU list. */
+    qsort(found, count, sizeof(struct cache_entry *), cache_compare_mtime);
+
+    for(int i = 0; i < count; i++){
+        cache_index(found[i]->id, found[i]->size);
+        free(found[i]);
+    }
+
+    free(found);
+
+    DSFYDEBUG("Indexed %u cache entries, %lu bytes.\n", stats.entries, stats.bytes);
+}
+
+static bool cache_make_directory(){
     char *ptr;
 
     if((ptr = getenv("XDG_CACHE_HOME")) != NULL){
@@ -51,13 +264,39 @@ bool cache_init(){
     return true;
 }
 
+bool cache_init(){
+    bool ok = true;
+
+    pthread_mutex_lock(&cache_mutex);
+
+    if(!cache_initialized){
+        if((ok = cache_make_directory())){
+            cache_scan();
+            cache_evict();
+            cache_initialized = true;
+        }
+    }
+
+    pthread_mutex_unlock(&cache_mutex);
+
+    return ok;
+}
+
 void cache_clear(){
-    DIR *dir = opendir(cache_directory);
+    DIR *dir;
     struct dirent *dirp;
+    char path[PATH_MAX];
 
-    if(!dir){
+    pthread_mutex_lock(&cache_mutex);
+
+    while(lru_head){
+        cache_drop(lru_head, false);
+    }
+
+    if(!(dir = opendir(cache_directory))){
         DSFYDEBUG("Error opening cache directory.\n");
 
+        pthread_mutex_unlock(&cache_mutex);
         return;
     }
 
@@ -68,48 +307,92 @@ void cache_clear(){
         }
 
         /* Build cache filename. */
-        snprintf(cache_filename, PATH_MAX, "%s/%s", cache_directory, dirp->d_name);
+        cache_path(path, dirp->d_name);
 
-        remove(cache_filename);
+        remove(path);
     }
+
+    closedir(dir);
+
+    pthread_mutex_unlock(&cache_mutex);
 }
 
 bool cache_contains(unsigned char *id){
-    /* Build cache filename. */
-    snprintf(cache_filename, PATH_MAX, "%s/%s", cache_directory, id);
+    bool found;
 
-    /* Try to open file for reading. */
-    FILE *file = fopen(cache_filename, "r");
+    pthread_mutex_lock(&cache_mutex);
 
-    if(file){
-        fclose(file);
+    found = cache_find((char *)id) != NULL;
+    if(found)
+        stats.hits++;
+    else
+        stats.misses++;
 
-        return true;
-    }
+    pthread_mutex_unlock(&cache_mutex);
 
-    return false;
+    return found;
 }
 
-unsigned char *cache_load(unsigned char *id, unsigned int *size){
-    unsigned char *data;
-    unsigned long fsize;
+/* Open the file of a cached entry and mark it as most recently used.
+   Returns the file descriptor, or -1 if the entry isn't cached. */
+static int cache_open(unsigned char *id, unsigned long *size){
+    struct cache_entry *e;
+    struct stat st;
+    char path[PATH_MAX];
+    int fd;
+
+    pthread_mutex_lock(&cache_mutex);
+
+    if((e = cache_find((char *)id)) == NULL){
+        pthread_mutex_unlock(&cache_mutex);
+
+        return -1;
+    }
+
+    /* Mark as most recently used. */
+    lru_unlink(e);
+    lru_push_front(e);
+
+    pthread_mutex_unlock(&cache_mutex);
 
     /* Build cache filename. */
-    snprintf(cache_filename, PATH_MAX, "%s/%s", cache_directory, id);
+    cache_path(path, (char *)id);
 
     /* Try to open file for reading. */
-    FILE *file = fopen(cache_filename, "r");
-
-    if(!file){
+    if((fd = open(path, O_RDONLY)) < 0){
         DSFYDEBUG("Error opening file in read-mode.\n");
 
-        return NULL;
+        /* The file is gone, so forget about it. */
+        pthread_mutex_lock(&cache_mutex);
+        if((e = cache_find((char *)id)) != NULL)
+            cache_drop(e, false);
+        pthread_mutex_unlock(&cache_mutex);
+
+        return -1;
     }
 
     /* Determine file size. */
-    fseek(file, 0, SEEK_END);
-    fsize = ftell(file);
-    fseek(file, 0L, SEEK_SET);
+    if(fstat(fd, &st) != 0){
+        DSFYDEBUG("Error reading cache file size.\n");
+
+        close(fd);
+        return -1;
+    }
+
+    *size = st.st_size;
+
+    return fd;
+}
+
+unsigned char *cache_load(unsigned char *id, unsigned int *size){
+    unsigned char *data;
+    unsigned long fsize, done = 0;
+    ssize_t n;
+    int fd;
+
+    if((fd = cache_open(id, &fsize)) < 0){
+        return NULL;
+    }
 
     /* Allocate memory. */
     data = (unsigned char *)malloc(fsize);
@@ -117,19 +400,64 @@ unsigned char *cache_load(unsigned char *id, unsigned int *size){
     if(!data){
         DSFYDEBUG("Error allocating memory for cache data.\n");
 
+        close(fd);
         return NULL;
     }
 
     /* Read data into memory. */
-    if(fread(data, 1, fsize, file) != fsize){
-        free(data);
+    while(done < fsize){
+        if((n = read(fd, data + done, fsize - done)) <= 0){
+            if(n < 0 && errno == EINTR)
+                continue;
 
-        DSFYDEBUG("Error reading cache data.\n");
+            free(data);
+            close(fd);
+
+            DSFYDEBUG("Error reading cache data.\n");
+
+            return NULL;
+        }
+        done += n;
+    }
+
+    close(fd);
+
+    if(size){
+        *size = fsize;
+    }
+
+    return data;
+}
+
+unsigned char *cache_map(unsigned char *id, unsigned int *size, bool writable){
+    void *data;
+    unsigned long fsize;
+    int fd;
 
+    if((fd = cache_open(id, &fsize)) < 0){
         return NULL;
     }
 
-    fclose(file);
+    /* Nothing to map. */
+    if(fsize == 0){
+        close(fd);
+        return NULL;
+    }
+
+    /* A private mapping, so writes to it never reach the file. */
+    data = mmap(NULL, fsize, writable ? PROT_READ | PROT_WRITE : PROT_READ,
+                MAP_PRIVATE, fd, 0);
+
+    /* The mapping keeps the file alive. */
+    close(fd);
+
+    if(data == MAP_FAILED){
+        DSFYDEBUG("Error mapping cache data. errno = %d\n", errno);
+
+        return NULL;
+    }
+
+    madvise(data, fsize, MADV_SEQUENTIAL);
 
     if(size){
         *size = fsize;
@@ -138,47 +466,110 @@ unsigned char *cache_load(unsigned char *id, unsigned int *size){
     return data;
 }
 
+void cache_unmap(unsigned char *data, unsigned int size){
+    if(data){
+        munmap(data, size);
+    }
+}
+
 void cache_remove(unsigned char *id){
-    /* Build cache filename. */
-    snprintf(cache_filename, PATH_MAX, "%s/%s", cache_directory, id);
+    struct cache_entry *e;
+    char path[PATH_MAX];
+
+    pthread_mutex_lock(&cache_mutex);
 
-    /* Remove cache file. */
-    if(remove(cache_filename) != 0){
-        DSFYDEBUG("Error removing cache file.\n");
+    if((e = cache_find((char *)id)) != NULL){
+        cache_drop(e, true);
     }
+    else{
+        /* Build cache filename. */
+        cache_path(path, (char *)id);
+
+        /* Remove cache file. */
+        if(remove(path) != 0){
+            DSFYDEBUG("Error removing cache file.\n");
+        }
+    }
+
+    pthread_mutex_unlock(&cache_mutex);
 }
 
 void cache_store(unsigned char *id, unsigned char *data, unsigned int size){
+    char path[PATH_MAX];
+    char temp[PATH_MAX];
+
+    if(strlen((char *)id) >= CACHE_ID_LENGTH){
+        DSFYDEBUG("Cache id too long.\n");
+
+        return;
+    }
+
     /* Build cache filename. */
-    snprintf(cache_filename, PATH_MAX, "%s/%s", cache_directory, id);
+    cache_path(path, (char *)id);
 
-    /* Try to open file for writing. */
-    FILE *file = fopen(cache_filename, "w");
+    /* Write to a temporary file and rename it over the entry, so mappings
+       of the old contents stay valid. Dot files are not indexed. */
+    snprintf(temp, PATH_MAX, "%s/.%s.XXXXXX", cache_directory, (char *)id);
+
+    int fd = mkstemp(temp);
+    FILE *file = fd < 0 ? NULL : fdopen(fd, "w");
 
     if(!file){
         DSFYDEBUG("Error opening file in write-mode.\n");
 
+        if(fd >= 0){
+            close(fd);
+            remove(temp);
+        }
         return;
     }
 
+    fchmod(fd, 0644);
+
     /* Write data to file. */
     if(fwrite(data, 1, size, file) != size){
         DSFYDEBUG("Error writing cache data.\n");
 
+        fclose(file);
+        remove(temp);
         return;
     }
 
-    fclose(file);
+    if(fclose(file) != 0 || rename(temp, path) != 0){
+        DSFYDEBUG("Error writing cache data.\n");
+
+        remove(temp);
+        return;
+    }
+
+    pthread_mutex_lock(&cache_mutex);
+    cache_index((char *)id, size);
+    cache_evict();
+    pthread_mutex_unlock(&cache_mutex);
+}
+
+void cache_set_max_size(unsigned long max_bytes){
+    pthread_mutex_lock(&cache_mutex);
+    stats.max_bytes = max_bytes;
+    cache_evict();
+    pthread_mutex_unlock(&cache_mutex);
+}
+
+void cache_get_stats(struct cache_stats *s){
+    pthread_mutex_lock(&cache_mutex);
+    *s = stats;
+    pthread_mutex_unlock(&cache_mutex);
 }
 
 unsigned int cache_get_meta_playlist_revision(){
     unsigned int revision;
+    char path[PATH_MAX];
 
     /* Build cache filename. */
-    snprintf(cache_filename, PATH_MAX, "%s/meta_playlist_revision", cache_directory);
+    cache_path(path, "meta_playlist_revision");
 
     /* Try to open file for reading. */
-    FILE *file = fopen(cache_filename, "r");
+    FILE *file = fopen(path, "r");
 
     if(!file){
         DSFYDEBUG("Error opening file in read-mode.\n");
@@ -190,6 +581,7 @@ unsigned int cache_get_meta_playlist_revision(){
     if(fread(&revision, sizeof(unsigned int), 1, file) != 1){
         DSFYDEBUG("Error reading meta playlist revision.\n");
 
+        fclose(file);
         return 0;
     }
 
@@ -199,11 +591,13 @@ unsigned int cache_get_meta_playlist_revision(){
 }
 
 void cache_set_meta_playlist_revision(unsigned int revision){
+    char path[PATH_MAX];
+
     /* Build cache filename. */
-    snprintf(cache_filename, PATH_MAX, "%s/meta_playlist_revision", cache_directory);
+    cache_path(path, "meta_playlist_revision");
 
     /* Try to open file for writing. */
-    FILE *file = fopen(cache_filename, "w");
+    FILE *file = fopen(path, "w");
 
     if(!file){
         DSFYDEBUG("Error opening file in write-mode.\n");
@@ -215,9 +609,9 @@ void cache_set_meta_playlist_revision(unsigned int revision){
     if(fwrite(&revision, sizeof(unsigned int), 1, file) != 1){
         DSFYDEBUG("Error writing meta playlist revision.\n");
 
+        fclose(file);
         return;
     }
 
     fclose(file);
 }
-
@@ -3,12 +3,18 @@
 
 #include <stdbool.h>
 
+struct cache_stats;
+
 bool cache_init();
 void cache_clear();
 bool cache_contains(unsigned char *id);
 unsigned char *cache_load(unsigned char *id, unsigned int *size);
+unsigned char *cache_map(unsigned char *id, unsigned int *size, bool writable);
+void cache_unmap(unsigned char *data, unsigned int size);
 void cache_remove(unsigned char *id);
 void cache_store(unsigned char *id, unsigned char *data, unsigned int size);
+void cache_set_max_size(unsigned long max_bytes);
+void cache_get_stats(struct cache_stats *stats);
 
 unsigned int cache_get_meta_playlist_revision();
 void cache_set_meta_playlist_revision(unsigned int revision);
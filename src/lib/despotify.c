@@ -8,7 +8,7 @@
 #include <unistd.h>
 #include <zlib.h>
 
-#include "aes.h"
+#include "aesctr.h"
 #include "auth.h"
 #include "buf.h"
 #include "cache.h"
@@ -26,8 +26,6 @@
 #include "util.h"
 #include "xml.h"
 
-#define MAX_BROWSE_REQ 244 /* max entries to load in one browse request */
-
 bool despotify_init()
 {
     DSFYDEBUG("Initializing networking\n");
@@ -48,6 +46,159 @@ bool despotify_cleanup()
     return true;
 }
 
+void despotify_set_cache_size(unsigned long max_bytes)
+{
+    cache_set_max_size(max_bytes);
+}
+
+void despotify_get_cache_stats(struct cache_stats* stats)
+{
+    cache_get_stats(stats);
+}
+
+void despotify_clear_cache()
+{
+    cache_clear();
+}
+
+/****************************************************
+ *
+ *  Instrumentation
+ *
+ */
+
+/* upper bounds of the latency buckets, in seconds */
+const double despotify_latency_bounds[DESPOTIFY_LATENCY_BUCKETS - 1] = {
+    0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10
+};
+
+static void stats_record(struct despotify_session* ds, int op,
+                         double started, bool ok)
+{
+    struct op_stats* s = &ds->stats.ops[op];
+    double seconds = time_now() - started;
+    int bucket = 0;
+
+    while (bucket < DESPOTIFY_LATENCY_BUCKETS - 1 &&
+           seconds > despotify_latency_bounds[bucket])
+        bucket++;
+
+    pthread_mutex_lock(&ds->stats_mutex);
+    s->count++;
+    if (!ok)
+        s->errors++;
+    s->seconds += seconds;
+    if (seconds > s->max_seconds)
+        s->max_seconds = seconds;
+    s->buckets[bucket]++;
+    pthread_mutex_unlock(&ds->stats_mutex);
+}
+
+static void stats_add_bytes(struct despotify_session* ds, int op, int len)
+{
+    pthread_mutex_lock(&ds->stats_mutex);
+    ds->stats.ops[op].bytes += len;
+    pthread_mutex_unlock(&ds->stats_mutex);
+}
+
+/* Start a request answered into ds->response, timing it until
+   despotify_wait_timeout() returns. A late reply to an earlier request
+   that timed out may have left response_ready set; clear it, or the wait
+   would return before this request is answered. */
+static void despotify_begin_request(struct despotify_session* ds, int op)
+{
+    pthread_mutex_lock(&ds->sync_mutex);
+    ds->response_ready = false;
+    pthread_mutex_unlock(&ds->sync_mutex);
+
+    ds->op = op;
+    ds->op_started = time_now();
+}
+
+/* cache_contains(), counting hits and misses */
+static bool despotify_cache_contains(struct despotify_session* ds,
+                                     unsigned char* id)
+{
+    bool found;
+
+    if (!ds->use_cache)
+        return false;
+
+    found = cache_contains(id);
+
+    pthread_mutex_lock(&ds->stats_mutex);
+    if (found)
+        ds->stats.cache_hits++;
+    else
+        ds->stats.cache_misses++;
+    pthread_mutex_unlock(&ds->stats_mutex);
+
+    return found;
+}
+
+static unsigned char* despotify_cache_load(struct despotify_session* ds,
+                                           unsigned char* id, int* len)
+{
+    double started = time_now();
+    unsigned char* data = cache_load(id, (unsigned int*) len);
+
+    stats_record(ds, DESPOTIFY_OP_CACHE_LOAD, started, data != NULL);
+    return data;
+}
+
+/* Like despotify_cache_load(), but maps the entry instead of copying it.
+   The view is private and writable, as the XML parser works in place.
+   Release it with cache_unmap(). */
+static unsigned char* despotify_cache_map(struct despotify_session* ds,
+                                          unsigned char* id, int* len)
+{
+    double started = time_now();
+    unsigned char* data = cache_map(id, (unsigned int*) len, true);
+
+    stats_record(ds, DESPOTIFY_OP_CACHE_LOAD, started, data != NULL);
+    return data;
+}
+
+void despotify_sample_fifo(struct despotify_session* ds)
+{
+    struct snd_fifo* fifo = ds->fifo;
+
+    if (!fifo || fifo->maxbytes <= 0)
+        return;
+
+    pthread_mutex_lock(&ds->stats_mutex);
+    ds->stats.fifo_samples++;
+    ds->stats.fifo_fill_sum += (double) fifo->totbytes / fifo->maxbytes;
+    if (fifo->totbytes < fifo->watermark)
+        ds->stats.fifo_below_watermark++;
+    pthread_mutex_unlock(&ds->stats_mutex);
+}
+
+void despotify_get_stats(struct despotify_session* ds,
+                         struct despotify_stats* stats)
+{
+    assert(ds != NULL);
+
+    pthread_mutex_lock(&ds->stats_mutex);
+    *stats = ds->stats;
+    pthread_mutex_unlock(&ds->stats_mutex);
+
+    if (ds->fifo) {
+        stats->fifo_bytes = ds->fifo->totbytes;
+        stats->fifo_max_bytes = ds->fifo->maxbytes;
+        stats->fifo_watermark = ds->fifo->watermark;
+    }
+}
+
+void despotify_reset_stats(struct despotify_session* ds)
+{
+    assert(ds != NULL);
+
+    pthread_mutex_lock(&ds->stats_mutex);
+    memset(&ds->stats, 0, sizeof ds->stats);
+    pthread_mutex_unlock(&ds->stats_mutex);
+}
+
 static void* despotify_thread(void* arg)
 {
     struct despotify_session* ds = arg;
@@ -84,6 +235,9 @@ struct despotify_session* despotify_init_client(void(*callback)(struct despotify
     ds->thread = (pthread_t)0;
     pthread_cond_init(&ds->sync_cond, NULL);
     pthread_mutex_init(&ds->sync_mutex, NULL);
+    pthread_mutex_init(&ds->prefetch_mutex, NULL);
+    pthread_mutex_init(&ds->stats_mutex, NULL);
+    ds->op = -1;
 
     ds->user_info = &ds->session->user_info;
     ds->client_callback = callback;
@@ -163,12 +317,16 @@ bool despotify_authenticate(struct despotify_session* ds,
     pthread_create(&ds->thread, NULL, &despotify_thread, ds);
 
     pthread_mutex_lock(&ds->session->login_mutex);
-    pthread_cond_wait(&ds->session->login_cond, &ds->session->login_mutex);
+    while (!ds->session->logged_in)
+        pthread_cond_wait(&ds->session->login_cond,
+                          &ds->session->login_mutex);
     pthread_mutex_unlock(&ds->session->login_mutex);
 
     return true;
 }
 
+static void prefetch_collect(struct despotify_session* ds);
+
 void despotify_exit(struct despotify_session* ds)
 {
     DSFYDEBUG("Calling despotify_free() and requesting disconnection\n");
@@ -196,6 +354,15 @@ void despotify_free(struct despotify_session* ds, bool should_disconnect)
 
     snd_destroy(ds);
 
+    /* the networking thread is gone, nothing is in flight anymore */
+    for (struct prefetch* p = ds->prefetch; p; p = p->next) {
+        p->detached = true;
+        p->in_flight = 0;
+    }
+    prefetch_collect(ds);
+    pthread_mutex_destroy(&ds->prefetch_mutex);
+    pthread_mutex_destroy(&ds->stats_mutex);
+
     session_free(ds->session);
     free(ds);
 
@@ -241,13 +408,37 @@ void despotify_set_watermark(struct despotify_session* ds, int watermark)
  */
 
 
+/* Decrypt a channel packet of a file into a buffer for the fifo */
+static struct snd_buffer* despotify_decrypt(struct despotify_session* ds,
+                                            struct aes_ctr* aes,
+                                            unsigned char* buf,
+                                            unsigned short len)
+{
+    struct snd_buffer* b = snd_buffer_new(ds, len);
+
+    b->cmd = SND_CMD_DATA;
+    b->length = len;
+    aes_ctr_decrypt(aes, b->ptr, buf, len);
+
+    return b;
+}
+
+/* Add SND_CMD_START to buffer chain, with a copy of the track struct */
+static void despotify_start_track(struct despotify_session* ds)
+{
+    struct track* copy = malloc(sizeof(struct track));
+    memcpy(copy, ds->track, sizeof(struct track));
+    snd_ioctl(ds, SND_CMD_START, copy, 0);
+}
+
 /* called by channel */
 static int despotify_aes_callback(CHANNEL* ch,
                                   unsigned char* buf,
                                   unsigned short len)
 {
+    struct despotify_session* ds = ch->private;
+
     if (ch->state == CHANNEL_DATA) {
-        struct despotify_session* ds = ch->private;
         struct track* t = ds->track;
 
         if (t->key)
@@ -256,27 +447,323 @@ static int despotify_aes_callback(CHANNEL* ch,
         t->key = malloc(len);
         memcpy(t->key, buf, len);
 
-        /* Expand file key */
-        rijndaelKeySetupEnc (ds->aes.state, t->key, 128);
-
-        /* Set initial IV */
-        memcpy(ds->aes.IV,
-               "\x72\xe0\x67\xfb\xdd\xcb\xcf\x77"
-               "\xeb\xe8\xbc\x64\x3f\x63\x0d\x93",
-               16);
+        /* Expand file key, set initial IV */
+        aes_ctr_init(&ds->aes, t->key);
 
         DSFYDEBUG ("Got AES key\n");
+        stats_record(ds, DESPOTIFY_OP_KEY, ds->key_requested, true);
 
-        /* Add SND_CMD_START to buffer chain,
-           with a copy of the track struct */
-        struct track* copy = malloc(sizeof(struct track));
-        memcpy(copy, ds->track, sizeof(struct track));
-        snd_ioctl(ds, SND_CMD_START, copy, 0);
+        despotify_start_track(ds);
+    }
+    else if (ch->state == CHANNEL_ERROR) {
+        stats_record(ds, DESPOTIFY_OP_KEY, ds->key_requested, false);
+        if (ds->client_callback)
+            ds->client_callback(ds, DESPOTIFY_TRACK_PLAY_ERROR,
+                                NULL, ds->client_callback_data);
     }
 
     return 0;
 }
 
+/****************************************************
+ *
+ *  Prefetching of the next tracks in a list
+ *
+ *  Entries live in ds->prefetch, guarded by ds->prefetch_mutex. Their
+ *  requests are answered in the networking thread, so an entry that is
+ *  no longer wanted stays in the list, detached, until the last of them
+ *  has called back.
+ *
+ */
+
+static void prefetch_free_buffers(struct despotify_session* ds,
+                                  struct snd_buffer* b)
+{
+    while (b) {
+        struct snd_buffer* next = b->next;
+        snd_buffer_free(ds, b);
+        b = next;
+    }
+}
+
+/* Free detached entries that have nothing in flight. Lock held. */
+static void prefetch_collect(struct despotify_session* ds)
+{
+    struct prefetch** link = &ds->prefetch;
+
+    while (*link) {
+        struct prefetch* p = *link;
+
+        if (p->detached && !p->in_flight) {
+            *link = p->next;
+            prefetch_free_buffers(ds, p->data);
+            prefetch_free_buffers(ds, p->pending);
+            if (p->key)
+                free(p->key);
+            free(p);
+        }
+        else
+            link = &p->next;
+    }
+}
+
+/* Entries are keyed by file id, not by track pointer: a freed track's
+   address may be reused by a new track of another file. */
+static struct prefetch* prefetch_find(struct despotify_session* ds,
+                                      struct track* t)
+{
+    unsigned char file_id[20];
+    struct prefetch* p;
+
+    hex_ascii_to_bytes(t->file_id, file_id, sizeof file_id);
+    for (p = ds->prefetch; p; p = p->next)
+        if (!p->detached && !memcmp(p->file_id, file_id, sizeof file_id))
+            return p;
+
+    return NULL;
+}
+
+static int prefetch_substream_callback(CHANNEL* ch,
+                                       unsigned char* buf,
+                                       unsigned short len)
+{
+    struct prefetch* p = ch->private;
+    struct despotify_session* ds = p->ds;
+    struct snd_buffer* b;
+    struct snd_buffer** end;
+
+    pthread_mutex_lock(&ds->prefetch_mutex);
+
+    switch (ch->state) {
+    case CHANNEL_DATA:
+        stats_add_bytes(ds, DESPOTIFY_OP_SUBSTREAM, len);
+        if (p->detached)
+            break;
+
+        b = despotify_decrypt(ds, &p->aes, buf, len);
+
+        for (end = &p->pending; *end; end = &(*end)->next)
+            ;
+        *end = b;
+        break;
+
+    case CHANNEL_ERROR:
+        /* keep what we have, the player fetches the rest */
+        stats_record(ds, DESPOTIFY_OP_SUBSTREAM, p->requested, false);
+        p->in_flight--;
+        prefetch_free_buffers(ds, p->pending);
+        p->pending = NULL;
+        break;
+
+    case CHANNEL_END:
+        stats_record(ds, DESPOTIFY_OP_SUBSTREAM, p->requested, true);
+        p->in_flight--;
+        if (p->detached)
+            break;
+
+        for (end = &p->data; *end; end = &(*end)->next)
+            ;
+        *end = p->pending;
+        p->pending = NULL;
+
+        p->offset += ch->total_data_len;
+        p->substreams++;
+        memcpy(p->ready_IV, p->aes.IV, 16);
+
+        if (ch->total_data_len < SUBSTREAM_SIZE)
+            p->complete = true;
+        else if (p->substreams < ds->prefetch_substreams) {
+            p->requested = time_now();
+            if (!cmd_getsubstreams(ds->session, p->file_id,
+                                   p->offset, SUBSTREAM_SIZE,
+                                   200 * 1000, /* unknown, static value */
+                                   prefetch_substream_callback, p))
+                p->in_flight++;
+        }
+        break;
+
+    default:
+        break;
+    }
+
+    prefetch_collect(ds);
+    pthread_mutex_unlock(&ds->prefetch_mutex);
+
+    return 0;
+}
+
+static int prefetch_aes_callback(CHANNEL* ch,
+                                 unsigned char* buf,
+                                 unsigned short len)
+{
+    struct prefetch* p = ch->private;
+    struct despotify_session* ds = p->ds;
+
+    pthread_mutex_lock(&ds->prefetch_mutex);
+    p->in_flight--;
+    stats_record(ds, DESPOTIFY_OP_KEY, p->requested,
+                 ch->state != CHANNEL_ERROR);
+
+    if (ch->state != CHANNEL_ERROR && !p->detached) {
+        DSFYDEBUG("Got AES key for a prefetched track\n");
+
+        p->key = malloc(len);
+        memcpy(p->key, buf, len);
+        aes_ctr_init(&p->aes, p->key);
+        memcpy(p->ready_IV, p->aes.IV, 16);
+
+        p->requested = time_now();
+        if (ds->prefetch_substreams > 0 &&
+            !cmd_getsubstreams(ds->session, p->file_id,
+                               0, SUBSTREAM_SIZE,
+                               200 * 1000, /* unknown, static value */
+                               prefetch_substream_callback, p))
+            p->in_flight++;
+    }
+    else
+        p->detached = true;
+
+    prefetch_collect(ds);
+    pthread_mutex_unlock(&ds->prefetch_mutex);
+
+    return 0;
+}
+
+/* Make sure the next playable tracks after ds->track are prefetched,
+   and drop the ones that aren't coming up anymore */
+static void despotify_prefetch(struct despotify_session* ds)
+{
+    struct track* t;
+    struct prefetch* p;
+    int count = 0;
+
+    pthread_mutex_lock(&ds->prefetch_mutex);
+
+    for (p = ds->prefetch; p; p = p->next)
+        p->wanted = false;
+
+    for (t = ds->track; t && ds->play_as_list; t = t->next) {
+        if (t == ds->track || !t->playable)
+            continue;
+        if (count++ == ds->prefetch_tracks)
+            break;
+
+        p = prefetch_find(ds, t);
+        if (!p) {
+            char tid[16];
+
+            p = calloc(1, sizeof(struct prefetch));
+            p->ds = ds;
+            hex_ascii_to_bytes(t->file_id, p->file_id, sizeof p->file_id);
+            hex_ascii_to_bytes(t->track_id, tid, sizeof tid);
+
+            p->next = ds->prefetch;
+            ds->prefetch = p;
+
+            DSFYDEBUG("Prefetching %s\n", t->title);
+            p->requested = time_now();
+            if (!cmd_aeskey(ds->session, p->file_id, tid,
+                            prefetch_aes_callback, p))
+                p->in_flight++;
+        }
+        p->wanted = true;
+    }
+
+    for (p = ds->prefetch; p; p = p->next)
+        if (!p->wanted)
+            p->detached = true;
+
+    prefetch_collect(ds);
+    pthread_mutex_unlock(&ds->prefetch_mutex);
+}
+
+static void despotify_end_of_track(struct despotify_session* ds);
+
+/* Start ds->track from its prefetched key and data, if there are any */
+static bool despotify_start_prefetched(struct despotify_session* ds)
+{
+    struct track* t = ds->track;
+    struct prefetch* p;
+    struct snd_buffer* b;
+    bool complete;
+
+    pthread_mutex_lock(&ds->prefetch_mutex);
+
+    p = prefetch_find(ds, t);
+    if (!p || !p->key) {
+        pthread_mutex_unlock(&ds->prefetch_mutex);
+        return false;
+    }
+
+    DSFYDEBUG("Starting %s from %d prefetched bytes\n", t->title, p->offset);
+
+    if (t->key)
+        free(t->key);
+    t->key = p->key;
+    p->key = NULL;
+
+    memcpy(ds->aes.state, p->aes.state, sizeof ds->aes.state);
+    memcpy(ds->aes.IV, p->ready_IV, 16);
+    ds->offset = p->offset;
+    complete = p->complete;
+
+    despotify_start_track(ds);
+    while ((b = p->data)) {
+        p->data = b->next;
+        snd_push(ds, b);
+    }
+
+    /* anything still arriving is for the player to fetch again */
+    p->detached = true;
+    prefetch_collect(ds);
+    pthread_mutex_unlock(&ds->prefetch_mutex);
+
+    if (complete)
+        despotify_end_of_track(ds);
+
+    return true;
+}
+
+/* The whole file of ds->track has been received, go on to the next */
+static void despotify_end_of_track(struct despotify_session* ds)
+{
+    /* find next playable track */
+    do {
+        ds->track = ds->track->next;
+    } while (ds->track && !ds->track->playable);
+
+    /* Add SND_CMD_END to buffer chain */
+    snd_ioctl(ds, SND_CMD_END, NULL, 0);
+
+    ds->offset = 0;
+
+    if (ds->track && ds->play_as_list) {
+        if (!despotify_start_prefetched(ds)) {
+            char fid[20], tid[16];
+            hex_ascii_to_bytes(ds->track->file_id, fid, sizeof fid);
+            hex_ascii_to_bytes(ds->track->track_id, tid, sizeof tid);
+
+            /* request key for next track */
+            ds->key_requested = time_now();
+            cmd_aeskey(ds->session, fid, tid, despotify_aes_callback, ds);
+        }
+
+        despotify_prefetch(ds);
+    }
+}
+
+void despotify_set_prefetch(struct despotify_session* ds,
+                            int tracks, int substreams)
+{
+    assert(ds != NULL);
+
+    ds->prefetch_tracks = tracks;
+    ds->prefetch_substreams = substreams;
+
+    if (ds->track)
+        despotify_prefetch(ds);
+}
+
 static int despotify_substream_callback(CHANNEL * ch,
                                         unsigned char *buf,
                                         unsigned short len)
@@ -288,58 +775,17 @@ static int despotify_substream_callback(CHANNEL * ch,
             DSFYDEBUG("CHANNEL_HEADER\n");
             break;
 
-    case CHANNEL_DATA: {
-            int block;
-            unsigned char* plaintext = (unsigned char *) malloc (len + 1024);
-
-            /* Decrypt each 1024 byte block */
-            for (block = 0; block < len / 1024; block++) {
-                int i;
-
-                /* Deinterleave the 4x256 byte blocks */
-                unsigned char* ciphertext = plaintext + block * 1024;
-                unsigned char* w = buf + block * 1024 + 0 * 256;
-                unsigned char* x = buf + block * 1024 + 1 * 256;
-                unsigned char* y = buf + block * 1024 + 2 * 256;
-                unsigned char* z = buf + block * 1024 + 3 * 256;
-
-                for (i = 0; i < 1024 && (block * 1024 + i) < len; i += 4) {
-                    *ciphertext++ = *w++;
-                    *ciphertext++ = *x++;
-                    *ciphertext++ = *y++;
-                    *ciphertext++ = *z++;
-                }
-
-                /* Decrypt 1024 bytes block. This will fail for the last block. */
-                for (i = 0; i < 1024 && (block * 1024 + i) < len; i += 16) {
-                    int j;
-
-                    /* Produce 16 bytes of keystream from the IV */
-                    rijndaelEncrypt(ds->aes.state, 10,
-                                    ds->aes.IV,
-                                    ds->aes.keystream);
-
-                    /* Update IV counter */
-                    for (j = 15; j >= 0; j--) {
-                        ds->aes.IV[j] += 1;
-                        if (ds->aes.IV[j] != 0)
-                            break;
-                    }
-
-                    /* Produce plaintext by XORing ciphertext with keystream */
-                    for (j = 0; j < 16; j++)
-                        plaintext[block * 1024 + i + j] ^= ds->aes.keystream[j];
-                }
-            }
-
+    case CHANNEL_DATA:
+            stats_add_bytes(ds, DESPOTIFY_OP_SUBSTREAM, len);
 
             /* Push data onto the sound buffer queue */
-            snd_ioctl(ds, SND_CMD_DATA, plaintext, len);
+            snd_push(ds, despotify_decrypt(ds, &ds->aes, buf, len));
             break;
-        }
 
     case CHANNEL_ERROR:
             DSFYDEBUG("got CHANNEL_ERROR #%d\n", ds->errorcount);
+            stats_record(ds, DESPOTIFY_OP_SUBSTREAM,
+                         ds->substream_requested, false);
             ds->errorcount += 1;
             if (ds->errorcount > 3)
                 exit(-1);
@@ -349,6 +795,8 @@ static int despotify_substream_callback(CHANNEL * ch,
             DSFYDEBUG("got CHANNEL_END, processed %d bytes data\n",
                       ch->total_data_len);
             ds->errorcount = 0;
+            stats_record(ds, DESPOTIFY_OP_SUBSTREAM,
+                         ds->substream_requested, true);
 
             /* Reflect the current offset in the player context */
             ds->offset += ch->total_data_len;
@@ -357,25 +805,7 @@ static int despotify_substream_callback(CHANNEL * ch,
                 DSFYDEBUG("Stream returned short coutn (%d of %d requested), marking END\n",
                           ch->total_data_len, SUBSTREAM_SIZE);
 
-                /* find next playable track */
-                do {
-                    ds->track = ds->track->next;
-                } while (ds->track && !ds->track->playable);
-                
-                /* Add SND_CMD_END to buffer chain */
-                snd_ioctl(ds, SND_CMD_END, NULL, 0);
-
-                ds->offset = 0;
-
-                int error = 0;
-                if (ds->track && ds->play_as_list) {
-                    char fid[20], tid[16];
-                    hex_ascii_to_bytes(ds->track->file_id, fid, sizeof fid);
-                    hex_ascii_to_bytes(ds->track->track_id, tid, sizeof tid);
-                    
-                    /* request key for next track */
-                    error = cmd_aeskey(ds->session, fid, tid, despotify_aes_callback, ds);
-                }
+                despotify_end_of_track(ds);
             }
             snd_ioctl(ds, SND_CMD_CHANNEL_END, NULL, 0);
             break;
@@ -394,6 +824,7 @@ int despotify_snd_read_stream(struct despotify_session* ds)
     char fid[20];
     hex_ascii_to_bytes(ds->track->file_id, fid, sizeof fid);
 
+    ds->substream_requested = time_now();
     if (cmd_getsubstreams(ds->session, fid,
                           ds->offset, SUBSTREAM_SIZE,
                           200 * 1000, /* unknown, static value */
@@ -438,17 +869,23 @@ bool despotify_play(struct despotify_session* ds,
 
     ds->track = t;
     ds->play_as_list = play_as_list;
+    ds->track_started = time_now();
 
-    char fid[20], tid[16];
-    hex_ascii_to_bytes(ds->track->file_id, fid, sizeof fid);
-    hex_ascii_to_bytes(ds->track->track_id, tid, sizeof tid);
+    if (!despotify_start_prefetched(ds)) {
+        char fid[20], tid[16];
+        hex_ascii_to_bytes(ds->track->file_id, fid, sizeof fid);
+        hex_ascii_to_bytes(ds->track->track_id, tid, sizeof tid);
 
-    int error = cmd_aeskey(ds->session, fid, tid, despotify_aes_callback, ds);
-    if (error) {
-        DSFYDEBUG("cmd_aeskey() failed for %s\n", t->title);
-        return false;
+        ds->key_requested = time_now();
+        int error = cmd_aeskey(ds->session, fid, tid, despotify_aes_callback, ds);
+        if (error) {
+            DSFYDEBUG("cmd_aeskey() failed for %s\n", t->title);
+            return false;
+        }
     }
 
+    despotify_prefetch(ds);
+
     /* from here everything is handled in despotify_thread() */
     return true;
 }
@@ -554,6 +991,8 @@ static int despotify_plain_callback(CHANNEL *ch,
 
     switch (ch->state) {
     case CHANNEL_DATA:
+            if (ds->op >= 0)
+                stats_add_bytes(ds, ds->op, len);
             buf_append_data(ds->response, buf, len);
             break;
 
@@ -573,6 +1012,7 @@ static int despotify_plain_callback(CHANNEL *ch,
     if (done) {
         /* tell caller we're done */
         pthread_mutex_lock(&ds->sync_mutex);
+        ds->response_ready = true;
         pthread_cond_signal(&ds->sync_cond);
         pthread_mutex_unlock(&ds->sync_mutex);
     }
@@ -589,6 +1029,9 @@ static int despotify_gzip_callback(CHANNEL*  ch,
 
     switch (ch->state) {
         case CHANNEL_DATA:
+            if (ds->op >= 0)
+                stats_add_bytes(ds, ds->op, len);
+
             /* Skip a minimal gzip header */
             if (ch->total_data_len < 10) {
         int skip_len = 10 - ch->total_data_len;
@@ -622,6 +1065,7 @@ static int despotify_gzip_callback(CHANNEL*  ch,
     if (done) {
         /* tell caller we're done */
         pthread_mutex_lock(&ds->sync_mutex);
+        ds->response_ready = true;
         pthread_cond_signal(&ds->sync_cond);
         pthread_mutex_unlock(&ds->sync_mutex);
     }
@@ -635,7 +1079,11 @@ static int despotify_gzip_callback(CHANNEL*  ch,
  *  Timeouts
  *
  */
-bool despotify_wait_timeout(struct despotify_session* ds){
+/* Wait for the response like despotify_wait_timeout(), but return with
+   sync_mutex still held, so the caller can act on a timeout before a late
+   reply comes in. */
+static bool despotify_wait_locked(struct despotify_session* ds)
+{
     struct timeval  tv;
     struct timespec ts;
 
@@ -650,17 +1098,36 @@ bool despotify_wait_timeout(struct despotify_session* ds){
     /* timed wait until response is ready */
     pthread_mutex_lock(&ds->sync_mutex);
 
-    if (pthread_cond_timedwait(&ds->sync_cond, &ds->sync_mutex, &ts) == ETIMEDOUT) {
-        pthread_mutex_unlock(&ds->sync_mutex);
+    /* the response may well be in before we get here, with a nearby
+       server */
+    bool ok = true;
+    while (ok && !ds->response_ready)
+        ok = pthread_cond_timedwait(&ds->sync_cond, &ds->sync_mutex,
+                                    &ts) != ETIMEDOUT;
+    ds->response_ready = false;
 
-        DSFYDEBUG("Timeout while waiting on sync condition\n");
+    return ok;
+}
 
-        return false;
+/* Record the end of the request started by despotify_begin_request() */
+static void despotify_end_request(struct despotify_session* ds, bool ok)
+{
+    if (ds->op >= 0) {
+        stats_record(ds, ds->op, ds->op_started, ok);
+        ds->op = -1;
     }
 
+    if (!ok)
+        DSFYDEBUG("Timeout while waiting on sync condition\n");
+}
+
+bool despotify_wait_timeout(struct despotify_session* ds)
+{
+    bool ok = despotify_wait_locked(ds);
     pthread_mutex_unlock(&ds->sync_mutex);
 
-    return true;
+    despotify_end_request(ds, ok);
+    return ok;
 }
 
 /****************************************************
@@ -671,6 +1138,13 @@ bool despotify_wait_timeout(struct despotify_session* ds){
 
 struct search_result* despotify_search(struct despotify_session* ds,
                                        char* searchtext, int maxresults)
+{
+    return despotify_search_page(ds, searchtext, 0, maxresults);
+}
+
+struct search_result* despotify_search_page(struct despotify_session* ds,
+                                            char* searchtext,
+                                            int offset, int maxresults)
 {
     struct search_result* search = NULL;
 
@@ -683,7 +1157,8 @@ struct search_result* despotify_search(struct despotify_session* ds,
     DSFYstrncpy(ds->playlist->name, buf, sizeof ds->playlist->name);
     DSFYstrncpy(ds->playlist->author, ds->session->username, sizeof ds->playlist->author);
 
-    int ret = cmd_search(ds->session, searchtext, 0, maxresults,
+    despotify_begin_request(ds, DESPOTIFY_OP_SEARCH);
+    int ret = cmd_search(ds->session, searchtext, offset, maxresults,
                          despotify_gzip_callback, ds);
     if (ret) {
         ds->last_error = "cmd_search() failed";
@@ -733,6 +1208,7 @@ struct search_result* despotify_search_more(struct despotify_session *ds,
 
     ds->response = buf_new();
 
+    despotify_begin_request(ds, DESPOTIFY_OP_SEARCH);
     int ret = cmd_search(ds->session, search->query,
                          offset, maxresults,
                          despotify_gzip_callback, ds);
@@ -780,166 +1256,312 @@ void despotify_free_search(struct search_result *search) {
  *
  */
 
-static bool despotify_load_tracks(struct despotify_session *ds, bool cache_do_store)
+/* A track browse, inflated and parsed as it arrives. */
+struct tracks_request
 {
-    struct playlist* pl = ds->playlist;
+    struct despotify_session* ds;
+    z_stream z;
+    bool inflating; /* z is set up and the stream hasn't ended */
+    bool complete; /* the stream ended */
+    bool abandoned; /* timed out, free once the channel ends */
+    bool ended; /* the channel ended, so it won't touch the request again */
+    struct xml_tracklist_stream* xml;
+    struct buf* copy; /* all of the xml, for the cache, or NULL */
+};
+
+static void despotify_inflate_tracks(struct tracks_request* req,
+                                     unsigned char* data, int len)
+{
+    unsigned char out[4096];
 
-    if (!pl->num_tracks)
-        return true;
+    req->z.next_in = data;
+    req->z.avail_in = len;
 
-    struct track* t = pl->tracks;
+    while (req->inflating) {
+        req->z.next_out = out;
+        req->z.avail_out = sizeof out;
 
-    /* construct an array of 16-byte track ids */
-    char* tracklist = malloc(MAX_BROWSE_REQ * 16);
-    SHA1_CTX sha_ctx;
-    unsigned char hash[20], tracks_hash[41];
-    int track_count = 0;
+        int rc = inflate(&req->z, Z_NO_FLUSH);
+        int inflated = sizeof out - req->z.avail_out;
 
-    /* don't request too many tracks at once */
-    int count;
-    for (int totcount=0; totcount < pl->num_tracks; totcount += count) {
-        ds->response = buf_new();
+        if (inflated) {
+            xml_tracklist_stream_feed(req->xml, out, inflated);
+            if (req->copy)
+                buf_append_data(req->copy, out, inflated);
+        }
 
-        struct track* firsttrack = t;
-        for (count = 0; t && count < MAX_BROWSE_REQ; t = t->next, count++)
-            hex_ascii_to_bytes(t->track_id, tracklist + count * 16, 16);
+        if (rc == Z_STREAM_END) {
+            req->inflating = false;
+            req->complete = true;
+        }
+        else if (rc != Z_OK && rc != Z_BUF_ERROR) {
+            DSFYDEBUG("error: inflate() returned %d\n", rc);
+            req->inflating = false;
+        }
+        else if (rc == Z_BUF_ERROR || req->z.avail_out)
+            break; /* wait for more input */
+    }
+}
 
-        /* create a hash of the tracklist */
-        SHA1Init(&sha_ctx);
-        SHA1Update(&sha_ctx, tracklist, count * 16);
-        SHA1Final(hash, &sha_ctx);
+static void despotify_free_tracks_request(struct tracks_request* req)
+{
+    inflateEnd(&req->z);
+    xml_tracklist_stream_free(req->xml);
+    if (req->copy)
+        buf_free(req->copy);
+    free(req);
+}
 
-        hex_bytes_to_ascii(hash, tracks_hash, 20);
-        tracks_hash[40] = '\0'; /* enforce string termination */
+static int despotify_tracks_callback(CHANNEL* ch,
+                                     unsigned char* buf,
+                                     unsigned short len)
+{
+    struct tracks_request* req = ch->private;
+    struct despotify_session* ds = req->ds;
+    bool done = false;
 
-        /* check cache */
-        if (ds->use_cache && cache_contains(tracks_hash)) {
-            unsigned char* data;
-            int len;
+    /* parse under the lock, so a timed out request can't be freed or
+       written to behind the caller's back */
+    pthread_mutex_lock(&ds->sync_mutex);
 
-            DSFYDEBUG("Loading cached tracks...\n");
+    switch (ch->state) {
+        case CHANNEL_DATA:
+            if (req->abandoned)
+                break;
 
-            if ((data = cache_load(tracks_hash, &len)) != NULL) {
-                track_count += xml_parse_tracklist(firsttrack, data, len,
-                                               true, ds->high_bitrate);
-                free(data);
+            if (ds->op >= 0)
+                stats_add_bytes(ds, ds->op, len);
 
-                continue;
+            /* Skip a minimal gzip header */
+            if (ch->total_data_len < 10) {
+                int skip_len = 10 - ch->total_data_len;
+                while (skip_len && len) {
+                    skip_len--;
+                    len--;
+                    buf++;
+                }
             }
-        }
 
-        int error = cmd_browse(ds->session, BROWSE_TRACK, tracklist, count, 
-                               despotify_gzip_callback, ds);
+            if (len)
+                despotify_inflate_tracks(req, buf, len);
+            break;
 
-        if (error) {
-            DSFYDEBUG("cmd_browse() failed with %d\n", error);
-            ds->last_error = "Network error.";
-            session_disconnect(ds->session);
-            return false;
-        }
+        case CHANNEL_ERROR:
+            DSFYDEBUG("!!! channel error\n");
+            done = true;
+            break;
 
-        /* wait until track fetch is ready */
-        if (!despotify_wait_timeout(ds)) {
-            ds->last_error = "Timeout while loading tracks";
-            return NULL;
-        }
+        case CHANNEL_END:
+            done = true;
+            break;
 
-        /* add tracks to playlist */
-        struct buf* b = despotify_inflate(ds->response->ptr, ds->response->len);
-        if (b) {
-            /* store tracks xml in cache. */
-            if (cache_do_store)
-                cache_store(tracks_hash, b->ptr, b->len);
+        default:
+            break;
+    }
 
-            track_count += xml_parse_tracklist(firsttrack, b->ptr, b->len,
-                                               true, ds->high_bitrate);
-            buf_free(b);
+    if (done) {
+        req->ended = true;
+        if (req->abandoned)
+            despotify_free_tracks_request(req);
+        else {
+            /* tell caller we're done */
+            ds->response_ready = true;
+            pthread_cond_signal(&ds->sync_cond);
         }
-
-        buf_free(ds->response);
     }
-    free(tracklist);
 
-    /* tracks that still lack meta data are likely duplicates */
-    if (track_count < pl->num_tracks) {
-        for (t = pl->tracks; t; t = t->next) {
-            if (!t->has_meta_data) {
-                struct track* tt;
-                for (tt = pl->tracks; tt; tt = tt->next) {
-                    if (tt->has_meta_data &&
-                        !strncmp(tt->track_id, t->track_id, sizeof tt->track_id)) {
-                        struct track* next = t->next;
-                        *t = *tt;
-                        t->next = next;
-
-                        /* deep copy of artist list */
-                        struct artist* a = calloc(1, sizeof(struct artist));
-                        t->artist = a;
-                        struct artist* ta;
-                        for (ta = tt->artist; ta; ta = ta->next) {
-                            *a = *ta;
-                            if (ta->next)
-                                a = a->next = calloc(1, sizeof(struct artist));
-                        }
-
-                        /* deep copy of georestrictions. */
-                        if(tt->allowed) {
-                            t->allowed = calloc(strlen(tt->allowed) + 1,
-                                                sizeof(char));
-                            DSFYstrncpy(t->allowed, tt->allowed, 
-                                        strlen(tt->allowed) + 1);
-                        }
-                        
-                        if(tt->forbidden) {
-                            t->forbidden = calloc(strlen(tt->forbidden) + 1,
-                                                  sizeof(char));
-                            DSFYstrncpy(t->forbidden, tt->forbidden, 
-                                        strlen(tt->forbidden) + 1);
-                        }
-
-                        t->has_meta_data = true;
-                        track_count++;
-                        break;
+    pthread_mutex_unlock(&ds->sync_mutex);
+
+    return 0;
+}
+
+/* Give tracks that still lack meta data after their browse the meta data
+   of another track with the same id, as they are likely duplicates.
+   Returns the number of tracks that got meta data. */
+static int despotify_copy_duplicates(struct track* root,
+                                     struct track* first,
+                                     struct track* end)
+{
+    int track_count = 0;
+
+    for (struct track* t = first; t != end; t = t->next) {
+        if (!t->has_meta_data) {
+            struct track* tt;
+            for (tt = root; tt; tt = tt->next) {
+                if (tt->has_meta_data &&
+                    !strncmp(tt->track_id, t->track_id, sizeof tt->track_id)) {
+                    struct track* next = t->next;
+                    *t = *tt;
+                    t->next = next;
+
+                    /* deep copy of artist list */
+                    struct artist* a = calloc(1, sizeof(struct artist));
+                    t->artist = a;
+                    struct artist* ta;
+                    for (ta = tt->artist; ta; ta = ta->next) {
+                        *a = *ta;
+                        if (ta->next)
+                            a = a->next = calloc(1, sizeof(struct artist));
+                    }
+
+                    /* deep copy of georestrictions. */
+                    if(tt->allowed) {
+                        t->allowed = calloc(strlen(tt->allowed) + 1,
+                                            sizeof(char));
+                        DSFYstrncpy(t->allowed, tt->allowed, 
+                                    strlen(tt->allowed) + 1);
                     }
+                
+                    if(tt->forbidden) {
+                        t->forbidden = calloc(strlen(tt->forbidden) + 1,
+                                              sizeof(char));
+                        DSFYstrncpy(t->forbidden, tt->forbidden, 
+                                    strlen(tt->forbidden) + 1);
+                    }
+
+                    t->has_meta_data = true;
+                    track_count++;
+                    break;
                 }
             }
         }
     }
-    pl->num_tracks = track_count;
 
-    return true;
+    return track_count;
 }
 
-struct playlist* despotify_get_playlist(struct despotify_session *ds,
-                                        char* playlist_id, bool cache_do_store)
+/* Load the meta data of up to max tracks from *next, and move *next past
+   them. Returns the number of tracks that got meta data, or -1. */
+static int despotify_load_track_chunk(struct despotify_session *ds,
+                                      struct playlist* pl,
+                                      struct track** next, int max,
+                                      bool cache_do_store)
 {
-    ds->playlist = calloc(1, sizeof(struct playlist));
+    struct track* firsttrack = *next;
+    struct track* t;
+    unsigned char tracklist[MAX_BROWSE_REQ * 16];
+    SHA1_CTX sha_ctx;
+    unsigned char hash[20], tracks_hash[41];
+    int track_count = 0;
+    int count;
+
+    if (max > MAX_BROWSE_REQ)
+        max = MAX_BROWSE_REQ;
+
+    /* construct an array of 16-byte track ids */
+    for (count = 0, t = firsttrack; t && count < max; t = t->next, count++)
+        hex_ascii_to_bytes(t->track_id, tracklist + count * 16, 16);
+    *next = t;
+
+    if (!count)
+        return 0;
+
+    /* create a hash of the tracklist */
+    SHA1Init(&sha_ctx);
+    SHA1Update(&sha_ctx, tracklist, count * 16);
+    SHA1Final(hash, &sha_ctx);
+
+    hex_bytes_to_ascii(hash, tracks_hash, 20);
+    tracks_hash[40] = '\0'; /* enforce string termination */
 
     /* check cache */
-    if (ds->use_cache && playlist_id && cache_contains(playlist_id)) {
-        unsigned char* data;
-        int len;
+    unsigned char* data = NULL;
+    int len;
 
-        DSFYDEBUG("Loading cached playlist '%s'...\n", playlist_id);
+    if (despotify_cache_contains(ds, tracks_hash)) {
+        DSFYDEBUG("Loading cached tracks...\n");
 
-        if ((data = cache_load(playlist_id, &len)) != NULL) {
-            ds->playlist = xml_parse_playlist(ds->playlist, data, len, false);
-            free(data);
+        if ((data = despotify_cache_map(ds, tracks_hash, &len)) != NULL) {
+            track_count = xml_parse_tracklist(firsttrack, data, len,
+                                              true, ds->high_bitrate);
+            cache_unmap(data, len);
+        }
+    }
 
-            DSFYstrncpy(ds->playlist->playlist_id, playlist_id, sizeof ds->playlist->playlist_id);
+    if (!data) {
+        /* inflate and parse the reply while it comes in */
+        struct tracks_request* req = calloc(1, sizeof(struct tracks_request));
+        req->ds = ds;
+        req->xml = xml_tracklist_stream_new(firsttrack, ds->high_bitrate);
+        if (cache_do_store)
+            req->copy = buf_new();
+        req->inflating = inflateInit2(&req->z, -MAX_WBITS) == Z_OK;
 
-            /* fill the playlist with track info */
-            if (!despotify_load_tracks(ds, cache_do_store)) {
-                ds->last_error = "Failed loading track info";
-                DSFYDEBUG("%s", ds->last_error);
-                free(ds->playlist);
-                return NULL;
-            }
+        despotify_begin_request(ds, DESPOTIFY_OP_TRACKS);
+        int error = cmd_browse(ds->session, BROWSE_TRACK, tracklist, count,
+                               despotify_tracks_callback, req);
 
-            return ds->playlist;
+        if (error) {
+            DSFYDEBUG("cmd_browse() failed with %d\n", error);
+            ds->last_error = "Network error.";
+            despotify_free_tracks_request(req);
+            session_disconnect(ds->session);
+            return -1;
         }
+
+        /* wait until track fetch is ready. Tell a timeout from a reply
+           that just made it with the lock still held, as the callback
+           decides under it whether the request is ours to free. */
+        bool ok = despotify_wait_locked(ds);
+        if (!ok && req->ended)
+            ok = true;
+        else if (!ok)
+            req->abandoned = true;
+        pthread_mutex_unlock(&ds->sync_mutex);
+        despotify_end_request(ds, ok);
+
+        if (!ok) {
+            ds->last_error = "Timeout while loading tracks";
+            return -1;
+        }
+
+        /* store tracks xml in cache. */
+        if (req->copy && req->complete)
+            cache_store(tracks_hash, req->copy->ptr, req->copy->len);
+
+        track_count = req->xml->num_tracks;
+        despotify_free_tracks_request(req);
     }
 
+    return track_count + despotify_copy_duplicates(pl->tracks, firsttrack, *next);
+}
+
+static bool despotify_load_tracks(struct despotify_session *ds, bool cache_do_store)
+{
+    struct playlist* pl = ds->playlist;
+    struct track* t = pl->tracks;
+    int track_count = 0;
+
+    /* don't request too many tracks at once */
+    for (int totcount = 0; t && totcount < pl->num_tracks;
+         totcount += MAX_BROWSE_REQ) {
+        int count = despotify_load_track_chunk(ds, pl, &t,
+                                               pl->num_tracks - totcount,
+                                               cache_do_store);
+        if (count < 0)
+            return false;
+
+        track_count += count;
+    }
+    pl->num_tracks = track_count;
+
+    return true;
+}
+
+int despotify_load_playlist_tracks(struct despotify_session *ds,
+                                   struct playlist* pl,
+                                   struct track** next,
+                                   bool cache_do_store)
+{
+    return despotify_load_track_chunk(ds, pl, next, MAX_BROWSE_REQ,
+                                      cache_do_store);
+}
+
+/* Fetch the xml of a playlist, or of the list of playlists if playlist_id
+   is NULL, into ds->response. */
+static bool despotify_request_playlist(struct despotify_session *ds,
+                                       char* playlist_id)
+{
     ds->response = buf_new();
 
     static const char* load_lists =
@@ -956,6 +1578,7 @@ struct playlist* despotify_get_playlist(struct despotify_session *ds,
         memset(pid, 0, sizeof pid);
     }
 
+    despotify_begin_request(ds, DESPOTIFY_OP_PLAYLIST);
     int error = cmd_getplaylist(ds->session, pid, PLAYLIST_CURRENT,
                                 despotify_plain_callback, ds);
     if (error) {
@@ -963,17 +1586,46 @@ struct playlist* despotify_get_playlist(struct despotify_session *ds,
         ds->last_error = "Network error.";
         session_disconnect(ds->session);
 
-        return NULL;
+        return false;
     }
 
     /* wait until playlist fetch is ready */
     if (!despotify_wait_timeout(ds)) {
         ds->last_error = "Timeout while loading playlist";
-        return NULL;
+        return false;
     }
 
     buf_append_u8(ds->response, 0); /* null terminate xml string */
 
+    return true;
+}
+
+struct playlist* despotify_get_playlist_ids(struct despotify_session *ds,
+                                            char* playlist_id,
+                                            bool cache_do_store)
+{
+    ds->playlist = calloc(1, sizeof(struct playlist));
+
+    /* check cache */
+    if (playlist_id && despotify_cache_contains(ds, playlist_id)) {
+        unsigned char* data;
+        int len;
+
+        DSFYDEBUG("Loading cached playlist '%s'...\n", playlist_id);
+
+        if ((data = despotify_cache_map(ds, playlist_id, &len)) != NULL) {
+            ds->playlist = xml_parse_playlist(ds->playlist, data, len, false);
+            cache_unmap(data, len);
+
+            DSFYstrncpy(ds->playlist->playlist_id, playlist_id, sizeof ds->playlist->playlist_id);
+
+            return ds->playlist;
+        }
+    }
+
+    if (!despotify_request_playlist(ds, playlist_id))
+        return NULL;
+
     /* store playlist xml in cache. */
     if (cache_do_store && playlist_id)
         cache_store(playlist_id, ds->response->ptr, ds->response->len);
@@ -989,6 +1641,15 @@ struct playlist* despotify_get_playlist(struct despotify_session *ds,
     ds->list_of_lists = false;
     buf_free(ds->response);
 
+    return ds->playlist;
+}
+
+struct playlist* despotify_get_playlist(struct despotify_session *ds,
+                                        char* playlist_id, bool cache_do_store)
+{
+    if (!despotify_get_playlist_ids(ds, playlist_id, cache_do_store))
+        return NULL;
+
     if (playlist_id) {
         /* fill the playlist with track info */
         if (!despotify_load_tracks(ds, cache_do_store)) {
@@ -1002,6 +1663,30 @@ struct playlist* despotify_get_playlist(struct despotify_session *ds,
     return ds->playlist;
 }
 
+bool despotify_get_playlist_revision(struct despotify_session *ds,
+                                     char* playlist_id, bool cache_do_store,
+                                     unsigned int* revision,
+                                     unsigned int* checksum)
+{
+    if (!despotify_request_playlist(ds, playlist_id))
+        return false;
+
+    /* store playlist xml in cache, so a following despotify_get_playlist()
+       doesn't have to request it again. */
+    if (cache_do_store)
+        cache_store(playlist_id, ds->response->ptr, ds->response->len);
+
+    struct playlist* pl = calloc(1, sizeof(struct playlist));
+    xml_parse_playlist(pl, ds->response->ptr, ds->response->len, false);
+    buf_free(ds->response);
+
+    *revision = pl->revision;
+    *checksum = pl->checksum;
+    xml_free_playlist(pl);
+
+    return true;
+}
+
 void despotify_free_playlist(struct playlist* p)
 {
     xml_free_playlist(p);
@@ -1084,6 +1769,7 @@ bool despotify_rename_playlist(struct despotify_session *ds,
 
     unsigned char pid[17];
     hex_ascii_to_bytes(playlist->playlist_id, pid, 17);
+    despotify_begin_request(ds, DESPOTIFY_OP_PLAYLIST);
     int error = cmd_changeplaylist(ds->session, pid, xml, playlist->revision,
                                    playlist->num_tracks, playlist->checksum,
                                    playlist->is_collaborative,
@@ -1141,6 +1827,7 @@ bool despotify_set_playlist_collaboration(struct despotify_session *ds,
 
     unsigned char pid[17];
     hex_ascii_to_bytes(playlist->playlist_id, pid, 17);
+    despotify_begin_request(ds, DESPOTIFY_OP_PLAYLIST);
     int error = cmd_changeplaylist(ds->session, pid, xml, playlist->revision,
                                    playlist->num_tracks, playlist->checksum,
                                    playlist->is_collaborative,
@@ -1187,15 +1874,15 @@ struct artist_browse* despotify_get_artist(struct despotify_session* ds,
     ds->artist_browse = calloc(1, sizeof(struct artist_browse));
 
     /* check cache */
-    if (ds->use_cache && cache_contains(artist_id)) {
+    if (despotify_cache_contains(ds, artist_id)) {
         unsigned char* data;
         int len;
 
         DSFYDEBUG("Loading cached artist '%s'...\n", artist_id);
 
-        if ((data = cache_load(artist_id, &len)) != NULL) {
+        if ((data = despotify_cache_map(ds, artist_id, &len)) != NULL) {
             xml_parse_browse_artist(ds->artist_browse, data, len, ds->high_bitrate);
-            free(data);
+            cache_unmap(data, len);
 
             return ds->artist_browse;
         }
@@ -1205,6 +1892,7 @@ struct artist_browse* despotify_get_artist(struct despotify_session* ds,
 
     unsigned char id[16];
     hex_ascii_to_bytes(artist_id, id, sizeof id);
+    despotify_begin_request(ds, DESPOTIFY_OP_ARTIST);
     int error = cmd_browse(ds->session, BROWSE_ARTIST, id, 1,
                            despotify_gzip_callback, ds);
 
@@ -1243,16 +1931,17 @@ void despotify_free_artist_browse(struct artist_browse* a)
 void* despotify_get_image(struct despotify_session* ds, char* image_id, int* len)
 {
     /* check cache */
-    if (ds->use_cache && cache_contains(image_id)) {
+    if (despotify_cache_contains(ds, image_id)) {
         DSFYDEBUG("Loading cached image '%s'...\n", image_id);
 
-        return (void *)cache_load(image_id, len);
+        return (void *)despotify_cache_load(ds, image_id, len);
     }
 
     ds->response = buf_new();
 
     unsigned char id[20];
     hex_ascii_to_bytes(image_id, id, sizeof id);
+    despotify_begin_request(ds, DESPOTIFY_OP_IMAGE);
     int error = cmd_request_image(ds->session, id,
                                   despotify_plain_callback, ds);
     if (error) {
@@ -1281,21 +1970,51 @@ void* despotify_get_image(struct despotify_session* ds, char* image_id, int* len
     return image;
 }
 
+void* despotify_map_image(struct despotify_session* ds, char* image_id,
+                          int* len, bool* mapped)
+{
+    void* image = NULL;
+
+    /* check cache */
+    if (despotify_cache_contains(ds, image_id)) {
+        double started = time_now();
+
+        DSFYDEBUG("Mapping cached image '%s'...\n", image_id);
+
+        image = cache_map(image_id, (unsigned int*) len, false);
+        stats_record(ds, DESPOTIFY_OP_CACHE_LOAD, started, image != NULL);
+    }
+
+    *mapped = image != NULL;
+    if (image)
+        return image;
+
+    return despotify_get_image(ds, image_id, len);
+}
+
+void despotify_free_image(void* image, int len, bool mapped)
+{
+    if (mapped)
+        cache_unmap(image, len);
+    else
+        free(image);
+}
+
 struct album_browse* despotify_get_album(struct despotify_session* ds,
                                          char* album_id)
 {
     ds->album_browse = calloc(1, sizeof(struct album_browse));
 
     /* check cache */
-    if (ds->use_cache && cache_contains(album_id)) {
+    if (despotify_cache_contains(ds, album_id)) {
         unsigned char* data;
         int len;
 
         DSFYDEBUG("Loading cached album '%s'...\n", album_id);
 
-        if ((data = cache_load(album_id, &len)) != NULL) {
+        if ((data = despotify_cache_map(ds, album_id, &len)) != NULL) {
             xml_parse_browse_album(ds->album_browse, data, len, ds->high_bitrate);
-            free(data);
+            cache_unmap(data, len);
 
             return ds->album_browse;
         }
@@ -1305,6 +2024,7 @@ struct album_browse* despotify_get_album(struct despotify_session* ds,
 
     unsigned char id[16];
     hex_ascii_to_bytes(album_id, id, sizeof id);
+    despotify_begin_request(ds, DESPOTIFY_OP_ALBUM);
     int error = cmd_browse(ds->session, BROWSE_ALBUM, id, 1,
                            despotify_gzip_callback, ds);
 
@@ -1355,6 +2075,7 @@ struct track* despotify_get_tracks(struct despotify_session* ds, char* track_ids
     for (int i = 0; i < num_tracks; i++)
         hex_ascii_to_bytes(track_ids[i], tracklist + i * 16, 16);
 
+    despotify_begin_request(ds, DESPOTIFY_OP_TRACKS);
     int error = cmd_browse(ds->session, BROWSE_TRACK, tracklist, num_tracks,
                            despotify_gzip_callback, ds);
 
@@ -7,8 +7,10 @@
 
 #define STRING_LENGTH 256
 #define MAX_SEARCH_RESULTS 100 /* max search results per request */
+#define MAX_BROWSE_REQ 244 /* max entries to load in one browse request */
 #define SUBSTREAM_SIZE (100 * 1024)
 #define TIMEOUT 10 /* timeout in seconds */
+#define CACHE_DEFAULT_MAX_SIZE (512UL * 1024 * 1024) /* in bytes */
 
 struct track
 {
@@ -140,14 +142,19 @@ struct snd_buffer /* internal use */
     int cmd; /* command for the player... 1 == DATA, 0 == INIT */
     int consumed; /* Number of bytes consumed */
     unsigned char* ptr;
+    int size; /* bytes allocated along with the struct, 0 if ptr is not */
 
     struct snd_buffer* next;
 };
 
+/* Size classes of recycled buffers, 1 KB to 64 KB */
+#define SND_POOL_CLASSES 7
+
 struct snd_fifo /* internal use */
 {
     pthread_mutex_t lock;
-    pthread_cond_t cs;
+    pthread_cond_t cs; /* signalled when buffers are added */
+    pthread_cond_t dl_cond; /* signalled when dlstate changes */
     int totbytes; /* Total number of bytes added to queue */
     int maxbytes; /* Maximum size of queue */
     int watermark; /* Low watermark */
@@ -155,6 +162,40 @@ struct snd_fifo /* internal use */
 
     struct snd_buffer* start;	/* First buffer */
     struct snd_buffer* end;	/* Last buffer */
+
+    /* Freed buffers kept for reuse, by size class */
+    pthread_mutex_t pool_lock;
+    struct snd_buffer* pool[SND_POOL_CLASSES];
+    int pool_bytes;
+};
+
+struct aes_ctr /* internal use */
+{
+    unsigned int  state[4 * (10 + 1)];
+    unsigned char IV[16];
+};
+
+struct prefetch /* internal use */
+{
+    struct despotify_session* ds;
+    unsigned char file_id[20];
+
+    unsigned char* key;
+    struct aes_ctr aes;
+    unsigned char ready_IV[16]; /* IV at the end of data */
+    double requested; /* time of the request in flight */
+
+    struct snd_buffer* data; /* complete substreams, decrypted */
+    struct snd_buffer* pending; /* substream being received */
+    int offset; /* bytes in data */
+    int substreams; /* substreams in data */
+    bool complete; /* data holds the whole file */
+
+    bool wanted;
+    bool detached; /* free once nothing is in flight */
+    int in_flight; /* requests still to call back */
+
+    struct prefetch* next;
 };
 
 struct pcm_data
@@ -165,6 +206,59 @@ struct pcm_data
     char buf[4096];
 };
 
+struct cache_stats
+{
+    unsigned int entries;
+    unsigned long bytes;
+    unsigned long max_bytes; /* 0 means no limit */
+    unsigned long hits;
+    unsigned long misses;
+    unsigned long evictions;
+};
+
+/* operations timed by the session */
+enum despotify_op {
+    DESPOTIFY_OP_SEARCH,
+    DESPOTIFY_OP_PLAYLIST,
+    DESPOTIFY_OP_TRACKS, /* track browse, one per chunk of a playlist */
+    DESPOTIFY_OP_ALBUM,
+    DESPOTIFY_OP_ARTIST,
+    DESPOTIFY_OP_IMAGE,
+    DESPOTIFY_OP_KEY,
+    DESPOTIFY_OP_SUBSTREAM,
+    DESPOTIFY_OP_CACHE_LOAD,
+    DESPOTIFY_OP_COUNT
+};
+
+/* latency histogram buckets, the last one is unbounded */
+#define DESPOTIFY_LATENCY_BUCKETS 14
+extern const double despotify_latency_bounds[DESPOTIFY_LATENCY_BUCKETS - 1];
+
+struct op_stats
+{
+    unsigned long count;
+    unsigned long errors;
+    unsigned long bytes; /* received from the server */
+    double seconds; /* sum of all latencies */
+    double max_seconds;
+    unsigned long buckets[DESPOTIFY_LATENCY_BUCKETS];
+};
+
+struct despotify_stats
+{
+    struct op_stats ops[DESPOTIFY_OP_COUNT];
+    unsigned long cache_hits;
+    unsigned long cache_misses;
+
+    /* FIFO fill level, sampled whenever the decoder asks for data */
+    unsigned long fifo_samples;
+    unsigned long fifo_below_watermark;
+    double fifo_fill_sum; /* sum of totbytes / maxbytes */
+    int fifo_bytes; /* at the time of despotify_get_stats() */
+    int fifo_max_bytes;
+    int fifo_watermark;
+};
+
 struct despotify_session
 {
     bool initialized;
@@ -173,11 +267,7 @@ struct despotify_session
     const char *last_error;
 
     /* AES CTR state */
-    struct {
-        unsigned int  state[4 * (10 + 1)];
-        unsigned char IV[16];
-        unsigned char keystream[16];
-    } aes;
+    struct aes_ctr aes;
 
     pthread_t thread;
 
@@ -191,12 +281,31 @@ struct despotify_session
     /* client/lib synchronization */
     pthread_mutex_t sync_mutex;
     pthread_cond_t  sync_cond;
+    bool response_ready; /* guarded by sync_mutex */
 
     bool list_of_lists;
     bool play_as_list;
     bool high_bitrate;
     bool use_cache;
 
+    /* lookahead for list playback */
+    int prefetch_tracks;
+    int prefetch_substreams;
+    struct prefetch* prefetch;
+    pthread_mutex_t prefetch_mutex;
+
+    /* seconds from track start until its first PCM data */
+    double track_started;
+    double time_to_first_pcm;
+
+    /* instrumentation */
+    struct despotify_stats stats;
+    pthread_mutex_t stats_mutex;
+    int op; /* request waiting for ds->response, or -1 */
+    double op_started;
+    double key_requested;
+    double substream_requested;
+
     /* client callback */
     void(*client_callback)(struct despotify_session* session,
                            int signal,
@@ -242,6 +351,11 @@ enum {
 bool despotify_init(void);
 bool despotify_cleanup(void);
 
+/* Disk cache, shared by all sessions. */
+void despotify_set_cache_size(unsigned long max_bytes);
+void despotify_get_cache_stats(struct cache_stats* stats);
+void despotify_clear_cache(void);
+
 /* Session stuff. */
 struct despotify_session *despotify_init_client(void(*callback)(struct despotify_session*, int, void*, void*), void*, bool, bool);
 
@@ -261,8 +375,18 @@ bool despotify_authenticate(struct despotify_session *ds,
 void despotify_set_buffer_size(struct despotify_session* ds, int size);
 void despotify_set_watermark(struct despotify_session* ds, int watermark);
 
+/* Fetch the key and first substreams of the next tracks when playing a
+   list, so they start without waiting for the network. */
+void despotify_set_prefetch(struct despotify_session* ds,
+                            int tracks, int substreams);
+
 void despotify_free(struct despotify_session *ds, bool should_disconnect);
 
+/* Counters and latencies of requests made by the session. */
+void despotify_get_stats(struct despotify_session* ds,
+                         struct despotify_stats* stats);
+void despotify_reset_stats(struct despotify_session* ds);
+
 const char *despotify_get_error(struct despotify_session *ds);
 
 /* Browse functions.  */
@@ -274,6 +398,12 @@ struct track* despotify_get_tracks(struct despotify_session* ds, char* track_ids
 struct track* despotify_get_track(struct despotify_session* ds, char* track_id);
 void* despotify_get_image(struct despotify_session* ds,
                           char* image_id, int* len);
+/* Like despotify_get_image(), but a cached image is returned as a read-only
+   mapping of the cache file, and *mapped set. Release the image with
+   despotify_free_image(). */
+void* despotify_map_image(struct despotify_session* ds, char* image_id,
+                          int* len, bool* mapped);
+void despotify_free_image(void* image, int len, bool mapped);
 
 void despotify_free_artist_browse(struct artist_browse* a);
 void despotify_free_album_browse(struct album_browse* a);
@@ -285,6 +415,9 @@ void despotify_free_track(struct track* t);
 /* Search */
 struct search_result* despotify_search(struct despotify_session *ds,
                                        char *searchtext, int maxresults);
+struct search_result* despotify_search_page(struct despotify_session *ds,
+                                            char *searchtext,
+                                            int offset, int maxresults);
 struct search_result* despotify_search_more(struct despotify_session *ds,
                                             struct search_result* search,
                                             int offset, int maxresults);
@@ -294,7 +427,27 @@ void despotify_free_search(struct search_result *search);
 /* Playlist handling. */
 struct playlist* despotify_get_playlist(struct despotify_session *ds,
                                         char* playlist_id, bool cache_do_store);
+
+/* Loading a playlist a chunk at a time, to show the first tracks of a big
+   playlist before the rest have loaded. despotify_get_playlist_ids()
+   returns the playlist with only the ids of its tracks. Every call to
+   despotify_load_playlist_tracks() then loads the meta data of the next
+   MAX_BROWSE_REQ tracks from *next, which starts at pl->tracks, and moves
+   *next past them. It returns the number of tracks that got meta data, or
+   -1 on errors; *next is NULL once all are loaded. */
+struct playlist* despotify_get_playlist_ids(struct despotify_session *ds,
+                                            char* playlist_id,
+                                            bool cache_do_store);
+int despotify_load_playlist_tracks(struct despotify_session *ds,
+                                   struct playlist* pl,
+                                   struct track** next,
+                                   bool cache_do_store);
+
 struct playlist* despotify_get_stored_playlists(struct despotify_session *ds);
+bool despotify_get_playlist_revision(struct despotify_session *ds,
+                                     char* playlist_id, bool cache_do_store,
+                                     unsigned int* revision,
+                                     unsigned int* checksum);
 bool despotify_rename_playlist(struct despotify_session *ds,
                                struct playlist *playlist, char *name);
 bool despotify_set_playlist_collaboration(struct despotify_session *ds,
@@ -302,6 +455,17 @@ bool despotify_set_playlist_collaboration(struct despotify_session *ds,
                                           bool collaborative);
 void despotify_free_playlist(struct playlist* playlist);
 
+/* Snapshots of loaded playlists, to show at the next start before the
+   server has been asked. despotify_save_snapshot() saves count playlists
+   along with the meta playlist revision they were loaded at, replacing
+   the file at path atomically. despotify_load_snapshot() returns the
+   playlists as a list, to free with despotify_free_playlist(), or NULL if
+   the file is missing, unreadable or holds no playlists. */
+bool despotify_save_snapshot(const char* path, struct playlist** lists,
+                             int count, unsigned int meta_revision);
+struct playlist* despotify_load_snapshot(const char* path,
+                                         unsigned int* meta_revision);
+
 /* Playback control. */
 
 bool despotify_play(struct despotify_session *ds,
@@ -336,5 +500,6 @@ void despotify_uri2id(char* uri, char* id);
 
 /* internal functions */
 int despotify_snd_read_stream(struct despotify_session* ds);
+void despotify_sample_fifo(struct despotify_session* ds);
 
 #endif
@@ -104,7 +104,6 @@ int handle_aeskey (unsigned char *payload, int len)
 
 int handle_aeskeyerr (unsigned char *payload) {
     CHANNEL *ch;
-    struct despotify_session* ds;
     int ret = 0;
 
     DSFYDEBUG("Server said 0x0e (AES key error) for channel %d\n",
@@ -114,13 +113,9 @@ int handle_aeskeyerr (unsigned char *payload) {
 				    (*(unsigned short *) (payload + 2)))) !=
 			   NULL) {
 
-        ds = ch->private;
-        
-        if(ds->client_callback)
-	       ds->client_callback(ds, DESPOTIFY_TRACK_PLAY_ERROR, 
-                               NULL, 
-                               ds->client_callback_data);
-
+		/* let the requester know, it reports the error */
+		ch->state = CHANNEL_ERROR;
+		ret = ch->callback (ch, NULL, 0);
 		channel_unregister (ch);
 	}
 	else {
@@ -151,6 +146,7 @@ static int handle_welcome (SESSION * session)
 {
     /* signal "login complete" */
     pthread_mutex_lock(&session->login_mutex);
+    session->logged_in = true;
     pthread_cond_signal(&session->login_cond);
     pthread_mutex_unlock(&session->login_mutex);
     return 0;
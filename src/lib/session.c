@@ -120,8 +120,19 @@ int session_connect (SESSION * session)
 	struct addrinfo h, *airoot, *ai;
 	char host[1025 + 1], port[6], *service_list, *service;
 
-	/* Lookup service hosts in DNS */
-        service_list = dns_srv_list ("_spotify-client._tcp.spotify.com");
+	/*
+	 * $DESPOTIFY_SERVER ("host:port") overrides the service lookup,
+	 * to connect to a local test server for instance.
+	 *
+	 */
+	if ((service = getenv ("DESPOTIFY_SERVER")) != NULL && *service) {
+		service_list = malloc (strlen (service) + 2);
+		sprintf (service_list, "%s\n", service);
+	}
+	else
+		/* Lookup service hosts in DNS */
+		service_list = dns_srv_list ("_spotify-client._tcp.spotify.com");
+
 	if (!service_list) {
             DSFYDEBUG ("Service lookup failed. falling back to ap.spotify.com\n");
             service_list = malloc(200);
@@ -134,7 +145,7 @@ int session_connect (SESSION * session)
 		if (sscanf (service, "%[^:]:%5s\n", host, port) != 2)
 			return -1;
 
-		service += strlen (host) + 7;
+		service += strlen (host) + strlen (port) + 2;
 		DSFYDEBUG ("Connecting to %s:%s\n", host,
 			   port);
 
@@ -199,6 +210,7 @@ void session_disconnect (SESSION * session)
 
 	session->key_recv_IV = 0;
 	session->key_send_IV = 0;
+	session->logged_in = false;
 
 	session->user_info.username[0] = 0;
 	session->user_info.country[0] = 0;
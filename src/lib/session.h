@@ -126,6 +126,7 @@ typedef struct session
         /* login synchronization */
         pthread_mutex_t login_mutex;
         pthread_cond_t  login_cond;
+        bool logged_in;
 } SESSION;
 
 SESSION *session_init_client (void);
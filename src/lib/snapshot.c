@@ -0,0 +1,349 @@
+/*
+ * Snapshots of playlists with their tracks, in a single file, so a client
+ * can show the stored playlists of the last run before it has talked to
+ * the server.
+ *
+ * The file holds a header, with the revision of the meta playlist the
+ * playlists were loaded at, and then the playlists one after another.
+ * Numbers are in host byte order and strings are length prefixed, so a
+ * file from another kind of host fails the magic check and is ignored.
+ * Track keys are not saved.
+ *
+ * $Id$
+ */
+
+#include <fcntl.h>
+#include <limits.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include "buf.h"
+#include "despotify.h"
+#include "util.h"
+
+#define SNAPSHOT_MAGIC 0x70616e73 /* "snap" on little endian hosts */
+#define SNAPSHOT_VERSION 1
+#define NO_STRING 0xffffffff
+
+/****************************************************
+ *
+ *  Writing
+ *
+ */
+
+static void put_u32(struct buf* b, unsigned int value)
+{
+    buf_append_data(b, &value, sizeof value);
+}
+
+static void put_string(struct buf* b, const char* s)
+{
+    if (!s) {
+        put_u32(b, NO_STRING);
+        return;
+    }
+
+    unsigned int len = strlen(s);
+    put_u32(b, len);
+    buf_append_data(b, (void*) s, len);
+}
+
+static void put_float(struct buf* b, float value)
+{
+    buf_append_data(b, &value, sizeof value);
+}
+
+static void put_track(struct buf* b, struct track* t)
+{
+    struct artist* a;
+    unsigned int artists = 0;
+
+    buf_append_u8(b, t->has_meta_data | t->playable << 1 |
+                     t->geo_restricted << 2);
+    put_string(b, (char*) t->track_id);
+    put_string(b, (char*) t->file_id);
+    put_u32(b, t->file_bitrate);
+    put_string(b, (char*) t->album_id);
+    put_string(b, (char*) t->cover_id);
+    put_string(b, t->allowed);
+    put_string(b, t->forbidden);
+    put_string(b, t->title);
+    put_string(b, t->album);
+    put_u32(b, t->length);
+    put_u32(b, t->tracknumber);
+    put_u32(b, t->year);
+    put_float(b, t->popularity);
+
+    for (a = t->artist; a; a = a->next)
+        artists++;
+    put_u32(b, artists);
+    for (a = t->artist; a; a = a->next) {
+        put_string(b, a->name);
+        put_string(b, a->id);
+        put_string(b, a->portrait_id);
+        put_float(b, a->popularity);
+    }
+}
+
+static void put_playlist(struct buf* b, struct playlist* pl)
+{
+    struct track* t;
+    unsigned int tracks = 0;
+
+    put_string(b, pl->name);
+    put_string(b, pl->author);
+    put_string(b, (char*) pl->playlist_id);
+    buf_append_u8(b, pl->is_collaborative);
+    put_u32(b, pl->revision);
+    put_u32(b, pl->checksum);
+
+    for (t = pl->tracks; t; t = t->next)
+        tracks++;
+    put_u32(b, tracks);
+    for (t = pl->tracks; t; t = t->next)
+        put_track(b, t);
+}
+
+bool despotify_save_snapshot(const char* path, struct playlist** lists,
+                             int count, unsigned int meta_revision)
+{
+    char temp[PATH_MAX];
+    struct buf* b = buf_new();
+    bool saved = false;
+
+    put_u32(b, SNAPSHOT_MAGIC);
+    put_u32(b, SNAPSHOT_VERSION);
+    put_u32(b, meta_revision);
+    put_u32(b, count);
+    for (int i = 0; i < count; i++)
+        put_playlist(b, lists[i]);
+
+    /* Write to a temporary file and rename it over the old snapshot, so
+       readers never see half of it. */
+    if (snprintf(temp, sizeof temp, "%s.XXXXXX", path) >= (int) sizeof temp) {
+        buf_free(b);
+        return false;
+    }
+
+    int fd = mkstemp(temp);
+    FILE* file = fd < 0 ? NULL : fdopen(fd, "w");
+    if (file) {
+        fchmod(fd, 0644);
+        saved = fwrite(b->ptr, 1, b->len, file) == (size_t) b->len;
+        saved = fclose(file) == 0 && saved && rename(temp, path) == 0;
+        if (!saved)
+            remove(temp);
+    }
+    else if (fd >= 0) {
+        close(fd);
+        remove(temp);
+    }
+
+    if (!saved) {
+        DSFYDEBUG("Error writing snapshot %s\n", path);
+    }
+
+    buf_free(b);
+    return saved;
+}
+
+/****************************************************
+ *
+ *  Reading
+ *
+ */
+
+struct reader
+{
+    unsigned char* ptr;
+    unsigned char* end;
+    bool failed;
+};
+
+static bool take(struct reader* r, void* out, size_t size)
+{
+    if (r->failed || (size_t) (r->end - r->ptr) < size) {
+        r->failed = true;
+        memset(out, 0, size);
+        return false;
+    }
+
+    memcpy(out, r->ptr, size);
+    r->ptr += size;
+    return true;
+}
+
+static unsigned int get_u32(struct reader* r)
+{
+    unsigned int value;
+    take(r, &value, sizeof value);
+    return value;
+}
+
+static unsigned char get_u8(struct reader* r)
+{
+    unsigned char value;
+    take(r, &value, sizeof value);
+    return value;
+}
+
+static float get_float(struct reader* r)
+{
+    float value;
+    take(r, &value, sizeof value);
+    return value;
+}
+
+/* Read a string into a field of size bytes */
+static void get_string(struct reader* r, char* out, size_t size)
+{
+    unsigned int len = get_u32(r);
+
+    out[0] = 0;
+    if (r->failed || len == NO_STRING)
+        return;
+
+    if (len >= size || (size_t) (r->end - r->ptr) < len) {
+        r->failed = true;
+        return;
+    }
+
+    memcpy(out, r->ptr, len);
+    out[len] = 0;
+    r->ptr += len;
+}
+
+/* Read a string into a new allocation, NULL if it was saved as NULL */
+static char* get_new_string(struct reader* r)
+{
+    unsigned int len = get_u32(r);
+    char* s;
+
+    if (r->failed || len == NO_STRING)
+        return NULL;
+
+    if ((size_t) (r->end - r->ptr) < len) {
+        r->failed = true;
+        return NULL;
+    }
+
+    s = malloc(len + 1);
+    memcpy(s, r->ptr, len);
+    s[len] = 0;
+    r->ptr += len;
+    return s;
+}
+
+static struct track* get_track(struct reader* r)
+{
+    struct track* t = calloc(1, sizeof(struct track));
+    struct artist** link = &t->artist;
+    unsigned char flags = get_u8(r);
+
+    t->has_meta_data = flags & 1;
+    t->playable = (flags >> 1) & 1;
+    t->geo_restricted = (flags >> 2) & 1;
+    get_string(r, (char*) t->track_id, sizeof t->track_id);
+    get_string(r, (char*) t->file_id, sizeof t->file_id);
+    t->file_bitrate = get_u32(r);
+    get_string(r, (char*) t->album_id, sizeof t->album_id);
+    get_string(r, (char*) t->cover_id, sizeof t->cover_id);
+    t->allowed = get_new_string(r);
+    t->forbidden = get_new_string(r);
+    get_string(r, t->title, sizeof t->title);
+    get_string(r, t->album, sizeof t->album);
+    t->length = get_u32(r);
+    t->tracknumber = get_u32(r);
+    t->year = get_u32(r);
+    t->popularity = get_float(r);
+
+    for (unsigned int artists = get_u32(r); artists && !r->failed;
+         artists--) {
+        struct artist* a = calloc(1, sizeof(struct artist));
+        get_string(r, a->name, sizeof a->name);
+        get_string(r, a->id, sizeof a->id);
+        get_string(r, a->portrait_id, sizeof a->portrait_id);
+        a->popularity = get_float(r);
+        *link = a;
+        link = &a->next;
+    }
+
+    return t;
+}
+
+static struct playlist* get_playlist(struct reader* r)
+{
+    struct playlist* pl = calloc(1, sizeof(struct playlist));
+    struct track** link = &pl->tracks;
+
+    get_string(r, pl->name, sizeof pl->name);
+    get_string(r, pl->author, sizeof pl->author);
+    get_string(r, (char*) pl->playlist_id, sizeof pl->playlist_id);
+    pl->is_collaborative = get_u8(r);
+    pl->revision = get_u32(r);
+    pl->checksum = get_u32(r);
+
+    for (unsigned int tracks = get_u32(r); tracks && !r->failed; tracks--) {
+        *link = get_track(r);
+        link = &(*link)->next;
+        pl->num_tracks++;
+    }
+
+    return pl;
+}
+
+struct playlist* despotify_load_snapshot(const char* path,
+                                         unsigned int* meta_revision)
+{
+    struct reader r;
+    struct playlist* root = NULL;
+    struct playlist** link = &root;
+    struct stat st;
+    unsigned char* data;
+    int fd;
+
+    fd = open(path, O_RDONLY);
+    if (fd < 0)
+        return NULL;
+
+    if (fstat(fd, &st) || !(data = malloc(st.st_size + 1))) {
+        close(fd);
+        return NULL;
+    }
+
+    r.ptr = data;
+    r.end = data + st.st_size;
+    r.failed = false;
+    for (unsigned char* p = data; p < r.end; ) {
+        ssize_t n = read(fd, p, r.end - p);
+        if (n <= 0) {
+            r.failed = true;
+            break;
+        }
+        p += n;
+    }
+    close(fd);
+
+    if (get_u32(&r) != SNAPSHOT_MAGIC || get_u32(&r) != SNAPSHOT_VERSION)
+        r.failed = true;
+
+    *meta_revision = get_u32(&r);
+    for (unsigned int lists = get_u32(&r); lists && !r.failed; lists--) {
+        *link = get_playlist(&r);
+        link = &(*link)->next;
+    }
+
+    free(data);
+
+    if (r.failed || !root) {
+        DSFYDEBUG("Snapshot %s is not usable\n", path);
+        if (root)
+            despotify_free_playlist(root);
+        return NULL;
+    }
+
+    return root;
+}
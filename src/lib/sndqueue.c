@@ -24,11 +24,51 @@ enum {
     DL_END_OF_LIST
 };
 
-static void shortsleep(void)
+/* How long snd_get_pcm() waits for data before returning none */
+#define DATA_WAIT_NS 100000000
+
+/* Set the download state and wake anyone waiting for it. */
+static void snd_set_dlstate(struct despotify_session* ds, int state)
+{
+	pthread_mutex_lock(&ds->fifo->lock);
+	ds->dlstate = state;
+	pthread_cond_broadcast(&ds->fifo->dl_cond);
+	pthread_mutex_unlock(&ds->fifo->lock);
+}
+
+/* Wait for the substream being downloaded, if any, to end */
+static void snd_wait_download(struct despotify_session* ds)
 {
-    /* sleep 100 ms */
-    struct timespec delay = {0, 100000000};
-    nanosleep(&delay, NULL);
+	pthread_mutex_lock(&ds->fifo->lock);
+	while (ds->dlstate == DL_FILLING_BUSY) {
+		DSFYDEBUG("dlstate = %d. waiting...\n", ds->dlstate);
+		pthread_cond_wait(&ds->fifo->dl_cond, &ds->fifo->lock);
+	}
+	pthread_mutex_unlock(&ds->fifo->lock);
+}
+
+/* Wait a while for the fifo to get data, true if it has some */
+static bool snd_wait_data(struct despotify_session* ds)
+{
+	struct timespec deadline;
+	bool ready;
+
+	clock_gettime(CLOCK_REALTIME, &deadline);
+	deadline.tv_nsec += DATA_WAIT_NS;
+	if (deadline.tv_nsec >= 1000000000) {
+		deadline.tv_sec++;
+		deadline.tv_nsec -= 1000000000;
+	}
+
+	pthread_mutex_lock(&ds->fifo->lock);
+	while (!ds->fifo->start &&
+	       !pthread_cond_timedwait(&ds->fifo->cs, &ds->fifo->lock,
+	                               &deadline))
+		;
+	ready = ds->fifo->start != NULL;
+	pthread_mutex_unlock(&ds->fifo->lock);
+
+	return ready;
 }
 
 void snd_reset_codec(struct despotify_session* ds) {
@@ -46,12 +86,112 @@ void snd_reset_codec(struct despotify_session* ds) {
 }
 
 
+/****************************************************
+ *
+ *  Buffers
+ *
+ *  Buffers of channel data are allocated together with their struct
+ *  snd_buffer, in size classes of 1 KB to 64 KB, and freed ones are kept
+ *  in the fifo for reuse, up to the size of the fifo itself. The network
+ *  thread takes them, the player gives them back.
+ *
+ */
+
+#define POOL_MIN_SHIFT 10
+
+/* Size class of a buffer of size bytes, or -1 if it is too big */
+static int snd_pool_class(int size)
+{
+	int class = 0;
+
+	while ((1 << (POOL_MIN_SHIFT + class)) < size)
+		if (++class == SND_POOL_CLASSES)
+			return -1;
+
+	return class;
+}
+
+/* Returns a buffer of at least size bytes at ptr, its other fields zeroed */
+struct snd_buffer* snd_buffer_new(struct despotify_session* ds, int size)
+{
+	struct snd_fifo* fifo = ds->fifo;
+	struct snd_buffer* b = NULL;
+	int class = snd_pool_class(size);
+
+	if (class >= 0) {
+		size = 1 << (POOL_MIN_SHIFT + class);
+
+		if (fifo) {
+			pthread_mutex_lock(&fifo->pool_lock);
+			b = fifo->pool[class];
+			if (b) {
+				fifo->pool[class] = b->next;
+				fifo->pool_bytes -= size;
+			}
+			pthread_mutex_unlock(&fifo->pool_lock);
+		}
+	}
+
+	if (!b) {
+		b = malloc(sizeof(struct snd_buffer) + size);
+		if (!b) {
+			perror("malloc failed");
+			exit(-1);
+		}
+	}
+
+	memset(b, 0, sizeof(struct snd_buffer));
+	b->ptr = (unsigned char*) (b + 1);
+	b->size = size;
+
+	return b;
+}
+
+/* Free a buffer, from snd_buffer_new() or not */
+void snd_buffer_free(struct despotify_session* ds, struct snd_buffer* b)
+{
+	struct snd_fifo* fifo = ds->fifo;
+	int class;
+
+	if (!b->size) {
+		if (b->ptr)
+			free(b->ptr);
+		free(b);
+		return;
+	}
+
+	class = snd_pool_class(b->size);
+	if (fifo && class >= 0) {
+		pthread_mutex_lock(&fifo->pool_lock);
+		if (fifo->pool_bytes + b->size <= fifo->maxbytes) {
+			b->next = fifo->pool[class];
+			fifo->pool[class] = b;
+			fifo->pool_bytes += b->size;
+			b = NULL;
+		}
+		pthread_mutex_unlock(&fifo->pool_lock);
+	}
+
+	if (b)
+		free(b);
+}
+
+/* Record how long the current track took to produce audio */
+static void snd_first_pcm(struct despotify_session* ds)
+{
+	if (ds->track_started) {
+		ds->time_to_first_pcm = time_now() - ds->track_started;
+		ds->track_started = 0;
+	}
+}
+
 /* Reset for new song */
 void snd_reset(struct despotify_session* ds)
 {
 	DSFYDEBUG("Setting state to DL_DRAINING\n");
 	ds->fifo->totbytes = 0;
 	ds->dlstate = DL_DRAINING;
+	ds->track_started = 0;
 	snd_reset_codec(ds);
 }
 
@@ -81,6 +221,21 @@ bool snd_init(struct despotify_session *ds)
 		return NULL;
 	}
 
+	if (pthread_cond_init (&ds->fifo->dl_cond, NULL)) {
+		pthread_cond_destroy (&ds->fifo->cs);
+		pthread_mutex_destroy (&ds->fifo->lock);
+		DSFYfree (ds->fifo);
+		return NULL;
+	}
+
+	if (pthread_mutex_init (&ds->fifo->pool_lock, NULL)) {
+		pthread_cond_destroy (&ds->fifo->dl_cond);
+		pthread_cond_destroy (&ds->fifo->cs);
+		pthread_mutex_destroy (&ds->fifo->lock);
+		DSFYfree (ds->fifo);
+		return NULL;
+	}
+
         return true;
 }
 
@@ -97,13 +252,21 @@ void snd_destroy (struct despotify_session* ds)
 		while (ds->fifo->start) {
                         struct snd_buffer* b = ds->fifo->start;
 			ds->fifo->start = ds->fifo->start->next;
-			free (b->ptr);
-			free (b);
+			snd_buffer_free(ds, b);
 		}
 
+		for (int i = 0; i < SND_POOL_CLASSES; i++)
+			while (ds->fifo->pool[i]) {
+				struct snd_buffer* b = ds->fifo->pool[i];
+				ds->fifo->pool[i] = b->next;
+				free(b);
+			}
+
                 pthread_mutex_unlock(&ds->fifo->lock);
 		pthread_cond_destroy(&ds->fifo->cs);
+		pthread_cond_destroy(&ds->fifo->dl_cond);
 		pthread_mutex_destroy(&ds->fifo->lock);
+		pthread_mutex_destroy(&ds->fifo->pool_lock);
                 
 		DSFYfree (ds->fifo);
 	}
@@ -112,11 +275,8 @@ void snd_destroy (struct despotify_session* ds)
 static void snd_fill_fifo(struct despotify_session* ds)
 {
     if (ds->dlabort) {
-        while (ds->dlstate == DL_FILLING_BUSY) {
-            DSFYDEBUG("dlstate = %d. waiting...\n", ds->dlstate);
-            shortsleep();
-        }
-        ds->dlstate = DL_DRAINING;
+        snd_wait_download(ds);
+        snd_set_dlstate(ds, DL_DRAINING);
         return;
     }
 
@@ -126,7 +286,7 @@ static void snd_fill_fifo(struct despotify_session* ds)
                 DSFYDEBUG("Low on data (%d / %d), fetching another channel\n",
                           ds->fifo->totbytes, ds->fifo->maxbytes);
                 DSFYDEBUG("dlstate = DL_FILLING_BUSY\n");
-                ds->dlstate = DL_FILLING_BUSY;
+                snd_set_dlstate(ds, DL_FILLING_BUSY);
                 despotify_snd_read_stream(ds);
             }
             break;
@@ -134,12 +294,12 @@ static void snd_fill_fifo(struct despotify_session* ds)
         case DL_FILLING:
             if (ds->fifo->totbytes < (ds->fifo->maxbytes - SUBSTREAM_SIZE)) {
                 DSFYDEBUG("dlstate = DL_FILLING_BUSY\n");
-                ds->dlstate = DL_FILLING_BUSY;
+                snd_set_dlstate(ds, DL_FILLING_BUSY);
                 despotify_snd_read_stream(ds);
             }
             else {
                 DSFYDEBUG("buffer filled. setting dlstate DL_DRAINING\n");
-                ds->dlstate = DL_DRAINING;
+                snd_set_dlstate(ds, DL_DRAINING);
             }
             break;
     }
@@ -155,15 +315,12 @@ int snd_stop (struct despotify_session *ds)
         if (ds->dlstate < DL_DRAINING)
             ds->dlabort = true;
             
-        while (ds->dlstate == DL_FILLING_BUSY) {
-            DSFYDEBUG("dlstate = %d. waiting...\n", ds->dlstate);
-            shortsleep();
-        }
+        snd_wait_download(ds);
         
         /* Don't request more data in pcm_read(),
            even if the buffer gets low */
         DSFYDEBUG("dlstate = DL_DRAINING\n");
-        ds->dlstate = DL_DRAINING;
+        snd_set_dlstate(ds, DL_DRAINING);
 
         pthread_mutex_lock (&ds->fifo->lock);
 
@@ -171,8 +328,7 @@ int snd_stop (struct despotify_session *ds)
 	while (ds->fifo->start) {
 		struct snd_buffer* b = ds->fifo->start;
 		ds->fifo->start = ds->fifo->start->next;
-		free(b->ptr);
-		free(b);
+		snd_buffer_free(ds, b);
 	}
 
 	ds->fifo->start = NULL;
@@ -180,6 +336,7 @@ int snd_stop (struct despotify_session *ds)
 
 	/* Reset the session */
 	snd_reset(ds);
+	pthread_cond_broadcast(&ds->fifo->dl_cond);
 
         ds->dlabort = false;
         pthread_mutex_unlock (&ds->fifo->lock);
@@ -198,11 +355,9 @@ int snd_next(struct despotify_session *ds)
         if (b->cmd == SND_CMD_START)
             break;
 
-        if (b->ptr)
-            free(b->ptr);
         ds->fifo->totbytes -= b->length;
         next = b->next;
-        free(b);
+        snd_buffer_free(ds, b);
     }
 
     ds->fifo->start = b;
@@ -216,6 +371,8 @@ int snd_next(struct despotify_session *ds)
     
     pthread_mutex_unlock(&ds->fifo->lock);
 
+    ds->track_started = time_now();
+
     /* notify client */
     if (ds->client_callback)
         ds->client_callback(ds, DESPOTIFY_NEW_TRACK,
@@ -235,12 +392,12 @@ void snd_ioctl (struct despotify_session* ds, int cmd, void *data, int length)
                 /* end of substream */
                 if (ds->dlabort) {
                     DSFYDEBUG("ds->dlstate = DL_DRAINING\n");
-                    ds->dlstate = DL_DRAINING;
+                    snd_set_dlstate(ds, DL_DRAINING);
                 }
                 else
                     if (ds->dlstate != DL_END_OF_LIST) {
                         DSFYDEBUG("ds->dlstate = DL_FILLING\n");
-                        ds->dlstate = DL_FILLING; /* step down from DL_FILLING_BUSY */
+                        snd_set_dlstate(ds, DL_FILLING); /* step down from DL_FILLING_BUSY */
                     }
                 return;
 
@@ -248,18 +405,12 @@ void snd_ioctl (struct despotify_session* ds, int cmd, void *data, int length)
                 /* end of track. end of playlist? */
                 if (!ds->track) {
                     DSFYDEBUG("ds->dlstate = DL_END_OF_LIST\n");
-                    ds->dlstate = DL_END_OF_LIST;
+                    snd_set_dlstate(ds, DL_END_OF_LIST);
                 }
                 break;
         }
 
-        if (ds->dlabort) {
-            if (data)
-                free(data);
-            return;
-        }
-
-        struct snd_buffer* buff = malloc(sizeof(struct snd_buffer));
+        struct snd_buffer* buff = calloc(1, sizeof(struct snd_buffer));
 	if (!buff) {
 		perror ("malloc failed");
 		exit (-1);
@@ -267,9 +418,23 @@ void snd_ioctl (struct despotify_session* ds, int cmd, void *data, int length)
 
         buff->length = length;
 	buff->cmd = cmd;
-        buff->consumed = 0;
         buff->ptr = data;
-	buff->next = NULL;
+
+        snd_push(ds, buff);
+}
+
+/* Queue a buffer for the player, which frees it */
+void snd_push(struct despotify_session* ds, struct snd_buffer* buff)
+{
+        if (ds->dlabort) {
+            snd_buffer_free(ds, buff);
+            return;
+        }
+
+        int cmd = buff->cmd;
+        int length = buff->length;
+        buff->consumed = 0;
+        buff->next = NULL;
 
         pthread_mutex_lock (&ds->fifo->lock);
 
@@ -306,8 +471,8 @@ void snd_ioctl (struct despotify_session* ds, int cmd, void *data, int length)
 
 	ds->fifo->totbytes += buff->length;
 
-	/* Signal receiver */
-	pthread_cond_signal (&ds->fifo->cs);
+	/* Signal receivers */
+	pthread_cond_broadcast (&ds->fifo->cs);
 	pthread_mutex_unlock (&ds->fifo->lock);
 
         ds->fifo->lastcmd = cmd;
@@ -349,6 +514,10 @@ int snd_consume_data(struct despotify_session* ds, int req_bytes, void* private,
 		/* Increment by one */
                 ds->fifo->start = ds->fifo->start->next;
 
+                /* unless a skip or play is waiting for it already */
+                if (!ds->track_started)
+                    ds->track_started = time_now();
+
                 /* notify client */
                 if (ds->client_callback)
                     ds->client_callback(ds, DESPOTIFY_NEW_TRACK,
@@ -357,9 +526,7 @@ int snd_consume_data(struct despotify_session* ds, int req_bytes, void* private,
                 /* If this was the last entry */
                 if (b == ds->fifo->end)
                     ds->fifo->end = NULL;
-                if (b->ptr)
-                    DSFYfree (b->ptr);
-                DSFYfree (b);
+                snd_buffer_free(ds, b);
                 break;
                 
             case SND_CMD_DATA:
@@ -389,8 +556,7 @@ int snd_consume_data(struct despotify_session* ds, int req_bytes, void* private,
                     if (b == ds->fifo->end)
 			ds->fifo->end = NULL;
                     
-                    DSFYfree (b->ptr);
-                    DSFYfree (b);
+                    snd_buffer_free(ds, b);
                 }
 
                 /* exit if input is empty or output is full */
@@ -420,9 +586,7 @@ int snd_consume_data(struct despotify_session* ds, int req_bytes, void* private,
                 /* If this was the last entry */
                 if (b == ds->fifo->end)
                     ds->fifo->end = NULL;
-                if (b->ptr)
-                    DSFYfree (b->ptr);
-		DSFYfree (b);
+                snd_buffer_free(ds, b);
 
 		_DSFYDEBUG("Calling despotify_end_of_track\n");
 
@@ -553,6 +717,7 @@ int snd_do_vorbis(struct despotify_session* ds, struct pcm_data* pcm ) {
 
         /* valid data *was* read, update length. */
         pcm->len = r;
+        snd_first_pcm(ds);
 
         if (ds->client_callback) {
             double point = ov_time_tell(ds->vf);
@@ -672,6 +837,7 @@ int snd_do_mpeg(struct despotify_session* ds, struct pcm_data* pcm) {
 		}
 		
 		pcm->len = bytes;
+		snd_first_pcm(ds);
 		if (ds->client_callback) {
 			off_t frame_cur;
 			off_t frame_left;
@@ -736,12 +902,21 @@ int snd_stream_is_vorbis(struct despotify_session* ds) {
 
 int snd_get_pcm(struct despotify_session* ds, struct pcm_data* pcm)
 {
-    if (!ds || !ds->fifo || !ds->fifo->start) {
+    if (!ds || !ds->fifo) {
+        /* nothing has been played yet */
+        struct timespec delay = {0, DATA_WAIT_NS};
         pcm->len = 0;
-        shortsleep();
+        nanosleep(&delay, NULL);
         return 0;
     }
 
+    if (!snd_wait_data(ds)) {
+        pcm->len = 0;
+        return 0;
+    }
+
+    despotify_sample_fifo(ds);
+
     /* top up fifo */
     snd_fill_fifo(ds);
 
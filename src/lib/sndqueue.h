@@ -60,6 +60,9 @@ int snd_stop (struct despotify_session* ds);
 int snd_next (struct despotify_session *ds);
 void snd_start (struct despotify_session* ds);
 void snd_ioctl (struct despotify_session *session, int cmd, void *data, int length);
+void snd_push (struct despotify_session* ds, struct snd_buffer* b);
+struct snd_buffer* snd_buffer_new (struct despotify_session* ds, int size);
+void snd_buffer_free (struct despotify_session* ds, struct snd_buffer* b);
 long pcm_read (struct despotify_session* ds, char *buffer, int length,
                int bigendianp, int word, int sgned, int *bitstream);
 
@@ -10,6 +10,7 @@
 #include <ctype.h>
 #include <unistd.h>
 #include <errno.h>
+#include <sys/time.h>
 #include "network.h"
 
 #include "util.h"
@@ -130,3 +131,12 @@ ssize_t block_write (int fd, void *buf, size_t nbyte)
 	}
 	return idx;
 }
+
+/* Wall clock time in seconds, for measuring intervals */
+double time_now (void)
+{
+	struct timeval tv;
+
+	gettimeofday (&tv, NULL);
+	return tv.tv_sec + tv.tv_usec / 1000000.0;
+}
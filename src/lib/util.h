@@ -35,4 +35,5 @@ void fhexdump8x32 (FILE *, char *, void *, int);
 void logdata (char *, int, void *, int);
 ssize_t block_read (int, void *, size_t);
 ssize_t block_write (int, void *, size_t);
+double time_now (void);
 #endif
@@ -11,6 +11,7 @@
 #include <string.h>
 #include <locale.h>
 
+#include "buf.h"
 #include "despotify.h"
 #include "ezxml.h"
 #include "util.h"
@@ -105,7 +106,9 @@ struct playlist* xml_parse_playlist(struct playlist* pl,
         struct playlist* prev = NULL;
         struct playlist* p = pl;
 
-        for (char* id = strtok(items, ",\n"); id; id = strtok(NULL, ",\n"))
+        char* save = NULL;
+        for (char* id = items ? strtok_r(items, ",\n", &save) : NULL; id;
+             id = strtok_r(NULL, ",\n", &save))
         {
             if (prev) {
                 p = calloc(1, sizeof(struct playlist));
@@ -122,7 +125,9 @@ struct playlist* xml_parse_playlist(struct playlist* pl,
         struct track* t = NULL;
 
         int track_count = 0;
-        for (char* id = strtok(items, ",\n"); id; id = strtok(NULL, ",\n"))
+        char* save = NULL;
+        for (char* id = items ? strtok_r(items, ",\n", &save) : NULL; id;
+             id = strtok_r(NULL, ",\n", &save))
         {
             t = calloc(1, sizeof(struct track));
             if (prev)
@@ -173,154 +178,167 @@ void xml_free_playlist(struct playlist* pl)
     }
 }
 
-static int parse_tracks(ezxml_t xml, struct track* t, bool ordered, bool high_bitrate)
+/* Find the track struct for a track of an ordered list, that is the first
+   one from root without meta data and with the id of the track. */
+static struct track* find_track(ezxml_t track, struct track* root)
 {
-    int track_count = 0;
-    struct track* prev = NULL;
-    struct track* root = t;
-
-    for (ezxml_t track = ezxml_get(xml, "track",-1); track; track = track->next)
-    {
-        /* is this an ordered list? in that case we have to find the
-           right track struct for every track id */
-        if (ordered) {
-            char tid[33];
-            xmlstrncpy(tid, sizeof tid, track, "id", -1);
-            struct track* tt;
-            for (tt = root; tt; tt = tt->next)
+    char tid[33];
+    xmlstrncpy(tid, sizeof tid, track, "id", -1);
+    struct track* tt;
+    for (tt = root; tt; tt = tt->next)
+        if (!tt->has_meta_data &&
+            !strncmp(tt->track_id, tid, sizeof tt->track_id))
+            break;
+    /* if we didn't find the id, check if an old, redirected
+       id is used */
+    if (!tt) {
+        char rid[33];
+        for (ezxml_t re = ezxml_child(track, "redirect"); re; re = re->next) {
+            strncpy(rid, re->txt, sizeof rid);
+            for (tt = root; tt; tt = tt->next) {
+                /* update to new id */
+                /* FIXME: This invalidates the playlist checksum */
                 if (!tt->has_meta_data &&
-                    !strncmp(tt->track_id, tid, sizeof tt->track_id))
+                    !strncmp(tt->track_id, rid, sizeof tt->track_id)) {
+                    memcpy (tt->track_id, tid, sizeof tt->track_id);
                     break;
-            /* if we didn't find the id, check if an old, redirected
-               id is used */
-            if (!tt) {
-                char rid[33];
-                for (ezxml_t re = ezxml_child(track, "redirect"); re; re = re->next) {
-                    strncpy(rid, re->txt, sizeof rid);
-                    for (tt = root; tt; tt = tt->next) {
-                        /* update to new id */
-                        /* FIXME: This invalidates the playlist checksum */
-                        if (!tt->has_meta_data &&
-                            !strncmp(tt->track_id, rid, sizeof tt->track_id)) {
-                            memcpy (tt->track_id, tid, sizeof tt->track_id);
-                            break;
-                        }
-                    }
-                    if (tt)
-                        break;
-                }
-                /* we've wasted enough cpu cycles on this track now */
-                if (!tt) {
-                    DSFYDEBUG("!!! error: track id not found: %s\n", tid);
-                    continue;
                 }
             }
-            t = tt;
+            if (tt)
+                break;
         }
-        else
-            if (!t) {
-                t = calloc(1, sizeof(struct track));
-                prev->next = t;
-            }
+    }
 
-        xmlstrncpy(t->title, sizeof t->title, track, "title", -1);
-        xmlstrncpy(t->album, sizeof t->album, track, "album", -1);
-
-        xmlstrncpy(t->track_id, sizeof t->track_id, track, "id", -1);
-        xmlstrncpy(t->cover_id, sizeof t->cover_id, track, "cover", -1);
-        xmlstrncpy(t->album_id, sizeof t->album_id, track, "album-id", -1);
-
-        /* create list of artists */
-        struct artist* preva = NULL;
-        struct artist* artist = calloc(1, sizeof(struct artist));
-        t->artist = artist;
-        ezxml_t xid = ezxml_get(track, "artist-id", -1);
-        for (ezxml_t xa = ezxml_get(track, "artist", -1); xa; xa = xa->next) {
-            if (preva) {
-                artist = calloc(1, sizeof(struct artist));
-                preva->next = artist;
-            }
-            DSFYstrncpy(artist->name, xa->txt, sizeof artist->name);
+    /* we've wasted enough cpu cycles on this track now */
+    if (!tt)
+        DSFYDEBUG("!!! error: track id not found: %s\n", tid);
 
-            if (xid) {
-                DSFYstrncpy(artist->id, xid->txt, sizeof artist->id);
-                xid = xid->next;
-            }
-            preva = artist;
+    return tt;
+}
+
+static void parse_track(ezxml_t track, struct track* t, bool high_bitrate)
+{
+    xmlstrncpy(t->title, sizeof t->title, track, "title", -1);
+    xmlstrncpy(t->album, sizeof t->album, track, "album", -1);
+
+    xmlstrncpy(t->track_id, sizeof t->track_id, track, "id", -1);
+    xmlstrncpy(t->cover_id, sizeof t->cover_id, track, "cover", -1);
+    xmlstrncpy(t->album_id, sizeof t->album_id, track, "album-id", -1);
+
+    /* create list of artists */
+    struct artist* preva = NULL;
+    struct artist* artist = calloc(1, sizeof(struct artist));
+    t->artist = artist;
+    ezxml_t xid = ezxml_get(track, "artist-id", -1);
+    for (ezxml_t xa = ezxml_get(track, "artist", -1); xa; xa = xa->next) {
+        if (preva) {
+            artist = calloc(1, sizeof(struct artist));
+            preva->next = artist;
+        }
+        DSFYstrncpy(artist->name, xa->txt, sizeof artist->name);
+
+        if (xid) {
+            DSFYstrncpy(artist->id, xid->txt, sizeof artist->id);
+            xid = xid->next;
         }
+        preva = artist;
+    }
 
-        for ( ezxml_t file = ezxml_get(track, "files",0, "file",-1); file; file = file->next) {
-            char* fmt = (char*)ezxml_attr(file, "format");
-            if (fmt) {
-                unsigned int bitrate = 0;
-                bool found_rate = false;
+    for ( ezxml_t file = ezxml_get(track, "files",0, "file",-1); file; file = file->next) {
+        char* fmt = (char*)ezxml_attr(file, "format");
+        if (fmt) {
+            unsigned int bitrate = 0;
+            bool found_rate = false;
 #ifndef MP3_SUPPORT
-                if ( strncmp("Ogg",fmt,3) != 0 ) {
-                    /* Ignore */
-                    continue;
-                }
+            if ( strncmp("Ogg",fmt,3) != 0 ) {
+                /* Ignore */
+                continue;
+            }
 #endif
-                if (sscanf(fmt,"Ogg Vorbis,%u,", &bitrate)) {
-                    found_rate = true;
-                } else if (sscanf(fmt,"MPEG 1 layer 3,%u,", &bitrate)) {
-                    found_rate = true;
-                }
+            if (sscanf(fmt,"Ogg Vorbis,%u,", &bitrate)) {
+                found_rate = true;
+            } else if (sscanf(fmt,"MPEG 1 layer 3,%u,", &bitrate)) {
+                found_rate = true;
+            }
 
 
-                if ( found_rate ) {
-                    if ( high_bitrate ) {
-                        /* Find the highest possible bitrate */
-                        if ( bitrate > t->file_bitrate || t->file_bitrate == 0 ) {
-                            t->file_bitrate = bitrate;
-                        } else {
-                            continue;
-                        }
+            if ( found_rate ) {
+                if ( high_bitrate ) {
+                    /* Find the highest possible bitrate */
+                    if ( bitrate > t->file_bitrate || t->file_bitrate == 0 ) {
+                        t->file_bitrate = bitrate;
+                    } else {
+                        continue;
+                    }
+                } else {
+                    /* Find the lowest possible bitrate
+                     * TODO: Is this correct behaviour ? 
+                     */
+                    if ( (bitrate < t->file_bitrate || t->file_bitrate == 0)  && bitrate != 0 ) {
+                        t->file_bitrate = bitrate;
                     } else {
-                        /* Find the lowest possible bitrate
-                         * TODO: Is this correct behaviour ? 
-                         */
-                        if ( (bitrate < t->file_bitrate || t->file_bitrate == 0)  && bitrate != 0 ) {
-                            t->file_bitrate = bitrate;
-                        } else {
-                            continue;
-                        }
+                        continue;
                     }
                 }
+            }
 
-                char* id = (char*)ezxml_attr(file, "id");
-                if (id) {
-                    DSFYstrncpy(t->file_id, id, sizeof t->file_id);
-                    t->playable = true;
-                }
+            char* id = (char*)ezxml_attr(file, "id");
+            if (id) {
+                DSFYstrncpy(t->file_id, id, sizeof t->file_id);
+                t->playable = true;
             }
         }
-        
-        for ( ezxml_t restriction = ezxml_get(track, "restrictions", 0, "restriction", -1); restriction; restriction = restriction->next) {
-            char *catalogues = (char*)ezxml_attr(restriction, "catalogues");
-            if(catalogues && strstr(catalogues, "premium") != NULL) {
-                char* allowed = (char*)ezxml_attr(restriction, "allowed");
-                if(allowed) {
-                    t->allowed = calloc(strlen(allowed)+1, sizeof(char));
-                    DSFYstrncpy(t->allowed, allowed, strlen(allowed)+1);
-                } else {
-                    t->allowed = NULL;
-                }    
-                
-                char* forbidden = (char*)ezxml_attr(restriction, "forbidden");
-                if(forbidden) {
-                    t->forbidden = calloc(strlen(forbidden)+1, sizeof(char));
-                    DSFYstrncpy(t->forbidden, forbidden, strlen(forbidden)+1);
-                } else {
-                    t->forbidden = NULL;
-                }
+    }
+    
+    for ( ezxml_t restriction = ezxml_get(track, "restrictions", 0, "restriction", -1); restriction; restriction = restriction->next) {
+        char *catalogues = (char*)ezxml_attr(restriction, "catalogues");
+        if(catalogues && strstr(catalogues, "premium") != NULL) {
+            char* allowed = (char*)ezxml_attr(restriction, "allowed");
+            if(allowed) {
+                t->allowed = calloc(strlen(allowed)+1, sizeof(char));
+                DSFYstrncpy(t->allowed, allowed, strlen(allowed)+1);
+            } else {
+                t->allowed = NULL;
+            }    
+            
+            char* forbidden = (char*)ezxml_attr(restriction, "forbidden");
+            if(forbidden) {
+                t->forbidden = calloc(strlen(forbidden)+1, sizeof(char));
+                DSFYstrncpy(t->forbidden, forbidden, strlen(forbidden)+1);
+            } else {
+                t->forbidden = NULL;
             }
         }
+    }
 
-        xmlatoi(&t->year, track, "year", -1);
-        xmlatoi(&t->length, track, "length", -1);
-        xmlatoi(&t->tracknumber, track, "track-number", -1);
-        xmlatof(&t->popularity, track, "popularity", -1);
-        t->has_meta_data = true;
+    xmlatoi(&t->year, track, "year", -1);
+    xmlatoi(&t->length, track, "length", -1);
+    xmlatoi(&t->tracknumber, track, "track-number", -1);
+    xmlatof(&t->popularity, track, "popularity", -1);
+    t->has_meta_data = true;
+}
+
+static int parse_tracks(ezxml_t xml, struct track* t, bool ordered, bool high_bitrate)
+{
+    int track_count = 0;
+    struct track* prev = NULL;
+    struct track* root = t;
+
+    for (ezxml_t track = ezxml_get(xml, "track",-1); track; track = track->next)
+    {
+        /* is this an ordered list? in that case we have to find the
+           right track struct for every track id */
+        if (ordered) {
+            if (!(t = find_track(track, root)))
+                continue;
+        }
+        else
+            if (!t) {
+                t = calloc(1, sizeof(struct track));
+                prev->next = t;
+            }
+
+        parse_track(track, t, high_bitrate);
 
         prev = t;
         t = t->next;
@@ -409,6 +427,85 @@ int xml_parse_tracklist(struct track* firsttrack,
 }
 
 
+struct xml_tracklist_stream* xml_tracklist_stream_new(struct track* firsttrack,
+                                                     bool high_bitrate)
+{
+    struct xml_tracklist_stream* stream =
+        calloc(1, sizeof(struct xml_tracklist_stream));
+
+    stream->text = buf_new();
+    stream->firsttrack = firsttrack;
+    stream->high_bitrate = high_bitrate;
+
+    return stream;
+}
+
+/* Start of the next <track> element in text, or NULL. */
+static char* find_track_start(char* text)
+{
+    char* start;
+
+    for (start = strstr(text, "<track"); start;
+         start = strstr(start + 6, "<track"))
+        if (start[6] == '>' || isspace(start[6]))
+            return start;
+
+    return NULL;
+}
+
+int xml_tracklist_stream_feed(struct xml_tracklist_stream* stream,
+                              unsigned char* xml,
+                              int len)
+{
+    struct buf* text = stream->text;
+    int track_count = 0;
+    int pos = 0;
+
+    buf_append_data(text, xml, len);
+    buf_append_u8(text, 0); /* null terminate for strstr() */
+    text->len--;
+
+    /* parse every complete <track> element on its own */
+    for (;;) {
+        char* start = find_track_start((char*)text->ptr + pos);
+        if (!start) {
+            /* keep what may be the beginning of a tag */
+            if (text->len - pos > 6)
+                pos = text->len - 6;
+            break;
+        }
+
+        pos = start - (char*)text->ptr;
+        char* end = strstr(start, "</track>");
+        if (!end)
+            break;
+
+        end += 8;
+        pos = end - (char*)text->ptr;
+
+        ezxml_t track = ezxml_parse_str(start, end - start);
+        struct track* t = find_track(track, stream->firsttrack);
+        if (t) {
+            parse_track(track, t, stream->high_bitrate);
+            track_count++;
+        }
+        ezxml_free(track);
+    }
+
+    /* drop what has been parsed */
+    memmove(text->ptr, text->ptr + pos, text->len - pos + 1);
+    text->len -= pos;
+
+    stream->num_tracks += track_count;
+    return track_count;
+}
+
+void xml_tracklist_stream_free(struct xml_tracklist_stream* stream)
+{
+    buf_free(stream->text);
+    free(stream);
+}
+
 int xml_parse_search(struct search_result* search,
                      struct track* firsttrack,
                      unsigned char* xml,
@@ -29,6 +29,25 @@ int xml_parse_tracklist(struct track* firsttrack,
                         bool ordered,
                         bool high_bitrate);
 
+/* Incremental parsing of the reply to a track browse, fed with the xml as
+   it arrives. Every <track> element is parsed into its track struct, in
+   the list from firsttrack, as soon as it is complete. */
+struct xml_tracklist_stream
+{
+    struct buf* text; /* xml not parsed yet */
+    struct track* firsttrack;
+    bool high_bitrate;
+    int num_tracks; /* tracks parsed so far */
+};
+
+struct xml_tracklist_stream* xml_tracklist_stream_new(struct track* firsttrack,
+                                                     bool high_bitrate);
+/* Returns the number of tracks parsed from this piece. */
+int xml_tracklist_stream_feed(struct xml_tracklist_stream* stream,
+                              unsigned char* xml,
+                              int len);
+void xml_tracklist_stream_free(struct xml_tracklist_stream* stream);
+
 bool xml_parse_browse_artist(struct artist_browse* a,
                              unsigned char* xml,
                              int len,